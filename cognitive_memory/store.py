@@ -23,6 +23,8 @@ from cognitive_memory.exceptions import ConnectionError, ValidationError, Search
 from mcp_server.db.graph import (
     add_node as db_add_node,
     add_edge as db_add_edge,
+    add_nodes_batch as db_add_nodes_batch,
+    add_edges_batch as db_add_edges_batch,
     query_neighbors as db_query_neighbors,
     find_path as db_find_path,
     get_node_by_name,
@@ -297,7 +299,7 @@ class MemoryStore:
 
         try:
             # Generate embedding for the query
-            query_embedding = generate_query_embedding(query.strip())
+            query_embedding = asyncio.run(generate_query_embedding(query.strip()))
 
             # Execute search using async-to-sync conversion
             with self._connection_manager.get_connection() as conn:
@@ -1315,6 +1317,70 @@ class GraphStore:
         except Exception as e:
             raise StorageError(f"Failed to add edge: {e}") from e
 
+    def add_nodes_batch(self, nodes: list[dict[str, Any]]) -> list[str]:
+        """
+        Add many nodes in one transaction (bulk variant of add_node).
+
+        Args:
+            nodes: Dicts with name, label and optional properties
+
+        Returns:
+            Node IDs (UUID strings) in input order
+
+        Raises:
+            ValidationError: If a name or label is empty
+            ConnectionError: If not connected to database
+            StorageError: If database operation fails
+        """
+        self._ensure_connected()
+
+        # Input validation
+        for node in nodes:
+            if not node.get("name") or not node["name"].strip():
+                raise ValidationError("name cannot be empty")
+            if not node.get("label") or not node["label"].strip():
+                raise ValidationError("label cannot be empty")
+
+        try:
+            results = asyncio.run(db_add_nodes_batch(nodes))
+            return [str(result["node_id"]) for result in results]
+
+        except Exception as e:
+            raise StorageError(f"Failed to add node batch: {e}") from e
+
+    def add_edges_batch(self, edges: list[dict[str, Any]]) -> list[str]:
+        """
+        Add many edges with auto-upsert nodes in one transaction.
+
+        Args:
+            edges: Dicts with source_name, target_name, relation and
+                   optional weight (0.0-1.0) and properties
+
+        Returns:
+            Edge IDs (UUID strings) in input order
+
+        Raises:
+            ValidationError: If names or relation are empty, or weight out of range
+            ConnectionError: If not connected to database
+            StorageError: If database operation fails
+        """
+        self._ensure_connected()
+
+        # Input validation
+        for edge in edges:
+            for field in ("source_name", "target_name", "relation"):
+                if not edge.get(field) or not edge[field].strip():
+                    raise ValidationError(f"{field} cannot be empty")
+            if not 0.0 <= edge.get("weight", 1.0) <= 1.0:
+                raise ValidationError("weight must be between 0.0 and 1.0")
+
+        try:
+            results = asyncio.run(db_add_edges_batch(edges))
+            return [str(result["edge_id"]) for result in results]
+
+        except Exception as e:
+            raise StorageError(f"Failed to add edge batch: {e}") from e
+
     def query_neighbors(
         self,
         node_name: str,
@@ -52,6 +52,12 @@ from mcp_server.db.connection import (  # noqa: E402
     get_connection,
     initialize_pool,
 )
+from mcp_server.db.decay_scores import refresh_decay_scores  # noqa: E402
+from mcp_server.db.edge_stats import (  # noqa: E402
+    flush_edge_stats,
+    run_edge_stats_flusher,
+)
+from mcp_server.external.embedding_worker import run_embedding_worker  # noqa: E402
 from mcp_server.health.haiku_health_check import periodic_health_check  # noqa: E402
 from mcp_server.middleware import TenantMiddleware  # noqa: E402
 from mcp_server.resources import register_resources  # noqa: E402
@@ -173,6 +179,9 @@ async def server_lifespan(mcp: FastMCP) -> AsyncIterator[None]:
         await initialize_database()
         yield
     finally:
+        # Shutdown: write buffered edge access stats before the pool closes
+        await flush_edge_stats()
+
         # Shutdown: Close all database connections
         logger.info("Closing database connections")
         try:
@@ -245,6 +254,15 @@ async def initialize_database() -> None:
     asyncio.create_task(periodic_health_check())
     logger.info("Health check background task started (15-minute intervals)")
 
+    # Start write-behind embedding worker (Migration 052)
+    asyncio.create_task(run_embedding_worker())
+
+    # Sync decay parameters and refresh stale edge memory strengths (Migration 054)
+    asyncio.create_task(refresh_decay_scores())
+
+    # Write-behind flusher for edge access/engagement stats
+    asyncio.create_task(run_edge_stats_flusher())
+
 
 def main() -> None:
     """
@@ -7,21 +7,31 @@ This module provides functionality to detect and classify dissonances
 between edges in the knowledge graph based on AGM belief revision theory.
 """
 
+import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import os
 import re
+import threading
 import uuid
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone, timedelta
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
+from pgvector.psycopg2 import register_vector
+from psycopg2.extras import execute_values
+
 from mcp_server.db.connection import (
     get_connection,
     get_connection_sync,
     get_connection_with_project_context,
     get_connection_with_project_context_sync,
 )
+from mcp_server.db.graph_cache import invalidate_graph_cache
 from mcp_server.db.graph import get_or_create_node, add_edge, get_edge_by_id
 from mcp_server.external.anthropic_client import HaikuClient
 from mcp_server.analysis.smf import (
@@ -29,9 +39,196 @@ from mcp_server.analysis.smf import (
     generate_neutral_reasoning, validate_neutrality, validate_safeguards, IMMUTABLE_SAFEGUARDS
 )
 from mcp_server.middleware.context import get_current_project
+from mcp_server.utils.rate_limiter import AsyncRateLimiter
 
 logger = logging.getLogger(__name__)
 
+# Pair analysis runs through a bounded worker pool; the pair budget is wall-clock
+# time (MCP transport timeout ~30-60s), not a pair count
+DISSONANCE_TIME_BUDGET = float(os.getenv("DISSONANCE_TIME_BUDGET", "40"))
+DISSONANCE_MAX_CONCURRENCY = int(os.getenv("DISSONANCE_MAX_CONCURRENCY", "8"))
+DISSONANCE_REQUESTS_PER_MINUTE = float(os.getenv("DISSONANCE_REQUESTS_PER_MINUTE", "120"))
+# Pairs classified per Haiku call (1 = one call per pair)
+DISSONANCE_BATCH_SIZE = int(os.getenv("DISSONANCE_BATCH_SIZE", "5"))
+# Haiku calls already in flight at the budget may finish within this grace
+# (covers one retry cycle of generate_response); later they are cancelled
+DISSONANCE_IN_FLIGHT_GRACE = 15.0
+
+# Only the highest ranked uncached pairs go to Haiku (see rank_dissonance_candidates)
+DISSONANCE_MAX_CANDIDATES = int(os.getenv("DISSONANCE_MAX_CANDIDATES", "50"))
+# Pair score = cosine of the edges' far endpoints + these structural bonuses
+SAME_ENDPOINT_BONUS = 1.0   # Both edges link the context node to the same node
+SAME_RELATION_BONUS = 0.25  # Same relation to different nodes (PREFERS X vs. PREFERS Y)
+
+# Migration 056: reuse verdicts of pairs whose edges did not change
+DISSONANCE_VERDICT_CACHE = os.getenv("DISSONANCE_VERDICT_CACHE", "true").lower() == "true"
+
+# Migration 057: scope="recent" only pairs edges changed since the last completed check
+DISSONANCE_INCREMENTAL = os.getenv("DISSONANCE_INCREMENTAL", "true").lower() == "true"
+
+_rate_limiter: AsyncRateLimiter | None = None
+_rate_limiter_lock = threading.Lock()
+
+
+def get_dissonance_rate_limiter() -> AsyncRateLimiter:
+    """Get the process-wide Haiku rate limiter shared by all dissonance checks."""
+    global _rate_limiter
+    if _rate_limiter is None:
+        with _rate_limiter_lock:
+            if _rate_limiter is None:
+                _rate_limiter = AsyncRateLimiter(
+                    DISSONANCE_REQUESTS_PER_MINUTE, burst=DISSONANCE_MAX_CONCURRENCY
+                )
+    return _rate_limiter
+
+
+def _far_endpoint(edge: dict[str, Any], context_node_id: str) -> str:
+    """The endpoint of an edge that is not the context node."""
+    if str(edge.get("source_id")) == str(context_node_id):
+        return str(edge.get("target_id"))
+    return str(edge.get("source_id"))
+
+
+def rank_dissonance_candidates(
+    edges: list[dict[str, Any]],
+    endpoint_vectors: dict[str, Any],
+    context_node_id: str,
+    limit: int | None = DISSONANCE_MAX_CANDIDATES,
+    changed: set[int] | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Rank all edge pairs by how likely they conflict, without any LLM call.
+
+    All edges share the context node, so a pair is scored by the cosine
+    similarity of their far endpoints (node embedding, or the linked L2
+    insight embedding) plus SAME_ENDPOINT_BONUS / SAME_RELATION_BONUS.
+    Edges without a vector only get the structural bonuses.
+
+    Args:
+        edges: Edges from _fetch_edges() (modified_at DESC)
+        endpoint_vectors: node_id -> embedding of far endpoints
+        context_node_id: UUID of the context node
+        limit: Max pairs to return (None: all pairs)
+        changed: If given, only pairs with at least one of these edge indices
+                 (incremental check)
+
+    Returns:
+        (i, j) index pairs with i < j, best first; ties keep (i, j) order
+    """
+    n = len(edges)
+    if n < 2 or (limit is not None and limit <= 0):
+        return []
+
+    far_ids = [_far_endpoint(edge, context_node_id) for edge in edges]
+    dim = next((len(vector) for vector in endpoint_vectors.values()), 1)
+    matrix = np.zeros((n, dim), dtype=np.float32)
+    for row, node_id in enumerate(far_ids):
+        vector = endpoint_vectors.get(node_id)
+        if vector is None:
+            continue
+        vector = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            matrix[row] = vector / norm
+
+    scores = matrix @ matrix.T
+    endpoint_codes = np.unique(np.array(far_ids, dtype=str), return_inverse=True)[1]
+    relation_codes = np.unique(
+        np.array([str(edge.get("relation")) for edge in edges], dtype=str), return_inverse=True
+    )[1]
+    scores += SAME_ENDPOINT_BONUS * (endpoint_codes[:, None] == endpoint_codes[None, :])
+    scores += SAME_RELATION_BONUS * (relation_codes[:, None] == relation_codes[None, :])
+
+    rows, cols = np.triu_indices(n, k=1)
+    if changed is not None:
+        is_changed = np.zeros(n, dtype=bool)
+        is_changed[list(changed)] = True
+        keep = is_changed[rows] | is_changed[cols]
+        rows, cols = rows[keep], cols[keep]
+    pair_scores = scores[rows, cols]
+    top = np.argsort(-pair_scores, kind="stable")[:limit]
+    return [(int(rows[k]), int(cols[k])) for k in top]
+
+
+def _edge_stamp(edge: dict[str, Any]) -> Any:
+    """Newest of created_at/modified_at (None if the edge has neither)."""
+    stamps = [ts for ts in (edge.get("modified_at"), edge.get("created_at")) if ts is not None]
+    return max(stamps) if stamps else None
+
+
+def _changed_edge_indices(edges: list[dict[str, Any]], since: datetime) -> set[int]:
+    """Indices of edges created or modified after since (no timestamps: changed)."""
+    changed = set()
+    for index, edge in enumerate(edges):
+        stamp = _edge_stamp(edge)
+        if stamp is None or stamp > since:
+            changed.add(index)
+    return changed
+
+
+def _next_watermark(
+    edges: list[dict[str, Any]],
+    changed: set[int] | None,
+    processed: set[tuple[int, int]],
+    check_started_at: datetime,
+) -> datetime:
+    """
+    Watermark that keeps every eligible pair this check did not process eligible.
+
+    A pair is paired again while one of its edges is newer than the
+    watermark, so the watermark stops just before the newest edge of the
+    oldest unprocessed pair (left for a later check by
+    DISSONANCE_MAX_CANDIDATES, cut by the time budget or failed). Pairs with an unstamped edge are always
+    eligible and never hold it back.
+
+    Args:
+        edges: Edges of the check
+        changed: Eligible edge indices (None: every pair was eligible)
+        processed: (i, j) pairs with i < j that got a verdict (cached or fresh)
+        check_started_at: Upper bound, edges changed during the check stay eligible
+
+    Returns:
+        check_started_at, or an earlier time if eligible pairs were left out
+    """
+    # Pairs in order of their newer edge: the first unprocessed one bounds the watermark
+    stamps = [_edge_stamp(edge) for edge in edges]
+    order = sorted((stamp, index) for index, stamp in enumerate(stamps) if stamp is not None)
+    for k, (stamp, index) in enumerate(order):
+        if changed is not None and index not in changed:
+            continue  # older edges are unchanged as well, so the pair is not eligible
+        for _, other in order[:k]:
+            if (min(index, other), max(index, other)) not in processed:
+                return min(check_started_at, stamp - timedelta(microseconds=1))
+    return check_started_at
+
+
+def _edge_version(edge: dict[str, Any]) -> Any:
+    """Verdict cache version of an edge: COALESCE(modified_at, created_at)."""
+    modified_at = edge.get("modified_at")
+    return modified_at if modified_at is not None else edge.get("created_at")
+
+
+def _parse_edge_properties(edge: dict[str, Any]) -> dict[str, Any]:
+    """Edge properties as dict (handle both string and dict formats)."""
+    raw = edge.get("properties", "{}")
+    if isinstance(raw, dict):
+        return raw
+    try:
+        return json.loads(raw) if raw else {}
+    except json.JSONDecodeError:
+        return {}
+
+
+def _edge_prompt_fields(prefix: str, edge: dict[str, Any]) -> dict[str, Any]:
+    """Prompt placeholders for one edge ({prefix}_relation, {prefix}_source, ...)."""
+    return {
+        f"{prefix}_relation": edge.get("relation", "unknown"),
+        f"{prefix}_source": edge.get("source_name", "unknown"),
+        f"{prefix}_target": edge.get("target_name", "unknown"),
+        f"{prefix}_properties": json.dumps(_parse_edge_properties(edge), indent=2),
+        f"{prefix}_created": edge.get("created_at", "unknown"),
+    }
+
 
 class DissonanceType(Enum):
     """Classification of dissonance types."""
@@ -79,6 +276,15 @@ class DissonanceCheckResult:
     api_calls: int = 0
     total_tokens: int = 0
     estimated_cost_eur: float = 0.0
+    # Pairs covered within DISSONANCE_TIME_BUDGET vs. all possible pairs
+    pairs_analyzed: int = 0
+    pairs_total: int = 0
+    # Verdict cache (Migration 056): pairs served without a Haiku call
+    cache_hits: int = 0
+    cache_misses: int = 0
+    # Incremental check (Migration 057): only pairs with an edge changed since the watermark
+    incremental: bool = False
+    changed_edges: int = 0
 
 
 @dataclass
@@ -97,6 +303,40 @@ class NuanceReviewProposal:
 _nuance_reviews: list[dict[str, Any]] = []
 
 
+def _result_from_verdict(edge_a: dict, edge_b: dict, result_data: dict[str, Any]) -> DissonanceResult:
+    """Build a DissonanceResult from one parsed Haiku verdict."""
+    # Normalize dissonance_type to lowercase for enum matching
+    raw_type = result_data["dissonance_type"]
+    normalized_type = raw_type.lower() if isinstance(raw_type, str) else raw_type
+
+    return DissonanceResult(
+        edge_a_id=edge_a["id"],
+        edge_b_id=edge_b["id"],
+        dissonance_type=DissonanceType(normalized_type),
+        confidence_score=float(result_data["confidence_score"]),
+        description=result_data["description"],
+        context={
+            "reasoning": result_data["reasoning"],
+            "edge_a": edge_a,
+            "edge_b": edge_b
+        },
+        requires_review=(result_data["dissonance_type"] == "NUANCE")
+    )
+
+
+def _failed_result(edge_a: dict, edge_b: dict, error: Exception) -> DissonanceResult:
+    """NONE result for a pair whose analysis failed (never cached)."""
+    return DissonanceResult(
+        edge_a_id=edge_a["id"],
+        edge_b_id=edge_b["id"],
+        dissonance_type=DissonanceType.NONE,
+        confidence_score=0.0,
+        description="Analysis failed",
+        context={"error": str(error)},
+        requires_review=False
+    )
+
+
 class DissonanceEngine:
     """
     Engine for detecting and classifying dissonances in knowledge graph edges.
@@ -161,6 +401,9 @@ class DissonanceEngine:
                 context_node = result["id"]
 
         try:
+            # Watermark candidate: edges changed during this check are picked up next time
+            check_started_at = datetime.now(timezone.utc)
+
             # Fetch edges based on scope
             edges = self._fetch_edges(context_node, scope)
 
@@ -180,76 +423,92 @@ class DissonanceEngine:
             # Analyze pairs for dissonances
             dissonances = []
             pending_reviews = []
-            api_calls = 0
             total_tokens = 0
             estimated_cost = 0.0
 
-            # HIGH-3 Fix: Limit O(n²) API calls to max 10 pairs
-            # MCP transport has timeout (~30-60s), so limit to ~10 API calls
-            # Each Haiku call takes ~3-6 seconds
-            # 10 pairs × 5s = 50s (within timeout)
-            MAX_PAIRS = 10
-            pairs_analyzed = 0
-
-            # Generate all unique pairs of edges (with limit)
-            limit_reached = False
-            for i in range(len(edges)):
-                if limit_reached:
-                    break
-                for j in range(i + 1, len(edges)):
-                    # Cost protection: stop after MAX_PAIRS
-                    if pairs_analyzed >= MAX_PAIRS:
-                        logger.warning(
-                            f"Reached max pair limit ({MAX_PAIRS}). "
-                            f"Analyzed {pairs_analyzed} of {len(edges) * (len(edges) - 1) // 2} possible pairs."
-                        )
-                        limit_reached = True
-                        break
-
-                    pairs_analyzed += 1
-                    edge_a = edges[i]
-                    edge_b = edges[j]
-
-                    try:
-                        # Use LLM to analyze dissonance
-                        result = await self._analyze_dissonance_pair(edge_a, edge_b)
-
-                        # Track API call regardless of result
-                        api_calls += 1
-
-                        if result.dissonance_type != DissonanceType.NONE:
-                            # Fetch memory strength for both edges (AC #11)
-                            memory_strength_a = self._get_memory_strength(str(edge_a["id"]))
-                            memory_strength_b = self._get_memory_strength(str(edge_b["id"]))
-
-                            result.edge_a_memory_strength = memory_strength_a
-                            result.edge_b_memory_strength = memory_strength_b
-
-                            # Set authoritative source based on memory strength
-                            if memory_strength_a is not None and memory_strength_b is not None:
-                                result.authoritative_source = "edge_a" if memory_strength_a > memory_strength_b else "edge_b"
-
-                            dissonances.append(result)
-
-                            # Create review proposal for NUANCE classifications (AC #6)
-                            if result.dissonance_type == DissonanceType.NUANCE:
-                                await self.create_nuance_review(result)
-                                pending_reviews.append(result)
-                                result.requires_review = True
-
-                            # SMF Integration: Create proposal for all detected dissonances (Story 7.9)
-                            await self.create_smf_proposal(result, edge_a, edge_b)
-
-                    except Exception as e:
-                        # MED-3 Fix: Propagate API errors for proper fallback handling
-                        error_msg = str(e).lower()
-                        if "haiku" in error_msg or "api" in error_msg or "anthropic" in error_msg:
-                            # API failure - propagate to trigger fallback in outer try/catch
-                            logger.error(f"Haiku API error during edge pair analysis: {e}")
-                            raise  # Re-raise to trigger fallback logic
-                        # Non-API errors: continue with other pairs
-                        logger.warning(f"Failed to analyze edge pair {edge_a['id']}-{edge_b['id']}: {e}")
+            # HIGH-3 Fix: O(n²) pairs are pre-ranked without LLM calls, the best
+            # DISSONANCE_MAX_CANDIDATES uncached pairs run concurrently under a
+            # shared rate limit and are bounded by wall-clock time
+            pairs_total = len(edges) * (len(edges) - 1) // 2
+
+            # Incremental: scope="recent" pairs only edges changed since the
+            # last completed check against the existing set
+            changed = None
+            watermark = self._load_watermark(context_node) if scope == "recent" else None
+            if watermark is not None:
+                changed = _changed_edge_indices(edges, watermark)
+                unchanged = len(edges) - len(changed)
+                pairs_total -= unchanged * (unchanged - 1) // 2
+                logger.info(
+                    f"Incremental dissonance check since {watermark.isoformat()}: "
+                    f"{len(changed)} of {len(edges)} edges changed"
+                )
+            ranked = self._rank_candidate_pairs(edges, context_node, changed)
+
+            # Unchanged pairs reuse their cached verdict. The candidate limit only
+            # applies to the misses, so pairs processed by an earlier check do not
+            # take the slots of pairs no check has reached yet
+            prompt_version = self._prompt_version()
+            cached = self._load_cached_verdicts(edges, ranked, prompt_version)
+            uncached = [pair for pair in ranked if pair not in cached]
+            misses = uncached[:DISSONANCE_MAX_CANDIDATES]
+            selected = set(misses)
+            candidates = [pair for pair in ranked if pair in cached or pair in selected]
+            fresh, api_calls = await self._analyze_pairs(edges, misses)
+            self._store_verdicts(fresh, prompt_version)
+
+            fresh_by_ids = {(str(a["id"]), str(b["id"])): (a, b, r) for a, b, r in fresh}
+            analyzed = []
+            processed: set[tuple[int, int]] = set()
+            for i, j in candidates:
+                if (i, j) in cached:
+                    entry = (edges[i], edges[j], cached[(i, j)])
+                else:
+                    entry = fresh_by_ids.get((str(edges[i]["id"]), str(edges[j]["id"])))
+                    if entry is None:
                         continue
+                analyzed.append(entry)
+                if "error" not in entry[2].context:
+                    processed.add((i, j))
+            if not DISSONANCE_VERDICT_CACHE:
+                # Without the cache no later check knows which pairs were
+                # processed; pairs below the cut are skipped, not deferred
+                processed.update(uncached[DISSONANCE_MAX_CANDIDATES:])
+
+            for edge_a, edge_b, result in analyzed:
+                if result.dissonance_type == DissonanceType.NONE:
+                    continue
+
+                # Fetch memory strength for both edges (AC #11)
+                memory_strength_a = self._get_memory_strength(str(edge_a["id"]))
+                memory_strength_b = self._get_memory_strength(str(edge_b["id"]))
+
+                result.edge_a_memory_strength = memory_strength_a
+                result.edge_b_memory_strength = memory_strength_b
+
+                # Set authoritative source based on memory strength
+                if memory_strength_a is not None and memory_strength_b is not None:
+                    result.authoritative_source = "edge_a" if memory_strength_a > memory_strength_b else "edge_b"
+
+                dissonances.append(result)
+
+                try:
+                    # Create review proposal for NUANCE classifications (AC #6)
+                    if result.dissonance_type == DissonanceType.NUANCE:
+                        await self.create_nuance_review(result)
+                        pending_reviews.append(result)
+                        result.requires_review = True
+
+                    # SMF Integration: Create proposal for all detected dissonances (Story 7.9)
+                    await self.create_smf_proposal(result, edge_a, edge_b)
+                except Exception as e:
+                    logger.warning(f"Failed to record dissonance {edge_a['id']}-{edge_b['id']}: {e}")
+
+            # The watermark only moves past pairs that got a verdict; pairs left
+            # out by DISSONANCE_MAX_CANDIDATES or the time budget are paired again
+            next_watermark = _next_watermark(edges, changed, processed, check_started_at)
+            if watermark is None or next_watermark > watermark:
+                self._store_watermark(context_node, next_watermark)
 
             # Log completion
             logger.info(f"Dissonance check completed: {len(edges)} edges, {len(dissonances)} conflicts found")
@@ -264,6 +523,12 @@ class DissonanceEngine:
                 api_calls=api_calls,
                 total_tokens=total_tokens,
                 estimated_cost_eur=estimated_cost,
+                pairs_analyzed=len(analyzed),
+                pairs_total=pairs_total,
+                cache_hits=len(cached),
+                cache_misses=len(misses),
+                incremental=changed is not None,
+                changed_edges=len(changed) if changed is not None else len(edges),
                 status="success"
             )
 
@@ -284,6 +549,320 @@ class DissonanceEngine:
                 )
             raise
 
+    def _rank_candidate_pairs(
+        self, edges: list[dict[str, Any]], context_node_id: str, changed: set[int] | None = None
+    ) -> list[tuple[int, int]]:
+        """
+        Pre-rank all eligible edge pairs, most likely conflicts first.
+
+        Embedding lookup failures degrade to the structural heuristics.
+        """
+        far_ids = {_far_endpoint(edge, context_node_id) for edge in edges}
+        try:
+            vectors = self._fetch_endpoint_vectors(sorted(far_ids))
+        except Exception as e:
+            logger.warning(f"Endpoint embeddings unavailable for dissonance ranking: {e}")
+            vectors = {}
+        return rank_dissonance_candidates(edges, vectors, context_node_id, None, changed)
+
+    def _load_watermark(self, context_node_id: str) -> datetime | None:
+        """
+        Watermark of this context node (Migration 057): edges changed after it
+        have pairs that no check has processed yet.
+
+        None (full pairing) if incremental checks are disabled, no check has
+        stored one yet or the lookup fails.
+        """
+        if not DISSONANCE_INCREMENTAL:
+            return None
+        try:
+            with get_connection_with_project_context_sync(read_only=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT checked_at FROM dissonance_check_watermarks
+                    WHERE project_id = %s AND context_node_id = %s
+                    """,
+                    (self.project_id, str(context_node_id)),
+                )
+                row = cursor.fetchone()
+        except Exception as e:
+            logger.warning(f"Dissonance watermark unavailable, pairing all edges: {e}")
+            return None
+        return row["checked_at"] if row else None
+
+    def _store_watermark(self, context_node_id: str, checked_at: datetime) -> None:
+        """Advance the watermark of a context node (never moves back). Never raises."""
+        try:
+            with get_connection_with_project_context_sync() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO dissonance_check_watermarks (project_id, context_node_id, checked_at)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (project_id, context_node_id) DO UPDATE
+                    SET checked_at = GREATEST(dissonance_check_watermarks.checked_at, EXCLUDED.checked_at)
+                    """,
+                    (self.project_id, str(context_node_id), checked_at),
+                )
+        except Exception as e:
+            logger.warning(f"Failed to store dissonance watermark: {e}")
+
+    def _fetch_endpoint_vectors(self, node_ids: list[str]) -> dict[str, Any]:
+        """
+        Fetch node embeddings, falling back to the linked L2 insight embedding.
+
+        Migration 055: nodes.embedding; nodes.vector_id -> l2_insights.embedding.
+        """
+        with get_connection_with_project_context_sync(read_only=True) as conn:
+            register_vector(conn)
+            cursor = conn.cursor()
+            cursor.execute(
+                """
+                SELECT n.id::text AS node_id, COALESCE(n.embedding, i.embedding) AS embedding
+                FROM nodes n
+                LEFT JOIN l2_insights i ON i.id = n.vector_id
+                WHERE n.id = ANY(%s::uuid[])
+                  AND COALESCE(n.embedding, i.embedding) IS NOT NULL
+                """,
+                (node_ids,),
+            )
+            return {row["node_id"]: row["embedding"] for row in cursor.fetchall()}
+
+    def _prompt_version(self) -> str:
+        """Version of the classification prompt and model, part of the verdict cache key."""
+        model = getattr(self.haiku_client, "model", "")
+        templates = (
+            f"{model}\n{DISSONANCE_CLASSIFICATION_PROMPT}\n"
+            f"{DISSONANCE_BATCH_PAIR_TEMPLATE}\n{DISSONANCE_BATCH_CLASSIFICATION_PROMPT}"
+        )
+        return hashlib.sha256(templates.encode()).hexdigest()[:16]
+
+    def _load_cached_verdicts(
+        self, edges: list[dict[str, Any]], pairs: list[tuple[int, int]], prompt_version: str
+    ) -> dict[tuple[int, int], DissonanceResult]:
+        """
+        Look up cached verdicts for pairs whose edges are unchanged (Migration 056).
+
+        A verdict only matches while both edges still have the version
+        (_edge_version()) it was computed for; pairs with an unversioned edge
+        are never cached. Lookup failures (e.g. migration not applied) are
+        treated as misses.
+
+        Returns:
+            (i, j) -> cached DissonanceResult
+        """
+        if not DISSONANCE_VERDICT_CACHE or not pairs:
+            return {}
+
+        pairs = [
+            (i, j) for i, j in pairs
+            if _edge_version(edges[i]) is not None and _edge_version(edges[j]) is not None
+        ]
+        if not pairs:
+            return {}
+
+        keys = [(edges[i], edges[j]) for i, j in pairs]
+        try:
+            with get_connection_with_project_context_sync(read_only=True) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT v.edge_a_id::text AS edge_a_id, v.edge_b_id::text AS edge_b_id,
+                           v.dissonance_type, v.confidence_score, v.description, v.reasoning
+                    FROM unnest(%s::text[], %s::uuid[], %s::uuid[], %s::timestamptz[], %s::timestamptz[])
+                         AS k(project_id, edge_a_id, edge_b_id, a_version, b_version)
+                    JOIN dissonance_verdicts v
+                      ON v.project_id = k.project_id
+                     AND v.edge_a_id = k.edge_a_id
+                     AND v.edge_b_id = k.edge_b_id
+                     AND v.edge_a_version = k.a_version
+                     AND v.edge_b_version = k.b_version
+                    WHERE v.prompt_version = %s
+                    """,
+                    (
+                        [a.get("project_id") or self.project_id for a, _ in keys],
+                        [str(a["id"]) for a, _ in keys],
+                        [str(b["id"]) for _, b in keys],
+                        [_edge_version(a) for a, _ in keys],
+                        [_edge_version(b) for _, b in keys],
+                        prompt_version,
+                    ),
+                )
+                rows = {(row["edge_a_id"], row["edge_b_id"]): row for row in cursor.fetchall()}
+        except Exception as e:
+            logger.warning(f"Dissonance verdict cache unavailable: {e}")
+            return {}
+
+        cached = {}
+        for (i, j), (edge_a, edge_b) in zip(pairs, keys, strict=True):
+            row = rows.get((str(edge_a["id"]), str(edge_b["id"])))
+            if row is None:
+                continue
+            dissonance_type = DissonanceType(row["dissonance_type"])
+            cached[(i, j)] = DissonanceResult(
+                edge_a_id=edge_a["id"],
+                edge_b_id=edge_b["id"],
+                dissonance_type=dissonance_type,
+                confidence_score=float(row["confidence_score"]),
+                description=row["description"],
+                context={
+                    "reasoning": row["reasoning"],
+                    "edge_a": edge_a,
+                    "edge_b": edge_b,
+                    "cached": True
+                },
+                requires_review=(dissonance_type == DissonanceType.NUANCE)
+            )
+        return cached
+
+    def _store_verdicts(
+        self,
+        analyzed: list[tuple[dict[str, Any], dict[str, Any], DissonanceResult]],
+        prompt_version: str,
+    ) -> None:
+        """
+        Cache fresh Haiku verdicts, replacing stale verdicts of the same pairs.
+
+        Failed analyses, pairs with an unversioned edge and pairs of other
+        projects (read via shared access, not writable under RLS) are not
+        cached. Never raises.
+        """
+        if not DISSONANCE_VERDICT_CACHE:
+            return
+
+        rows = [
+            (
+                self.project_id, str(edge_a["id"]), str(edge_b["id"]), prompt_version,
+                _edge_version(edge_a), _edge_version(edge_b),
+                result.dissonance_type.value, result.confidence_score,
+                result.description, result.context.get("reasoning"),
+            )
+            for edge_a, edge_b, result in analyzed
+            if "error" not in result.context
+            and _edge_version(edge_a) is not None and _edge_version(edge_b) is not None
+            and (edge_a.get("project_id") or self.project_id) == self.project_id
+            and (edge_b.get("project_id") or self.project_id) == self.project_id
+        ]
+        if not rows:
+            return
+
+        try:
+            with get_connection_with_project_context_sync() as conn:
+                cursor = conn.cursor()
+                execute_values(
+                    cursor,
+                    """
+                    INSERT INTO dissonance_verdicts (
+                        project_id, edge_a_id, edge_b_id, prompt_version,
+                        edge_a_version, edge_b_version,
+                        dissonance_type, confidence_score, description, reasoning
+                    )
+                    VALUES %s
+                    ON CONFLICT (project_id, edge_a_id, edge_b_id, prompt_version) DO UPDATE
+                    SET edge_a_version = EXCLUDED.edge_a_version,
+                        edge_b_version = EXCLUDED.edge_b_version,
+                        dissonance_type = EXCLUDED.dissonance_type,
+                        confidence_score = EXCLUDED.confidence_score,
+                        description = EXCLUDED.description,
+                        reasoning = EXCLUDED.reasoning,
+                        created_at = NOW()
+                    """,
+                    rows,
+                    page_size=len(rows),
+                )
+        except Exception as e:
+            logger.warning(f"Failed to cache dissonance verdicts: {e}")
+
+    async def _analyze_pairs(
+        self, edges: list[dict[str, Any]], pairs: list[tuple[int, int]]
+    ) -> tuple[list[tuple[dict[str, Any], dict[str, Any], DissonanceResult]], int]:
+        """
+        Analyze edge pairs with a bounded worker pool within DISSONANCE_TIME_BUDGET.
+
+        Up to DISSONANCE_MAX_CONCURRENCY workers take batches of
+        DISSONANCE_BATCH_SIZE pairs in the given order, one Haiku call per
+        batch; every call waits for the shared rate limiter. No batch starts
+        after the budget; calls still in flight get DISSONANCE_IN_FLIGHT_GRACE
+        to finish and are cancelled (not counted) afterwards.
+
+        Raises:
+            Exception: Haiku/API errors, to trigger the fallback in dissonance_check()
+
+        Returns:
+            Tuple of ((edge_a, edge_b, result) per analyzed pair in the given
+            pair order, Haiku calls made)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + DISSONANCE_TIME_BUDGET
+        limiter = get_dissonance_rate_limiter()
+        batch_size = max(1, DISSONANCE_BATCH_SIZE)
+        pairs_total = len(pairs)
+        pairs = enumerate(pairs)
+        results: dict[int, tuple[dict[str, Any], dict[str, Any], DissonanceResult]] = {}
+        api_calls = 0
+        budget_reached = False
+
+        async def worker() -> None:
+            nonlocal api_calls, budget_reached
+            # The iterator is shared: islice() never awaits, so no pair is taken twice
+            while batch := list(itertools.islice(pairs, batch_size)):
+                # Check the budget first: a slot that would only come after the
+                # deadline is not reserved, so it stays free for other checks
+                remaining = deadline - loop.time()
+                delay = limiter.reserve(max_delay=remaining) if remaining > 0 else None
+                if delay is None:
+                    budget_reached = True
+                    return
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                batch_edges = [(edges[i], edges[j]) for _, (i, j) in batch]
+                try:
+                    # Use LLM to analyze dissonance
+                    batch_results, calls = await self._analyze_dissonance_batch(batch_edges)
+                except Exception as e:
+                    # MED-3 Fix: Propagate API errors for proper fallback handling
+                    error_msg = str(e).lower()
+                    if "haiku" in error_msg or "api" in error_msg or "anthropic" in error_msg:
+                        logger.error(f"Haiku API error during edge pair analysis: {e}")
+                        raise
+                    # Non-API errors: continue with other pairs
+                    pair_ids = ", ".join(f"{a['id']}-{b['id']}" for a, b in batch_edges)
+                    logger.warning(f"Failed to analyze edge pairs {pair_ids}: {e}")
+                    continue
+                api_calls += calls
+                for (index, _), (edge_a, edge_b), result in zip(
+                    batch, batch_edges, batch_results, strict=True
+                ):
+                    results[index] = (edge_a, edge_b, result)
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(DISSONANCE_MAX_CONCURRENCY, -(-pairs_total // batch_size)))
+        ]
+        if not workers:
+            return [], 0
+        done, pending = await asyncio.wait(
+            workers,
+            timeout=DISSONANCE_TIME_BUDGET + DISSONANCE_IN_FLIGHT_GRACE,
+            return_when=asyncio.FIRST_EXCEPTION,
+        )
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for task in done:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+
+        if budget_reached or pending:
+            logger.warning(
+                f"Reached dissonance time budget ({DISSONANCE_TIME_BUDGET:.0f}s). "
+                f"Analyzed {len(results)} of {pairs_total} candidate pairs."
+            )
+        return [results[index] for index in sorted(results)], api_calls
+
     def _fetch_edges(self, context_node_id: str, scope: str) -> list[dict[str, Any]]:
         """
         Fetch edges based on scope criteria.
@@ -364,38 +943,10 @@ class DissonanceEngine:
     async def _analyze_dissonance_pair(self, edge_a: dict, edge_b: dict) -> DissonanceResult:
         """Analyze a pair of edges for dissonance using LLM."""
 
-        # Parse edge properties (handle both string and dict formats)
-        props_a_raw = edge_a.get("properties", "{}")
-        props_b_raw = edge_b.get("properties", "{}")
-
-        if isinstance(props_a_raw, dict):
-            props_a = props_a_raw
-        else:
-            try:
-                props_a = json.loads(props_a_raw) if props_a_raw else {}
-            except json.JSONDecodeError:
-                props_a = {}
-
-        if isinstance(props_b_raw, dict):
-            props_b = props_b_raw
-        else:
-            try:
-                props_b = json.loads(props_b_raw) if props_b_raw else {}
-            except json.JSONDecodeError:
-                props_b = {}
-
         # Prepare prompt with edge information
         prompt = DISSONANCE_CLASSIFICATION_PROMPT.format(
-            edge_a_relation=edge_a.get("relation", "unknown"),
-            edge_a_source=edge_a.get("source_name", "unknown"),
-            edge_a_target=edge_a.get("target_name", "unknown"),
-            edge_a_properties=json.dumps(props_a, indent=2),
-            edge_a_created=edge_a.get("created_at", "unknown"),
-            edge_b_relation=edge_b.get("relation", "unknown"),
-            edge_b_source=edge_b.get("source_name", "unknown"),
-            edge_b_target=edge_b.get("target_name", "unknown"),
-            edge_b_properties=json.dumps(props_b, indent=2),
-            edge_b_created=edge_b.get("created_at", "unknown")
+            **_edge_prompt_fields("edge_a", edge_a),
+            **_edge_prompt_fields("edge_b", edge_b)
         )
 
         # Call Haiku API with retry logic (will be implemented in Task 3)
@@ -415,39 +966,78 @@ class DissonanceEngine:
                 raise ValueError(f"No JSON found in response: {response[:100]}")
 
             # Parse JSON response
-            result_data = json.loads(json_str)
-
-            # Normalize dissonance_type to lowercase for enum matching
-            raw_type = result_data["dissonance_type"]
-            normalized_type = raw_type.lower() if isinstance(raw_type, str) else raw_type
-
-            # Create DissonanceResult
-            return DissonanceResult(
-                edge_a_id=edge_a["id"],
-                edge_b_id=edge_b["id"],
-                dissonance_type=DissonanceType(normalized_type),
-                confidence_score=float(result_data["confidence_score"]),
-                description=result_data["description"],
-                context={
-                    "reasoning": result_data["reasoning"],
-                    "edge_a": edge_a,
-                    "edge_b": edge_b
-                },
-                requires_review=(result_data["dissonance_type"] == "NUANCE")
-            )
+            return _result_from_verdict(edge_a, edge_b, json.loads(json_str))
 
         except Exception as e:
             logger.error(f"Failed to analyze dissonance with LLM: {e}")
             # Return NONE dissonance on failure
-            return DissonanceResult(
-                edge_a_id=edge_a["id"],
-                edge_b_id=edge_b["id"],
-                dissonance_type=DissonanceType.NONE,
-                confidence_score=0.0,
-                description="Analysis failed",
-                context={"error": str(e)},
-                requires_review=False
+            return _failed_result(edge_a, edge_b, e)
+
+    async def _analyze_dissonance_batch(
+        self, batch: list[tuple[dict, dict]]
+    ) -> tuple[list[DissonanceResult], int]:
+        """
+        Analyze several edge pairs with one Haiku call (DISSONANCE_BATCH_SIZE).
+
+        Pairs whose verdict is missing or malformed in the batched response
+        are re-analyzed with single-pair calls (each waiting for the shared
+        rate limiter). An API failure marks the whole batch as failed, like
+        _analyze_dissonance_pair() does for one pair.
+
+        Returns:
+            Tuple of (one result per pair in batch order, Haiku calls made)
+        """
+        if len(batch) == 1:
+            return [await self._analyze_dissonance_pair(*batch[0])], 1
+
+        pair_blocks = "\n".join(
+            DISSONANCE_BATCH_PAIR_TEMPLATE.format(
+                pair=index,
+                **_edge_prompt_fields("edge_a", edge_a),
+                **_edge_prompt_fields("edge_b", edge_b)
+            )
+            for index, (edge_a, edge_b) in enumerate(batch, start=1)
+        )
+        prompt = DISSONANCE_BATCH_CLASSIFICATION_PROMPT.format(
+            pair_count=len(batch), pairs=pair_blocks
+        )
+
+        try:
+            response = await self.haiku_client.generate_response(
+                prompt=prompt,
+                temperature=0.0,  # Deterministic classification
+                max_tokens=350 * len(batch)
             )
+        except Exception as e:
+            logger.error(f"Failed to analyze dissonance batch with LLM: {e}")
+            return [_failed_result(edge_a, edge_b, e) for edge_a, edge_b in batch], 1
+
+        verdicts: dict[int, DissonanceResult] = {}
+        try:
+            if "[" not in response or "]" not in response:
+                raise ValueError(f"No JSON array found in response: {response[:100]}")
+            items = json.loads(response[response.find("["):response.rfind("]") + 1])
+            if not isinstance(items, list):
+                raise ValueError("Batched response is not a JSON array")
+            for item in items:
+                try:
+                    index = int(item["pair"]) - 1
+                    if 0 <= index < len(batch) and index not in verdicts:
+                        verdicts[index] = _result_from_verdict(*batch[index], item)
+                except (KeyError, TypeError, ValueError):
+                    continue
+        except (ValueError, json.JSONDecodeError) as e:
+            logger.warning(f"Unparseable batched dissonance response, falling back to single pairs: {e}")
+
+        results: list[DissonanceResult] = []
+        api_calls = 1
+        for index, (edge_a, edge_b) in enumerate(batch):
+            if index not in verdicts:
+                await get_dissonance_rate_limiter().acquire()
+                verdicts[index] = await self._analyze_dissonance_pair(edge_a, edge_b)
+                api_calls += 1
+            results.append(verdicts[index])
+        return results, api_calls
 
     async def create_nuance_review(self, dissonance: DissonanceResult) -> NuanceReviewProposal:
         """Erstellt einen Review-Proposal für NUANCE-Klassifikation."""
@@ -674,6 +1264,58 @@ Du analysierst potenzielle Konflikte in einer Selbst-Narrative.
 Falls kein Konflikt erkannt wird, setze dissonance_type auf "NONE".
 """
 
+# Batched variant: several independent pairs per Haiku call (DISSONANCE_BATCH_SIZE)
+DISSONANCE_BATCH_PAIR_TEMPLATE = """
+### Paar {pair}
+
+**Edge A:**
+- Relation: {edge_a_relation}
+- Source: {edge_a_source} → Target: {edge_a_target}
+- Properties: {edge_a_properties}
+- Erstellt: {edge_a_created}
+
+**Edge B:**
+- Relation: {edge_b_relation}
+- Source: {edge_b_source} → Target: {edge_b_target}
+- Properties: {edge_b_properties}
+- Erstellt: {edge_b_created}
+"""
+
+DISSONANCE_BATCH_CLASSIFICATION_PROMPT = """
+Du analysierst potenzielle Konflikte in einer Selbst-Narrative.
+Klassifiziere jedes der folgenden {pair_count} Edge-Paare unabhängig voneinander.
+{pairs}
+**Klassifikations-Kriterien:**
+
+1. **EVOLUTION**: Die Positionen zeigen zeitliche Entwicklung
+   - Früher X, jetzt Y (nicht gleichzeitig wahr)
+   - Eine Position hat die andere abgelöst
+   - Beispiel: "Früher mochte ich X" → "Jetzt bevorzuge ich Y"
+
+2. **CONTRADICTION**: Echter logischer Widerspruch
+   - Beide Positionen beanspruchen gleichzeitige Gültigkeit
+   - Können nicht beide wahr sein
+   - Beispiel: "Ich glaube an X" UND "Ich glaube nicht an X"
+
+3. **NUANCE**: Dialektische Spannung die okay ist
+   - Beide Positionen können gleichzeitig wahr sein
+   - Komplexität/Ambiguität ist Teil der Identität
+   - Beispiel: "Ich schätze Autonomie" UND "Ich schätze Verbindung"
+
+**Output Format (JSON-Array, genau ein Objekt pro Paar):**
+[
+  {{
+    "pair": <Nummer des Paars>,
+    "dissonance_type": "EVOLUTION" | "CONTRADICTION" | "NUANCE" | "NONE",
+    "confidence_score": <float 0.0-1.0>,
+    "description": "<1-2 Sätze Erklärung>",
+    "reasoning": "<Begründung für die Klassifikation>"
+  }}
+]
+
+Falls kein Konflikt erkannt wird, setze dissonance_type auf "NONE".
+"""
+
 
 def _find_review_by_id(review_id: str) -> dict[str, Any] | None:
     """
@@ -747,6 +1389,7 @@ def _mark_edge_as_superseded(edge_id: str, superseded_at: str, superseded_by: st
                 (json.dumps(existing_props), edge_id)
             )
             conn.commit()
+            invalidate_graph_cache()
 
             logger.debug(f"Marked edge {edge_id} as superseded by {superseded_by}")
             return True
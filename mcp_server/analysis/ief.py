@@ -10,11 +10,15 @@ scoring logic that weights relevance, semantic similarity, recency, and
 constitutive relationships.
 """
 
+import json
 import math
 import uuid
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import Any, Optional, Callable
 
+import numpy as np
+
 # IEF Weights (sum = 1.0) - mutable, can be recalibrated
 IEF_WEIGHT_RELEVANCE = 0.30
 IEF_WEIGHT_SIMILARITY = 0.25
@@ -77,6 +81,61 @@ def calculate_ief_score(
             }
         }
     """
+    # Component 2: Semantic Similarity
+    semantic_similarity = _calculate_semantic_similarity(
+        vector_id=_edge_vector_id(edge_data),
+        query_embedding=query_embedding
+    )
+
+    return _build_ief_result(edge_data, semantic_similarity, pending_nuance_edge_ids)
+
+
+def calculate_ief_scores(
+    edges: list[dict[str, Any]],
+    query_embedding: list[float] | None = None,
+    pending_nuance_edge_ids: set[str] | None = None,
+    conn: Any = None,
+) -> list[dict[str, Any]]:
+    """
+    Calculate IEF scores for many edges at once.
+
+    Same result per edge as calculate_ief_score(), but the L2-Insight
+    embeddings of all edges are loaded with one query and the semantic
+    similarities are computed as one NumPy matrix-vector product instead of
+    one connection and one Python loop per edge.
+
+    Args:
+        edges: Edge dicts as accepted by calculate_ief_score()
+        query_embedding: Optional 1536-dim query embedding for semantic similarity
+        pending_nuance_edge_ids: Optional set of edge IDs with unresolved NUANCE reviews
+        conn: Optional open connection for the embedding lookup
+
+    Returns:
+        List of calculate_ief_score() result dicts, in the order of edges
+    """
+    similarities = _calculate_semantic_similarities(
+        [_edge_vector_id(edge_data) for edge_data in edges],
+        query_embedding,
+        conn=conn,
+    )
+    return [
+        _build_ief_result(edge_data, semantic_similarity, pending_nuance_edge_ids)
+        for edge_data, semantic_similarity in zip(edges, similarities, strict=True)
+    ]
+
+
+def _edge_vector_id(edge_data: dict[str, Any]) -> int | None:
+    """L2-Insight ID of an edge (edge properties first, then the edge dict)."""
+    properties = edge_data.get("edge_properties") or edge_data.get("properties") or {}
+    return properties.get("vector_id") or edge_data.get("vector_id")
+
+
+def _build_ief_result(
+    edge_data: dict[str, Any],
+    semantic_similarity: float,
+    pending_nuance_edge_ids: set[str] | None,
+) -> dict[str, Any]:
+    """Combine the IEF components of one edge into the calculate_ief_score() result."""
     edge_id = edge_data.get("edge_id") or edge_data.get("id")
     properties = edge_data.get("edge_properties") or edge_data.get("properties") or {}
 
@@ -85,13 +144,6 @@ def calculate_ief_score(
     from mcp_server.utils.relevance import calculate_relevance_score
     relevance_score = calculate_relevance_score(edge_data)
 
-    # Component 2: Semantic Similarity
-    vector_id = properties.get("vector_id") or edge_data.get("vector_id")
-    semantic_similarity = _calculate_semantic_similarity(
-        vector_id=vector_id,
-        query_embedding=query_embedding
-    )
-
     # Component 3: Recency Boost
     modified_at = edge_data.get("modified_at")
     recency_boost = _calculate_recency_boost(modified_at)
@@ -227,6 +279,97 @@ def _get_insight_embedding(vector_id: int) -> list[float] | None:
     return None
 
 
+def _calculate_semantic_similarities(
+    vector_ids: list[int | None],
+    query_embedding: list[float] | None,
+    conn: Any = None,
+) -> list[float]:
+    """
+    Semantic similarity for many L2-Insights (see _calculate_semantic_similarity()).
+
+    Returns:
+        One float between 0.0 and 1.0 per vector_id (0.5 if not calculable)
+    """
+    similarities = [0.5] * len(vector_ids)
+    if not query_embedding:
+        return similarities
+
+    embeddings = get_insight_embeddings(
+        [vector_id for vector_id in vector_ids if vector_id], conn=conn
+    )
+    if not embeddings:
+        return similarities
+
+    # Dimension mismatches keep the neutral 0.5 (as in _cosine_similarity())
+    query = np.asarray(query_embedding, dtype=np.float64)
+    rows = [
+        i for i, vector_id in enumerate(vector_ids)
+        if vector_id and int(vector_id) in embeddings
+        and embeddings[int(vector_id)].shape == query.shape
+    ]
+    if rows:
+        matrix = np.stack([embeddings[int(vector_ids[i])] for i in rows])
+        for i, similarity in zip(rows, _cosine_similarities(query, matrix).tolist(), strict=True):
+            similarities[i] = similarity
+    return similarities
+
+
+def get_insight_embeddings(vector_ids: Iterable[int], conn: Any = None) -> dict[int, np.ndarray]:
+    """
+    Batched embedding lookup for many L2-Insights in a single query.
+
+    Args:
+        vector_ids: l2_insights IDs to look up
+        conn: Optional open connection; a pooled sync connection is used if None
+
+    Returns:
+        Dict insight_id -> float64 embedding. Insights without embedding are omitted.
+    """
+    ids = sorted({int(i) for i in vector_ids})
+    if not ids:
+        return {}
+
+    query = """
+        SELECT id, embedding
+        FROM l2_insights
+        WHERE id = ANY(%s) AND embedding IS NOT NULL;
+    """
+
+    if conn is not None:
+        cursor = conn.cursor()
+        cursor.execute(query, (ids,))
+        rows = cursor.fetchall()
+    else:
+        from mcp_server.db.connection import get_connection_sync
+
+        with get_connection_sync() as pooled_conn:
+            cursor = pooled_conn.cursor()
+            cursor.execute(query, (ids,))
+            rows = cursor.fetchall()
+
+    embeddings: dict[int, np.ndarray] = {}
+    for row in rows:
+        embedding = row["embedding"]
+        if isinstance(embedding, str):
+            # pgvector text format "[x,y,...]" when no vector adapter is registered
+            embedding = json.loads(embedding)
+        embeddings[int(row["id"])] = np.asarray(embedding, dtype=np.float64)
+    return embeddings
+
+
+def _cosine_similarities(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Row-wise cosine similarity of an (n, d) matrix to a d-dim query, mapped to 0.0-1.0.
+
+    Vectorized counterpart of _cosine_similarity(); zero vectors get 0.5.
+    """
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    dots = matrix @ query
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cos_sim = np.where(norms > 0, dots / norms, 0.0)
+    return np.where(norms > 0, (cos_sim + 1) / 2, 0.5)
+
+
 def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
     """
     Calculate cosine similarity between two vectors (numpy-free).
@@ -241,7 +384,7 @@ def _cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
     if len(vec_a) != len(vec_b):
         return 0.5  # Fallback on dimension mismatch
 
-    dot_product = sum(a * b for a, b in zip(vec_a, vec_b))
+    dot_product = sum(a * b for a, b in zip(vec_a, vec_b, strict=True))
     norm_a = math.sqrt(sum(a * a for a in vec_a))
     norm_b = math.sqrt(sum(b * b for b in vec_b))
 
@@ -410,6 +553,70 @@ def register_feedback_callback(callback: Callable[[str, bool, Optional[str]], No
 # Context Critic Feedback (Story 26.4 - EP-4 Lazy Evaluation)
 # =============================================================================
 
+# Feedback weights (from Architecture); not_now has no effect
+INSIGHT_FEEDBACK_WEIGHTS: dict[str, float] = {
+    "helpful": 0.1,
+    "not_relevant": -0.1,
+}
+FEEDBACK_SCORE_MIN = 0.0
+FEEDBACK_SCORE_MAX = 1.5
+
+
+def get_insight_feedback_adjustments(
+    insight_ids: list[int],
+    conn: Any = None,
+) -> dict[int, float]:
+    """
+    Batched feedback lookup for many insights in a single query.
+
+    Used by rrf_fusion() so fusion costs at most one extra query regardless
+    of how many L2 results are fused (instead of one connection per result).
+
+    Args:
+        insight_ids: L2 insight IDs to look up
+        conn: Optional open connection; a pooled sync connection is used if None
+
+    Returns:
+        Dict insight_id -> summed feedback adjustment. Insights without
+        feedback are omitted (adjustment 0.0).
+    """
+    ids = sorted({int(i) for i in insight_ids})
+    if not ids:
+        return {}
+
+    query = """
+        SELECT insight_id, feedback_type, COUNT(*) AS cnt
+        FROM insight_feedback
+        WHERE insight_id = ANY(%s)
+        GROUP BY insight_id, feedback_type;
+    """
+
+    if conn is not None:
+        cursor = conn.cursor()
+        cursor.execute(query, (ids,))
+        rows = cursor.fetchall()
+    else:
+        from mcp_server.db.connection import get_connection_sync
+
+        with get_connection_sync() as pooled_conn:
+            cursor = pooled_conn.cursor()
+            cursor.execute(query, (ids,))
+            rows = cursor.fetchall()
+
+    adjustments: dict[int, float] = {}
+    for row in rows:
+        weight = INSIGHT_FEEDBACK_WEIGHTS.get(row["feedback_type"], 0.0)
+        if weight:
+            insight_id = row["insight_id"]
+            adjustments[insight_id] = adjustments.get(insight_id, 0.0) + weight * row["cnt"]
+    return adjustments
+
+
+def apply_feedback_adjustment(base_score: float, feedback_adjustment: float) -> float:
+    """Apply a precomputed feedback adjustment, clamped to [0.0, 1.5]."""
+    return max(FEEDBACK_SCORE_MIN, min(FEEDBACK_SCORE_MAX, base_score + feedback_adjustment))
+
+
 def apply_insight_feedback_to_score(
     base_score: float,
     insight_id: int
@@ -430,6 +637,9 @@ def apply_insight_feedback_to_score(
     - not_relevant: -0.1 weight reduction
     - not_now: 0 (no effect)
 
+    For many insights at once use get_insight_feedback_adjustments() +
+    apply_feedback_adjustment() (one query instead of one per insight).
+
     Args:
         base_score: Original IEF score before feedback adjustment
         insight_id: L2 insight ID to look up feedback for
@@ -437,31 +647,5 @@ def apply_insight_feedback_to_score(
     Returns:
         Adjusted IEF score (clamped to [0.0, 1.5] range)
     """
-    from mcp_server.db.connection import get_connection_sync
-
-    # Query all feedback for this insight
-    with get_connection_sync() as conn:
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            SELECT feedback_type
-            FROM insight_feedback
-            WHERE insight_id = %s;
-            """,
-            (insight_id,)
-        )
-        feedbacks = cursor.fetchall()
-
-    # Aggregate feedback adjustments
-    feedback_adjustment = 0.0
-    for fb in feedbacks:
-        feedback_type = fb["feedback_type"]
-        if feedback_type == "helpful":
-            feedback_adjustment += 0.1
-        elif feedback_type == "not_relevant":
-            feedback_adjustment -= 0.1
-        # not_now: no adjustment
-
-    # Apply adjustment (clamped to valid range)
-    final_score = max(0.0, min(1.5, base_score + feedback_adjustment))
-    return final_score
\ No newline at end of file
+    adjustments = get_insight_feedback_adjustments([insight_id])
+    return apply_feedback_adjustment(base_score, adjustments.get(int(insight_id), 0.0))
@@ -24,6 +24,7 @@ import yaml
 
 from mcp_server.db.connection import get_connection, get_connection_sync
 from mcp_server.db.graph import get_edge_by_id, _log_audit_entry
+from mcp_server.db.graph_cache import invalidate_graph_cache
 from mcp_server.external.anthropic_client import HaikuClient
 
 logger = logging.getLogger(__name__)
@@ -860,6 +861,9 @@ def undo_proposal(proposal_id: int, actor: str) -> dict[str, Any]:
         conn.commit()
         cursor.close()
 
+    # Edge properties changed: drop cached graph snapshots
+    invalidate_graph_cache(project_id)
+
     # Audit log (outside connection context)
     _log_audit_entry(
         edge_id=str(proposal["affected_edges"][0]) if proposal["affected_edges"] else str(proposal_id),
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Concurrency Benchmark for the Async Pool Backend.
+
+Measures hybrid_search or graph traversal throughput with 1, 8 and 32
+parallel clients sharing one event loop. With the blocking psycopg2 calls
+offloaded to the DB executor, throughput should scale with the client count
+until the connection pool or the database saturates; with inline execution
+it stays flat because every scan serializes on the event loop.
+
+Workloads:
+    search:    hybrid_search (semantic + keyword scans)
+    traversal: query_neighbors(max_depth=3) from the project's highest-degree
+               nodes, on the SQL path (adjacency cache disabled)
+
+Modes:
+    offload: the production code as shipped (DB work on the DB executor)
+    inline:  the same statements executed directly on the loop
+             (pre-change behavior, for comparison)
+
+Usage:
+    python -m mcp_server.benchmarking.concurrency_benchmark
+    python -m mcp_server.benchmarking.concurrency_benchmark --clients 1 8 32 --requests 20 --mode inline
+    python -m mcp_server.benchmarking.concurrency_benchmark --workload traversal
+
+Output:
+    - JSON results file: mcp_server/benchmarking/results/concurrency_{workload}_{mode}_{timestamp}.json
+    - Summary table on stdout
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load environment before imports
+load_dotenv(".env.development")
+
+from mcp_server.db import graph  # noqa: E402
+from mcp_server.db.connection import (  # noqa: E402
+    close_all_connections,
+    get_connection_with_project_context,
+    initialize_pool,
+)
+from mcp_server.middleware.context import set_project_id  # noqa: E402
+from mcp_server.tools import (  # noqa: E402
+    handle_hybrid_search,
+    keyword_search,
+    semantic_search,
+)
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULTS_DIR = Path("mcp_server/benchmarking/results")
+
+DEFAULT_CLIENT_COUNTS = [1, 8, 32]
+DEFAULT_REQUESTS_PER_CLIENT = 10
+DEFAULT_PROJECT_ID = os.getenv("BENCHMARK_PROJECT_ID", "io")
+TRAVERSAL_DEPTH = 3
+TRAVERSAL_START_NODES = 5
+
+BENCHMARK_QUERIES = [
+    "cognitive memory architecture",
+    "episodic reflection on failed retrieval",
+    "relationship between autonomy and connection",
+    "database connection pool exhaustion",
+    "how does decay affect relevance",
+]
+
+
+def _random_embedding(dim: int = 1536) -> list[float]:
+    """Deterministic-enough random unit-scale embedding (no OpenAI calls)."""
+    return [random.uniform(-1.0, 1.0) for _ in range(dim)]
+
+
+# =============================================================================
+# Client Workloads
+# =============================================================================
+
+async def _offload_request(query: str, embedding: list[float]) -> None:
+    """One hybrid_search call through the production handler."""
+    result = await handle_hybrid_search({
+        "query_text": query,
+        "query_embedding": embedding,
+        "top_k": 5,
+    })
+    if "error" in result:
+        raise RuntimeError(f"{result['error']}: {result.get('details')}")
+
+
+async def _inline_request(query: str, embedding: list[float]) -> None:
+    """Same scans executed on the event loop (pre-change behavior)."""
+    async with get_connection_with_project_context(read_only=True) as conn:
+        semantic_search(embedding, 5, conn)
+        keyword_search(query, 5, conn)
+
+
+async def _traversal_request(node_id: str) -> None:
+    """One multi-hop query_neighbors traversal (inline mode: see _inline_graph_statements)."""
+    await graph.query_neighbors(node_id, max_depth=TRAVERSAL_DEPTH)
+
+
+@contextmanager
+def _inline_graph_statements() -> Iterator[None]:
+    """Run graph.py's executor calls directly on the loop (pre-change behavior)."""
+    async def run_inline(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    offload = graph.run_in_db_executor
+    graph.run_in_db_executor = run_inline
+    try:
+        yield
+    finally:
+        graph.run_in_db_executor = offload
+
+
+async def _load_start_nodes(project_id: str) -> list[str]:
+    """Highest-degree nodes of the project: the traversals that used to stall the loop."""
+    set_project_id(project_id)
+    async with get_connection_with_project_context(read_only=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT node_id::text AS node_id
+            FROM (
+                SELECT source_id AS node_id FROM edges
+                UNION ALL
+                SELECT target_id FROM edges
+            ) endpoints
+            GROUP BY node_id
+            ORDER BY COUNT(*) DESC
+            LIMIT %s;
+            """,
+            (TRAVERSAL_START_NODES,),
+        )
+        return [row["node_id"] for row in cursor.fetchall()]
+
+
+async def _run_client(
+    client_id: int,
+    requests: int,
+    mode: str,
+    project_id: str,
+    start_nodes: list[str] | None,
+    latencies: list[float],
+    errors: list[str],
+) -> None:
+    """Issue `requests` sequential searches or traversals from a single simulated client."""
+    set_project_id(project_id)
+    request_fn = _offload_request if mode == "offload" else _inline_request
+    for i in range(requests):
+        if start_nodes is not None:
+            node_id = start_nodes[(client_id + i) % len(start_nodes)]
+        else:
+            query = BENCHMARK_QUERIES[(client_id + i) % len(BENCHMARK_QUERIES)]
+            embedding = _random_embedding()
+        start = time.perf_counter()
+        try:
+            if start_nodes is not None:
+                await _traversal_request(node_id)
+            else:
+                await request_fn(query, embedding)
+            latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(str(e))
+
+
+async def run_level(
+    clients: int,
+    requests: int,
+    mode: str,
+    project_id: str,
+    start_nodes: list[str] | None = None,
+) -> dict[str, Any]:
+    """
+    Run one concurrency level and return throughput/latency statistics.
+
+    Args:
+        clients: Number of parallel clients
+        requests: Sequential requests per client
+        mode: "offload" or "inline"
+        project_id: Project context used for RLS
+        start_nodes: Traversal start node ids (traversal workload), None for hybrid_search
+
+    Returns:
+        Dict with throughput (req/s), latency percentiles and error count
+    """
+    latencies: list[float] = []
+    errors: list[str] = []
+
+    start = time.perf_counter()
+    inline_graph = mode == "inline" and start_nodes is not None
+    with _inline_graph_statements() if inline_graph else nullcontext():
+        await asyncio.gather(*[
+            _run_client(c, requests, mode, project_id, start_nodes, latencies, errors)
+            for c in range(clients)
+        ])
+    wall = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] if ordered else 0.0
+
+    return {
+        "clients": clients,
+        "mode": mode,
+        "requests": clients * requests,
+        "succeeded": len(latencies),
+        "errors": len(errors),
+        "wall_seconds": wall,
+        "throughput_rps": len(latencies) / wall if wall > 0 else 0.0,
+        "p50_latency": statistics.median(ordered) if ordered else 0.0,
+        "p95_latency": p95,
+        "sample_errors": errors[:3],
+    }
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="hybrid_search / graph traversal concurrency benchmark")
+    parser.add_argument("--clients", type=int, nargs="+", default=DEFAULT_CLIENT_COUNTS)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS_PER_CLIENT)
+    parser.add_argument("--mode", choices=["offload", "inline"], default="offload")
+    parser.add_argument("--workload", choices=["search", "traversal"], default="search")
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--project", default=DEFAULT_PROJECT_ID)
+    args = parser.parse_args()
+
+    await initialize_pool(min_connections=1, max_connections=args.pool_size)
+
+    try:
+        start_nodes = None
+        if args.workload == "traversal":
+            # Measure the SQL traversal, not the in-process adjacency cache
+            os.environ["GRAPH_ADJACENCY_CACHE"] = "false"
+            start_nodes = await _load_start_nodes(args.project)
+            if not start_nodes:
+                raise SystemExit(f"Project {args.project!r} has no edges to traverse")
+
+        # Warm-up: establish connections and plan caches
+        await run_level(1, 2, args.mode, args.project, start_nodes)
+
+        results = []
+        for clients in args.clients:
+            level = await run_level(clients, args.requests, args.mode, args.project, start_nodes)
+            results.append(level)
+            logger.info(
+                f"{clients:>3} clients ({args.workload}, {args.mode}): {level['throughput_rps']:.1f} req/s, "
+                f"p50={level['p50_latency'] * 1000:.1f}ms, p95={level['p95_latency'] * 1000:.1f}ms, "
+                f"errors={level['errors']}"
+            )
+    finally:
+        close_all_connections()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = RESULTS_DIR / f"concurrency_{args.workload}_{args.mode}_{timestamp}.json"
+    # File I/O off the event loop
+    payload = json.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "workload": args.workload,
+        "pool_size": args.pool_size,
+        "requests_per_client": args.requests,
+        "results": results,
+    }, indent=2)
+    await asyncio.to_thread(results_file.write_text, payload)
+
+    print()
+    print(f"{'clients':>8} {'req/s':>10} {'p50 ms':>10} {'p95 ms':>10} {'errors':>8}")
+    for level in results:
+        print(
+            f"{level['clients']:>8} {level['throughput_rps']:>10.1f} "
+            f"{level['p50_latency'] * 1000:>10.1f} {level['p95_latency'] * 1000:>10.1f} "
+            f"{level['errors']:>8}"
+        )
+    print(f"\nResults saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Connection Acquisition Benchmark for get_connection_with_project_context().
+
+Measures the latency of acquiring a pooled connection with RLS context and
+releasing it again (empty block + commit), at several concurrency levels.
+The lean path skips the health check for recently used connections, applies
+the pgvector session settings once per physical connection and sets the RLS
+context in one statement; the legacy path replays the previous sequence on
+every acquisition.
+
+Modes:
+    lean:   get_connection_with_project_context() as shipped
+    legacy: SELECT 1 health check + SET hnsw.iterative_scan + SET
+            hnsw.max_scan_tuples + SELECT set_project_context() + commit
+            (pre-change behavior, four round trips)
+
+Usage:
+    python -m mcp_server.benchmarking.connection_acquisition_benchmark
+    python -m mcp_server.benchmarking.connection_acquisition_benchmark --concurrency 1 4 8 --repetitions 200 --mode both
+
+Output:
+    - JSON results file: mcp_server/benchmarking/results/connection_acquisition_{timestamp}.json
+    - Summary table on stdout
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load environment before imports
+load_dotenv(".env.development")
+
+from mcp_server.db.connection import (  # noqa: E402
+    _checkin_connection,
+    _checkout_connection,
+    _run_health_check,
+    close_all_connections,
+    configure_pgvector_iterative_scans_sync,
+    get_connection_with_project_context,
+    initialize_pool,
+    run_in_db_executor,
+)
+from mcp_server.middleware.context import set_project_id  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULTS_DIR = Path("mcp_server/benchmarking/results")
+
+DEFAULT_CONCURRENCY = [1, 4, 8]
+DEFAULT_REPETITIONS = 200
+DEFAULT_PROJECT_ID = os.getenv("BENCHMARK_PROJECT_ID", "io")
+
+
+# =============================================================================
+# Acquisition Variants
+# =============================================================================
+
+async def _lean_acquisition(project_id: str) -> None:
+    """get_connection_with_project_context() as shipped."""
+    async with get_connection_with_project_context(read_only=True):
+        pass
+
+
+def _legacy_setup(conn: Any, project_id: str) -> None:
+    """Health check, two SETs and set_project_context(), then commit."""
+    _run_health_check(conn)
+    configure_pgvector_iterative_scans_sync(conn)
+    cursor = conn.cursor()
+    cursor.execute("SELECT set_project_context(%s)", (project_id,))
+    cursor.close()
+    conn.commit()
+
+
+async def _legacy_acquisition(project_id: str) -> None:
+    """Four round trips on every acquisition (pre-change behavior)."""
+    conn = await _checkout_connection()
+    try:
+        await run_in_db_executor(_legacy_setup, conn, project_id)
+    finally:
+        await _checkin_connection(conn)
+
+
+async def run_cell(
+    mode: str,
+    project_id: str,
+    concurrency: int,
+    repetitions: int,
+) -> dict[str, Any]:
+    """
+    Time one (mode, concurrency) cell.
+
+    Returns:
+        Dict with acquisition latency percentiles and throughput
+    """
+    acquire = _lean_acquisition if mode == "lean" else _legacy_acquisition
+
+    # Warm-up: open pooled connections and apply session settings
+    await asyncio.gather(*[acquire(project_id) for _ in range(concurrency)])
+
+    latencies: list[float] = []
+
+    async def worker(count: int) -> None:
+        for _ in range(count):
+            start = time.perf_counter()
+            await acquire(project_id)
+            latencies.append(time.perf_counter() - start)
+
+    per_worker = max(1, repetitions // concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(per_worker) for _ in range(concurrency)])
+    wall_time = time.perf_counter() - start
+
+    ordered = sorted(latencies)
+    return {
+        "mode": mode,
+        "concurrency": concurrency,
+        "acquisitions": len(ordered),
+        "p50_latency": statistics.median(ordered),
+        "p95_latency": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "throughput": len(ordered) / wall_time,
+    }
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Connection acquisition latency benchmark")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS)
+    parser.add_argument("--mode", choices=["lean", "legacy", "both"], default="both")
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--project", default=DEFAULT_PROJECT_ID)
+    args = parser.parse_args()
+
+    modes = ["legacy", "lean"] if args.mode == "both" else [args.mode]
+
+    await initialize_pool(min_connections=1, max_connections=args.pool_size)
+    set_project_id(args.project)
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            for mode in modes:
+                cell = await run_cell(mode, args.project, concurrency, args.repetitions)
+                results.append(cell)
+                logger.info(
+                    f"concurrency={concurrency:>3} ({mode}): "
+                    f"p50={cell['p50_latency'] * 1000:.2f}ms, "
+                    f"p95={cell['p95_latency'] * 1000:.2f}ms, "
+                    f"throughput={cell['throughput']:.0f}/s"
+                )
+    finally:
+        close_all_connections()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = RESULTS_DIR / f"connection_acquisition_{timestamp}.json"
+    # File I/O off the event loop
+    payload = json.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "pool_size": args.pool_size,
+        "repetitions": args.repetitions,
+        "results": results,
+    }, indent=2)
+    await asyncio.to_thread(results_file.write_text, payload)
+
+    print()
+    print(f"{'concurrency':>12} {'mode':>7} {'p50 ms':>10} {'p95 ms':>10} {'acq/s':>10}")
+    for cell in results:
+        print(
+            f"{cell['concurrency']:>12} {cell['mode']:>7} "
+            f"{cell['p50_latency'] * 1000:>10.2f} {cell['p95_latency'] * 1000:>10.2f} "
+            f"{cell['throughput']:>10.0f}"
+        )
+    print(f"\nResults saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
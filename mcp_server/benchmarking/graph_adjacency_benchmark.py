@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Graph Adjacency Cache Benchmark for query_neighbors() and find_path().
+
+Seeds a synthetic random graph and measures traversal latency at depth 1-5
+with SQL traversals (cache disabled) and with the in-process CSR adjacency
+cache (GRAPH_ADJACENCY_CACHE=true, snapshot loaded during warm-up).
+
+Modes:
+    cte:   query_neighbors as SQL CTE, find_path as bidirectional BFS with
+           one SQL query per level
+    cache: the same calls served from the project's GraphSnapshot
+
+Usage:
+    python -m mcp_server.benchmarking.graph_adjacency_benchmark
+    python -m mcp_server.benchmarking.graph_adjacency_benchmark --nodes 2000 --edges 6000 --depths 1 2 3 --mode both
+
+The synthetic rows are written to the benchmark project and removed again
+when the run finishes.
+
+Output:
+    - JSON results file: mcp_server/benchmarking/results/graph_adjacency_{timestamp}.json
+    - Summary table on stdout
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load environment before imports
+load_dotenv(".env.development")
+
+from mcp_server.db.connection import (  # noqa: E402
+    close_all_connections,
+    get_connection_with_project_context,
+    initialize_pool,
+)
+from mcp_server.db.graph import find_path, query_neighbors  # noqa: E402
+from mcp_server.db.graph_cache import (  # noqa: E402
+    get_graph_cache,
+    invalidate_graph_cache,
+)
+from mcp_server.middleware.context import set_project_id  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULTS_DIR = Path("mcp_server/benchmarking/results")
+
+DEFAULT_NODES = 1000
+DEFAULT_EDGES = 3000
+DEFAULT_DEPTHS = [1, 2, 3, 4, 5]
+DEFAULT_REPETITIONS = 10
+DEFAULT_PROJECT_ID = os.getenv("BENCHMARK_PROJECT_ID", "io")
+
+
+# =============================================================================
+# Synthetic Graph
+# =============================================================================
+
+async def seed_graph(project_id: str, nodes: int, edges: int, seed: int) -> dict[str, Any]:
+    """
+    Insert `nodes` nodes and `edges` random directed edges between them.
+
+    Returns:
+        Dict with node IDs/names for the queries and cleanup
+    """
+    rng = random.Random(seed)
+    run = uuid.uuid4().hex[:8]
+    names = [f"benchadj_{run}_{i}" for i in range(nodes)]
+    node_ids: list[str] = []
+
+    async with get_connection_with_project_context() as conn:
+        cursor = conn.cursor()
+        for name in names:
+            cursor.execute(
+                "INSERT INTO nodes (project_id, label, name, properties) "
+                "VALUES (%s, 'Benchmark', %s, '{}'::jsonb) RETURNING id;",
+                (project_id, name),
+            )
+            node_ids.append(str(cursor.fetchone()["id"]))
+
+        pairs = {(rng.randrange(nodes), rng.randrange(nodes)) for _ in range(edges)}
+        for source, target in pairs:
+            cursor.execute(
+                "INSERT INTO edges (project_id, source_id, target_id, relation, weight, properties) "
+                "VALUES (%s, %s, %s, 'BENCHMARK', %s, '{}'::jsonb) ON CONFLICT DO NOTHING;",
+                (project_id, node_ids[source], node_ids[target], rng.random()),
+            )
+
+    return {"node_ids": node_ids, "names": names}
+
+
+async def drop_graph(seeded: dict[str, Any]) -> None:
+    """Remove the synthetic nodes and edges."""
+    async with get_connection_with_project_context() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "DELETE FROM edges WHERE source_id = ANY(%s::uuid[]) OR target_id = ANY(%s::uuid[]);",
+            (seeded["node_ids"], seeded["node_ids"]),
+        )
+        cursor.execute("DELETE FROM nodes WHERE id = ANY(%s::uuid[]);", (seeded["node_ids"],))
+
+
+# =============================================================================
+# Measurement
+# =============================================================================
+
+def _percentiles(latencies: list[float]) -> tuple[float, float]:
+    ordered = sorted(latencies)
+    return statistics.median(ordered), ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+async def run_cell(
+    mode: str,
+    seeded: dict[str, Any],
+    depth: int,
+    repetitions: int,
+    seed: int,
+) -> dict[str, Any]:
+    """
+    Time query_neighbors and find_path at one depth in one mode.
+
+    Returns:
+        Dict with p50/p95 per operation and the result sizes of the last run
+    """
+    os.environ["GRAPH_ADJACENCY_CACHE"] = "true" if mode == "cache" else "false"
+    rng = random.Random(seed)
+    starts = [rng.randrange(len(seeded["node_ids"])) for _ in range(repetitions)]
+    ends = [rng.randrange(len(seeded["node_ids"])) for _ in range(repetitions)]
+
+    # Warm-up: plan caches, pooled connections and (cache mode) the snapshot load
+    await query_neighbors(seeded["node_ids"][starts[0]], max_depth=depth)
+
+    neighbor_latencies: list[float] = []
+    path_latencies: list[float] = []
+    neighbors: list[dict] = []
+    path: dict[str, Any] = {}
+    for start, end in zip(starts, ends, strict=True):
+        t0 = time.perf_counter()
+        neighbors = await query_neighbors(seeded["node_ids"][start], max_depth=depth)
+        neighbor_latencies.append(time.perf_counter() - t0)
+
+        t0 = time.perf_counter()
+        path = await find_path(seeded["names"][start], seeded["names"][end], max_depth=depth)
+        path_latencies.append(time.perf_counter() - t0)
+
+    neighbors_p50, neighbors_p95 = _percentiles(neighbor_latencies)
+    path_p50, path_p95 = _percentiles(path_latencies)
+    return {
+        "mode": mode,
+        "depth": depth,
+        "neighbors_p50": neighbors_p50,
+        "neighbors_p95": neighbors_p95,
+        "find_path_p50": path_p50,
+        "find_path_p95": path_p95,
+        "neighbors": len(neighbors),
+        "path_found": bool(path.get("path_found")),
+    }
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Graph adjacency cache benchmark")
+    parser.add_argument("--nodes", type=int, default=DEFAULT_NODES)
+    parser.add_argument("--edges", type=int, default=DEFAULT_EDGES)
+    parser.add_argument("--depths", type=int, nargs="+", default=DEFAULT_DEPTHS)
+    parser.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS)
+    parser.add_argument("--mode", choices=["cte", "cache", "both"], default="both")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--project", default=DEFAULT_PROJECT_ID)
+    args = parser.parse_args()
+
+    modes = ["cte", "cache"] if args.mode == "both" else [args.mode]
+
+    await initialize_pool(min_connections=1, max_connections=args.pool_size)
+    set_project_id(args.project)
+
+    results = []
+    seeded = await seed_graph(args.project, args.nodes, args.edges, args.seed)
+    invalidate_graph_cache(args.project)
+    try:
+        for depth in args.depths:
+            for mode in modes:
+                cell = await run_cell(mode, seeded, depth, args.repetitions, args.seed)
+                results.append(cell)
+                logger.info(
+                    f"depth={depth} ({mode}): "
+                    f"neighbors p50={cell['neighbors_p50'] * 1000:.1f}ms, "
+                    f"find_path p50={cell['find_path_p50'] * 1000:.1f}ms, "
+                    f"neighbors={cell['neighbors']}"
+                )
+    finally:
+        await drop_graph(seeded)
+        invalidate_graph_cache(args.project)
+        close_all_connections()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = RESULTS_DIR / f"graph_adjacency_{timestamp}.json"
+    # File I/O off the event loop
+    payload = json.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "nodes": args.nodes,
+        "edges": args.edges,
+        "repetitions": args.repetitions,
+        "cache_stats": get_graph_cache().get_stats(),
+        "results": results,
+    }, indent=2)
+    await asyncio.to_thread(results_file.write_text, payload)
+
+    print()
+    print(
+        f"{'depth':>6} {'mode':>6} {'nbr p50 ms':>11} {'nbr p95 ms':>11} "
+        f"{'path p50 ms':>12} {'path p95 ms':>12} {'neighbors':>10}"
+    )
+    for cell in results:
+        print(
+            f"{cell['depth']:>6} {cell['mode']:>6} "
+            f"{cell['neighbors_p50'] * 1000:>11.1f} {cell['neighbors_p95'] * 1000:>11.1f} "
+            f"{cell['find_path_p50'] * 1000:>12.1f} {cell['find_path_p95'] * 1000:>12.1f} "
+            f"{cell['neighbors']:>10}"
+        )
+    print(f"\nResults saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Graph Channel Benchmark for the set-based hybrid_search graph path.
+
+Seeds a synthetic graph (entity nodes, each with N neighbor nodes backed by
+an L2 insight) and measures graph_search latency while scaling the number of
+entities in the query and neighbors per entity. The set-based path resolves
+entities -> nodes -> neighbors -> insights in one query; the legacy path
+replays the previous per-entity / per-neighbor / per-insight lookups, each
+on its own pooled connection.
+
+Modes:
+    set:    graph_search as shipped (one query on the channel connection)
+    legacy: get_node_by_name + query_neighbors + get_node_by_name per neighbor
+            + one l2_insights SELECT per vector_id (pre-change behavior)
+
+Usage:
+    python -m mcp_server.benchmarking.graph_channel_benchmark
+    python -m mcp_server.benchmarking.graph_channel_benchmark --entities 1 4 8 --neighbors 5 20 50 --mode both
+
+The synthetic rows are written to the benchmark project and removed again
+when the run finishes.
+
+Output:
+    - JSON results file: mcp_server/benchmarking/results/graph_channel_{timestamp}.json
+    - Summary table on stdout
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import statistics
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+# Load environment before imports
+load_dotenv(".env.development")
+
+from mcp_server.db.connection import (  # noqa: E402
+    close_all_connections,
+    get_connection_with_project_context,
+    initialize_pool,
+)
+from mcp_server.db.graph import get_node_by_name, query_neighbors  # noqa: E402
+from mcp_server.middleware.context import set_project_id  # noqa: E402
+from mcp_server.tools import graph_search  # noqa: E402
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+RESULTS_DIR = Path("mcp_server/benchmarking/results")
+
+DEFAULT_ENTITY_COUNTS = [1, 4, 8]
+DEFAULT_NEIGHBOR_COUNTS = [5, 20, 50]
+DEFAULT_REPETITIONS = 10
+DEFAULT_PROJECT_ID = os.getenv("BENCHMARK_PROJECT_ID", "io")
+
+# Embedding content is irrelevant for the graph channel
+_ZERO_EMBEDDING = "[" + ",".join(["0"] * 1536) + "]"
+
+
+# =============================================================================
+# Synthetic Graph
+# =============================================================================
+
+async def seed_graph(project_id: str, entities: int, neighbors: int) -> dict[str, Any]:
+    """
+    Insert `entities` entity nodes, each linked to `neighbors` insight-backed nodes.
+
+    Returns:
+        Dict with the query text plus node/insight IDs for cleanup
+    """
+    run = uuid.uuid4().hex[:8]
+    entity_names = [f"Benchgraph{run}E{e}" for e in range(entities)]
+    node_ids: list[str] = []
+    insight_ids: list[int] = []
+
+    async with get_connection_with_project_context() as conn:
+        cursor = conn.cursor()
+        for e, entity_name in enumerate(entity_names):
+            cursor.execute(
+                "INSERT INTO nodes (project_id, label, name, properties) "
+                "VALUES (%s, 'Benchmark', %s, '{}'::jsonb) RETURNING id;",
+                (project_id, entity_name),
+            )
+            entity_id = cursor.fetchone()["id"]
+            node_ids.append(str(entity_id))
+
+            for n in range(neighbors):
+                cursor.execute(
+                    "INSERT INTO l2_insights (project_id, content, embedding, source_ids, metadata) "
+                    "VALUES (%s, %s, %s::vector, ARRAY[]::integer[], '{}'::jsonb) RETURNING id;",
+                    (project_id, f"graph benchmark insight {run} {e}/{n}", _ZERO_EMBEDDING),
+                )
+                insight_id = cursor.fetchone()["id"]
+                insight_ids.append(insight_id)
+
+                cursor.execute(
+                    "INSERT INTO nodes (project_id, label, name, properties, vector_id) "
+                    "VALUES (%s, 'Benchmark', %s, '{}'::jsonb, %s) RETURNING id;",
+                    (project_id, f"benchgraph_{run}_{e}_{n}", insight_id),
+                )
+                neighbor_id = cursor.fetchone()["id"]
+                node_ids.append(str(neighbor_id))
+
+                cursor.execute(
+                    "INSERT INTO edges (project_id, source_id, target_id, relation, weight, properties) "
+                    "VALUES (%s, %s, %s, 'BENCHMARK', %s, '{}'::jsonb);",
+                    (project_id, entity_id, neighbor_id, 1.0 - n / (neighbors + 1)),
+                )
+
+    return {
+        "query_text": " ".join(entity_names),
+        "node_ids": node_ids,
+        "insight_ids": insight_ids,
+    }
+
+
+async def drop_graph(seeded: dict[str, Any]) -> None:
+    """Remove the synthetic nodes, edges and insights of one seed."""
+    async with get_connection_with_project_context() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "DELETE FROM edges WHERE source_id = ANY(%s::uuid[]) OR target_id = ANY(%s::uuid[]);",
+            (seeded["node_ids"], seeded["node_ids"]),
+        )
+        cursor.execute("DELETE FROM nodes WHERE id = ANY(%s::uuid[]);", (seeded["node_ids"],))
+        cursor.execute("DELETE FROM l2_insights WHERE id = ANY(%s);", (seeded["insight_ids"],))
+
+
+# =============================================================================
+# Graph Channel Variants
+# =============================================================================
+
+async def _set_based_channel(query_text: str, top_k: int) -> list[dict]:
+    """graph_search as shipped: one set-based query on the channel connection."""
+    async with get_connection_with_project_context(read_only=True) as conn:
+        return await graph_search(query_text, top_k, conn)
+
+
+async def _legacy_channel(query_text: str, top_k: int) -> list[dict]:
+    """Per-entity / per-neighbor / per-insight lookups (pre-change behavior)."""
+    from mcp_server.tools import extract_entities_from_query
+
+    results: list[dict] = []
+    seen_ids: set[int] = set()
+
+    async with get_connection_with_project_context(read_only=True) as conn:
+        for entity in extract_entities_from_query(query_text):
+            node = await get_node_by_name(entity)
+            if not node:
+                continue
+            for neighbor in await query_neighbors(node["id"], relation_type=None, max_depth=1):
+                neighbor_node = await get_node_by_name(neighbor["name"])
+                vector_id = neighbor_node["vector_id"] if neighbor_node else None
+                if not vector_id or vector_id in seen_ids:
+                    continue
+                seen_ids.add(vector_id)
+
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT id, content FROM l2_insights WHERE id = %s "
+                    "AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[]);",
+                    (vector_id,),
+                )
+                insight = cursor.fetchone()
+                if insight:
+                    results.append({"id": insight["id"], "graph_score": neighbor["weight"]})
+
+    results.sort(key=lambda x: x["graph_score"], reverse=True)
+    return results[:top_k]
+
+
+async def run_cell(
+    mode: str,
+    query_text: str,
+    top_k: int,
+    repetitions: int,
+) -> dict[str, Any]:
+    """
+    Time one (mode, entities, neighbors) cell.
+
+    Returns:
+        Dict with latency percentiles and the result count of the last run
+    """
+    channel = _set_based_channel if mode == "set" else _legacy_channel
+
+    # Warm-up: plan caches and pooled connections
+    await channel(query_text, top_k)
+
+    latencies: list[float] = []
+    results: list[dict] = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        results = await channel(query_text, top_k)
+        latencies.append(time.perf_counter() - start)
+
+    ordered = sorted(latencies)
+    return {
+        "mode": mode,
+        "p50_latency": statistics.median(ordered),
+        "p95_latency": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        "results": len(results),
+    }
+
+
+# =============================================================================
+# Main
+# =============================================================================
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="hybrid_search graph channel benchmark")
+    parser.add_argument("--entities", type=int, nargs="+", default=DEFAULT_ENTITY_COUNTS)
+    parser.add_argument("--neighbors", type=int, nargs="+", default=DEFAULT_NEIGHBOR_COUNTS)
+    parser.add_argument("--repetitions", type=int, default=DEFAULT_REPETITIONS)
+    parser.add_argument("--mode", choices=["set", "legacy", "both"], default="both")
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--project", default=DEFAULT_PROJECT_ID)
+    args = parser.parse_args()
+
+    modes = ["set", "legacy"] if args.mode == "both" else [args.mode]
+
+    await initialize_pool(min_connections=1, max_connections=args.pool_size)
+    set_project_id(args.project)
+
+    results = []
+    try:
+        for entities in args.entities:
+            for neighbors in args.neighbors:
+                seeded = await seed_graph(args.project, entities, neighbors)
+                # top_k large enough to return every seeded insight
+                top_k = entities * neighbors
+                try:
+                    for mode in modes:
+                        cell = await run_cell(mode, seeded["query_text"], top_k, args.repetitions)
+                        cell.update({"entities": entities, "neighbors": neighbors})
+                        results.append(cell)
+                        logger.info(
+                            f"{entities:>3} entities x {neighbors:>3} neighbors ({mode}): "
+                            f"p50={cell['p50_latency'] * 1000:.1f}ms, "
+                            f"p95={cell['p95_latency'] * 1000:.1f}ms, results={cell['results']}"
+                        )
+                finally:
+                    await drop_graph(seeded)
+    finally:
+        close_all_connections()
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = RESULTS_DIR / f"graph_channel_{timestamp}.json"
+    # File I/O off the event loop
+    payload = json.dumps({
+        "timestamp": datetime.now().isoformat(),
+        "pool_size": args.pool_size,
+        "repetitions": args.repetitions,
+        "results": results,
+    }, indent=2)
+    await asyncio.to_thread(results_file.write_text, payload)
+
+    print()
+    print(f"{'entities':>9} {'neighbors':>10} {'mode':>7} {'p50 ms':>10} {'p95 ms':>10} {'results':>8}")
+    for cell in results:
+        print(
+            f"{cell['entities']:>9} {cell['neighbors']:>10} {cell['mode']:>7} "
+            f"{cell['p50_latency'] * 1000:>10.1f} {cell['p95_latency'] * 1000:>10.1f} "
+            f"{cell['results']:>8}"
+        )
+    print(f"\nResults saved to: {results_file}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,17 +8,30 @@ Story 11.4.2: Adds RLS context integration with get_connection_with_project_cont
 Story 11.6.1: Adds pgvector 0.8.0 iterative scan configuration.
 Tech-Debt SSL Fix: Adds TCP keep-alive and periodic connection validation to prevent
                   SSL timeout errors after idle periods (>30 seconds).
+Async Pool Backend: Blocking psycopg2 work (checkout, health check, RLS setup,
+                  commit/rollback, checkin) of the async context managers runs on a
+                  dedicated DB executor so concurrent tool calls overlap instead of
+                  stalling the event loop. Use run_in_db_executor() for heavy queries.
+Lean Acquisition: The SELECT 1 health check only runs for connections idle longer
+                  than DB_HEALTH_CHECK_IDLE_SECONDS, pgvector session settings are
+                  applied once per physical connection, and the RLS setup is a single
+                  statement, so a warm acquisition costs one round trip instead of four.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import logging
 import os
 import threading
 import time
-from collections.abc import AsyncIterator, Iterator
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
+from typing import Any, TypeVar
 
 import psycopg2
 from psycopg2 import pool
@@ -49,6 +62,36 @@ _logger = logging.getLogger(__name__)
 _pool_validator_thread: threading.Thread | None = None
 _pool_validator_stop_event = threading.Event()
 
+# Async Pool Backend: SimpleConnectionPool is not thread-safe, so every
+# getconn/putconn goes through this lock (event loop, DB executor, validator).
+_pool_lock = threading.RLock()
+
+# Dedicated executor for blocking psycopg2 calls issued from async code.
+# Created by initialize_pool(); falls back to the loop's default executor.
+_db_executor: ThreadPoolExecutor | None = None
+
+# Extra executor workers on top of max_connections for checkout/checkin work
+_DB_EXECUTOR_EXTRA_WORKERS = 4
+
+# Lean Acquisition: connections returned to the pool less than this many seconds
+# ago skip the SELECT 1 health check (0 = check on every acquisition). Stays below
+# the ~30s idle period after which SSL connections were seen to drop.
+_HEALTH_CHECK_IDLE_SECONDS = float(os.getenv("DB_HEALTH_CHECK_IDLE_SECONDS", "20"))
+
+# Per physical connection (guarded by _pool_lock): monotonic time of the last
+# checkin, and whether the pgvector session settings are already in effect.
+# Connections never checked in are unknown and always get a health check.
+_last_checkin: weakref.WeakKeyDictionary[connection, float] = weakref.WeakKeyDictionary()
+_session_configured: weakref.WeakKeyDictionary[connection, bool] = weakref.WeakKeyDictionary()
+
+# Story 11.6.1: pgvector iterative scan settings (session level)
+_PGVECTOR_SESSION_SETTINGS = (
+    ("hnsw.iterative_scan", "relaxed_order"),
+    ("hnsw.max_scan_tuples", "20000"),
+)
+
+_T = TypeVar("_T")
+
 
 async def initialize_pool(
     min_connections: int = 1,
@@ -80,7 +123,7 @@ async def initialize_pool(
     Raises:
         PoolError: If pool initialization fails
     """
-    global _connection_pool, _pool_validator_thread, _pool_validator_stop_event
+    global _connection_pool, _pool_validator_thread, _pool_validator_stop_event, _db_executor
 
     if _connection_pool is not None:
         _logger.warning("Connection pool already initialized")
@@ -121,6 +164,14 @@ async def initialize_pool(
             f"Connection pool initialized: min={min_connections}, max={max_connections}"
         )
 
+        # Async Pool Backend: one worker per pooled connection plus headroom
+        # for checkout/checkin, so blocking DB work never runs on the event loop
+        if _db_executor is None:
+            _db_executor = ThreadPoolExecutor(
+                max_workers=max_connections + _DB_EXECUTOR_EXTRA_WORKERS,
+                thread_name_prefix="db-executor",
+            )
+
         # Test initial connection
         async with get_connection() as conn:
             cursor = conn.cursor()
@@ -164,6 +215,176 @@ def _is_transient_error(error: Exception) -> bool:
     return any(pattern.lower() in error_str for pattern in _TRANSIENT_ERROR_PATTERNS)
 
 
+def _pool_getconn() -> connection:
+    """Check out a connection from the pool (thread-safe)."""
+    if _connection_pool is None:
+        raise PoolError("Connection pool not initialized. Call initialize_pool() first.")
+    with _pool_lock:
+        return _connection_pool.getconn()
+
+
+def _pool_putconn(conn: connection, close: bool = False) -> None:
+    """Return a connection to the pool (thread-safe), optionally discarding it."""
+    if _connection_pool is None:
+        return
+    with _pool_lock:
+        if close:
+            _last_checkin.pop(conn, None)
+            _session_configured.pop(conn, None)
+            _connection_pool.putconn(conn, close=True)
+        else:
+            _last_checkin[conn] = time.monotonic()
+            _connection_pool.putconn(conn)
+
+
+def _health_check_due(conn: connection) -> bool:
+    """True if conn is unknown or has been idle in the pool past the threshold."""
+    with _pool_lock:
+        last_checkin = _last_checkin.get(conn)
+    return last_checkin is None or time.monotonic() - last_checkin >= _HEALTH_CHECK_IDLE_SECONDS
+
+
+def _forget_session_settings(conn: connection) -> None:
+    """Mark conn's session settings as lost (the transaction that set them rolled back)."""
+    with _pool_lock:
+        _session_configured.pop(conn, None)
+
+
+def _run_health_check(conn: connection) -> None:
+    """
+    Verify a freshly checked-out connection is alive.
+
+    Raises:
+        ConnectionHealthError: If the health check returns an unexpected result
+        psycopg2.Error: If the connection is broken
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT 1 as health_check")
+    result = cursor.fetchone()
+    if result["health_check"] != 1:
+        raise ConnectionHealthError("Connection health check failed")
+    cursor.close()
+
+
+def _apply_project_context(conn: connection, project_id: str) -> None:
+    """
+    Set the RLS project context on a connection in one statement.
+
+    On the first use of a physical connection the pgvector session settings
+    (Story 11.6.1) are applied by the same SELECT via set_config(); later
+    acquisitions only call set_project_context(). If the settings are
+    rejected (pgvector < 0.8.0), the transaction is rolled back and the
+    context is set without them, as configure_pgvector_iterative_scans_sync()
+    does.
+
+    Raises:
+        psycopg2.Error: If set_project_context() fails
+    """
+    with _pool_lock:
+        configured = conn in _session_configured
+
+    # Call set_project_context() which sets all session variables
+    # This is defined in migration 034_rls_helper_functions.sql
+    cursor = conn.cursor()
+    try:
+        if configured:
+            cursor.execute("SELECT set_project_context(%s)", (project_id,))
+            return
+
+        settings = ", ".join(
+            f"set_config('{name}', '{value}', false)" for name, value in _PGVECTOR_SESSION_SETTINGS
+        )
+        try:
+            cursor.execute(f"SELECT {settings}, set_project_context(%s)", (project_id,))
+        except psycopg2.Error as e:
+            if _is_transient_error(e):
+                raise
+            conn.rollback()
+            _logger.warning(
+                f"Failed to configure pgvector iterative scans (pgvector may not be 0.8.0+): {e}"
+            )
+            cursor.execute("SELECT set_project_context(%s)", (project_id,))
+
+        # Session-level set_config() persists once this transaction commits
+        with _pool_lock:
+            _session_configured[conn] = True
+    finally:
+        cursor.close()
+
+
+def _prepare_connection(conn: connection, project_id: str) -> None:
+    """
+    Lean acquisition: health check only after idle periods, then the RLS setup.
+
+    Raises:
+        ConnectionHealthError: If the health check fails (message keeps the cause
+            so _is_transient_error() still recognizes dropped connections)
+        psycopg2.Error: If setting the RLS context fails
+    """
+    if _health_check_due(conn):
+        try:
+            _run_health_check(conn)
+        except ConnectionHealthError:
+            raise
+        except psycopg2.Error as e:
+            raise ConnectionHealthError(f"Connection health check failed: {e}") from e
+
+    _apply_project_context(conn, project_id)
+
+
+async def run_in_db_executor(func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+    """
+    Run a blocking database callable on the DB executor.
+
+    Async Pool Backend: psycopg2 is a blocking driver. Running cursor work
+    through this helper keeps the event loop free, so a slow pgvector scan
+    in one tool call no longer stalls every other concurrent request.
+
+    The caller's contextvars (project context, request metadata) are copied
+    into the worker thread so RLS-aware helpers behave exactly as on the loop.
+
+    Args:
+        func: Blocking callable, e.g. a search function taking a connection
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Whatever func returns
+
+    Example:
+        async with get_connection_with_project_context(read_only=True) as conn:
+            rows = await run_in_db_executor(semantic_search, embedding, 5, conn)
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_db_executor, call)
+
+
+async def _checkout_connection() -> connection:
+    """
+    Check out a pooled connection without blocking the event loop.
+
+    If the awaiting task is cancelled while the checkout is in flight, the
+    connection is handed back to the pool as soon as the worker finishes.
+    """
+    future = asyncio.ensure_future(run_in_db_executor(_pool_getconn))
+    try:
+        return await asyncio.shield(future)
+    except asyncio.CancelledError:
+        def _return_orphan(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.exception() is None:
+                _pool_putconn(done.result())
+
+        future.add_done_callback(_return_orphan)
+        raise
+
+
+async def _checkin_connection(conn: connection, close: bool = False) -> None:
+    """Return a connection to the pool off-loop; shielded against cancellation."""
+    await asyncio.shield(run_in_db_executor(_pool_putconn, conn, close))
+
+
 def _pool_validator_loop(interval_seconds: int = 20) -> None:
     """
     Background thread loop to periodically validate connections in the pool.
@@ -194,7 +415,7 @@ def _pool_validator_loop(interval_seconds: int = 20) -> None:
             # Get a connection and validate it
             # This keeps the connection alive and detects stale connections
             try:
-                conn = _connection_pool.getconn()
+                conn = _pool_getconn()
                 try:
                     cursor = conn.cursor()
                     cursor.execute("SELECT 1 as pool_validator")
@@ -205,20 +426,20 @@ def _pool_validator_loop(interval_seconds: int = 20) -> None:
                     else:
                         logger.warning("Pool validator: unexpected health check result")
                         # Close this connection, don't return to pool
-                        _connection_pool.putconn(conn, close=True)
+                        _pool_putconn(conn, close=True)
                         conn = None
                 except (psycopg2.Error, Exception) as e:
                     logger.warning(f"Pool validator: connection health check failed: {e}")
                     # Close this connection, don't return to pool
                     try:
-                        _connection_pool.putconn(conn, close=True)
+                        _pool_putconn(conn, close=True)
                     except Exception:
                         pass
                     conn = None
                 finally:
                     # Return healthy connection to pool
                     if conn is not None:
-                        _connection_pool.putconn(conn)
+                        _pool_putconn(conn)
 
             except pool.PoolError as e:
                 logger.warning(f"Pool validator: pool error (may be exhausted or closed): {e}")
@@ -250,6 +471,7 @@ async def configure_pgvector_iterative_scans(conn: connection) -> None:
       stopping (prevents runaway queries)
 
     Called once per connection at acquisition in get_connection_with_project_context().
+    Failures are logged and ignored (see configure_pgvector_iterative_scans_sync).
 
     Args:
         conn: PostgreSQL connection object
@@ -257,25 +479,8 @@ async def configure_pgvector_iterative_scans(conn: connection) -> None:
     Reference:
         https://github.com/pgvector/pgvector#iterative-scan
     """
-    logger = logging.getLogger(__name__)
-    try:
-        # Use cursor for proper psycopg2 connection handling
-        cursor = conn.cursor()
-        try:
-            # Enable iterative scan with relaxed ordering
-            cursor.execute("SET hnsw.iterative_scan = 'relaxed_order'")
-            # Set maximum tuples to scan (prevents runaway queries)
-            cursor.execute("SET hnsw.max_scan_tuples = 20000")
-            logger.debug(
-                "pgvector iterative scans configured: relaxed_order, max_scan_tuples=20000"
-            )
-        finally:
-            cursor.close()
-    except Exception as e:
-        logger.warning(
-            f"Failed to configure pgvector iterative scans (pgvector may not be 0.8.0+): {e}"
-        )
-        # Non-fatal: continue without iterative scan optimization
+    # Async Pool Backend: the SETs are blocking psycopg2 calls, run them off-loop
+    await run_in_db_executor(configure_pgvector_iterative_scans_sync, conn)
 
 
 def configure_pgvector_iterative_scans_sync(conn: connection) -> None:
@@ -342,21 +547,17 @@ async def get_connection(max_retries: int = 3, retry_delay: float = 0.5) -> Asyn
     for attempt in range(max_retries + 1):
         try:
             # Get connection from pool
-            conn = _connection_pool.getconn()
+            conn = await _checkout_connection()
 
-            # Health check: verify connection is alive
+            # Health check: verify connection is alive (skipped if recently used)
             try:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1 as health_check")
-                result = cursor.fetchone()
-                if result["health_check"] != 1:
-                    raise ConnectionHealthError("Connection health check failed")
-                cursor.close()
+                if _health_check_due(conn):
+                    await run_in_db_executor(_run_health_check, conn)
             except (psycopg2.Error, Exception) as e:
                 _logger.warning(f"Connection health check failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
                 # Discard bad connection
                 try:
-                    _connection_pool.putconn(conn, close=True)
+                    await _checkin_connection(conn, close=True)
                 except Exception:
                     pass
                 conn = None
@@ -380,7 +581,7 @@ async def get_connection(max_retries: int = 3, retry_delay: float = 0.5) -> Asyn
             if _is_transient_error(e) and attempt < max_retries:
                 _logger.warning(f"Transient database error (attempt {attempt + 1}/{max_retries + 1}): {e}")
                 _logger.info(f"Retrying in {current_delay:.1f}s...")
-                time.sleep(current_delay)
+                await asyncio.sleep(current_delay)
                 current_delay *= 2
                 last_error = e
                 continue
@@ -388,7 +589,7 @@ async def get_connection(max_retries: int = 3, retry_delay: float = 0.5) -> Asyn
         except pool.PoolError as e:
             if attempt < max_retries:
                 _logger.warning(f"Pool error (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                time.sleep(current_delay)
+                await asyncio.sleep(current_delay)
                 current_delay *= 2
                 last_error = e
                 continue
@@ -398,7 +599,7 @@ async def get_connection(max_retries: int = 3, retry_delay: float = 0.5) -> Asyn
             # Always return connection to pool if it was successfully acquired
             if conn is not None:
                 try:
-                    _connection_pool.putconn(conn)
+                    await _checkin_connection(conn)
                     _logger.debug("Database connection returned to pool")
                 except Exception as e:
                     _logger.error(f"Error returning connection to pool: {e}")
@@ -443,21 +644,17 @@ def get_connection_sync(max_retries: int = 3, retry_delay: float = 0.5) -> Itera
     for attempt in range(max_retries + 1):
         try:
             # Get connection from pool
-            conn = _connection_pool.getconn()
+            conn = _pool_getconn()
 
-            # Health check: verify connection is alive
+            # Health check: verify connection is alive (skipped if recently used)
             try:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1 as health_check")
-                result = cursor.fetchone()
-                if result["health_check"] != 1:
-                    raise ConnectionHealthError("Connection health check failed")
-                cursor.close()
+                if _health_check_due(conn):
+                    _run_health_check(conn)
             except (psycopg2.Error, Exception) as e:
                 _logger.warning(f"Connection health check failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
                 # Discard bad connection
                 try:
-                    _connection_pool.putconn(conn, close=True)
+                    _pool_putconn(conn, close=True)
                 except Exception:
                     pass
                 conn = None
@@ -499,7 +696,7 @@ def get_connection_sync(max_retries: int = 3, retry_delay: float = 0.5) -> Itera
             # Always return connection to pool if it was successfully acquired
             if conn is not None:
                 try:
-                    _connection_pool.putconn(conn)
+                    _pool_putconn(conn)
                     _logger.debug("Database connection returned to pool (sync)")
                 except Exception as e:
                     _logger.error(f"Error returning connection to pool: {e}")
@@ -578,21 +775,21 @@ async def get_connection_with_project_context(
     for attempt in range(max_retries + 1):
         try:
             # Get connection from pool
-            conn = _connection_pool.getconn()
+            conn = await _checkout_connection()
 
-            # Health check: verify connection is alive
+            # Lean Acquisition: health check (only after idle periods), pgvector
+            # session settings (first use only) and set_project_context() in one
+            # executor hop. SET LOCAL (used by set_project_context) starts the
+            # explicit transaction that is committed or rolled back below.
             try:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1 as health_check")
-                result = cursor.fetchone()
-                if result["health_check"] != 1:
-                    raise ConnectionHealthError("Connection health check failed")
-                cursor.close()
-            except (psycopg2.Error, Exception) as e:
-                _logger.warning(f"Connection health check failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                # Discard bad connection
+                await run_in_db_executor(_prepare_connection, conn, project_id)
+            except (psycopg2.Error, ConnectionHealthError) as e:
+                _logger.warning(f"Connection setup failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+
+                # Discard the connection: a recently used connection skips the
+                # health check, so a dropped connection surfaces here as well
                 try:
-                    _connection_pool.putconn(conn, close=True)
+                    await _checkin_connection(conn, close=True)
                 except Exception:
                     pass
                 conn = None
@@ -605,25 +802,16 @@ async def get_connection_with_project_context(
                     last_error = e
                     continue
 
-                raise ConnectionHealthError(f"Connection health check failed: {e}") from e
+                if isinstance(e, ConnectionHealthError):
+                    raise
 
-            # CRITICAL: Set RLS context with appropriate transaction scoping
-            # Both read-only and write modes use explicit transaction because
-            # SET LOCAL (used by set_project_context) requires transaction context
-            try:
-                # Story 11.6.1: Configure pgvector iterative scans before transaction
-                await configure_pgvector_iterative_scans(conn)
+                _logger.error(f"Failed to set RLS context for project {project_id}: {e}")
+                raise RLSContextError(f"Failed to set RLS context: {e}") from e
 
+            try:
                 # Use explicit transaction for all operations
-                # psycopg2 uses connection as context manager for transactions
                 # (commits on success, rollbacks on exception)
-                cursor = conn.cursor()
                 try:
-                    # Call set_project_context() which sets all session variables
-                    # This is defined in migration 034_rls_helper_functions.sql
-                    cursor.execute("SELECT set_project_context(%s)", (project_id,))
-                    cursor.close()
-
                     _logger.debug(
                         f"RLS context set for project_id={project_id} "
                         f"(transaction started, context active)"
@@ -633,10 +821,13 @@ async def get_connection_with_project_context(
                     yield conn
 
                     # Commit on successful completion
-                    conn.commit()
-                except Exception:
-                    # Rollback on any exception
-                    conn.rollback()
+                    await run_in_db_executor(conn.commit)
+                except BaseException as e:
+                    # Rollback on any exception (also undoes first-use session settings);
+                    # a cancelled caller is rolled back by putconn on checkin
+                    _forget_session_settings(conn)
+                    if isinstance(e, Exception):
+                        await run_in_db_executor(conn.rollback)
                     raise
 
             except psycopg2.Error as e:
@@ -651,7 +842,7 @@ async def get_connection_with_project_context(
             if _is_transient_error(e) and attempt < max_retries:
                 _logger.warning(f"Transient database error (attempt {attempt + 1}/{max_retries + 1}): {e}")
                 _logger.info(f"Retrying in {current_delay:.1f}s...")
-                time.sleep(current_delay)
+                await asyncio.sleep(current_delay)
                 current_delay *= 2
                 last_error = e
                 continue
@@ -659,7 +850,7 @@ async def get_connection_with_project_context(
         except pool.PoolError as e:
             if attempt < max_retries:
                 _logger.warning(f"Pool error (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                time.sleep(current_delay)
+                await asyncio.sleep(current_delay)
                 current_delay *= 2
                 last_error = e
                 continue
@@ -669,7 +860,7 @@ async def get_connection_with_project_context(
             # Always return connection to pool if it was successfully acquired
             if conn is not None:
                 try:
-                    _connection_pool.putconn(conn)
+                    await _checkin_connection(conn)
                     _logger.debug("Database connection returned to pool")
                 except Exception as e:
                     _logger.error(f"Error returning connection to pool: {e}")
@@ -744,21 +935,21 @@ def get_connection_with_project_context_sync(
     for attempt in range(max_retries + 1):
         try:
             # Get connection from pool
-            conn = _connection_pool.getconn()
+            conn = _pool_getconn()
 
-            # Health check: verify connection is alive
+            # Lean Acquisition: health check (only after idle periods), pgvector
+            # session settings (first use only) and set_project_context().
+            # SET LOCAL (used by set_project_context) starts the explicit
+            # transaction that `with conn` commits or rolls back below.
             try:
-                cursor = conn.cursor()
-                cursor.execute("SELECT 1 as health_check")
-                result = cursor.fetchone()
-                if result["health_check"] != 1:
-                    raise ConnectionHealthError("Connection health check failed")
-                cursor.close()
-            except (psycopg2.Error, Exception) as e:
-                _logger.warning(f"Connection health check failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
-                # Discard bad connection
+                _prepare_connection(conn, project_id)
+            except (psycopg2.Error, ConnectionHealthError) as e:
+                _logger.warning(f"Connection setup failed (attempt {attempt + 1}/{max_retries + 1}): {e}")
+
+                # Discard the connection: a recently used connection skips the
+                # health check, so a dropped connection surfaces here as well
                 try:
-                    _connection_pool.putconn(conn, close=True)
+                    _pool_putconn(conn, close=True)
                 except Exception:
                     pass
                 conn = None
@@ -771,29 +962,27 @@ def get_connection_with_project_context_sync(
                     last_error = e
                     continue
 
-                raise ConnectionHealthError(f"Connection health check failed: {e}") from e
+                if isinstance(e, ConnectionHealthError):
+                    raise
 
-            # CRITICAL: Set RLS context with appropriate transaction scoping
-            # Both read-only and write modes use explicit transaction because
-            # SET LOCAL (used by set_project_context) requires transaction context
-            try:
-                # Story 11.6.1: Configure pgvector iterative scans before transaction
-                configure_pgvector_iterative_scans_sync(conn)
+                _logger.error(f"Failed to set RLS context for project {project_id}: {e}")
+                raise RLSContextError(f"Failed to set RLS context: {e}") from e
 
+            try:
                 # Use explicit transaction for all operations
                 with conn:
-                    cursor = conn.cursor()
-                    # Call set_project_context() which sets all session variables
-                    cursor.execute("SELECT set_project_context(%s)", (project_id,))
-                    cursor.close()
-
-                    _logger.debug(
-                        f"RLS context set for project_id={project_id} "
-                        f"(transaction started, context active)"
-                    )
-
-                    # Yield connection with active transaction and RLS context
-                    yield conn
+                    try:
+                        _logger.debug(
+                            f"RLS context set for project_id={project_id} "
+                            f"(transaction started, context active)"
+                        )
+
+                        # Yield connection with active transaction and RLS context
+                        yield conn
+                    except BaseException:
+                        # `with conn` rolls back, undoing first-use session settings
+                        _forget_session_settings(conn)
+                        raise
 
             except psycopg2.Error as e:
                 _logger.error(f"Failed to set RLS context for project {project_id}: {e}")
@@ -825,7 +1014,7 @@ def get_connection_with_project_context_sync(
             # Always return connection to pool if it was successfully acquired
             if conn is not None:
                 try:
-                    _connection_pool.putconn(conn)
+                    _pool_putconn(conn)
                     _logger.debug("Database connection returned to pool (sync)")
                 except Exception as e:
                     _logger.error(f"Error returning connection to pool: {e}")
@@ -844,7 +1033,7 @@ def close_all_connections(timeout: int = 10) -> None:
     Args:
         timeout: Maximum time in seconds to wait for connections to close
     """
-    global _connection_pool, _pool_validator_thread, _pool_validator_stop_event
+    global _connection_pool, _pool_validator_thread, _pool_validator_stop_event, _db_executor
 
     # Stop the pool validator thread first
     if _pool_validator_thread is not None:
@@ -858,6 +1047,11 @@ def close_all_connections(timeout: int = 10) -> None:
             _logger.info("Pool validator thread stopped")
         _pool_validator_thread = None
 
+    # Async Pool Backend: let in-flight DB executor work finish before closing
+    if _db_executor is not None:
+        _db_executor.shutdown(wait=True)
+        _db_executor = None
+
     if _connection_pool is None:
         _logger.info("No connection pool to close")
         return
@@ -866,7 +1060,8 @@ def close_all_connections(timeout: int = 10) -> None:
 
     try:
         # Close all connections in the pool
-        _connection_pool.closeall()
+        with _pool_lock:
+            _connection_pool.closeall()
         _logger.info("All database connections closed")
 
         # Clear global reference
@@ -911,6 +1106,23 @@ def get_pool_status() -> dict:
     }
 
 
+def get_free_connection_count() -> int | None:
+    """
+    Number of connections that can still be checked out before the pool is exhausted.
+
+    SimpleConnectionPool raises PoolError instead of waiting when all maxconn
+    connections are in use, so callers fanning out over several connections
+    size their concurrency with this.
+
+    Returns:
+        Free connection slots, or None if the pool is not initialized
+    """
+    with _pool_lock:
+        if _connection_pool is None:
+            return None
+        return max(0, _connection_pool.maxconn - len(_connection_pool._used))
+
+
 async def _test_database_connection_async() -> bool:
     """
     Async version of database connection test.
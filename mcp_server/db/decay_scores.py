@@ -0,0 +1,180 @@
+"""
+Decay Scores Module
+
+Keeps the materialized memory strength of edges (Migration 054) in line with
+config/decay_config.yaml.
+
+edges.memory_strength holds the time-independent part of the Ebbinghaus
+decay (S per sector and access_count); a trigger maintains it on every write
+that changes properties or access_count, and edge_relevance_score() turns it
+into the current relevance in SQL. The only other way S can go stale is a
+change of the sector parameters, so refresh_decay_scores() runs once at
+server start:
+
+1. Upsert the YAML sector parameters into decay_sector_config
+2. If any sector changed (or edges still lack a strength), rewrite only the
+   edges whose strength differs, per project under its RLS context
+
+The sync helpers are blocking psycopg2 calls taking a connection; async
+callers run them through run_in_db_executor().
+
+Usage:
+    asyncio.create_task(refresh_decay_scores())
+"""
+
+from __future__ import annotations
+
+import logging
+
+from psycopg2.extensions import connection
+from psycopg2.extras import execute_values
+
+from mcp_server.db.connection import (
+    get_connection,
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.middleware.context import set_project_id
+from mcp_server.utils.decay_config import SectorDecay, get_decay_config
+
+logger = logging.getLogger(__name__)
+
+
+def edge_relevance_sql(alias: str) -> str:
+    """
+    SQL expression for the current relevance_score of an edge row.
+
+    The decay clock is last_engaged (active use), falling back to
+    last_accessed like calculate_relevance_score(); passive reads only
+    touch last_accessed (edge_stats.py), so they do not reset the decay.
+    """
+    return (
+        f"edge_relevance_score({alias}.memory_strength, "
+        f"COALESCE({alias}.last_engaged, {alias}.last_accessed))"
+    )
+
+
+def sync_decay_sector_config(
+    conn: connection, decay_config: dict[str, SectorDecay]
+) -> list[str]:
+    """
+    Upsert sector parameters into decay_sector_config.
+
+    Args:
+        conn: Database connection (the table is global, no project context);
+            the upsert is committed
+        decay_config: Sector name -> SectorDecay, e.g. get_decay_config()
+
+    Returns:
+        Sectors that were inserted or whose S_base/S_floor changed
+    """
+    cursor = conn.cursor()
+    rows = execute_values(
+        cursor,
+        """
+        INSERT INTO decay_sector_config (sector, s_base, s_floor)
+        VALUES %s
+        ON CONFLICT (sector) DO UPDATE
+        SET s_base = EXCLUDED.s_base,
+            s_floor = EXCLUDED.s_floor,
+            updated_at = NOW()
+        WHERE decay_sector_config.s_base IS DISTINCT FROM EXCLUDED.s_base
+           OR decay_sector_config.s_floor IS DISTINCT FROM EXCLUDED.s_floor
+        RETURNING sector
+        """,
+        [
+            (sector, float(config.S_base), None if config.S_floor is None else float(config.S_floor))
+            for sector, config in decay_config.items()
+        ],
+        fetch=True,
+    )
+    cursor.close()
+    conn.commit()
+    return [row[0] for row in rows]
+
+
+def fetch_strength_refresh_projects(conn: connection, all_projects: bool) -> list[str]:
+    """
+    Projects whose edges need a memory_strength refresh.
+
+    Args:
+        conn: Database connection (no project context needed)
+        all_projects: True after a sector change (every edge may be stale),
+            otherwise only projects with edges that were never computed
+
+    Returns:
+        List of project IDs
+    """
+    cursor = conn.cursor()
+    if all_projects:
+        cursor.execute("SELECT DISTINCT project_id FROM edges")
+    else:
+        cursor.execute("SELECT DISTINCT project_id FROM edges WHERE memory_strength IS NULL")
+    rows = cursor.fetchall()
+    cursor.close()
+    return [row[0] for row in rows]
+
+
+def refresh_edge_memory_strength(conn: connection) -> int:
+    """
+    Recompute memory_strength where it differs from the current parameters.
+
+    Rows whose strength is already current are not written.
+
+    Args:
+        conn: Database connection with RLS project context active
+
+    Returns:
+        Number of edges updated
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        """
+        UPDATE edges
+        SET memory_strength = edge_memory_strength(properties, access_count)
+        WHERE memory_strength IS DISTINCT FROM edge_memory_strength(properties, access_count)
+          AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        """
+    )
+    updated = cursor.rowcount
+    cursor.close()
+    return updated
+
+
+async def refresh_decay_scores(decay_config: dict[str, SectorDecay] | None = None) -> int:
+    """
+    Sync decay_sector_config from the YAML config and refresh stale strengths.
+
+    Never raises: traversals keep working with the previous strengths, so
+    errors are only logged.
+
+    Args:
+        decay_config: Sector parameters (default: get_decay_config())
+
+    Returns:
+        Number of edges whose memory_strength was rewritten
+    """
+    try:
+        async with get_connection() as conn:
+            changed = await run_in_db_executor(
+                sync_decay_sector_config, conn, decay_config or get_decay_config()
+            )
+            projects = await run_in_db_executor(
+                fetch_strength_refresh_projects, conn, bool(changed)
+            )
+
+        updated = 0
+        for project_id in projects:
+            set_project_id(project_id)
+            async with get_connection_with_project_context() as conn:
+                updated += await run_in_db_executor(refresh_edge_memory_strength, conn)
+
+        if changed or updated:
+            logger.info(
+                f"Decay scores refreshed: sectors changed={changed}, "
+                f"edges updated={updated} in {len(projects)} projects"
+            )
+        return updated
+    except Exception as e:
+        logger.error(f"Decay score refresh failed: {e}")
+        return 0
@@ -0,0 +1,268 @@
+"""
+Edge Access Statistics Aggregator (write-behind)
+
+Buffers edge access and engagement events in process and writes them in
+bulk, so the read path (get_edge, query_neighbors, find_path) records
+telemetry without issuing an UPDATE per query.
+
+Events are aggregated per (project_id, edge_id): a hit count, the last
+access time and, for engagements, the last engagement time. Every
+EDGE_STATS_FLUSH_INTERVAL seconds the flusher writes all buffered edges
+with one UPDATE ... FROM (VALUES ...) per project (under that project's RLS
+context); a buffer reaching half of EDGE_STATS_MAX_PENDING wakes it early,
+and new edges beyond EDGE_STATS_MAX_PENDING are dropped (counted in stats).
+
+Access only moves last_accessed and access_count; the decay clock is
+last_engaged (edge_relevance_sql), so passive reads strengthen an edge
+without resetting its decay (Decay fix 2026-01-07). Graph cache snapshots
+are not invalidated by a flush; their TTL bounds the staleness of the
+access columns.
+
+Usage:
+    record_edge_access(edge_ids)          # read path, never blocks on the DB
+    asyncio.create_task(run_edge_stats_flusher())
+    await flush_edge_stats()              # on shutdown
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from typing import Any
+
+from psycopg2.extensions import connection
+from psycopg2.extras import execute_values
+
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.middleware.context import get_current_project, set_project_id
+
+logger = logging.getLogger(__name__)
+
+EDGE_STATS_FLUSH_INTERVAL = float(os.getenv("EDGE_STATS_FLUSH_INTERVAL", "10"))
+EDGE_STATS_MAX_PENDING = int(os.getenv("EDGE_STATS_MAX_PENDING", "10000"))
+
+_UUID_PATTERN = re.compile(
+    r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
+)
+
+_wake_event: asyncio.Event | None = None
+
+
+def edge_access_stats_enabled() -> bool:
+    """Whether reads record edge access stats (EDGE_ACCESS_STATS, default true)."""
+    return os.getenv("EDGE_ACCESS_STATS", "true").lower() == "true"
+
+
+class EdgeStatsAggregator:
+    """
+    Thread-safe buffer of edge access/engagement counts per (project_id, edge_id).
+
+    Each entry is [hits, last accessed_at, last engaged_at or None].
+    """
+
+    def __init__(self, max_pending: int = EDGE_STATS_MAX_PENDING) -> None:
+        self._lock = threading.Lock()
+        self._pending: dict[tuple[str, str], list[Any]] = {}
+        self._max_pending = max_pending
+        self._recorded = 0
+        self._dropped = 0
+        self._flushed = 0
+        self._flushes = 0
+
+    def record(
+        self, edge_ids: list[str], project_id: str, engaged: bool = False, hits: int = 1
+    ) -> bool:
+        """
+        Buffer one access (or engagement) per edge.
+
+        Returns:
+            True if the buffer is large enough that the flusher should run now
+        """
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            for edge_id in edge_ids:
+                edge_id = str(edge_id)
+                if not _UUID_PATTERN.match(edge_id):
+                    logger.warning(f"Invalid UUID format skipped for edge stats: {edge_id}")
+                    continue
+                key = (project_id, edge_id)
+                entry = self._pending.get(key)
+                if entry is None:
+                    if len(self._pending) >= self._max_pending:
+                        self._dropped += 1
+                        continue
+                    entry = self._pending[key] = [0, now, None]
+                entry[0] += hits
+                entry[1] = now
+                if engaged:
+                    entry[2] = now
+                self._recorded += 1
+            return len(self._pending) >= self._max_pending // 2
+
+    def drain(self) -> dict[str, list[tuple[str, int, datetime, datetime | None]]]:
+        """Take all buffered entries, grouped by project as UPDATE rows."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        by_project: dict[str, list[tuple[str, int, datetime, datetime | None]]] = {}
+        for (project_id, edge_id), (hits, accessed_at, engaged_at) in pending.items():
+            by_project.setdefault(project_id, []).append((edge_id, hits, accessed_at, engaged_at))
+        return by_project
+
+    def requeue(self, project_id: str, rows: list[tuple[str, int, datetime, datetime | None]]) -> None:
+        """Put rows of a failed flush back into the buffer (merged with newer events)."""
+        with self._lock:
+            for edge_id, hits, accessed_at, engaged_at in rows:
+                key = (project_id, edge_id)
+                entry = self._pending.get(key)
+                if entry is None:
+                    if len(self._pending) >= self._max_pending:
+                        self._dropped += 1
+                        continue
+                    self._pending[key] = [hits, accessed_at, engaged_at]
+                    continue
+                entry[0] += hits
+                entry[1] = max(entry[1], accessed_at)
+                if engaged_at is not None:
+                    entry[2] = max(entry[2], engaged_at) if entry[2] else engaged_at
+
+    def mark_flushed(self, edges: int) -> None:
+        with self._lock:
+            self._flushed += edges
+            self._flushes += 1
+
+    def get_stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "recorded": self._recorded,
+                "flushed": self._flushed,
+                "flushes": self._flushes,
+                "dropped": self._dropped,
+            }
+
+
+_aggregator_instance: EdgeStatsAggregator | None = None
+_aggregator_lock = threading.Lock()
+
+
+def get_edge_stats_aggregator() -> EdgeStatsAggregator:
+    """Get the process-wide edge stats aggregator (singleton)."""
+    global _aggregator_instance
+    if _aggregator_instance is None:
+        with _aggregator_lock:
+            if _aggregator_instance is None:
+                _aggregator_instance = EdgeStatsAggregator()
+    return _aggregator_instance
+
+
+def _record(edge_ids: list[str], engaged: bool) -> None:
+    if not edge_ids:
+        return
+    try:
+        if get_edge_stats_aggregator().record(edge_ids, get_current_project(), engaged=engaged):
+            if _wake_event is not None:
+                _wake_event.set()
+    except Exception as e:
+        # Stats are non-critical, never fail the caller
+        logger.warning(f"Failed to record edge stats: {e}")
+
+
+def record_edge_access(edge_ids: list[str]) -> None:
+    """Buffer a passive read of edges (last_accessed, access_count)."""
+    if edge_access_stats_enabled():
+        _record(edge_ids, engaged=False)
+
+
+def record_edge_engagement(edge_ids: list[str]) -> None:
+    """Buffer an active use of edges (also moves last_engaged, the decay clock)."""
+    _record(edge_ids, engaged=True)
+
+
+def apply_edge_stats(
+    conn: connection, rows: list[tuple[str, int, datetime, datetime | None]]
+) -> int:
+    """
+    Write aggregated stats with one bulk UPDATE and commit.
+
+    Args:
+        conn: Connection under the project's RLS context
+        rows: (edge_id, hits, accessed_at, engaged_at) tuples
+
+    Returns:
+        Number of edges updated
+    """
+    cursor = conn.cursor()
+    # GREATEST ignores NULLs: a NULL engaged_at keeps last_engaged unchanged
+    execute_values(
+        cursor,
+        """
+        UPDATE edges AS e
+        SET access_count = GREATEST(COALESCE(e.access_count, 0), 0) + v.hits,
+            last_accessed = GREATEST(e.last_accessed, v.accessed_at),
+            last_engaged = GREATEST(e.last_engaged, v.engaged_at)
+        FROM (VALUES %s) AS v(id, hits, accessed_at, engaged_at)
+        WHERE e.id = v.id
+        """,
+        rows,
+        template="(%s::uuid, %s::integer, %s::timestamptz, %s::timestamptz)",
+        page_size=len(rows),
+    )
+    updated = cursor.rowcount
+    conn.commit()
+    return updated
+
+
+async def flush_edge_stats() -> int:
+    """
+    Write all buffered edge stats, one bulk UPDATE per project.
+
+    Never raises: a failed project's rows are requeued for the next flush.
+
+    Returns:
+        Number of edges updated
+    """
+    aggregator = get_edge_stats_aggregator()
+    updated = 0
+    for project_id, rows in aggregator.drain().items():
+        try:
+            set_project_id(project_id)
+            async with get_connection_with_project_context() as conn:
+                updated += await run_in_db_executor(apply_edge_stats, conn, rows)
+        except Exception as e:
+            logger.warning(f"Edge stats flush failed for project {project_id}: {e}")
+            aggregator.requeue(project_id, rows)
+            continue
+        aggregator.mark_flushed(len(rows))
+    if updated:
+        logger.debug(f"Flushed access stats for {updated} edges")
+    return updated
+
+
+async def run_edge_stats_flusher(interval: float = EDGE_STATS_FLUSH_INTERVAL) -> None:
+    """
+    Flush buffered edge stats every interval seconds until cancelled.
+
+    A nearly full buffer wakes the flusher early. Never raises.
+
+    Args:
+        interval: Seconds between flushes
+    """
+    global _wake_event
+    _wake_event = asyncio.Event()
+    logger.info(f"Edge stats flusher started (interval={interval}s, max_pending={EDGE_STATS_MAX_PENDING})")
+
+    while True:
+        try:
+            await asyncio.wait_for(_wake_event.wait(), timeout=interval)
+        except TimeoutError:
+            pass
+        _wake_event.clear()
+        await flush_edge_stats()
@@ -0,0 +1,341 @@
+"""
+Entity Linker.
+
+Finds mentions of graph node names in free text with an Aho-Corasick
+automaton over all node names visible to a project. One linear pass over
+the text reports every mention, independent of the number of nodes, so
+callers no longer guess entities from capitalization (hybrid_search graph
+channel) or scan nodes with `text ILIKE '%' || name || '%'` per text
+(suggest_lateral_edges).
+
+Matching rules:
+- Names and text are case-folded (str.casefold) with whitespace runs
+  collapsed, so "agentic  business" links the node "Agentic Business"
+- A mention must start and end on word boundaries, except that names of at
+  least ENTITY_LINKER_MIN_COMPOUND_LENGTH characters may form the head or
+  tail of a compound word ("Datenbankmigration" links "Datenbank" and
+  "Migration", "Rust" is not linked inside "Trust")
+- Overlapping mentions resolve to the longest, then leftmost one
+
+Automatons are cached per project, loaded under that project's RLS context
+and dropped by add_node(); ENTITY_LINKER_TTL_SECONDS bounds staleness from
+writes made by other processes.
+
+Environment:
+    ENTITY_LINKER: "false" disables the linker (callers fall back) (default: true)
+    ENTITY_LINKER_TTL_SECONDS: Max automaton age in seconds (default: 300)
+    ENTITY_LINKER_MAX_NODES: Projects with more nodes are not linked (default: 100000)
+    ENTITY_LINKER_MIN_COMPOUND_LENGTH: Min name length for compound matches (default: 5)
+
+Usage:
+    from mcp_server.db.entity_linker import link_entity_names
+
+    names = await link_entity_names("Wie hängt die Datenbankmigration mit Python zusammen?")
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Any
+
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.db.project_cache import ProjectSnapshotCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENTITY_LINKER_TTL_SECONDS = 300.0
+DEFAULT_ENTITY_LINKER_MAX_NODES = 100_000
+DEFAULT_MIN_COMPOUND_LENGTH = 5
+
+
+def _fold(text: str) -> tuple[str, list[int]]:
+    """
+    Case-fold text and collapse whitespace runs to one space.
+
+    Returns:
+        (folded text, index of the original character for each folded character)
+    """
+    chars: list[str] = []
+    origin: list[int] = []
+    previous_space = True  # also strips leading whitespace
+    for i, ch in enumerate(text):
+        if ch.isspace():
+            if not previous_space:
+                chars.append(" ")
+                origin.append(i)
+            previous_space = True
+            continue
+        previous_space = False
+        for folded in ch.casefold():
+            chars.append(folded)
+            origin.append(i)
+    if chars and chars[-1] == " ":
+        chars.pop()
+        origin.pop()
+    return "".join(chars), origin
+
+
+class EntityAutomaton:
+    """
+    Aho-Corasick automaton over the case-folded node names of a project.
+
+    Immutable after construction; find_mentions() is safe to call from
+    several tasks at once.
+    """
+
+    def __init__(self, node_rows: list[Any], min_compound_length: int = DEFAULT_MIN_COMPOUND_LENGTH) -> None:
+        self.loaded_at = time.monotonic()
+        self.min_compound_length = min_compound_length
+        self.projects: set[str] = set()
+        # Pattern i: folded name length and the nodes carrying that name
+        self._lengths: list[int] = []
+        self._nodes: list[list[dict[str, Any]]] = []
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+
+        pattern_ids: dict[str, int] = {}
+        for row in node_rows:
+            self.projects.add(row["project_id"])
+            key, _ = _fold(row["name"] or "")
+            if not key:
+                continue
+            node = {"node_id": str(row["id"]), "name": row["name"], "label": row["label"]}
+            if key in pattern_ids:
+                self._nodes[pattern_ids[key]].append(node)
+                continue
+            pattern_ids[key] = len(self._lengths)
+            self._lengths.append(len(key))
+            self._nodes.append([node])
+            self._insert(key, pattern_ids[key])
+        self.name_count = len(self._lengths)
+        self._build_failure_links()
+
+    def _insert(self, key: str, pattern_id: int) -> None:
+        state = 0
+        for ch in key:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(pattern_id)
+
+    def _build_failure_links(self) -> None:
+        """BFS over the trie; each state also reports its failure state's outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _accepts(self, folded: str, start: int, end: int) -> bool:
+        """Word-boundary rule, relaxed to one side for long names (compounds)."""
+        left = start == 0 or not folded[start - 1].isalnum() or not folded[start].isalnum()
+        right = end == len(folded) or not folded[end].isalnum() or not folded[end - 1].isalnum()
+        if left and right:
+            return True
+        return (left or right) and end - start >= self.min_compound_length
+
+    def find_mentions(self, text: str) -> list[dict[str, Any]]:
+        """
+        Node-name mentions in text, in text order.
+
+        Returns:
+            One dict per (mention, node) with node_id, name, label, start and
+            end (character offsets into text) and the matched text
+        """
+        folded, origin = _fold(text)
+        goto, fail, out = self._goto, self._fail, self._out
+
+        candidates: list[tuple[int, int, int]] = []
+        state = 0
+        for i, ch in enumerate(folded):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for pattern_id in out[state]:
+                start = i + 1 - self._lengths[pattern_id]
+                if self._accepts(folded, start, i + 1):
+                    candidates.append((start, i + 1, pattern_id))
+
+        # Longest first, then leftmost; keep mentions that do not overlap
+        candidates.sort(key=lambda c: (c[0] - c[1], c[0]))
+        taken = bytearray(len(folded))
+        selected: list[tuple[int, int, int]] = []
+        for start, end, pattern_id in candidates:
+            if any(taken[start:end]):
+                continue
+            taken[start:end] = b"\x01" * (end - start)
+            selected.append((start, end, pattern_id))
+        selected.sort()
+
+        mentions: list[dict[str, Any]] = []
+        for start, end, pattern_id in selected:
+            text_start, text_end = origin[start], origin[end - 1] + 1
+            for node in self._nodes[pattern_id]:
+                mentions.append({
+                    **node,
+                    "start": text_start,
+                    "end": text_end,
+                    "text": text[text_start:text_end],
+                })
+        return mentions
+
+
+def load_node_names(conn: Any, max_nodes: int) -> list[Any] | None:
+    """
+    Fetch id, project_id, label and name of all nodes visible under the connection's RLS context.
+
+    Returns:
+        Node rows (oldest first), or None if there are more than max_nodes
+    """
+    cursor = conn.cursor()
+    # Defense-in-depth: explicit project_id filter (Story 11.7)
+    cursor.execute(
+        """
+        SELECT id, project_id, label, name
+        FROM nodes
+        WHERE project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        ORDER BY created_at
+        LIMIT %s;
+        """,
+        (max_nodes + 1,),
+    )
+    rows = cursor.fetchall()
+    if len(rows) > max_nodes:
+        return None
+    return rows
+
+
+class EntityLinkerCache(ProjectSnapshotCache[EntityAutomaton]):
+    """Per-project EntityAutomaton store (project_cache.py)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_ENTITY_LINKER_TTL_SECONDS,
+        max_nodes: int = DEFAULT_ENTITY_LINKER_MAX_NODES,
+        min_compound_length: int = DEFAULT_MIN_COMPOUND_LENGTH,
+    ) -> None:
+        super().__init__(self._load, ttl_seconds)
+        self.max_nodes = max_nodes
+        self.min_compound_length = min_compound_length
+
+    async def _load(self, project_id: str) -> EntityAutomaton | None:
+        """Build project_id's automaton under its RLS context (None if too large)."""
+        async with get_connection_with_project_context(read_only=True) as conn:
+            rows = await run_in_db_executor(load_node_names, conn, self.max_nodes)
+        if rows is None:
+            logger.info(f"Project {project_id} has more than {self.max_nodes} nodes, entity linker disabled")
+            return None
+
+        automaton = EntityAutomaton(rows, self.min_compound_length)
+        logger.debug(f"Built entity automaton for {project_id}: {automaton.name_count} names")
+        return automaton
+
+
+# Singleton instance for module-level access
+_linker_instance: EntityLinkerCache | None = None
+_linker_lock = threading.Lock()
+
+
+def entity_linker_enabled() -> bool:
+    """False if ENTITY_LINKER is set to a falsy value."""
+    return os.getenv("ENTITY_LINKER", "true").strip().lower() not in ("0", "false", "no")
+
+
+def get_entity_linker() -> EntityLinkerCache:
+    """
+    Get the shared EntityLinkerCache, configured from the environment on first use.
+
+    Environment:
+        ENTITY_LINKER_TTL_SECONDS: Max automaton age in seconds (default: 300)
+        ENTITY_LINKER_MAX_NODES: Larger projects are not linked (default: 100000)
+        ENTITY_LINKER_MIN_COMPOUND_LENGTH: Min name length for compound matches (default: 5)
+
+    Returns:
+        Shared EntityLinkerCache instance
+    """
+    global _linker_instance
+    if _linker_instance is None:
+        with _linker_lock:
+            if _linker_instance is None:
+                try:
+                    ttl = float(os.getenv("ENTITY_LINKER_TTL_SECONDS", str(DEFAULT_ENTITY_LINKER_TTL_SECONDS)))
+                    max_nodes = int(os.getenv("ENTITY_LINKER_MAX_NODES", str(DEFAULT_ENTITY_LINKER_MAX_NODES)))
+                    min_compound = int(
+                        os.getenv("ENTITY_LINKER_MIN_COMPOUND_LENGTH", str(DEFAULT_MIN_COMPOUND_LENGTH))
+                    )
+                except ValueError:
+                    logger.warning("Invalid entity linker configuration, using defaults")
+                    ttl, max_nodes, min_compound = (
+                        DEFAULT_ENTITY_LINKER_TTL_SECONDS,
+                        DEFAULT_ENTITY_LINKER_MAX_NODES,
+                        DEFAULT_MIN_COMPOUND_LENGTH,
+                    )
+                _linker_instance = EntityLinkerCache(ttl, max_nodes, min_compound)
+    return _linker_instance
+
+
+async def get_entity_automaton(project_id: str | None = None) -> EntityAutomaton | None:
+    """
+    Automaton for the project (default: current project context).
+
+    Returns None if the linker is disabled, the project is too large or the
+    automaton cannot be loaded; callers then use their non-linked fallback.
+    """
+    if not entity_linker_enabled():
+        return None
+    try:
+        if project_id is None:
+            from mcp_server.middleware.context import get_current_project
+
+            project_id = get_current_project()
+        return await get_entity_linker().get(project_id)
+    except Exception as e:
+        logger.warning(f"Entity linker unavailable for {project_id}: {e}")
+        return None
+
+
+async def link_entity_names(text: str, project_id: str | None = None) -> list[str] | None:
+    """
+    Names of the nodes mentioned in text, in order of first mention, deduplicated.
+
+    Returns:
+        Node names (exact, as stored), or None if no automaton is available
+    """
+    automaton = await get_entity_automaton(project_id)
+    if automaton is None:
+        return None
+    names: list[str] = []
+    for mention in automaton.find_mentions(text):
+        if mention["name"] not in names:
+            names.append(mention["name"])
+    return names
+
+
+def invalidate_entity_linker(project_id: str | None = None) -> None:
+    """
+    Drop cached automatons after a node write (no-op while nothing is cached).
+
+    Args:
+        project_id: Project whose nodes changed; None drops everything
+    """
+    if _linker_instance is not None:
+        _linker_instance.invalidate(project_id)
@@ -14,14 +14,28 @@ from __future__ import annotations
 import json
 import logging
 import math
-import re
 from datetime import datetime, timezone
+from collections.abc import Awaitable, Callable
 from typing import Any
 
-from mcp_server.db.connection import get_connection_with_project_context
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.db.decay_scores import edge_relevance_sql
+from mcp_server.db.edge_stats import record_edge_access, record_edge_engagement
+from mcp_server.db.entity_linker import invalidate_entity_linker
+from mcp_server.db.graph_cache import (
+    get_graph_snapshot,
+    graph_cache_enabled,
+    invalidate_graph_cache,
+    patch_graph_cache_node,
+)
+from mcp_server.db.graph_paths import bidirectional_shortest_paths, neighbor_edge_hits
+from mcp_server.external.embedding_worker import notify_pending_embeddings
 from mcp_server.utils.relevance import calculate_relevance_score
 from mcp_server.utils.sector_classifier import MemorySector
-from psycopg2.extras import Json
+from psycopg2.extras import Json, execute_values
 
 logger = logging.getLogger(__name__)
 
@@ -124,6 +138,59 @@ class ConstitutiveEdgeProtectionError(Exception):
 
 
 
+def _upsert_node_row(
+    cursor: Any,
+    project_id: str,
+    label: str,
+    name: str,
+    properties: str,
+    vector_id: int | None,
+) -> dict[str, Any]:
+    """
+    add_node() statement; runs on the DB executor.
+
+    Returns:
+        Row with id, label, name, project_id and was_inserted
+    """
+    # Story 11.5.1: Include project_id in INSERT and ON CONFLICT
+    cursor.execute(
+        """
+        INSERT INTO nodes (project_id, label, name, properties, vector_id)
+        VALUES (%s, %s, %s, %s::jsonb, %s)
+        ON CONFLICT (project_id, name) DO UPDATE SET
+            label = CASE
+                WHEN EXCLUDED.label = 'Entity' THEN nodes.label
+                ELSE EXCLUDED.label
+            END,
+            properties = nodes.properties || EXCLUDED.properties,
+            vector_id = COALESCE(EXCLUDED.vector_id, nodes.vector_id)
+        RETURNING id, label, name, project_id, created_at,
+            (xmax = 0) AS was_inserted;
+        """,
+        (project_id, label, name, properties, vector_id),
+    )
+
+    result = cursor.fetchone()
+    if result:
+        return result
+
+    # Fallback: fetch existing node (should not happen with RETURNING)
+    cursor.execute(
+        """
+        SELECT id, label, name, project_id, created_at
+        FROM nodes
+        WHERE project_id = %s AND name = %s
+        LIMIT 1;
+        """,
+        (project_id, name),
+    )
+
+    existing_result = cursor.fetchone()
+    if not existing_result:
+        raise RuntimeError(f"Failed to find existing node after conflict: project_id={project_id}, name={name}")
+    return {**existing_result, "was_inserted": False}
+
+
 async def add_node(
     label: str,
     name: str,
@@ -159,71 +226,28 @@ async def add_node(
 
     try:
         async with get_connection_with_project_context() as conn:
-            cursor = conn.cursor()
-
-            # Story 11.5.1: Include project_id in INSERT and ON CONFLICT
-            cursor.execute(
-                """
-                INSERT INTO nodes (project_id, label, name, properties, vector_id)
-                VALUES (%s, %s, %s, %s::jsonb, %s)
-                ON CONFLICT (project_id, name) DO UPDATE SET
-                    label = CASE
-                        WHEN EXCLUDED.label = 'Entity' THEN nodes.label
-                        ELSE EXCLUDED.label
-                    END,
-                    properties = nodes.properties || EXCLUDED.properties,
-                    vector_id = COALESCE(EXCLUDED.vector_id, nodes.vector_id)
-                RETURNING id, label, name, project_id, created_at,
-                    (xmax = 0) AS was_inserted;
-                """,
-                (project_id, label, name, properties, vector_id),
+            result = await run_in_db_executor(
+                _upsert_node_row, conn.cursor(), project_id, label, name, properties, vector_id
             )
 
-            result = cursor.fetchone()
+            node_id = str(result["id"])
+            created_name = result["name"]
+            created_project_id = result["project_id"]
+            created = result["was_inserted"]
 
-            if result:
-                node_id = str(result["id"])
-                created_name = result["name"]
-                created_project_id = result["project_id"]
-                created = result["was_inserted"]
-
-                if created:
-                    logger.debug(
-                        f"Created new node: id={node_id}, project_id={created_project_id}, "
-                        f"label={label}, name={created_name}"
-                    )
-                else:
-                    logger.debug(
-                        f"Updated existing node: id={node_id}, project_id={created_project_id}, "
-                        f"label={label}, name={created_name}"
-                    )
-
-            else:
-                # Fallback: fetch existing node (should not happen with RETURNING)
-                cursor.execute(
-                    """
-                    SELECT id, label, name, project_id, created_at
-                    FROM nodes
-                    WHERE project_id = %s AND name = %s
-                    LIMIT 1;
-                    """,
-                    (project_id, name),
-                )
-
-                existing_result = cursor.fetchone()
-                if not existing_result:
-                    raise RuntimeError(f"Failed to find existing node after conflict: project_id={project_id}, name={name}")
-
-                node_id = str(existing_result["id"])
-                created_label = existing_result["label"]
-                created_name = existing_result["name"]
-                created_project_id = existing_result["project_id"]
-                created = False
-
-                logger.debug(f"Found existing node: id={node_id}, project_id={created_project_id}, label={created_label}, name={created_name}")
+            logger.debug(
+                f"{'Created new' if created else 'Updated existing'} node: "
+                f"id={node_id}, project_id={created_project_id}, "
+                f"label={label}, name={created_name}"
+            )
 
             # Commit transaction
-            conn.commit()
+            await run_in_db_executor(conn.commit)
+            invalidate_graph_cache(created_project_id)
+            invalidate_entity_linker(created_project_id)
+            if created:
+                # New nodes start as embedding_status 'pending' (Migration 055)
+                notify_pending_embeddings()
 
             return {
                 "node_id": node_id,
@@ -491,6 +515,9 @@ async def update_node_properties(
             conn.commit()
 
             if result:
+                patch_graph_cache_node(
+                    str(result["id"]), result["label"], result["name"], result["properties"]
+                )
                 logger.debug(
                     "Updated node",
                     extra={"node_id": node_id, "vector_id": vector_id},
@@ -555,66 +582,27 @@ async def get_default_importance(edge_data: dict) -> str:
     return "medium"
 
 
-async def _update_edge_access_stats(edge_ids: list[str], conn: Any) -> None:
+async def _update_edge_access_stats(edge_ids: list[str], conn: Any = None) -> None:
     """
-    Update last_accessed and access_count for edges (TGN Minimal Story 7.2).
+    Record access for edges: last_accessed and access_count (TGN Minimal Story 7.2).
 
     NOTE: This updates last_accessed (technical timestamp), NOT last_engaged.
     last_engaged is only updated by _update_edge_engagement() for active usage.
 
-    Uses bulk UPDATE with atomic increment. Fails silently - access stats are non-critical.
+    Write-behind: the access is buffered in process and written with the
+    next bulk flush (edge_stats.py), so reads issue no UPDATE. Invalid ids
+    are skipped; access stats are non-critical and never raise.
 
     Args:
         edge_ids: List of edge UUIDs to update
-        conn: Active database connection (required, not optional)
+        conn: Unused, kept for existing callers (no write on their connection)
     """
-    if not edge_ids:
-        return
+    record_edge_access(edge_ids)
 
-    # Validate UUID format to prevent injection
-    uuid_pattern = re.compile(
-        r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
-    )
-    valid_edge_ids = []
-    for edge_id in edge_ids:
-        if uuid_pattern.match(str(edge_id)):
-            valid_edge_ids.append(str(edge_id))
-        else:
-            logger.warning(f"Invalid UUID format skipped: {edge_id}")
-
-    if not valid_edge_ids:
-        return
-
-    try:
-        cursor = conn.cursor()
-        # Use atomic increment to prevent race conditions
-        # NOTE: Only updates last_accessed, NOT last_engaged (Decay fix 2026-01-07)
-        cursor.execute(
-            """
-            UPDATE edges
-            SET last_accessed = NOW(),
-                access_count = GREATEST(COALESCE(access_count, 0), 0) + 1
-            WHERE id = ANY(%s::uuid[])
-            """,
-            (valid_edge_ids,)
-        )
-        conn.commit()
-        logger.debug(f"Updated access stats for {len(valid_edge_ids)} edges")
-
-    except Exception as e:
-        # More specific error handling
-        if "operational error" in str(e).lower():
-            logger.warning(f"Database connection error while updating access stats: {e}")
-        elif "integrity error" in str(e).lower():
-            logger.debug(f"Edge not found during access stats update: {e}")
-        else:
-            logger.warning(f"Unexpected error updating edge access stats: {e}")
-        # Don't re-raise - access stats are non-critical
 
-
-async def _update_edge_engagement(edge_ids: list[str], conn: Any) -> None:
+async def _update_edge_engagement(edge_ids: list[str], conn: Any = None) -> None:
     """
-    Update last_engaged for edges when they are ACTIVELY used.
+    Record last_engaged for edges when they are ACTIVELY used.
 
     This is the semantic timestamp for Ebbinghaus Decay calculation.
     Only called when an edge is truly "engaged" (written, updated, resolved).
@@ -632,49 +620,18 @@ async def _update_edge_engagement(edge_ids: list[str], conn: Any) -> None:
 
     Fix for: "Decay wird durch Query-Access zurückgesetzt" (2026-01-07)
 
+    Write-behind like _update_edge_access_stats(): buffered and flushed in
+    bulk (engagement implies access, so access_count and last_accessed move
+    as well).
+
     Args:
         edge_ids: List of edge UUIDs to update
-        conn: Active database connection (required, not optional)
+        conn: Unused, kept for existing callers (no write on their connection)
     """
-    if not edge_ids:
-        return
-
-    # Validate UUID format to prevent injection
-    uuid_pattern = re.compile(
-        r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
-    )
-    valid_edge_ids = []
-    for edge_id in edge_ids:
-        if uuid_pattern.match(str(edge_id)):
-            valid_edge_ids.append(str(edge_id))
-        else:
-            logger.warning(f"Invalid UUID format skipped for engagement: {edge_id}")
+    record_edge_engagement(edge_ids)
 
-    if not valid_edge_ids:
-        return
 
-    try:
-        cursor = conn.cursor()
-        # Update last_engaged AND last_accessed (engagement implies access)
-        cursor.execute(
-            """
-            UPDATE edges
-            SET last_engaged = NOW(),
-                last_accessed = NOW(),
-                access_count = GREATEST(COALESCE(access_count, 0), 0) + 1
-            WHERE id = ANY(%s::uuid[])
-            """,
-            (valid_edge_ids,)
-        )
-        conn.commit()
-        logger.debug(f"Updated engagement for {len(valid_edge_ids)} edges")
-
-    except Exception as e:
-        logger.warning(f"Failed to update edge engagement: {e}")
-        # Don't re-raise - engagement stats are non-critical
-
-
-async def _filter_superseded_edges(neighbors: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _filter_superseded_edges(neighbors: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """
     Filtert Edges die in einer EVOLUTION-Resolution als 'supersedes' markiert sind.
 
@@ -687,7 +644,9 @@ async def _filter_superseded_edges(neighbors: list[dict[str, Any]]) -> list[dict
     Limitation: Erkennt nur Edges die selbst supersedes/superseded_by Properties haben,
     nicht Edges die von separaten Resolution-Edges referenziert werden.
 
-    Future Enhancement: SQL-basierte Prüfung gegen Resolution-Edges für vollständige Erkennung.
+    query_neighbors() filtert seit Migration 053 bereits in der Traversierung über
+    die generierte Spalte edges.superseded (gleiche Regel wie _is_edge_superseded());
+    diese Funktion bleibt für bereits geladene Neighbor-Listen.
     """
     filtered = []
     for neighbor in neighbors:
@@ -709,7 +668,7 @@ async def _filter_superseded_edges(neighbors: list[dict[str, Any]]) -> list[dict
     return filtered
 
 
-async def _is_edge_superseded(edge_id: str, properties: dict) -> bool:
+def _is_edge_superseded(edge_id: str, properties: dict) -> bool:
     """
     Prüft ob eine Edge superseded wurde.
 
@@ -735,6 +694,7 @@ async def _is_edge_superseded(edge_id: str, properties: dict) -> bool:
     return False
 
 
+
 async def get_edge_by_id(edge_id: str) -> dict[str, Any] | None:
     """
     Hole Edge-Details für relevance_score Berechnung.
@@ -751,7 +711,7 @@ async def get_edge_by_id(edge_id: str) -> dict[str, Any] | None:
             # Defense-in-depth: explicit project_id filter (Story 11.7)
             cursor.execute(
                 """
-                SELECT id, properties, last_accessed, access_count
+                SELECT id, properties, last_accessed, last_engaged, access_count
                 FROM edges
                 WHERE id = %s::uuid
                     AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[]);
@@ -764,6 +724,7 @@ async def get_edge_by_id(edge_id: str) -> dict[str, Any] | None:
                     "id": str(result["id"]),
                     "edge_properties": result["properties"],
                     "last_accessed": result["last_accessed"],
+                    "last_engaged": result.get("last_engaged"),
                     "access_count": result["access_count"],
                 }
             return None
@@ -872,6 +833,83 @@ async def get_or_create_node(name: str, label: str = "Entity") -> dict[str, Any]
         raise
 
 
+def _with_entrenchment_level(properties: str) -> str:
+    """Add entrenchment_level to edge properties (Story 7.4, Task 5: AC #7, #8)."""
+    try:
+        props = json.loads(properties)
+    except json.JSONDecodeError:
+        props = {}
+
+    # AGM Belief Revision: Konstitutive Edges = maximal entrenchment
+    edge_type = props.get("edge_type", "descriptive")
+
+    if edge_type == "constitutive":
+        props["entrenchment_level"] = "maximal"
+    else:
+        props.setdefault("entrenchment_level", "default")
+
+    # Serialize back with updated properties
+    return json.dumps(props)
+
+
+def _upsert_edge_row(
+    cursor: Any,
+    project_id: str,
+    source_id: str,
+    target_id: str,
+    relation: str,
+    weight: float,
+    properties: str,
+    memory_sector: str,
+) -> dict[str, Any]:
+    """
+    add_edge() statement; runs on the DB executor.
+
+    Returns:
+        Row with id, project_id, source_id, target_id, relation, weight,
+        memory_sector and was_inserted
+    """
+    # Story 11.5.1: Include project_id in INSERT and ON CONFLICT
+    cursor.execute(
+        """
+        INSERT INTO edges (project_id, source_id, target_id, relation, weight, properties, memory_sector)
+        VALUES (%s, %s::uuid, %s::uuid, %s, %s, %s::jsonb, %s)
+        ON CONFLICT (project_id, source_id, target_id, relation)
+        DO UPDATE SET
+            weight = EXCLUDED.weight,
+            properties = EXCLUDED.properties,
+            memory_sector = EXCLUDED.memory_sector,
+            modified_at = NOW(),
+            last_engaged = NOW(),
+            last_accessed = NOW(),
+            access_count = GREATEST(COALESCE(edges.access_count, 0), 0) + 1
+        RETURNING id, project_id, source_id, target_id, relation, weight, memory_sector, created_at,
+            (xmax = 0) AS was_inserted;
+        """,
+        (project_id, source_id, target_id, relation, weight, properties, memory_sector),
+    )
+
+    result = cursor.fetchone()
+    if result:
+        return result
+
+    # Edge already exists, fetch the existing one
+    cursor.execute(
+        """
+        SELECT id, project_id, source_id, target_id, relation, weight, memory_sector, created_at
+        FROM edges
+        WHERE project_id = %s AND source_id = %s::uuid AND target_id = %s::uuid AND relation = %s
+        LIMIT 1;
+        """,
+        (project_id, source_id, target_id, relation),
+    )
+
+    existing_result = cursor.fetchone()
+    if not existing_result:
+        raise RuntimeError(f"Failed to find existing edge after conflict: project_id={project_id}, source={source_id}, target={target_id}, relation={relation}")
+    return {**existing_result, "was_inserted": False}
+
+
 async def add_edge(
     source_id: str,
     target_id: str,
@@ -908,103 +946,38 @@ async def add_edge(
         - project_id: project_id from context
     """
     from mcp_server.middleware.context import get_current_project
-    import json
 
     logger = logging.getLogger(__name__)
     project_id = get_current_project()
 
-    # Parse properties to add entrenchment_level (Story 7.4, Task 5: AC #7, #8)
-    try:
-        props = json.loads(properties)
-    except json.JSONDecodeError:
-        props = {}
-
-    # AGM Belief Revision: Konstitutive Edges = maximal entrenchment
-    edge_type = props.get("edge_type", "descriptive")
-
-    if edge_type == "constitutive":
-        props["entrenchment_level"] = "maximal"
-    else:
-        props.setdefault("entrenchment_level", "default")
-
-    # Serialize back with updated properties
-    properties = json.dumps(props)
+    properties = _with_entrenchment_level(properties)
 
     try:
         async with get_connection_with_project_context() as conn:
-            cursor = conn.cursor()
-
-            # Story 11.5.1: Include project_id in INSERT and ON CONFLICT
-            cursor.execute(
-                """
-                INSERT INTO edges (project_id, source_id, target_id, relation, weight, properties, memory_sector)
-                VALUES (%s, %s::uuid, %s::uuid, %s, %s, %s::jsonb, %s)
-                ON CONFLICT (project_id, source_id, target_id, relation)
-                DO UPDATE SET
-                    weight = EXCLUDED.weight,
-                    properties = EXCLUDED.properties,
-                    memory_sector = EXCLUDED.memory_sector,
-                    modified_at = NOW(),
-                    last_engaged = NOW(),
-                    last_accessed = NOW(),
-                    access_count = GREATEST(COALESCE(edges.access_count, 0), 0) + 1
-                RETURNING id, project_id, source_id, target_id, relation, weight, memory_sector, created_at,
-                    (xmax = 0) AS was_inserted;
-                """,
-                (project_id, source_id, target_id, relation, weight, properties, memory_sector),
+            result = await run_in_db_executor(
+                _upsert_edge_row, conn.cursor(), project_id, source_id, target_id,
+                relation, weight, properties, memory_sector,
             )
 
-            result = cursor.fetchone()
-
-            if result:
-                edge_id = str(result["id"])
-                created_project_id = result["project_id"]
-                created_source_id = str(result["source_id"])
-                created_target_id = str(result["target_id"])
-                created_relation = result["relation"]
-                created_weight = float(result["weight"])
-                created_memory_sector = result["memory_sector"]
-                # xmax = 0 means row was inserted, not updated
-                created = result["was_inserted"]
+            edge_id = str(result["id"])
+            created_project_id = result["project_id"]
+            created_source_id = str(result["source_id"])
+            created_target_id = str(result["target_id"])
+            created_relation = result["relation"]
+            created_weight = float(result["weight"])
+            created_memory_sector = result["memory_sector"]
+            # xmax = 0 means row was inserted, not updated
+            created = result["was_inserted"]
 
-                logger.debug(
-                    f"{'Created new' if created else 'Updated existing'} edge: "
-                    f"id={edge_id}, project_id={created_project_id}, "
-                    f"source={created_source_id}, target={created_target_id}, relation={created_relation}"
-                )
-
-            else:
-                # Edge already exists, fetch the existing one
-                cursor.execute(
-                    """
-                    SELECT id, project_id, source_id, target_id, relation, weight, memory_sector, created_at
-                    FROM edges
-                    WHERE project_id = %s AND source_id = %s::uuid AND target_id = %s::uuid AND relation = %s
-                    LIMIT 1;
-                    """,
-                    (project_id, source_id, target_id, relation),
-                )
-
-                existing_result = cursor.fetchone()
-                if not existing_result:
-                    raise RuntimeError(f"Failed to find existing edge after conflict: project_id={project_id}, source={source_id}, target={target_id}, relation={relation}")
-
-                edge_id = str(existing_result["id"])
-                created_project_id = existing_result["project_id"]
-                created_source_id = str(existing_result["source_id"])
-                created_target_id = str(existing_result["target_id"])
-                created_relation = existing_result["relation"]
-                created_weight = float(existing_result["weight"])
-                created_memory_sector = existing_result["memory_sector"]
-                created = False
-
-                logger.debug(
-                    f"Found existing edge: id={edge_id}, project_id={created_project_id}, "
-                    f"source={created_source_id}, target={created_target_id}, relation={created_relation}"
-                )
+            logger.debug(
+                f"{'Created new' if created else 'Updated existing'} edge: "
+                f"id={edge_id}, project_id={created_project_id}, "
+                f"source={created_source_id}, target={created_target_id}, relation={created_relation}"
+            )
 
             # Commit transaction
-            conn.commit()
+            await run_in_db_executor(conn.commit)
+            invalidate_graph_cache(created_project_id)
 
             return {
                 "edge_id": edge_id,
@@ -1022,6 +995,483 @@ async def add_edge(
         raise
 
 
+def _merge_node_items(nodes: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """
+    Collapse repeated names into one row per node.
+
+    ON CONFLICT DO UPDATE cannot touch the same row twice in one statement, so
+    repeated names are merged the way consecutive add_node() calls would
+    leave them: a later non-'Entity' label wins, properties are merged and a
+    later vector_id replaces an earlier one.
+    """
+    merged: dict[str, dict[str, Any]] = {}
+    for node in nodes:
+        label = node.get("label") or "Entity"
+        properties = node.get("properties") or {}
+        vector_id = node.get("vector_id")
+        current = merged.get(node["name"])
+        if current is None:
+            merged[node["name"]] = {
+                "label": label,
+                "properties": dict(properties),
+                "vector_id": vector_id,
+            }
+            continue
+        if label != "Entity":
+            current["label"] = label
+        current["properties"].update(properties)
+        if vector_id is not None:
+            current["vector_id"] = vector_id
+    return merged
+
+
+def _upsert_nodes(
+    cursor: Any, project_id: str, merged: dict[str, dict[str, Any]]
+) -> dict[str, Any]:
+    """Upsert merged node rows with one multi-row add_node() statement; rows by name."""
+    if not merged:
+        return {}
+    rows = execute_values(
+        cursor,
+        """
+        INSERT INTO nodes (project_id, label, name, properties, vector_id)
+        VALUES %s
+        ON CONFLICT (project_id, name) DO UPDATE SET
+            label = CASE
+                WHEN EXCLUDED.label = 'Entity' THEN nodes.label
+                ELSE EXCLUDED.label
+            END,
+            properties = nodes.properties || EXCLUDED.properties,
+            vector_id = COALESCE(EXCLUDED.vector_id, nodes.vector_id)
+        RETURNING id, label, name, project_id, (xmax = 0) AS was_inserted
+        """,
+        [
+            (project_id, row["label"], name, json.dumps(row["properties"]), row["vector_id"])
+            for name, row in merged.items()
+        ],
+        template="(%s, %s, %s, %s::jsonb, %s::integer)",
+        page_size=len(merged),
+        fetch=True,
+    )
+    return {row["name"]: row for row in rows}
+
+
+async def add_nodes_batch(nodes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Add many nodes in one transaction (bulk variant of add_node).
+
+    Repeated names are merged (see _merge_node_items) and all nodes are
+    upserted with one multi-row INSERT ... ON CONFLICT statement, so an
+    import costs one round trip instead of one connection per node.
+
+    Args:
+        nodes: Dicts with name, label (default "Entity"), optional
+               properties (dict) and vector_id
+
+    Returns:
+        One dict per input node, in input order, with node_id, created,
+        label, name and project_id. created is only True for the first
+        occurrence of a newly inserted name.
+    """
+    from mcp_server.middleware.context import get_current_project
+
+    logger = logging.getLogger(__name__)
+    project_id = get_current_project()
+
+    if not nodes:
+        return []
+
+    try:
+        async with get_connection_with_project_context() as conn:
+            upserted = await run_in_db_executor(
+                _upsert_nodes, conn.cursor(), project_id, _merge_node_items(nodes)
+            )
+            await run_in_db_executor(conn.commit)
+    except Exception as e:
+        logger.error(f"Failed to add node batch: project_id={project_id}, nodes={len(nodes)}, error={e}")
+        raise
+
+    invalidate_graph_cache(project_id)
+    invalidate_entity_linker(project_id)
+    if any(row["was_inserted"] for row in upserted.values()):
+        # New nodes start as embedding_status 'pending' (Migration 055)
+        notify_pending_embeddings()
+
+    results = []
+    reported: set[str] = set()
+    for node in nodes:
+        row = upserted[node["name"]]
+        results.append({
+            "node_id": str(row["id"]),
+            "created": row["was_inserted"] and node["name"] not in reported,
+            "label": row["label"],
+            "name": row["name"],
+            "project_id": row["project_id"],
+        })
+        reported.add(node["name"])
+
+    logger.debug(
+        f"Node batch: project_id={project_id}, nodes={len(nodes)}, "
+        f"created={sum(r['created'] for r in results)}"
+    )
+    return results
+
+
+def _upsert_edges(
+    cursor: Any, project_id: str, edges: list[dict[str, Any]], node_rows: dict[str, Any]
+) -> list[Any]:
+    """Upsert add_edges_batch() edges with one multi-row add_edge() statement."""
+    edge_values: dict[tuple[str, str, str], tuple] = {}
+    for edge in edges:
+        source_id = str(node_rows[edge["source_name"]]["id"])
+        target_id = str(node_rows[edge["target_name"]]["id"])
+        edge_values[(source_id, target_id, edge["relation"])] = (
+            project_id,
+            source_id,
+            target_id,
+            edge["relation"],
+            edge.get("weight", 1.0),
+            _with_entrenchment_level(json.dumps(edge.get("properties") or {})),
+            edge.get("memory_sector", "semantic"),
+        )
+
+    return execute_values(
+        cursor,
+        """
+        INSERT INTO edges (project_id, source_id, target_id, relation, weight, properties, memory_sector)
+        VALUES %s
+        ON CONFLICT (project_id, source_id, target_id, relation)
+        DO UPDATE SET
+            weight = EXCLUDED.weight,
+            properties = EXCLUDED.properties,
+            memory_sector = EXCLUDED.memory_sector,
+            modified_at = NOW(),
+            last_engaged = NOW(),
+            last_accessed = NOW(),
+            access_count = GREATEST(COALESCE(edges.access_count, 0), 0) + 1
+        RETURNING id, project_id, source_id, target_id, relation, weight, memory_sector,
+            (xmax = 0) AS was_inserted
+        """,
+        list(edge_values.values()),
+        template="(%s, %s::uuid, %s::uuid, %s, %s, %s::jsonb, %s)",
+        page_size=len(edge_values),
+        fetch=True,
+    )
+
+
+async def add_edges_batch(edges: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Add many edges between named nodes in one transaction (bulk variant of
+    graph_add_edge's get_or_create_node + add_edge sequence).
+
+    Endpoint names are resolved to ids (and missing nodes created) with one
+    node upsert; the edges are then upserted with one multi-row statement
+    using add_edge's ON CONFLICT rules. Repeated (source, target, relation)
+    triples collapse to the last occurrence.
+
+    Args:
+        edges: Dicts with source_name, target_name, relation and optional
+               source_label / target_label (default "Entity"), weight
+               (default 1.0), properties (dict) and memory_sector
+               (default "semantic")
+
+    Returns:
+        One dict per input edge, in input order, with edge_id, created,
+        source_id, target_id, relation, weight, memory_sector, project_id
+        and source_node_created / target_node_created.
+    """
+    from mcp_server.middleware.context import get_current_project
+
+    logger = logging.getLogger(__name__)
+    project_id = get_current_project()
+
+    if not edges:
+        return []
+
+    endpoint_nodes = []
+    for edge in edges:
+        endpoint_nodes.append({"name": edge["source_name"], "label": edge.get("source_label")})
+        endpoint_nodes.append({"name": edge["target_name"], "label": edge.get("target_label")})
+
+    try:
+        async with get_connection_with_project_context() as conn:
+            cursor = conn.cursor()
+            node_rows = await run_in_db_executor(
+                _upsert_nodes, cursor, project_id, _merge_node_items(endpoint_nodes)
+            )
+            edge_rows = await run_in_db_executor(_upsert_edges, cursor, project_id, edges, node_rows)
+            await run_in_db_executor(conn.commit)
+    except Exception as e:
+        logger.error(f"Failed to add edge batch: project_id={project_id}, edges={len(edges)}, error={e}")
+        raise
+
+    invalidate_graph_cache(project_id)
+    if any(row["was_inserted"] for row in node_rows.values()):
+        invalidate_entity_linker(project_id)
+        notify_pending_embeddings()
+
+    by_key = {
+        (str(row["source_id"]), str(row["target_id"]), row["relation"]): row
+        for row in edge_rows
+    }
+    results = []
+    reported: set[Any] = set()
+    for edge in edges:
+        source = node_rows[edge["source_name"]]
+        target = node_rows[edge["target_name"]]
+        key = (str(source["id"]), str(target["id"]), edge["relation"])
+        row = by_key[key]
+        results.append({
+            "edge_id": str(row["id"]),
+            "created": row["was_inserted"] and key not in reported,
+            "source_id": key[0],
+            "target_id": key[1],
+            "relation": row["relation"],
+            "weight": float(row["weight"]),
+            "memory_sector": row["memory_sector"],
+            "project_id": row["project_id"],
+            "source_node_created": source["was_inserted"] and source["name"] not in reported,
+            "target_node_created": target["was_inserted"] and target["name"] not in reported,
+        })
+        reported.update((key, source["name"], target["name"]))
+
+    logger.debug(
+        f"Edge batch: project_id={project_id}, edges={len(edges)}, "
+        f"created={sum(r['created'] for r in results)}"
+    )
+    return results
+
+
+def _traverse_neighbors(
+    cursor: Any,
+    node_id: str,
+    max_depth: int,
+    include_outgoing: bool,
+    include_incoming: bool,
+    edge_where_sql: str,
+    edge_params: list[Any],
+    final_select_sql: str,
+    final_params: list[Any],
+) -> list[Any]:
+    """
+    Traverse query_neighbors()'s edges level by level and load the hit rows.
+
+    Blocking; query_neighbors() calls this via run_in_db_executor. Each level
+    is one adjacency query for the nodes first reached on the previous level
+    (per direction), so every node is expanded at most once and at most
+    max_depth queries run, however many paths the graph has.
+    neighbor_edge_hits() (graph_paths.py) turns the adjacency into the
+    former CTE's rows (shortest simple-path distance per edge), and one
+    query hydrates them through `final_select_sql` over the `combined` rows.
+
+    Returns:
+        Rows with the query_neighbors() columns; empty without hits
+    """
+    # node -> [(edge_id, far node)] per direction; a key means "expanded"
+    adjacency: tuple[dict[str, list[tuple[str, str]]], dict[str, list[tuple[str, str]]]] = ({}, {})
+    frontiers: tuple[list[str], list[str]] = (
+        [node_id] if include_outgoing else [],
+        [node_id] if include_incoming else [],
+    )
+    seen = ({node_id}, {node_id})
+
+    for _ in range(max_depth):
+        if not frontiers[0] and not frontiers[1]:
+            break
+        for side in (0, 1):
+            for v in frontiers[side]:
+                adjacency[side][v] = []
+        frontier_sets = (set(frontiers[0]), set(frontiers[1]))
+        cursor.execute(
+            f"""
+            SELECT e.id, e.source_id, e.target_id
+            FROM edges e
+            -- As in the adjacency cache: edges to invisible nodes are skipped
+            JOIN nodes ns ON ns.id = e.source_id
+            JOIN nodes nt ON nt.id = e.target_id
+            WHERE (e.source_id = ANY(%s::uuid[]) OR e.target_id = ANY(%s::uuid[]))
+                {edge_where_sql};
+            """,
+            (frontiers[0], frontiers[1], *edge_params),
+        )
+        next_frontiers: tuple[list[str], list[str]] = ([], [])
+        for row in cursor.fetchall():
+            edge_id, source, target = str(row["id"]), str(row["source_id"]), str(row["target_id"])
+            for side, near, far in ((0, source, target), (1, target, source)):
+                # An edge matches if either end is in its direction's frontier
+                if near not in frontier_sets[side]:
+                    continue
+                adjacency[side][near].append((edge_id, far))
+                if far not in seen[side]:
+                    seen[side].add(far)
+                    next_frontiers[side].append(far)
+        frontiers = next_frontiers
+
+    node_ids: list[str] = []
+    edge_ids: list[str] = []
+    distances: list[int] = []
+    directions: list[str] = []
+    for side, label in ((0, "outgoing"), (1, "incoming")):
+        if node_id not in adjacency[side]:
+            continue
+        far_node = {edge_id: far for edges in adjacency[side].values() for edge_id, far in edges}
+        hits = neighbor_edge_hits(node_id, max_depth, adjacency[side].__getitem__)
+        for edge_id, distance in hits.items():
+            node_ids.append(far_node[edge_id])
+            edge_ids.append(edge_id)
+            distances.append(distance)
+            directions.append(label)
+
+    if not edge_ids:
+        return []
+
+    # Migration 054: relevance_score = exp(-days / S) with the
+    # materialized memory strength S, computed per edge in SQL
+    relevance_sql = edge_relevance_sql("e")
+    cursor.execute(
+        f"""
+        WITH hits AS (
+            SELECT *
+            FROM unnest(%s::uuid[], %s::uuid[], %s::int[], %s::text[])
+                AS h(node_id, edge_id, distance, edge_direction)
+        ),
+        combined AS (
+            SELECT
+                n.id AS node_id,
+                e.id AS edge_id,
+                n.label,
+                n.name,
+                n.properties AS node_properties,
+                e.properties AS edge_properties,
+                e.memory_sector,
+                e.relation,
+                e.weight,
+                e.last_accessed,
+                e.last_engaged,
+                e.access_count,
+                e.modified_at,
+                {relevance_sql} AS relevance_score,
+                h.distance,
+                h.edge_direction
+            FROM hits h
+            JOIN edges e ON e.id = h.edge_id
+            JOIN nodes n ON n.id = h.node_id
+            -- Story 11.7: Defense-in-depth project_id filter on edges table
+            WHERE e.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        )
+        {final_select_sql}
+        """,
+        (node_ids, edge_ids, distances, directions, *final_params),
+    )
+    return cursor.fetchall()
+
+
+async def _rank_neighbor_rows(
+    rows: list[Any],
+    use_ief: bool,
+    query_embedding: list[float] | None,
+) -> list[dict[str, Any]]:
+    """
+    Format query_neighbors() rows, score, sort and deduplicate them.
+
+    Shared by the SQL path and the adjacency cache path (graph_cache.py),
+    which produce rows with the same columns. Superseded edges are already
+    excluded by the traversal (Migration 053).
+    """
+    # Format results
+    neighbors = []
+
+    for row in rows:
+        # Datetime serialization: Convert to ISO strings for JSON compatibility
+        last_accessed = row["last_accessed"]
+        modified_at = row["modified_at"]
+
+        neighbors.append({
+            "node_id": str(row["node_id"]),  # Geändert von "id"
+            "label": row["label"],
+            "name": row["name"],
+            "properties": row["node_properties"],      # Umbenannt
+            "edge_properties": row["edge_properties"], # NEU
+            "memory_sector": row["memory_sector"],     # Story 8-5: FR26
+            "relation": row["relation"],
+            "weight": float(row["weight"]),
+            "distance": int(row["distance"]),
+            "edge_direction": row["edge_direction"],
+            "last_accessed": last_accessed.isoformat() if last_accessed else None,
+            "access_count": row["access_count"],       # NEU
+            "modified_at": modified_at.isoformat() if modified_at else None,
+            # Migration 054: SQL rows carry edge_relevance_score() from SQL
+            "relevance_score": row.get("relevance_score"),
+        })
+
+    # Decay clock for Python scoring (not part of the neighbor output)
+    last_engaged = [row.get("last_engaged") for row in rows]
+
+    # relevance_score in Python nur für Rows ohne SQL-Score (adjacency cache)
+    for neighbor, engaged_at in zip(neighbors, last_engaged, strict=True):
+        if neighbor["relevance_score"] is not None:
+            neighbor["relevance_score"] = float(neighbor["relevance_score"])
+            continue
+        edge_data = {
+            "edge_id": neighbor.get("edge_id"),
+            "edge_properties": neighbor.get("edge_properties", {}),
+            "last_accessed": neighbor.get("last_accessed"),
+            "last_engaged": engaged_at,
+            "access_count": neighbor.get("access_count"),
+            "modified_at": neighbor.get("modified_at"),  # For recency boost
+            "vector_id": neighbor.get("edge_properties", {}).get("vector_id"),  # For semantic similarity
+        }
+        neighbor["relevance_score"] = calculate_relevance_score(edge_data)
+
+    # NEU: IEF Score Berechnung wenn ICAI aktiviert
+    if use_ief:
+        from mcp_server.analysis.ief import calculate_ief_scores
+        from mcp_server.analysis.dissonance import get_pending_nuance_edge_ids
+
+        pending_nuance_ids = get_pending_nuance_edge_ids()
+
+        # One embedding query + one vectorized similarity pass for all edges
+        ief_results = await run_in_db_executor(
+            calculate_ief_scores,
+            [
+                {
+                    "edge_id": neighbor.get("edge_id"),
+                    "edge_properties": neighbor.get("edge_properties", {}),
+                    "last_accessed": neighbor.get("last_accessed"),
+                    "last_engaged": engaged_at,
+                    "access_count": neighbor.get("access_count"),
+                    "modified_at": neighbor.get("modified_at"),
+                    "vector_id": neighbor.get("edge_properties", {}).get("vector_id"),
+                }
+                for neighbor, engaged_at in zip(neighbors, last_engaged, strict=True)
+            ],
+            query_embedding=query_embedding,
+            pending_nuance_edge_ids=pending_nuance_ids,
+        )
+        for neighbor, ief_result in zip(neighbors, ief_results, strict=True):
+            neighbor["ief_score"] = ief_result["ief_score"]
+            neighbor["ief_components"] = ief_result["components"]
+
+    # Sortierung: IEF wenn aktiviert, sonst relevance_score
+    if use_ief:
+        neighbors.sort(key=lambda n: n.get("ief_score", 0), reverse=True)
+    else:
+        neighbors.sort(key=lambda n: n["relevance_score"], reverse=True)
+
+    # Deduplizierung nach Score-Sortierung: Behalte nur Edge mit höchstem Score pro Node
+    # (Story: Edge-Deduplizierung nach IEF-Score statt alphabetisch)
+    seen_nodes: set[str] = set()
+    deduplicated: list[dict[str, Any]] = []
+    for neighbor in neighbors:
+        neighbor_node_id = neighbor.get("node_id")
+        if neighbor_node_id and neighbor_node_id not in seen_nodes:
+            seen_nodes.add(neighbor_node_id)
+            deduplicated.append(neighbor)
+    neighbors = deduplicated
+
+    return neighbors
+
+
 async def query_neighbors(
     node_id: str,
     relation_type: str | None = None,
@@ -1031,22 +1481,32 @@ async def query_neighbors(
     properties_filter: dict[str, Any] | None = None,
     sector_filter: list[str] | None = None,  # Story 9-3
     use_ief: bool = False,
-    query_embedding: list[float] | None = None
+    query_embedding: list[float] | None = None,
+    limit: int | None = None,
+    offset: int = 0,
 ) -> list[dict[str, Any]]:
     """
     Query neighbor nodes using single-hop or multi-hop traversal with cycle detection.
 
-    Uses PostgreSQL WITH RECURSIVE CTE for graph traversal with cycle prevention
-    and optional relation type filtering. Supports bidirectional traversal.
+    Traverses level by level with one adjacency query per depth: each node is
+    expanded at most once per direction, and the rows of the former WITH
+    RECURSIVE CTE (shortest simple-path distance per edge, with its cycle
+    detection) are derived in memory (graph_paths.neighbor_edge_hits()), so
+    the work grows with the nodes reached, not with the number of paths.
+    Supports bidirectional traversal and optional relation type filtering.
+    With GRAPH_ADJACENCY_CACHE enabled, traversals without properties_filter
+    run in memory on the project's cached CSR snapshot (graph_cache.py).
 
     Args:
         node_id: UUID string of the starting node
         relation_type: Optional filter for specific relation types (e.g., "USES", "SOLVES")
         max_depth: Maximum traversal depth (1-5, default 1)
         direction: Traversal direction - "both" (default), "outgoing", or "incoming"
-        include_superseded: If False (default), filters out edges with superseded=True
-                           property. Set to True to include superseded edges (e.g., when
-                           querying Resolution edges). See _filter_superseded_edges().
+        include_superseded: If False (default), superseded edges (edges.superseded,
+                           Migration 053; same rule as _is_edge_superseded()) are not
+                           traversed, so nothing behind them is reached either. Set to
+                           True to include superseded edges (e.g., when querying
+                           Resolution edges).
         properties_filter: Optional JSONB filter for edge properties. Supported filters:
                           - "participants": str - Filter edges where participants array contains value
                           - "participants_contains_all": list[str] - Filter where participants has ALL values
@@ -1059,6 +1519,11 @@ async def query_neighbors(
                  Assembly Interface).
         query_embedding: Optional 1536-dimensional query embedding for semantic similarity
                          calculation in IEF.
+        limit: Optional page size. Without use_ief, the traversal hits are collapsed to
+               the best-scored edge per node, ranked and cut to the page inside Postgres
+               (edge_relevance_score(), Migration 054), so only `limit` rows are fetched
+               and formatted. The traversal itself is bounded either way (see above).
+        offset: Number of top-ranked neighbors to skip (with limit)
 
     Returns:
         List of neighbor node dicts with relation, distance, weight, and edge_direction data,
@@ -1075,6 +1540,26 @@ async def query_neighbors(
     if sector_filter is not None and len(sector_filter) == 0:
         return []
 
+    # Adjacency cache: traverse the in-process CSR snapshot instead of the DB
+    # (properties_filter needs JSONB containment and stays on the SQL path)
+    if graph_cache_enabled() and not properties_filter:
+        from mcp_server.middleware.context import get_current_project
+
+        snapshot = await get_graph_snapshot(get_current_project())
+        if snapshot is not None:
+            rows = snapshot.neighbor_rows(
+                node_id, relation_type, max_depth, direction, sector_filter, include_superseded
+            )
+            neighbors = await _rank_neighbor_rows(rows, use_ief, query_embedding)
+            if limit is not None:
+                neighbors = neighbors[offset:offset + limit]
+            await _update_edge_access_stats([row["edge_id"] for row in rows])
+            logger.debug(
+                f"Found {len(neighbors)} neighbors for node {node_id} "
+                f"with max_depth={max_depth}, direction={direction} (adjacency cache)"
+            )
+            return neighbors
+
     try:
         async with get_connection_with_project_context() as conn:
             cursor = conn.cursor()
@@ -1102,267 +1587,77 @@ async def query_neighbors(
                 sector_where_sql = " AND e.memory_sector = ANY(%s::text[])"
                 sector_params = [sector_filter]
 
-            # Use two separate recursive CTEs for bidirectional traversal
-            # PostgreSQL requires that recursive references only appear in the recursive term,
-            # not in the non-recursive (base) term. Using separate CTEs avoids this limitation.
-            #
-            # Story 7.6: Properties filter is applied to all 4 query blocks
-            # (outgoing base, outgoing recursive, incoming base, incoming recursive)
+            # Migration 053: superseded edges are not traversed at all (partial
+            # indexes idx_edges_active_source/target cover the active edges)
+            active_where_sql = "" if include_superseded else " AND NOT e.superseded"
+
             # Story 11.7: Defense-in-depth project_id filter on edges table
             project_filter_sql = " AND e.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])"
-            sql_query = f"""
-                WITH RECURSIVE
-                -- ═══════════════════════════════════════════════════════════════
-                -- CTE 1: Outgoing edges traversal (source → target)
-                -- ═══════════════════════════════════════════════════════════════
-                outgoing_neighbors AS (
-                    -- Base case: direct outgoing neighbors
-                    SELECT
-                        n.id AS node_id,
-                        e.id AS edge_id,
-                        n.label,
-                        n.name,
-                        n.properties AS node_properties,
-                        e.properties AS edge_properties,
-                        e.memory_sector,
-                        e.relation,
-                        e.weight,
-                        e.last_accessed,
-                        e.access_count,
-                        e.modified_at,
-                        1 AS distance,
-                        ARRAY[%s::uuid, n.id] AS path,
-                        'outgoing'::text AS edge_direction
-                    FROM edges e
-                    JOIN nodes n ON e.target_id = n.id
-                    WHERE e.source_id = %s::uuid
-                        AND (%s IS NULL OR e.relation = %s)
-                        {project_filter_sql}
-                        {props_where_sql}
-                        {sector_where_sql}
-
-                    UNION ALL
-
-                    -- Recursive case: follow outgoing edges from found nodes
-                    SELECT
-                        n.id AS node_id,
-                        e.id AS edge_id,
-                        n.label,
-                        n.name,
-                        n.properties AS node_properties,
-                        e.properties AS edge_properties,
-                        e.memory_sector,
-                        e.relation,
-                        e.weight,
-                        e.last_accessed,
-                        e.access_count,
-                        e.modified_at,
-                        ob.distance + 1 AS distance,
-                        ob.path || n.id AS path,
-                        'outgoing'::text AS edge_direction
-                    FROM outgoing_neighbors ob
-                    JOIN edges e ON e.source_id = ob.node_id
-                    JOIN nodes n ON e.target_id = n.id
-                    WHERE ob.distance < %s
-                        AND NOT (n.id = ANY(ob.path))  -- Cycle detection
-                        AND (%s IS NULL OR e.relation = %s)
-                        {project_filter_sql}
-                        {props_where_sql}
-                        {sector_where_sql}
-                ),
-                -- ═══════════════════════════════════════════════════════════════
-                -- CTE 2: Incoming edges traversal (target ← source)
-                -- ═══════════════════════════════════════════════════════════════
-                incoming_neighbors AS (
-                    -- Base case: direct incoming neighbors
-                    SELECT
-                        n.id AS node_id,
-                        e.id AS edge_id,
-                        n.label,
-                        n.name,
-                        n.properties AS node_properties,
-                        e.properties AS edge_properties,
-                        e.memory_sector,
-                        e.relation,
-                        e.weight,
-                        e.last_accessed,
-                        e.access_count,
-                        e.modified_at,
-                        1 AS distance,
-                        ARRAY[%s::uuid, n.id] AS path,
-                        'incoming'::text AS edge_direction
-                    FROM edges e
-                    JOIN nodes n ON e.source_id = n.id
-                    WHERE e.target_id = %s::uuid
-                        AND (%s IS NULL OR e.relation = %s)
-                        {project_filter_sql}
-                        {props_where_sql}
-                        {sector_where_sql}
-
-                    UNION ALL
-
-                    -- Recursive case: follow incoming edges from found nodes
-                    SELECT
-                        n.id AS node_id,
-                        e.id AS edge_id,
-                        n.label,
-                        n.name,
-                        n.properties AS node_properties,
-                        e.properties AS edge_properties,
-                        e.memory_sector,
-                        e.relation,
-                        e.weight,
-                        e.last_accessed,
-                        e.access_count,
-                        e.modified_at,
-                        ib.distance + 1 AS distance,
-                        ib.path || n.id AS path,
-                        'incoming'::text AS edge_direction
-                    FROM incoming_neighbors ib
-                    JOIN edges e ON e.target_id = ib.node_id
-                    JOIN nodes n ON e.source_id = n.id
-                    WHERE ib.distance < %s
-                        AND NOT (n.id = ANY(ib.path))  -- Cycle detection
-                        AND (%s IS NULL OR e.relation = %s)
-                        {project_filter_sql}
-                        {props_where_sql}
-                        {sector_where_sql}
-                ),
-                -- ═══════════════════════════════════════════════════════════════
-                -- Combine results based on direction parameter
-                -- ═══════════════════════════════════════════════════════════════
-                combined AS (
-                    SELECT * FROM outgoing_neighbors WHERE %s = true
-                    UNION ALL
-                    SELECT * FROM incoming_neighbors WHERE %s = true
+
+            # Every level query applies the same edge filters, so nothing
+            # behind a filtered edge is reached (Story 7.6 properties filter,
+            # Story 9-3 sector filter, Migration 053 superseded flag)
+            edge_where_sql = f"""
+                AND (%s IS NULL OR e.relation = %s)
+                {project_filter_sql}
+                {props_where_sql}
+                {sector_where_sql}
+                {active_where_sql}
+            """
+            edge_params = [relation_type, relation_type, *props_params, *sector_params]
+
+            bounded = limit is not None and not use_ief
+            final_params: list[Any] = []
+            if bounded:
+                # Bounded page: the best-scored edge per node (same
+                # tie-breaks as the Python ranking) and LIMIT/OFFSET in SQL,
+                # over the bounded set of traversal hits
+                final_select_sql = """
+                ,
+                best_per_node AS (
+                    SELECT DISTINCT ON (node_id) *
+                    FROM combined
+                    ORDER BY node_id, relevance_score DESC, distance ASC, weight DESC, name ASC
                 )
-                -- Final selection: all edges, deduplication happens in Python after IEF scoring
-                -- (Story: Edge-Deduplizierung nach IEF-Score statt alphabetisch)
                 SELECT
-                    node_id, edge_id, label, name, node_properties, edge_properties, memory_sector, relation, weight, last_accessed, access_count, modified_at, distance, edge_direction
+                    node_id, edge_id, label, name, node_properties, edge_properties, memory_sector, relation, weight, last_accessed, last_engaged, access_count, modified_at, relevance_score, distance, edge_direction
+                FROM best_per_node
+                ORDER BY relevance_score DESC, distance ASC, weight DESC, name ASC, node_id
+                LIMIT %s OFFSET %s;
+                """
+                final_params = [limit, offset]
+            else:
+                # Final selection: all edges, deduplication happens in Python after IEF scoring
+                # (Story: Edge-Deduplizierung nach IEF-Score statt alphabetisch)
+                final_select_sql = """
+                SELECT
+                    node_id, edge_id, label, name, node_properties, edge_properties, memory_sector, relation, weight, last_accessed, last_engaged, access_count, modified_at, relevance_score, distance, edge_direction
                 FROM combined
                 ORDER BY distance ASC, weight DESC, name ASC;
                 """
 
-            # Build parameter tuple with properties filter params repeated for each CTE block
-            # Pattern: base_params + props_params + sector_params (4 times: outgoing base, outgoing rec, incoming base, incoming rec)
-            params: tuple[Any, ...] = (
-                # Outgoing CTE: base case
-                node_id, node_id, relation_type, relation_type,
-                *props_params, *sector_params,  # Properties + sector filter for outgoing base
-                # Outgoing CTE: recursive case
-                max_depth, relation_type, relation_type,
-                *props_params, *sector_params,  # Properties + sector filter for outgoing recursive
-                # Incoming CTE: base case
-                node_id, node_id, relation_type, relation_type,
-                *props_params, *sector_params,  # Properties + sector filter for incoming base
-                # Incoming CTE: recursive case
-                max_depth, relation_type, relation_type,
-                *props_params, *sector_params,  # Properties + sector filter for incoming recursive
-                # Combined: direction filters
-                include_outgoing, include_incoming,
+            # Level-by-level traversal (each node expanded once) instead of a
+            # WITH RECURSIVE CTE that walks every simple path up to max_depth
+            results = await run_in_db_executor(
+                _traverse_neighbors,
+                cursor,
+                node_id,
+                max_depth,
+                include_outgoing,
+                include_incoming,
+                edge_where_sql,
+                edge_params,
+                final_select_sql,
+                final_params,
             )
+            neighbors = await _rank_neighbor_rows(results, use_ief, query_embedding)
+            if limit is not None and not bounded:
+                neighbors = neighbors[offset:offset + limit]
 
-            cursor.execute(sql_query, params)
-
-            results = cursor.fetchall()
-
-            # Format results - NEU: edge_id extrahieren
-            neighbors = []
-            edge_ids_for_update = []
-
-            for row in results:
-                edge_id = str(row["edge_id"]) if row.get("edge_id") else None
-                if edge_id:
-                    edge_ids_for_update.append(edge_id)
-
-                # Datetime serialization: Convert to ISO strings for JSON compatibility
-                last_accessed = row["last_accessed"]
-                modified_at = row["modified_at"]
-
-                neighbors.append({
-                    "node_id": str(row["node_id"]),  # Geändert von "id"
-                    "label": row["label"],
-                    "name": row["name"],
-                    "properties": row["node_properties"],      # Umbenannt
-                    "edge_properties": row["edge_properties"], # NEU
-                    "memory_sector": row["memory_sector"],     # Story 8-5: FR26
-                    "relation": row["relation"],
-                    "weight": float(row["weight"]),
-                    "distance": int(row["distance"]),
-                    "edge_direction": row["edge_direction"],
-                    "last_accessed": last_accessed.isoformat() if last_accessed else None,
-                    "access_count": row["access_count"],       # NEU
-                    "modified_at": modified_at.isoformat() if modified_at else None,
-                    "relevance_score": 0.0,                    # Wird nach Query berechnet
-                })
-
-            # relevance_score für jede Edge berechnen
-            for neighbor in neighbors:
-                edge_data = {
-                    "edge_id": neighbor.get("edge_id"),
-                    "edge_properties": neighbor.get("edge_properties", {}),
-                    "last_accessed": neighbor.get("last_accessed"),
-                    "access_count": neighbor.get("access_count"),
-                    "modified_at": neighbor.get("modified_at"),  # For recency boost
-                    "vector_id": neighbor.get("edge_properties", {}).get("vector_id"),  # For semantic similarity
-                }
-                neighbor["relevance_score"] = calculate_relevance_score(edge_data)
-
-            # NEU: IEF Score Berechnung wenn ICAI aktiviert
-            if use_ief:
-                from mcp_server.analysis.ief import calculate_ief_score
-                from mcp_server.analysis.dissonance import get_pending_nuance_edge_ids
-
-                pending_nuance_ids = get_pending_nuance_edge_ids()
-
-                for neighbor in neighbors:
-                    edge_data = {
-                        "edge_id": neighbor.get("edge_id"),
-                        "edge_properties": neighbor.get("edge_properties", {}),
-                        "last_accessed": neighbor.get("last_accessed"),
-                        "access_count": neighbor.get("access_count"),
-                        "modified_at": neighbor.get("modified_at"),
-                        "vector_id": neighbor.get("edge_properties", {}).get("vector_id"),
-                    }
-                    ief_result = calculate_ief_score(
-                        edge_data=edge_data,
-                        query_embedding=query_embedding,
-                        pending_nuance_edge_ids=pending_nuance_ids
-                    )
-                    neighbor["ief_score"] = ief_result["ief_score"]
-                    neighbor["ief_components"] = ief_result["components"]
-
-            # NEU: Nach relevance_score Berechnung (vor Zeile 853)
-            # MVP: Python-basierte Filterung (einfacher als SQL-Subquery)
-            if not include_superseded:
-                neighbors = await _filter_superseded_edges(neighbors)
-
-            # Sortierung: IEF wenn aktiviert, sonst relevance_score
-            if use_ief:
-                neighbors.sort(key=lambda n: n.get("ief_score", 0), reverse=True)
-            else:
-                neighbors.sort(key=lambda n: n["relevance_score"], reverse=True)
-
-            # Deduplizierung nach Score-Sortierung: Behalte nur Edge mit höchstem Score pro Node
-            # (Story: Edge-Deduplizierung nach IEF-Score statt alphabetisch)
-            seen_nodes: set[str] = set()
-            deduplicated: list[dict[str, Any]] = []
-            for neighbor in neighbors:
-                neighbor_node_id = neighbor.get("node_id")
-                if neighbor_node_id and neighbor_node_id not in seen_nodes:
-                    seen_nodes.add(neighbor_node_id)
-                    deduplicated.append(neighbor)
-            neighbors = deduplicated
-
-            # DISABLED: Auto-update removed to fix Decay reset issue (2026-01-07)
-            # Query-Access should NOT reset Ebbinghaus Decay.
-            # last_accessed is still useful for debugging, but calculate_relevance_score
-            # now uses last_engaged which is only updated by _update_edge_engagement().
-            # See: "Decay wird durch Query-Access zurückgesetzt" bug report
-            #
-            # if edge_ids_for_update:
-            #     _update_edge_access_stats(edge_ids_for_update, conn)
+            # Access telemetry is buffered (edge_stats.py): no write on the read
+            # path, and since the decay clock is last_engaged, query access does
+            # not reset Ebbinghaus Decay (2026-01-07 fix)
+            await _update_edge_access_stats([str(row["edge_id"]) for row in results])
 
             logger.debug(
                 f"Found {len(neighbors)} neighbors for node {node_id} "
@@ -1378,6 +1673,281 @@ async def query_neighbors(
         raise
 
 
+def query_entity_neighbor_insights(conn: Any, entity_names: list[str]) -> list[dict[str, Any]]:
+    """
+    Resolve entities to their depth-1 neighbors' L2 insights in one query.
+
+    Set-based replacement for the per-entity get_node_by_name() ->
+    query_neighbors() -> get_node_by_name() -> l2_insights lookup chain used
+    by the hybrid_search graph channel. Runs on the caller's connection, so
+    the channel costs a single round trip regardless of entity/neighbor count.
+
+    Matching rules mirror the per-entity path:
+    - Each entity resolves to one node by exact name (first match)
+    - Neighbors are direct edges in both directions (distance 1)
+    - A neighbor's insight is nodes.vector_id, falling back to
+      properties->>'vector_id'
+    - Edges, seed nodes and insights are restricted to get_allowed_projects()
+
+    Args:
+        conn: PostgreSQL connection with RLS project context active
+        entity_names: Entity names in query order
+
+    Returns:
+        One row per (entity, edge) with a matching insight, ordered by entity
+        position, then relevance_score DESC (edge_relevance_score(), Migration
+        054), weight DESC and neighbor name. Rows contain entity_ord, entity,
+        neighbor_id, neighbor_name, relation, weight, edge_properties,
+        last_accessed, access_count, relevance_score and the insight columns
+        (id, content, source_ids, metadata, io_category, is_identity,
+        source_file, project_id).
+    """
+    if not entity_names:
+        return []
+
+    cursor = conn.cursor()
+    # Story 11.7: Defense-in-depth project_id filter on every table touched
+    cursor.execute(
+        """
+        WITH seeds AS (
+            SELECT DISTINCT ON (q.ord) q.ord AS entity_ord, q.entity, n.id AS node_id
+            FROM unnest(%s::text[]) WITH ORDINALITY AS q(entity, ord)
+            JOIN nodes n ON n.name = q.entity
+            WHERE n.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+            ORDER BY q.ord, n.created_at
+        ),
+        neighbors AS (
+            SELECT s.entity_ord, s.entity, e.target_id AS neighbor_id, e.relation, e.weight,
+                   e.properties AS edge_properties, e.last_accessed, e.access_count,
+                   edge_relevance_score(e.memory_strength, COALESCE(e.last_engaged, e.last_accessed)) AS relevance_score
+            FROM seeds s
+            JOIN edges e ON e.source_id = s.node_id
+            WHERE e.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+
+            UNION ALL
+
+            SELECT s.entity_ord, s.entity, e.source_id AS neighbor_id, e.relation, e.weight,
+                   e.properties AS edge_properties, e.last_accessed, e.access_count,
+                   edge_relevance_score(e.memory_strength, COALESCE(e.last_engaged, e.last_accessed)) AS relevance_score
+            FROM seeds s
+            JOIN edges e ON e.target_id = s.node_id
+            WHERE e.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        )
+        SELECT nb.entity_ord, nb.entity, nb.neighbor_id, n.name AS neighbor_name,
+               nb.relation, nb.weight, nb.edge_properties, nb.last_accessed, nb.access_count,
+               nb.relevance_score, i.id, i.content, i.source_ids, i.metadata, i.io_category, i.is_identity,
+               i.source_file, i.project_id
+        FROM neighbors nb
+        JOIN nodes n ON n.id = nb.neighbor_id
+        JOIN l2_insights i ON i.id = COALESCE(
+            n.vector_id,
+            CASE WHEN n.properties->>'vector_id' ~ '^[0-9]+$'
+                 THEN (n.properties->>'vector_id')::integer END
+        )
+        WHERE i.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        ORDER BY nb.entity_ord, nb.relevance_score DESC, nb.weight DESC, n.name ASC;
+        """,
+        (list(entity_names),),
+    )
+    return cursor.fetchall()
+
+
+async def _score_paths(
+    paths: list[dict[str, Any]],
+    get_edge_detail: Callable[[str], Awaitable[dict[str, Any] | None]],
+    use_ief: bool,
+    query_embedding: list[float] | None,
+) -> None:
+    """
+    Add relevance (and optionally IEF) scores to find_path() paths in place.
+
+    get_edge_detail returns get_edge_by_id()-shaped dicts; the adjacency
+    cache path reads them from its snapshot instead of one query per edge.
+    Details that already carry a relevance_score (computed in SQL) are not
+    rescored in Python.
+    """
+    # relevance_score für alle Edges im Pfad berechnen
+    for path in paths:
+        edge_scores = []
+        for edge in path["edges"]:
+            edge_detail = await get_edge_detail(edge["edge_id"])
+            if edge_detail:
+                # SQL path: edge_relevance_score() (Migration 054), cache path: Python
+                score = edge_detail.get("relevance_score")
+                if score is None:
+                    score = calculate_relevance_score(edge_detail)
+                score = float(score)
+                edge["relevance_score"] = score
+                edge_scores.append(score)
+            else:
+                edge["relevance_score"] = 1.0  # Fallback
+                edge_scores.append(1.0)
+
+        # Produkt-Aggregation: "Alle Edges müssen relevant sein"
+        # Bei Score 0.5 * 0.5 = 0.25 (Pfad-Qualität sinkt exponentiell)
+        path["path_relevance"] = math.prod(edge_scores) if edge_scores else 1.0
+
+    # NEU: IEF Score für jeden Pfad wenn ICAI aktiviert
+    if use_ief:
+        from mcp_server.analysis.ief import calculate_ief_scores
+        from mcp_server.analysis.dissonance import get_pending_nuance_edge_ids
+
+        pending_nuance_ids = get_pending_nuance_edge_ids()
+
+        # Score each distinct edge once, in one batch across all paths
+        edge_details: dict[str, dict[str, Any]] = {}
+        for path in paths:
+            for edge in path["edges"]:
+                if edge["edge_id"] not in edge_details:
+                    edge_detail = await get_edge_detail(edge["edge_id"])
+                    if edge_detail:
+                        edge_details[edge["edge_id"]] = edge_detail
+        ief_scores = await run_in_db_executor(
+            calculate_ief_scores,
+            list(edge_details.values()),
+            query_embedding=query_embedding,
+            pending_nuance_edge_ids=pending_nuance_ids,
+        )
+        ief_by_edge = dict(zip(edge_details, ief_scores, strict=True))
+
+        for path in paths:
+            path_ief_scores = []
+            for edge in path["edges"]:
+                ief_result = ief_by_edge.get(edge["edge_id"])
+                if ief_result:
+                    edge["ief_score"] = ief_result["ief_score"]
+                    edge["ief_components"] = ief_result["components"]
+                    path_ief_scores.append(ief_result["ief_score"])
+
+            # Pfad-IEF als Produkt (analog zu path_relevance)
+            path["path_ief_score"] = math.prod(path_ief_scores) if path_ief_scores else 1.0
+
+        # Sortierung nach path_ief_score wenn ICAI aktiviert
+        paths.sort(key=lambda p: p.get("path_ief_score", 0), reverse=True)
+
+
+async def _find_path_cached(
+    start_node_name: str,
+    end_node_name: str,
+    max_depth: int,
+    use_ief: bool,
+    query_embedding: list[float] | None,
+) -> dict[str, Any] | None:
+    """
+    find_path() on the adjacency cache snapshot (no CTE, no per-node/edge lookups).
+
+    Returns:
+        find_path() result dict, or None if the project's graph is not cached
+    """
+    from mcp_server.middleware.context import get_current_project
+
+    snapshot = await get_graph_snapshot(get_current_project())
+    if snapshot is None:
+        return None
+
+    start_node = await get_node_by_name(start_node_name)
+    end_node = await get_node_by_name(end_node_name)
+    if not start_node or not end_node:
+        return {"path_found": False, "path_length": 0, "paths": []}
+
+    results = snapshot.find_paths(start_node["id"], end_node["id"], max_depth)
+    if not results:
+        return {"path_found": False, "path_length": 0, "paths": []}
+
+    paths = []
+    for row in results:
+        nodes = [snapshot.node_detail(node_id) for node_id in row["node_path"]]
+        edges = [snapshot.path_edge(edge_id) for edge_id in row["edge_path"]]
+        paths.append({
+            "nodes": [node for node in nodes if node],
+            "edges": [edge for edge in edges if edge],
+            "total_weight": row["total_weight"],
+        })
+
+    async def edge_detail(edge_id: str) -> dict[str, Any] | None:
+        return snapshot.edge_detail(edge_id)
+
+    await _score_paths(paths, edge_detail, use_ief, query_embedding)
+    await _update_edge_access_stats(
+        list({edge_id for row in results for edge_id in row["edge_path"]})
+    )
+    return {
+        "path_found": True,
+        "path_length": results[0]["path_length"],
+        "paths": paths,
+    }
+
+
+def _find_path_rows(
+    cursor: Any,
+    start_id: str,
+    end_id: str,
+    max_depth: int,
+) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Any]]:
+    """
+    Run find_path()'s bidirectional search and hydrate the found paths.
+
+    Blocking; find_path() calls this via run_in_db_executor.
+
+    Returns:
+        (paths from bidirectional_shortest_paths(), node rows by id,
+        edge rows by id); both row dicts are empty if no path was found
+    """
+    # Set query timeout for performance protection (applies to each
+    # frontier query of the search)
+    cursor.execute("SET LOCAL statement_timeout = '1000ms'")
+
+    def expand(frontier: list[str]) -> list[tuple[str, str, str, float]]:
+        # One adjacency query per BFS level; edges are undirected here
+        # Defense-in-depth: explicit project_id filter on edges (Story 11.7)
+        cursor.execute(
+            """
+            SELECT id, source_id, target_id, weight
+            FROM edges
+            WHERE (source_id = ANY(%s::uuid[]) OR target_id = ANY(%s::uuid[]))
+                AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[]);
+            """,
+            (frontier, frontier),
+        )
+        return [
+            (str(row["id"]), str(row["source_id"]), str(row["target_id"]), row["weight"])
+            for row in cursor.fetchall()
+        ]
+
+    # Bidirectional BFS meeting in the middle (graph_paths.py)
+    results = bidirectional_shortest_paths(start_id, end_id, max_depth, expand)
+    if not results:
+        return results, {}, {}
+
+    # Hydrate all nodes and edges of all paths with one query each
+    node_ids = list({node_id for row in results for node_id in row["node_path"]})
+    edge_ids = list({edge_id for row in results for edge_id in row["edge_path"]})
+
+    cursor.execute(
+        """
+        SELECT id, label, name, properties
+        FROM nodes
+        WHERE id = ANY(%s::uuid[]);
+        """,
+        (node_ids,),
+    )
+    node_rows = {str(row["id"]): row for row in cursor.fetchall()}
+
+    cursor.execute(
+        """
+        SELECT id, relation, weight, properties, memory_sector,
+               last_accessed, last_engaged, access_count,
+               edge_relevance_score(memory_strength, COALESCE(last_engaged, last_accessed)) AS relevance_score
+        FROM edges
+        WHERE id = ANY(%s::uuid[])
+            AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[]);
+        """,
+        (edge_ids,),
+    )
+    edge_rows = {str(row["id"]): row for row in cursor.fetchall()}
+    return results, node_rows, edge_rows
+
+
 async def find_path(
     start_node_name: str,
     end_node_name: str,
@@ -1388,8 +1958,13 @@ async def find_path(
     """
     Find the shortest path between two nodes using BFS-based pathfinding.
 
-    Uses PostgreSQL WITH RECURSIVE CTE for BFS traversal with bidirectional
-    edge traversal, cycle detection, and performance protection.
+    Runs a bidirectional BFS (graph_paths.py) that ignores edge direction:
+    the start and end frontiers are expanded alternately with one adjacency
+    query per level, visited nodes are never expanded again, and the search
+    stops where both sides meet. Up to 10 shortest paths are returned,
+    heaviest first; their nodes and edges are then loaded with one query
+    each. With GRAPH_ADJACENCY_CACHE enabled, the same search runs in memory
+    on the project's cached CSR snapshot (graph_cache.py).
 
     Args:
         start_node_name: Name of the starting node
@@ -1410,79 +1985,31 @@ async def find_path(
     start_time = time.time()
 
     try:
-        async with get_connection_with_project_context() as conn:
-            from psycopg2.extras import DictCursor
-            cursor = conn.cursor(cursor_factory=DictCursor)
-
-            # Set query timeout for performance protection
-            cursor.execute("SET LOCAL statement_timeout = '1000ms'")
+        if graph_cache_enabled():
+            cached = await _find_path_cached(
+                start_node_name, end_node_name, max_depth, use_ief, query_embedding
+            )
+            if cached is not None:
+                execution_time = (time.time() - start_time) * 1000
+                logger.debug(f"find_path completed in {execution_time:.2f}ms (adjacency cache)")
+                return cached
 
-            # Get node IDs for start and end nodes
-            start_node = await get_node_by_name(start_node_name)
-            end_node = await get_node_by_name(end_node_name)
+        # Get node IDs for start and end nodes
+        start_node = await get_node_by_name(start_node_name)
+        end_node = await get_node_by_name(end_node_name)
 
-            if not start_node or not end_node:
-                return {"path_found": False, "path_length": 0, "paths": []}
+        if not start_node or not end_node:
+            return {"path_found": False, "path_length": 0, "paths": []}
 
-            start_node_id = start_node["id"]
-            end_node_id = end_node["id"]
+        async with get_connection_with_project_context(read_only=True) as conn:
+            from psycopg2.extras import DictCursor
+            cursor = conn.cursor(cursor_factory=DictCursor)
 
-            # Use recursive CTE for BFS pathfinding with bidirectional traversal
-            # Defense-in-depth: explicit project_id filter on edges (Story 11.7)
-            cursor.execute(
-                """
-                WITH RECURSIVE paths AS (
-                    -- Base case: All neighbors of start node (depth=1)
-                    SELECT
-                        ARRAY[%s::uuid, CASE
-                            WHEN e.source_id = %s::uuid THEN e.target_id
-                            ELSE e.source_id
-                        END] AS node_path,
-                        ARRAY[e.id] AS edge_path,
-                        1 AS path_length,
-                        e.weight AS total_weight
-                    FROM edges e
-                    WHERE (e.source_id = %s::uuid OR e.target_id = %s::uuid)
-                        AND e.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
-
-                    UNION ALL
-
-                    -- Recursive case: Extend paths by one hop
-                    SELECT
-                        p.node_path || CASE
-                            WHEN e.source_id = p.node_path[array_length(p.node_path, 1)]
-                            THEN e.target_id
-                            ELSE e.source_id
-                        END AS node_path,
-                        p.edge_path || e.id AS edge_path,
-                        p.path_length + 1 AS path_length,
-                        p.total_weight + e.weight AS total_weight
-                    FROM paths p
-                    JOIN edges e ON (
-                        e.source_id = p.node_path[array_length(p.node_path, 1)]
-                        OR e.target_id = p.node_path[array_length(p.node_path, 1)]
-                    )
-                    WHERE p.path_length < %s
-                        AND e.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
-                        AND NOT (
-                            CASE
-                                WHEN e.source_id = p.node_path[array_length(p.node_path, 1)]
-                                THEN e.target_id
-                                ELSE e.source_id
-                            END = ANY(p.node_path)
-                        )  -- Cycle detection
-                )
-                SELECT node_path, edge_path, path_length, total_weight
-                FROM paths
-                WHERE node_path[array_length(node_path, 1)] = %s::uuid
-                ORDER BY path_length ASC, total_weight DESC
-                LIMIT 10;
-                """,
-                (start_node_id, start_node_id, start_node_id, start_node_id, max_depth, end_node_id),
+            # Search and hydration run on the DB executor, off the event loop
+            results, node_rows, edge_rows = await run_in_db_executor(
+                _find_path_rows, cursor, str(start_node["id"]), str(end_node["id"]), max_depth
             )
 
-            results = cursor.fetchall()
-
             if not results:
                 # Calculate execution time for performance monitoring
                 execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
@@ -1492,127 +2019,51 @@ async def find_path(
             # Process and format paths
             paths = []
             for row in results:
-                node_path = row["node_path"]  # Array of node UUIDs
-                edge_path = row["edge_path"]  # Array of edge UUIDs
-                total_weight = float(row["total_weight"])
-
-                # Bug #4 Fix: Handle UUID arrays that may be returned as strings
-                # PostgreSQL returns arrays as "{uuid1,uuid2,...}" which psycopg2
-                # may not automatically convert to Python lists
-                if isinstance(node_path, str):
-                    # Parse string representation: "{uuid1,uuid2}" -> ["uuid1", "uuid2"]
-                    node_path = [
-                        uuid_str.strip()
-                        for uuid_str in node_path.strip("{}").split(",")
-                        if uuid_str.strip()
-                    ]
-                if isinstance(edge_path, str):
-                    edge_path = [
-                        uuid_str.strip()
-                        for uuid_str in edge_path.strip("{}").split(",")
-                        if uuid_str.strip()
-                    ]
-
-                # Fetch detailed node information for each node in the path
-                nodes = []
-                for node_id in node_path:
-                    cursor.execute(
-                        """
-                        SELECT id, label, name, properties, vector_id, created_at
-                        FROM nodes
-                        WHERE id = %s::uuid;
-                        """,
-                        (str(node_id),),
-                    )
-                    node_result = cursor.fetchone()
-                    if node_result:
-                        nodes.append({
-                            "node_id": str(node_result["id"]),
-                            "label": node_result["label"],
-                            "name": node_result["name"],
-                            "properties": node_result["properties"],
-                        })
-
-                # Fetch detailed edge information for each edge in the path
-                edges = []
-                for edge_id in edge_path:
-                    cursor.execute(
-                        """
-                        SELECT id, source_id, target_id, relation, weight, properties, memory_sector
-                        FROM edges
-                        WHERE id = %s::uuid;
-                        """,
-                        (str(edge_id),),
-                    )
-                    edge_result = cursor.fetchone()
-                    if edge_result:
-                        edges.append({
-                            "edge_id": str(edge_result["id"]),
-                            "relation": edge_result["relation"],
-                            "weight": float(edge_result["weight"]),
-                            "memory_sector": edge_result["memory_sector"],  # Story 8-5: FR26
-                        })
-
+                nodes = [
+                    {
+                        "node_id": node_id,
+                        "label": node_rows[node_id]["label"],
+                        "name": node_rows[node_id]["name"],
+                        "properties": node_rows[node_id]["properties"],
+                    }
+                    for node_id in row["node_path"]
+                    if node_id in node_rows
+                ]
+                edges = [
+                    {
+                        "edge_id": edge_id,
+                        "relation": edge_rows[edge_id]["relation"],
+                        "weight": float(edge_rows[edge_id]["weight"]),
+                        "memory_sector": edge_rows[edge_id]["memory_sector"],  # Story 8-5: FR26
+                    }
+                    for edge_id in row["edge_path"]
+                    if edge_id in edge_rows
+                ]
                 paths.append({
                     "nodes": nodes,
                     "edges": edges,
-                    "total_weight": total_weight,
+                    "total_weight": row["total_weight"],
                 })
 
-            # relevance_score für alle Edges im Pfad berechnen
-            for path in paths:
-                edge_scores = []
-                for edge in path["edges"]:
-                    edge_detail = await get_edge_by_id(edge["edge_id"])
-                    if edge_detail:
-                        score = calculate_relevance_score(edge_detail)
-                        edge["relevance_score"] = score
-                        edge_scores.append(score)
-                    else:
-                        edge["relevance_score"] = 1.0  # Fallback
-                        edge_scores.append(1.0)
-
-                # Produkt-Aggregation: "Alle Edges müssen relevant sein"
-                # Bei Score 0.5 * 0.5 = 0.25 (Pfad-Qualität sinkt exponentiell)
-                path["path_relevance"] = math.prod(edge_scores) if edge_scores else 1.0
-
-            # NEU: IEF Score für jeden Pfad wenn ICAI aktiviert
-            if use_ief:
-                from mcp_server.analysis.ief import calculate_ief_score
-                from mcp_server.analysis.dissonance import get_pending_nuance_edge_ids
-
-                pending_nuance_ids = get_pending_nuance_edge_ids()
-
-                for path in paths:
-                    path_ief_scores = []
-                    for edge in path["edges"]:
-                        edge_detail = await get_edge_by_id(edge["edge_id"])
-                        if edge_detail:
-                            ief_result = calculate_ief_score(
-                                edge_data=edge_detail,
-                                query_embedding=query_embedding,
-                                pending_nuance_edge_ids=pending_nuance_ids
-                            )
-                            edge["ief_score"] = ief_result["ief_score"]
-                            edge["ief_components"] = ief_result["components"]
-                            path_ief_scores.append(ief_result["ief_score"])
-
-                    # Pfad-IEF als Produkt (analog zu path_relevance)
-                    path["path_ief_score"] = math.prod(path_ief_scores) if path_ief_scores else 1.0
-
-                # Sortierung nach path_ief_score wenn ICAI aktiviert
-                paths.sort(key=lambda p: p.get("path_ief_score", 0), reverse=True)
-
-            # DISABLED: Auto-update removed to fix Decay reset issue (2026-01-07)
-            # Path-finding Query should NOT reset Ebbinghaus Decay.
-            # See: "Decay wird durch Query-Access zurückgesetzt" bug report
-            #
-            # all_edge_ids: set[str] = set()
-            # for path in paths:
-            #     for edge in path["edges"]:
-            #         all_edge_ids.add(edge["edge_id"])
-            # if all_edge_ids:
-            #     _update_edge_access_stats(list(all_edge_ids), conn)
+            async def edge_detail(edge_id: str) -> dict[str, Any] | None:
+                # get_edge_by_id()-shaped dict from the batched edge rows
+                edge_row = edge_rows.get(edge_id)
+                if edge_row is None:
+                    return None
+                return {
+                    "id": edge_id,
+                    "edge_properties": edge_row["properties"],
+                    "last_accessed": edge_row["last_accessed"],
+                    "last_engaged": edge_row.get("last_engaged"),
+                    "access_count": edge_row["access_count"],
+                    "relevance_score": edge_row["relevance_score"],
+                }
+
+            await _score_paths(paths, edge_detail, use_ief, query_embedding)
+
+            # Buffered access telemetry (edge_stats.py); path-finding does not
+            # reset Ebbinghaus Decay (2026-01-07 fix, decay clock is last_engaged)
+            await _update_edge_access_stats(list(edge_rows))
 
             logger.debug(f"Found {len(paths)} paths from '{start_node_name}' to '{end_node_name}' with max_depth={max_depth}")
 
@@ -1629,7 +2080,7 @@ async def find_path(
 
             return {
                 "path_found": True,
-                "path_length": results[0]["path_length"] if results else 0,  # Shortest path length
+                "path_length": results[0]["path_length"],  # Shortest path length
                 "paths": paths,
             }
 
@@ -1672,6 +2123,8 @@ async def delete_edge(
 
     v3 CKG Component 0: Konstitutive Edge Protection
     """
+    from mcp_server.middleware.context import get_project_id
+
     logger = logging.getLogger(__name__)
 
     try:
@@ -1740,6 +2193,7 @@ async def delete_edge(
 
             deleted_result = cursor.fetchone()
             conn.commit()
+            invalidate_graph_cache(get_project_id())
 
             if deleted_result:
                 # Log successful deletion
@@ -0,0 +1,490 @@
+"""
+Graph Adjacency Cache.
+
+Optional in-process snapshot of the graph visible to a project, used by
+query_neighbors() and find_path() instead of WITH RECURSIVE CTEs that carry
+growing path arrays. The graph changes rarely compared with how often it is
+traversed, so one load per project serves many multi-hop queries in memory.
+
+Each snapshot stores the topology as compact CSR arrays (array module):
+- out_offsets/out_edges and in_offsets/in_edges: edge indices grouped by
+  source and by target node index
+- edge_source/edge_target: node indices, edge_relation/edge_sector: codes
+  into the relation/sector tables, edge_weight: float weights,
+  edge_superseded: edges.superseded flags (Migration 053)
+Row payloads (labels, names, properties, access stats) live in parallel
+lists and are only touched for edges that end up in a result.
+
+Snapshots are keyed by project and loaded under that project's RLS context,
+so they contain exactly the nodes and edges the CTEs would see. Graph writes
+in this process drop every snapshot that contains the written project
+(add_node, add_edge, delete_edge, sector/superseded updates) or patch it in
+place (update_node_properties). GRAPH_CACHE_TTL_SECONDS bounds staleness
+from writes made by other processes.
+
+Environment:
+    GRAPH_ADJACENCY_CACHE: "true" enables the cache (default: false)
+    GRAPH_CACHE_TTL_SECONDS: Max snapshot age in seconds (default: 300)
+    GRAPH_CACHE_MAX_EDGES: Larger graphs are not cached (default: 200000)
+
+Usage:
+    from mcp_server.db.graph_cache import get_graph_snapshot, graph_cache_enabled
+
+    if graph_cache_enabled():
+        snapshot = await get_graph_snapshot(project_id)
+        if snapshot is not None:
+            rows = snapshot.neighbor_rows(node_id, max_depth=3)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from array import array
+from collections.abc import Callable
+from typing import Any
+
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.db.graph_paths import bidirectional_shortest_paths, neighbor_edge_hits
+from mcp_server.db.project_cache import ProjectSnapshotCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_GRAPH_CACHE_TTL_SECONDS = 300.0
+DEFAULT_GRAPH_CACHE_MAX_EDGES = 200_000
+
+
+def _build_csr(node_count: int, keys: array) -> tuple[array, array]:
+    """Group edge indices by node index (counting sort) into offsets + edge list."""
+    offsets = array("i", [0] * (node_count + 1))
+    for key in keys:
+        offsets[key + 1] += 1
+    for i in range(node_count):
+        offsets[i + 1] += offsets[i]
+
+    cursor = array("i", offsets[:-1])
+    edges = array("i", [0] * len(keys))
+    for edge_idx, key in enumerate(keys):
+        edges[cursor[key]] = edge_idx
+        cursor[key] += 1
+    return offsets, edges
+
+
+class GraphSnapshot:
+    """
+    Immutable CSR view of a project's graph plus row payloads.
+
+    Only node payloads are patched in place (update_node_properties); the
+    topology is rebuilt on the next load after any edge write.
+    """
+
+    def __init__(
+        self,
+        node_rows: list[dict[str, Any]],
+        edge_rows: list[dict[str, Any]],
+    ) -> None:
+        self.node_ids: list[str] = []
+        self.node_index: dict[str, int] = {}
+        self.nodes: list[dict[str, Any]] = []
+        self.projects: set[str] = set()
+
+        for row in node_rows:
+            node_id = str(row["id"])
+            self.node_index[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+            self.nodes.append({
+                "label": row["label"],
+                "name": row["name"],
+                "properties": row["properties"],
+            })
+            self.projects.add(row["project_id"])
+
+        self.relations: list[str] = []
+        self.relation_codes: dict[str, int] = {}
+        self.sectors: list[str | None] = []
+        self.sector_codes: dict[str | None, int] = {}
+
+        self.edge_ids: list[str] = []
+        self.edge_index: dict[str, int] = {}
+        self.edges: list[dict[str, Any]] = []
+        self.edge_source = array("i")
+        self.edge_target = array("i")
+        self.edge_relation = array("I")
+        self.edge_sector = array("B")
+        self.edge_weight = array("d")
+        self.edge_superseded = array("B")
+
+        for row in edge_rows:
+            source = self.node_index.get(str(row["source_id"]))
+            target = self.node_index.get(str(row["target_id"]))
+            if source is None or target is None:
+                # Same as the CTE join: edges to invisible nodes are skipped
+                continue
+
+            edge_id = str(row["id"])
+            self.edge_index[edge_id] = len(self.edge_ids)
+            self.edge_ids.append(edge_id)
+            self.edges.append({
+                "properties": row["properties"],
+                "last_accessed": row["last_accessed"],
+                "last_engaged": row.get("last_engaged"),
+                "access_count": row["access_count"],
+                "modified_at": row["modified_at"],
+            })
+            self.edge_source.append(source)
+            self.edge_target.append(target)
+            self.edge_relation.append(self._code(self.relations, self.relation_codes, row["relation"]))
+            self.edge_sector.append(self._code(self.sectors, self.sector_codes, row["memory_sector"]))
+            self.edge_weight.append(float(row["weight"]))
+            self.edge_superseded.append(1 if row.get("superseded") else 0)
+            self.projects.add(row["project_id"])
+
+        self.superseded_count = sum(self.edge_superseded)
+        self.out_offsets, self.out_edges = _build_csr(len(self.node_ids), self.edge_source)
+        self.in_offsets, self.in_edges = _build_csr(len(self.node_ids), self.edge_target)
+        self.loaded_at = time.monotonic()
+
+    @staticmethod
+    def _code(table: list, codes: dict, value: Any) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(table)
+            table.append(value)
+        return code
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_ids)
+
+    # ------------------------------------------------------------------
+    # Edge filters and adjacency
+    # ------------------------------------------------------------------
+
+    def _edge_filter(
+        self,
+        relation_type: str | None,
+        sector_filter: list[str] | None,
+        include_superseded: bool = True,
+    ) -> Callable[[int], bool] | None:
+        """Predicate over edge indices (None = every edge passes, -1 code = nothing matches)."""
+        skip_superseded = not include_superseded and self.superseded_count > 0
+        relation_code = None
+        if relation_type is not None:
+            relation_code = self.relation_codes.get(relation_type, -1)
+        sector_codes = None
+        if sector_filter is not None:
+            sector_codes = {self.sector_codes[s] for s in sector_filter if s in self.sector_codes}
+
+        if relation_code is None and sector_codes is None and not skip_superseded:
+            return None
+
+        edge_relation, edge_sector, edge_superseded = self.edge_relation, self.edge_sector, self.edge_superseded
+
+        def passes(edge_idx: int) -> bool:
+            if skip_superseded and edge_superseded[edge_idx]:
+                return False
+            if relation_code is not None and edge_relation[edge_idx] != relation_code:
+                return False
+            return sector_codes is None or edge_sector[edge_idx] in sector_codes
+
+        return passes
+
+    def _directed(
+        self, outgoing: bool, edge_ok: Callable[[int], bool] | None
+    ) -> Callable[[int], list[tuple[int, int]]]:
+        """Return expand(v) -> [(edge_idx, far node idx)] for one traversal direction."""
+        if outgoing:
+            offsets, edges, far = self.out_offsets, self.out_edges, self.edge_target
+        else:
+            offsets, edges, far = self.in_offsets, self.in_edges, self.edge_source
+
+        def expand(v: int) -> list[tuple[int, int]]:
+            return [
+                (e, far[e])
+                for e in edges[offsets[v]:offsets[v + 1]]
+                if edge_ok is None or edge_ok(e)
+            ]
+
+        return expand
+
+    def _undirected(self, v: int) -> list[tuple[int, int]]:
+        """(edge_idx, other endpoint) for every edge touching v."""
+        out = [(e, self.edge_target[e]) for e in self.out_edges[self.out_offsets[v]:self.out_offsets[v + 1]]]
+        out.extend(
+            (e, self.edge_source[e]) for e in self.in_edges[self.in_offsets[v]:self.in_offsets[v + 1]]
+            if self.edge_source[e] != self.edge_target[e]  # self-loops are listed once
+        )
+        return out
+
+    # ------------------------------------------------------------------
+    # Traversals
+    # ------------------------------------------------------------------
+
+    def neighbor_rows(
+        self,
+        node_id: str,
+        relation_type: str | None = None,
+        max_depth: int = 1,
+        direction: str = "both",
+        sector_filter: list[str] | None = None,
+        include_superseded: bool = False,
+    ) -> list[dict[str, Any]]:
+        """
+        Rows equivalent to the query_neighbors() CTE, shortest row per edge.
+
+        As in the CTE, superseded edges are not traversed unless
+        include_superseded is set.
+
+        Returns:
+            Row dicts with the CTE's columns, ordered by distance ASC,
+            weight DESC, name ASC
+        """
+        start = self.node_index.get(node_id)
+        if start is None:
+            return []
+
+        edge_ok = self._edge_filter(relation_type, sector_filter, include_superseded)
+        rows: list[dict[str, Any]] = []
+        for outgoing, label in ((True, "outgoing"), (False, "incoming")):
+            if direction not in ("both", label):
+                continue
+            far = self.edge_target if outgoing else self.edge_source
+            hits = neighbor_edge_hits(start, max_depth, self._directed(outgoing, edge_ok))
+            for edge_idx, distance in hits.items():
+                node_idx = far[edge_idx]
+                node = self.nodes[node_idx]
+                edge = self.edges[edge_idx]
+                rows.append({
+                    "node_id": self.node_ids[node_idx],
+                    "edge_id": self.edge_ids[edge_idx],
+                    "label": node["label"],
+                    "name": node["name"],
+                    "node_properties": node["properties"],
+                    "edge_properties": edge["properties"],
+                    "memory_sector": self.sectors[self.edge_sector[edge_idx]],
+                    "relation": self.relations[self.edge_relation[edge_idx]],
+                    "weight": self.edge_weight[edge_idx],
+                    "last_accessed": edge["last_accessed"],
+                    "last_engaged": edge["last_engaged"],
+                    "access_count": edge["access_count"],
+                    "modified_at": edge["modified_at"],
+                    "distance": distance,
+                    "edge_direction": label,
+                })
+
+        rows.sort(key=lambda r: (r["distance"], -r["weight"], r["name"]))
+        return rows
+
+    def find_paths(
+        self,
+        start_id: str,
+        end_id: str,
+        max_depth: int,
+        limit: int = 10,
+    ) -> list[dict[str, Any]]:
+        """
+        Shortest simple paths between two nodes, ignoring edge direction.
+
+        Same bidirectional search as the SQL path of find_path()
+        (graph_paths.py), with CSR lookups instead of one query per level.
+
+        Returns:
+            List of dicts with node_path, edge_path (id strings), path_length
+            and total_weight
+        """
+        start = self.node_index.get(start_id)
+        end = self.node_index.get(end_id)
+        if start is None or end is None:
+            return []
+
+        edge_source, edge_target, edge_weight = self.edge_source, self.edge_target, self.edge_weight
+
+        def expand(frontier: list[int]) -> list[tuple[int, int, int, float]]:
+            seen: set[int] = set()
+            touching = []
+            for v in frontier:
+                for edge_idx, _ in self._undirected(v):
+                    if edge_idx not in seen:
+                        seen.add(edge_idx)
+                        touching.append(
+                            (edge_idx, edge_source[edge_idx], edge_target[edge_idx], edge_weight[edge_idx])
+                        )
+            return touching
+
+        results = bidirectional_shortest_paths(start, end, max_depth, expand, limit)
+        for row in results:
+            row["node_path"] = [self.node_ids[n] for n in row["node_path"]]
+            row["edge_path"] = [self.edge_ids[e] for e in row["edge_path"]]
+        return results
+
+    # ------------------------------------------------------------------
+    # Row lookups
+    # ------------------------------------------------------------------
+
+    def node_detail(self, node_id: str) -> dict[str, Any] | None:
+        """find_path() node dict (node_id, label, name, properties)."""
+        idx = self.node_index.get(node_id)
+        if idx is None:
+            return None
+        node = self.nodes[idx]
+        return {"node_id": node_id, "label": node["label"], "name": node["name"], "properties": node["properties"]}
+
+    def edge_detail(self, edge_id: str) -> dict[str, Any] | None:
+        """Edge dict shaped like get_edge_by_id() (input for relevance/IEF scoring)."""
+        idx = self.edge_index.get(edge_id)
+        if idx is None:
+            return None
+        edge = self.edges[idx]
+        return {
+            "id": edge_id,
+            "edge_properties": edge["properties"],
+            "last_accessed": edge["last_accessed"],
+            "last_engaged": edge["last_engaged"],
+            "access_count": edge["access_count"],
+        }
+
+    def path_edge(self, edge_id: str) -> dict[str, Any] | None:
+        """find_path() edge dict (edge_id, relation, weight, memory_sector)."""
+        idx = self.edge_index.get(edge_id)
+        if idx is None:
+            return None
+        return {
+            "edge_id": edge_id,
+            "relation": self.relations[self.edge_relation[idx]],
+            "weight": self.edge_weight[idx],
+            "memory_sector": self.sectors[self.edge_sector[idx]],
+        }
+
+    def patch_node(self, node_id: str, label: str, name: str, properties: Any) -> bool:
+        """Replace a node's payload in place; False if the node is not in this snapshot."""
+        idx = self.node_index.get(node_id)
+        if idx is None:
+            return False
+        self.nodes[idx] = {"label": label, "name": name, "properties": properties}
+        return True
+
+
+def load_graph_rows(conn: Any, max_edges: int) -> tuple[list[dict], list[dict]] | None:
+    """
+    Fetch all nodes and edges visible under the connection's RLS context.
+
+    Returns:
+        (node_rows, edge_rows), or None if the graph has more than max_edges edges
+    """
+    cursor = conn.cursor()
+    # Defense-in-depth: explicit project_id filter (Story 11.7)
+    cursor.execute(
+        """
+        SELECT id, project_id, source_id, target_id, relation, weight, memory_sector,
+               properties, last_accessed, last_engaged, access_count, modified_at, superseded
+        FROM edges
+        WHERE project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        LIMIT %s;
+        """,
+        (max_edges + 1,),
+    )
+    edge_rows = cursor.fetchall()
+    if len(edge_rows) > max_edges:
+        return None
+
+    cursor.execute(
+        """
+        SELECT id, project_id, label, name, properties
+        FROM nodes
+        WHERE project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[]);
+        """
+    )
+    return cursor.fetchall(), edge_rows
+
+
+class GraphAdjacencyCache(ProjectSnapshotCache[GraphSnapshot]):
+    """Per-project GraphSnapshot store (project_cache.py)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_GRAPH_CACHE_TTL_SECONDS,
+        max_edges: int = DEFAULT_GRAPH_CACHE_MAX_EDGES,
+    ) -> None:
+        super().__init__(self._load, ttl_seconds)
+        self.max_edges = max_edges
+
+    async def _load(self, project_id: str) -> GraphSnapshot | None:
+        """Load project_id's graph under its RLS context (None if too large)."""
+        async with get_connection_with_project_context(read_only=True) as conn:
+            rows = await run_in_db_executor(load_graph_rows, conn, self.max_edges)
+        if rows is None:
+            logger.info(f"Graph of project {project_id} exceeds {self.max_edges} edges, not cached")
+            return None
+
+        snapshot = GraphSnapshot(*rows)
+        logger.debug(
+            f"Loaded graph snapshot for {project_id}: "
+            f"{len(snapshot.node_ids)} nodes, {snapshot.edge_count} edges"
+        )
+        return snapshot
+
+    def patch_node(self, node_id: str, label: str, name: str, properties: Any) -> None:
+        """Apply an updated node payload to every snapshot that holds the node."""
+        self.update_each(lambda snapshot: snapshot.patch_node(node_id, label, name, properties))
+
+
+# Singleton instance for module-level access
+_cache_instance: GraphAdjacencyCache | None = None
+_cache_lock = threading.Lock()
+
+
+def graph_cache_enabled() -> bool:
+    """True if GRAPH_ADJACENCY_CACHE is set to a truthy value."""
+    return os.getenv("GRAPH_ADJACENCY_CACHE", "false").strip().lower() in ("1", "true", "yes")
+
+
+def get_graph_cache() -> GraphAdjacencyCache:
+    """
+    Get the shared GraphAdjacencyCache, configured from the environment on first use.
+
+    Environment:
+        GRAPH_CACHE_TTL_SECONDS: Max snapshot age in seconds (default: 300)
+        GRAPH_CACHE_MAX_EDGES: Graphs with more edges are not cached (default: 200000)
+
+    Returns:
+        Shared GraphAdjacencyCache instance
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                try:
+                    ttl = float(os.getenv("GRAPH_CACHE_TTL_SECONDS", str(DEFAULT_GRAPH_CACHE_TTL_SECONDS)))
+                    max_edges = int(os.getenv("GRAPH_CACHE_MAX_EDGES", str(DEFAULT_GRAPH_CACHE_MAX_EDGES)))
+                except ValueError:
+                    logger.warning("Invalid graph cache configuration, using defaults")
+                    ttl, max_edges = DEFAULT_GRAPH_CACHE_TTL_SECONDS, DEFAULT_GRAPH_CACHE_MAX_EDGES
+                _cache_instance = GraphAdjacencyCache(ttl_seconds=ttl, max_edges=max_edges)
+    return _cache_instance
+
+
+async def get_graph_snapshot(project_id: str) -> GraphSnapshot | None:
+    """Snapshot of project_id's graph from the shared cache (None if not cacheable)."""
+    return await get_graph_cache().get(project_id)
+
+
+def invalidate_graph_cache(project_id: str | None = None) -> None:
+    """
+    Drop cached snapshots after a graph write (no-op while nothing is cached).
+
+    Args:
+        project_id: Project whose nodes/edges changed; None drops everything
+    """
+    if _cache_instance is not None:
+        _cache_instance.invalidate(project_id)
+
+
+def patch_graph_cache_node(node_id: str, label: str, name: str, properties: Any) -> None:
+    """Patch a node payload in cached snapshots after update_node_properties()."""
+    if _cache_instance is not None:
+        _cache_instance.patch_node(node_id, label, name, properties)
@@ -0,0 +1,220 @@
+"""
+Bidirectional Shortest-Path Search.
+
+Breadth-first search from both ends of a find_path() query at once, used by
+the SQL path (one adjacency query per BFS level) and by the adjacency cache
+snapshot (CSR lookups). Each side only expands nodes it has not visited yet,
+so a depth-d search touches about two balls of radius d/2 instead of every
+simple path of length d from the start node.
+
+Edges are traversed ignoring their direction, as in the former find_path()
+CTE. Only shortest paths are returned: the search stops at the first level
+where both sides meet, and the `limit` heaviest paths of that length are
+picked with a k-best pass over the BFS predecessor DAGs, without
+enumerating every shortest path.
+
+Usage:
+    from mcp_server.db.graph_paths import bidirectional_shortest_paths
+
+    def expand(frontier):
+        # every edge touching a frontier node: (edge_id, source, target, weight)
+        ...
+
+    paths = bidirectional_shortest_paths(start_id, end_id, max_depth, expand)
+
+neighbor_edge_hits() is the directed counterpart for query_neighbors(): it
+reproduces the rows of the former WITH RECURSIVE CTE (shortest simple-path
+distance per edge) from a BFS that expands every node once, for the SQL
+path (adjacency loaded level by level) and the adjacency cache alike.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable
+from typing import Any
+
+# (edge_id, source_id, target_id, weight)
+PathEdge = tuple[Hashable, Hashable, Hashable, float]
+
+# v -> [(edge_id, far node)] along one traversal direction
+Expand = Callable[[Hashable], Iterable[tuple[Hashable, Hashable]]]
+
+# node -> [(edge_id, predecessor node, edge weight)] towards that side's root
+_Predecessors = dict[Hashable, list[tuple[Hashable, Hashable, float]]]
+
+
+def _best_paths(
+    predecessors: _Predecessors,
+    node: Hashable,
+    limit: int,
+    memo: dict[Hashable, list[tuple[float, list[Hashable], list[Hashable]]]],
+) -> list[tuple[float, list[Hashable], list[Hashable]]]:
+    """
+    The `limit` heaviest (weight, nodes, edges) paths from the side's root to node.
+
+    Paths are listed root first; every predecessor is one BFS level closer
+    to the root, so the recursion depth is bounded by the search radius.
+    """
+    if node in memo:
+        return memo[node]
+    preds = predecessors[node]
+    if not preds:
+        best = [(0.0, [node], [])]
+    else:
+        candidates = [
+            (weight + edge_weight, nodes + [node], edges + [edge_id])
+            for edge_id, prev, edge_weight in preds
+            for weight, nodes, edges in _best_paths(predecessors, prev, limit, memo)
+        ]
+        candidates.sort(key=lambda p: -p[0])
+        best = candidates[:limit]
+    memo[node] = best
+    return best
+
+
+def bidirectional_shortest_paths(
+    start: Hashable,
+    end: Hashable,
+    max_depth: int,
+    expand: Callable[[list[Hashable]], Iterable[PathEdge]],
+    limit: int = 10,
+) -> list[dict[str, Any]]:
+    """
+    Up to `limit` shortest paths between start and end, heaviest first.
+
+    Args:
+        start: Start node ID
+        end: End node ID (must differ from start)
+        max_depth: Maximum path length in hops
+        expand: Returns every edge with an endpoint in the given frontier
+            (each edge at most once), ignoring direction
+        limit: Maximum number of paths
+
+    Returns:
+        List of dicts with node_path, edge_path, path_length and
+        total_weight, ordered by total_weight DESC; empty if no path of at
+        most max_depth hops exists
+    """
+    if start == end or max_depth < 1:
+        return []
+
+    distances: tuple[dict[Hashable, int], dict[Hashable, int]] = ({start: 0}, {end: 0})
+    predecessors: tuple[_Predecessors, _Predecessors] = ({start: []}, {end: []})
+    frontiers: list[list[Hashable]] = [[start], [end]]
+    radius = [0, 0]
+    meeting: list[Hashable] = []
+
+    while not meeting and radius[0] + radius[1] < max_depth:
+        # Expand the smaller frontier (fewer edges to fetch per level)
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        dist, preds = distances[side], predecessors[side]
+        frontier = set(frontiers[side])
+        level = radius[side] + 1
+        next_frontier: list[Hashable] = []
+
+        for edge_id, source, target, weight in expand(frontiers[side]):
+            for u, w in ((source, target), (target, source)):
+                if u not in frontier or u == w:
+                    continue
+                if w not in dist:
+                    dist[w] = level
+                    preds[w] = []
+                    next_frontier.append(w)
+                if dist[w] == level:
+                    preds[w].append((edge_id, u, float(weight)))
+
+        radius[side] = level
+        frontiers[side] = next_frontier
+        if not next_frontier:
+            return []
+        # The first level on which the balls intersect fixes the shortest
+        # length (radius sum); every meeting node lies on the other
+        # side's outermost level.
+        other = distances[1 - side]
+        meeting = [v for v in next_frontier if v in other]
+
+    if not meeting:
+        return []
+
+    path_length = radius[0] + radius[1]
+    memo_start: dict[Hashable, list[tuple[float, list[Hashable], list[Hashable]]]] = {}
+    memo_end: dict[Hashable, list[tuple[float, list[Hashable], list[Hashable]]]] = {}
+    found: list[tuple[float, list[Hashable], list[Hashable]]] = []
+    for node in meeting:
+        heads = _best_paths(predecessors[0], node, limit, memo_start)
+        tails = _best_paths(predecessors[1], node, limit, memo_end)
+        for head_weight, head_nodes, head_edges in heads:
+            for tail_weight, tail_nodes, tail_edges in tails:
+                found.append((
+                    head_weight + tail_weight,
+                    head_nodes + tail_nodes[-2::-1],
+                    head_edges + tail_edges[::-1],
+                ))
+
+    found.sort(key=lambda p: -p[0])
+    return [
+        {
+            "node_path": nodes,
+            "edge_path": edges,
+            "path_length": path_length,
+            "total_weight": weight,
+        }
+        for weight, nodes, edges in found[:limit]
+    ]
+
+
+def bfs_distances(
+    start: Hashable,
+    expand: Expand,
+    max_distance: int,
+    avoid: Hashable | None = None,
+) -> dict[Hashable, int]:
+    """Hop distances from start up to max_distance, never entering `avoid`."""
+    distances = {start: 0}
+    frontier = [start]
+    for distance in range(1, max_distance + 1):
+        next_frontier = []
+        for v in frontier:
+            for _, w in expand(v):
+                if w != avoid and w not in distances:
+                    distances[w] = distance
+                    next_frontier.append(w)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return distances
+
+
+def neighbor_edge_hits(start: Hashable, max_depth: int, expand: Expand) -> dict[Hashable, int]:
+    """
+    Minimal distance at which each edge ends a simple path from start.
+
+    The former query_neighbors() CTE emitted one row per simple path (start
+    excluded from revisits after the first hop). Rows of the same edge only
+    differ in distance, and only the shortest one is kept, so per edge
+    u -> n it is enough to know the shortest path to u avoiding n.
+
+    expand() is only called for nodes within max_depth - 1 hops of start.
+    """
+    distances = bfs_distances(start, expand, max_depth - 1)
+    avoiding: dict[Hashable, dict[Hashable, int]] = {}
+    hits: dict[Hashable, int] = {}
+
+    for u, du in distances.items():
+        for edge_id, n in expand(u):
+            if u == start:
+                hits[edge_id] = 1
+                continue
+            if n == start or n == u:
+                continue  # cycle detection
+            du_without_n: int | None = du
+            dn = distances.get(n)
+            if dn is not None and dn < du:
+                # n may lie on every shortest path to u: re-run BFS without n
+                if n not in avoiding:
+                    avoiding[n] = bfs_distances(start, expand, max_depth - 1, avoid=n)
+                du_without_n = avoiding[n].get(u)
+                if du_without_n is None:
+                    continue
+            hits[edge_id] = du_without_n + 1
+    return hits
@@ -0,0 +1,31 @@
+-- Migration 050: HNSW Vector Indexes for l2_insights and episode_memory
+--
+-- Problem: 001_initial_schema.sql left idx_l2_embedding / idx_episode_embedding
+-- commented out (IVFFlat needs training data). configure_pgvector_iterative_scans()
+-- sets hnsw.* GUCs on every connection, but without an HNSW index
+-- semantic_search() and episode_semantic_search() fall back to sequential scans.
+--
+-- Solution: HNSW indexes with cosine ops (matches the <=> operator used in the
+-- search functions). HNSW needs no training data, so it can be built on an
+-- empty or small table and stays correct as rows are added.
+--
+-- Build parameters: m = 16, ef_construction = 64 (pgvector defaults).
+-- For custom parameters, progress reporting and index size use the admin CLI:
+--   python scripts/manage_vector_indexes.py build --m 24 --ef-construction 128
+--
+-- IMPORTANT: CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+-- Apply with psql in autocommit mode (no BEGIN/COMMIT wrapper, no -1 flag).
+-- Existing indexes with the same name are left untouched (IF NOT EXISTS).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_l2_embedding_hnsw
+    ON l2_insights USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_episode_embedding_hnsw
+    ON episode_memory USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- Verify: both indexes exist and are valid (indisvalid = true)
+-- SELECT c.relname, i.indisvalid, pg_size_pretty(pg_relation_size(c.oid))
+-- FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+-- WHERE c.relname IN ('idx_l2_embedding_hnsw', 'idx_episode_embedding_hnsw');
@@ -0,0 +1,4 @@
+-- Rollback Migration 050: Remove HNSW Vector Indexes
+-- Run in autocommit mode (DROP INDEX CONCURRENTLY cannot run in a transaction)
+DROP INDEX CONCURRENTLY IF EXISTS idx_l2_embedding_hnsw;
+DROP INDEX CONCURRENTLY IF EXISTS idx_episode_embedding_hnsw;
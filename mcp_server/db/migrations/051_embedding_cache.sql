@@ -0,0 +1,28 @@
+-- Migration 051: Persistent query-embedding cache
+--
+-- Problem: generate_query_embedding(), execute_golden_test(), handle_l2_insights
+-- and suggest_lateral_edges call the OpenAI embeddings API for every request,
+-- even for query texts that were embedded minutes (or a day) earlier.
+--
+-- Solution: embedding_cache table behind the in-process LRU in
+-- mcp_server/external/embedding_cache.py. Key is (model, sha256 of the
+-- whitespace-normalized text); the text itself is never stored, so the table
+-- holds no project content and is intentionally not covered by RLS.
+--
+-- Dependencies: pgvector extension (Migration 001)
+-- Breaking Changes: KEINE - New table, migration is idempotent
+
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model VARCHAR(100) NOT NULL,
+    text_hash CHAR(64) NOT NULL,           -- sha256 hex of normalized text
+    embedding vector NOT NULL,             -- untyped dimension: one table for all models
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_used_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (model, text_hash)
+);
+
+-- Pruning of cold entries, e.g.:
+-- DELETE FROM embedding_cache WHERE last_used_at < NOW() - INTERVAL '90 days';
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_last_used_at
+    ON embedding_cache(last_used_at);
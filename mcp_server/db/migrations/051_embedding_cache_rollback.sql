@@ -0,0 +1,5 @@
+-- Rollback Migration 051: Persistent query-embedding cache
+-- Safe: the cache only holds derived data; callers fall back to the API.
+
+DROP INDEX IF EXISTS idx_embedding_cache_last_used_at;
+DROP TABLE IF EXISTS embedding_cache;
@@ -0,0 +1,39 @@
+-- Migration 052: Write-behind embeddings for l2_insights and episode_memory
+--
+-- Problem: compress_to_l2_insight and store_episode block the tool response on
+-- the OpenAI embeddings call (store_episode even holds a pooled connection
+-- while waiting). embedding was NOT NULL, so a row could not exist before its
+-- vector did.
+--
+-- Solution: optional async ingest mode. Rows are inserted immediately with
+-- embedding = NULL and embedding_status = 'pending' (keyword search finds them
+-- right away); the embedding worker (mcp_server/external/embedding_worker.py)
+-- fills vectors in batches and flips the status to 'success'. Rows that keep
+-- failing are marked 'failed' after EMBEDDING_MAX_ATTEMPTS tries.
+--
+-- Vector queries filter on embedding IS NOT NULL. The partial indexes keep
+-- the worker's pending scan cheap regardless of table size.
+--
+-- Dependencies: Migration 001 (tables), Migration 050 (HNSW indexes skip NULLs)
+-- Breaking Changes: KEINE - existing rows default to 'success', migration is idempotent
+
+ALTER TABLE l2_insights ALTER COLUMN embedding DROP NOT NULL;
+ALTER TABLE l2_insights
+    ADD COLUMN IF NOT EXISTS embedding_status VARCHAR(10) NOT NULL DEFAULT 'success'
+        CHECK (embedding_status IN ('pending', 'success', 'failed')),
+    ADD COLUMN IF NOT EXISTS embedding_attempts SMALLINT NOT NULL DEFAULT 0;
+
+ALTER TABLE episode_memory ALTER COLUMN embedding DROP NOT NULL;
+ALTER TABLE episode_memory
+    ADD COLUMN IF NOT EXISTS embedding_status VARCHAR(10) NOT NULL DEFAULT 'success'
+        CHECK (embedding_status IN ('pending', 'success', 'failed')),
+    ADD COLUMN IF NOT EXISTS embedding_attempts SMALLINT NOT NULL DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_l2_insights_embedding_pending
+    ON l2_insights(id) WHERE embedding_status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_episode_memory_embedding_pending
+    ON episode_memory(id) WHERE embedding_status = 'pending';
+
+-- Verify: no row is missing a vector unless it is pending/failed
+-- SELECT COUNT(*) FROM l2_insights WHERE embedding IS NULL AND embedding_status = 'success';
@@ -0,0 +1,20 @@
+-- Rollback Migration 052: Write-behind embeddings
+-- WARNING: rows still waiting for a vector (embedding IS NULL) are deleted,
+-- since the NOT NULL constraint cannot be restored while they exist.
+-- Let the embedding worker drain the queue first to avoid data loss:
+--   SELECT COUNT(*) FROM l2_insights WHERE embedding IS NULL;
+--   SELECT COUNT(*) FROM episode_memory WHERE embedding IS NULL;
+
+DROP INDEX IF EXISTS idx_l2_insights_embedding_pending;
+DROP INDEX IF EXISTS idx_episode_memory_embedding_pending;
+
+DELETE FROM l2_insights WHERE embedding IS NULL;
+DELETE FROM episode_memory WHERE embedding IS NULL;
+
+ALTER TABLE l2_insights DROP COLUMN IF EXISTS embedding_attempts;
+ALTER TABLE l2_insights DROP COLUMN IF EXISTS embedding_status;
+ALTER TABLE l2_insights ALTER COLUMN embedding SET NOT NULL;
+
+ALTER TABLE episode_memory DROP COLUMN IF EXISTS embedding_attempts;
+ALTER TABLE episode_memory DROP COLUMN IF EXISTS embedding_status;
+ALTER TABLE episode_memory ALTER COLUMN embedding SET NOT NULL;
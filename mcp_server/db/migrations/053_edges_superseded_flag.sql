@@ -0,0 +1,39 @@
+-- Migration 053: Materialized superseded flag on edges
+--
+-- Problem: query_neighbors() walked superseded edges like any other edge and
+-- only dropped them afterwards in Python (_filter_superseded_edges), so the
+-- recursive CTEs kept expanding branches behind edges that EVOLUTION
+-- resolutions had retired.
+--
+-- Solution: edges.superseded is a generated column computed from the same
+-- rule as _is_edge_superseded() - properties.superseded = true or a status
+-- containing "superseded", resolution edges never count. Every write path
+-- that sets those properties (_mark_edge_as_superseded via resolve_dissonance
+-- and SMF approvals) maintains it without extra application code.
+--
+-- The partial indexes cover only active edges, so traversals with
+-- include_superseded=false (the default) filter on NOT superseded in every
+-- CTE step and never enter superseded branches.
+--
+-- Dependencies: Migration 012 (edges), Migration 015 (edge temporal fields)
+-- Risk: MEDIUM - adding a stored generated column rewrites the edges table
+-- Rollback: 053_edges_superseded_flag_rollback.sql
+
+ALTER TABLE edges
+    ADD COLUMN IF NOT EXISTS superseded BOOLEAN GENERATED ALWAYS AS (
+        COALESCE(properties->>'edge_type', '') <> 'resolution'
+        AND (
+            COALESCE(properties->'superseded' = 'true'::jsonb, false)
+            OR COALESCE(properties->>'status', '') ILIKE '%superseded%'
+        )
+    ) STORED;
+
+-- Outbound / inbound traversal steps over active edges
+CREATE INDEX IF NOT EXISTS idx_edges_active_source
+    ON edges(source_id) WHERE NOT superseded;
+
+CREATE INDEX IF NOT EXISTS idx_edges_active_target
+    ON edges(target_id) WHERE NOT superseded;
+
+-- Verify: distribution of the flag
+-- SELECT superseded, COUNT(*) FROM edges GROUP BY superseded;
@@ -0,0 +1,7 @@
+-- Rollback Migration 053: Materialized superseded flag on edges
+-- The flag is derived from edges.properties, no data is lost.
+
+DROP INDEX IF EXISTS idx_edges_active_source;
+DROP INDEX IF EXISTS idx_edges_active_target;
+
+ALTER TABLE edges DROP COLUMN IF EXISTS superseded;
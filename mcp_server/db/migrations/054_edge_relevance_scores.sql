@@ -0,0 +1,113 @@
+-- Migration 054: Materialized memory strength and SQL relevance score for edges
+--
+-- Problem: calculate_relevance_score() recomputed the Ebbinghaus decay in
+-- Python for every edge of every traversal (sector config lookup, ISO
+-- timestamp parsing, one debug record per edge), and query_neighbors() /
+-- find_path() / the graph search channel could only rank edges after
+-- fetching all of them.
+--
+-- Solution: split the formula relevance = exp(-days_since / S) into
+--   - edges.memory_strength: S = max(S_base * (1 + ln(1 + access_count)), S_floor)
+--     per sector, 'Infinity' for constitutive edges. It only depends on the
+--     edge's properties and access_count, so a BEFORE trigger keeps it
+--     current on exactly the writes that change it.
+--   - edge_relevance_score(memory_strength, last_accessed): the time-dependent
+--     part, evaluated in SQL so traversals can ORDER BY / LIMIT on relevance
+--     inside Postgres.
+--
+-- Sector parameters live in decay_sector_config, seeded with
+-- DEFAULT_DECAY_CONFIG. mcp_server/db/decay_scores.py syncs it from
+-- config/decay_config.yaml at server start and rewrites only the edges whose
+-- strength changed (refresh_edge_memory_strength).
+--
+-- Dependencies: Migration 012 (edges), Migration 015 (access_count), Migration 036 (RLS)
+-- Risk: MEDIUM - the backfill rewrites every edge row once; under FORCE RLS
+--       it only reaches the migrating role's projects, the startup refresh
+--       fills the remaining rows per project
+-- Rollback: 054_edge_relevance_scores_rollback.sql
+
+-- ============================================================================
+-- Sector decay parameters (global config, no project data, no RLS)
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS decay_sector_config (
+    sector VARCHAR(50) PRIMARY KEY,
+    s_base DOUBLE PRECISION NOT NULL,
+    s_floor DOUBLE PRECISION,              -- NULL = can decay to zero
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
+
+INSERT INTO decay_sector_config (sector, s_base, s_floor) VALUES
+    ('emotional', 200, 150),
+    ('semantic', 100, NULL),
+    ('episodic', 150, 100),
+    ('procedural', 120, NULL),
+    ('reflective', 180, 120)
+ON CONFLICT (sector) DO NOTHING;
+
+-- ============================================================================
+-- S for one edge (same rules as calculate_relevance_score())
+-- ============================================================================
+-- Sector comes from properties.memory_sector, unknown sectors fall back to
+-- 'semantic'. NULL only if decay_sector_config has no usable row.
+CREATE OR REPLACE FUNCTION edge_memory_strength(props JSONB, access_count INTEGER)
+RETURNS DOUBLE PRECISION
+LANGUAGE sql STABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN props->>'edge_type' = 'constitutive' THEN 'Infinity'::float8
+        ELSE (
+            SELECT GREATEST(
+                c.s_base * (1 + ln(1 + GREATEST(COALESCE(access_count, 0), 0))),
+                COALESCE(c.s_floor, 0)
+            )
+            FROM decay_sector_config c
+            WHERE c.sector IN (COALESCE(NULLIF(props->>'memory_sector', ''), 'semantic'), 'semantic')
+            ORDER BY c.sector = COALESCE(NULLIF(props->>'memory_sector', ''), 'semantic') DESC
+            LIMIT 1
+        )
+    END
+$$;
+
+-- ============================================================================
+-- relevance_score = exp(-days_since / S), 1.0 without timestamp or S
+-- ============================================================================
+-- The exponent is clamped to [-700, 0]: exp() raises on underflow, and future
+-- timestamps score 1.0 like min(1.0, ...) in Python.
+CREATE OR REPLACE FUNCTION edge_relevance_score(strength DOUBLE PRECISION, engaged_at TIMESTAMPTZ)
+RETURNS DOUBLE PRECISION
+LANGUAGE sql STABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN strength IS NULL OR engaged_at IS NULL THEN 1.0::float8
+        ELSE exp(LEAST(0.0, GREATEST(-700.0,
+            -(EXTRACT(EPOCH FROM (now() - engaged_at)) / 86400.0) / strength
+        )))
+    END
+$$;
+
+-- ============================================================================
+-- Materialized S, maintained on insert and on engagement / property changes
+-- ============================================================================
+ALTER TABLE edges ADD COLUMN IF NOT EXISTS memory_strength DOUBLE PRECISION;
+
+CREATE OR REPLACE FUNCTION edges_set_memory_strength()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.memory_strength := edge_memory_strength(NEW.properties, NEW.access_count);
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_edges_memory_strength ON edges;
+CREATE TRIGGER trg_edges_memory_strength
+    BEFORE INSERT OR UPDATE OF properties, access_count ON edges
+    FOR EACH ROW EXECUTE FUNCTION edges_set_memory_strength();
+
+-- Backfill
+UPDATE edges
+SET memory_strength = edge_memory_strength(properties, access_count)
+WHERE memory_strength IS DISTINCT FROM edge_memory_strength(properties, access_count);
+
+-- Verify: strength distribution per sector
+-- SELECT COALESCE(properties->>'memory_sector', 'semantic') AS sector,
+--        MIN(memory_strength), MAX(memory_strength), COUNT(*)
+-- FROM edges GROUP BY 1;
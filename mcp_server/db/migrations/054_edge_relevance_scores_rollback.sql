@@ -0,0 +1,9 @@
+-- Rollback Migration 054: Materialized memory strength and SQL relevance score
+-- Safe: memory_strength is derived data; traversals fall back to
+-- calculate_relevance_score() only after reverting the application code.
+DROP TRIGGER IF EXISTS trg_edges_memory_strength ON edges;
+DROP FUNCTION IF EXISTS edges_set_memory_strength();
+ALTER TABLE edges DROP COLUMN IF EXISTS memory_strength;
+DROP FUNCTION IF EXISTS edge_relevance_score(DOUBLE PRECISION, TIMESTAMPTZ);
+DROP FUNCTION IF EXISTS edge_memory_strength(JSONB, INTEGER);
+DROP TABLE IF EXISTS decay_sector_config;
@@ -0,0 +1,67 @@
+-- Migration 055: Node embeddings with HNSW index
+--
+-- Problem: suggest_lateral_edges embedded the node name on every call, ran a
+-- vector search over l2_insights and then, per insight, looked for node
+-- names mentioned in the insight text. Nodes had no vector of their own, so
+-- "which nodes are semantically close to this node" could not be asked
+-- directly.
+--
+-- Solution: nodes.embedding over node_embedding_text() (name, label and the
+-- description/summary properties), filled by the write-behind embedding
+-- worker (Migration 052 columns and pipeline):
+-- - existing nodes start as embedding_status 'pending' and are backfilled in
+--   EMBEDDING_WORKER_BATCH_SIZE batches
+-- - new nodes default to 'pending'; a trigger marks a node pending again
+--   whenever its embedded text changes (add_node upserts, property updates)
+-- - the previous vector stays in place until the new one is stored
+--
+-- Lateral suggestions are one ANN query over nodes (idx_nodes_embedding_hnsw).
+--
+-- IMPORTANT: CREATE INDEX CONCURRENTLY cannot run inside a transaction block.
+-- Apply with psql in autocommit mode (no BEGIN/COMMIT wrapper, no -1 flag).
+--
+-- Dependencies: Migration 012 (nodes), Migration 050 (HNSW), Migration 052 (write-behind)
+-- Breaking Changes: KEINE - new columns, migration is idempotent
+-- Rollback: 055_node_embeddings_rollback.sql
+
+-- Text that is embedded for a node (also used by the embedding worker)
+CREATE OR REPLACE FUNCTION node_embedding_text(name TEXT, label TEXT, properties JSONB)
+RETURNS TEXT
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT concat_ws(' ', name, '(' || label || ')',
+                     properties->>'description', properties->>'summary')
+$$;
+
+ALTER TABLE nodes
+    ADD COLUMN IF NOT EXISTS embedding vector(1536),
+    ADD COLUMN IF NOT EXISTS embedding_status VARCHAR(10) NOT NULL DEFAULT 'pending'
+        CHECK (embedding_status IN ('pending', 'success', 'failed')),
+    ADD COLUMN IF NOT EXISTS embedding_attempts SMALLINT NOT NULL DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION nodes_mark_embedding_pending()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF node_embedding_text(NEW.name, NEW.label, NEW.properties)
+       IS DISTINCT FROM node_embedding_text(OLD.name, OLD.label, OLD.properties) THEN
+        NEW.embedding_status := 'pending';
+        NEW.embedding_attempts := 0;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_nodes_embedding_pending ON nodes;
+CREATE TRIGGER trg_nodes_embedding_pending
+    BEFORE UPDATE OF name, label, properties ON nodes
+    FOR EACH ROW EXECUTE FUNCTION nodes_mark_embedding_pending();
+
+CREATE INDEX IF NOT EXISTS idx_nodes_embedding_pending
+    ON nodes(id) WHERE embedding_status = 'pending';
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_nodes_embedding_hnsw
+    ON nodes USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- Verify: backfill progress
+-- SELECT embedding_status, COUNT(*) FROM nodes GROUP BY embedding_status;
@@ -0,0 +1,11 @@
+-- Rollback Migration 055: Node embeddings
+-- Safe: node vectors are derived data; suggest_lateral_edges falls back to
+-- the insight-based candidates without them.
+DROP INDEX CONCURRENTLY IF EXISTS idx_nodes_embedding_hnsw;
+DROP INDEX IF EXISTS idx_nodes_embedding_pending;
+DROP TRIGGER IF EXISTS trg_nodes_embedding_pending ON nodes;
+DROP FUNCTION IF EXISTS nodes_mark_embedding_pending();
+ALTER TABLE nodes DROP COLUMN IF EXISTS embedding_attempts;
+ALTER TABLE nodes DROP COLUMN IF EXISTS embedding_status;
+ALTER TABLE nodes DROP COLUMN IF EXISTS embedding;
+DROP FUNCTION IF EXISTS node_embedding_text(TEXT, TEXT, JSONB);
@@ -0,0 +1,78 @@
+-- Migration 056: Persistent cache of Haiku dissonance verdicts
+--
+-- Problem: dissonance_check() classifies every candidate edge pair with a
+-- Haiku call, so re-running a check on the same context node pays full LLM
+-- cost and latency again for pairs whose edges have not changed.
+--
+-- Solution: dissonance_verdicts keeps the last verdict per (project, edge_a,
+-- edge_b, prompt_version) together with the version of both edges it was
+-- computed for, COALESCE(modified_at, created_at): never NULL, so an edge
+-- without modified_at still has a comparable version. A cached verdict is
+-- only used while both versions still match; a newer verdict for the pair replaces the stale row, so the table
+-- holds at most one row per pair and prompt version. Rows disappear with
+-- their edges (ON DELETE CASCADE).
+--
+-- Verdicts contain project content (description, reasoning), so the table
+-- is covered by RLS like edges (Migration 036).
+--
+-- Dependencies: Migration 012 (edges), Migration 015 (edges.modified_at),
+--               Migration 034 (RLS helper functions)
+-- Breaking Changes: KEINE - New table, migration is idempotent
+-- Rollback: 056_dissonance_verdict_cache_rollback.sql
+
+CREATE TABLE IF NOT EXISTS dissonance_verdicts (
+    project_id VARCHAR(50) NOT NULL,
+    edge_a_id UUID NOT NULL REFERENCES edges(id) ON DELETE CASCADE,
+    edge_b_id UUID NOT NULL REFERENCES edges(id) ON DELETE CASCADE,
+    prompt_version CHAR(16) NOT NULL,      -- hash of prompt template + model
+    edge_a_version TIMESTAMPTZ NOT NULL,   -- COALESCE(modified_at, created_at) of each edge
+    edge_b_version TIMESTAMPTZ NOT NULL,   -- at the time of the verdict
+    dissonance_type VARCHAR(20) NOT NULL,  -- evolution | contradiction | nuance | none
+    confidence_score DOUBLE PRECISION NOT NULL,
+    description TEXT NOT NULL,
+    reasoning TEXT,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (project_id, edge_a_id, edge_b_id, prompt_version)
+);
+
+-- ON DELETE CASCADE from edges(id) looks up rows by edge_b_id as well
+CREATE INDEX IF NOT EXISTS idx_dissonance_verdicts_edge_b
+    ON dissonance_verdicts(edge_b_id);
+
+ALTER TABLE dissonance_verdicts ENABLE ROW LEVEL SECURITY;
+ALTER TABLE dissonance_verdicts FORCE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS require_project_id ON dissonance_verdicts;
+CREATE POLICY require_project_id ON dissonance_verdicts
+AS RESTRICTIVE
+FOR ALL
+USING (project_id IS NOT NULL);
+
+DROP POLICY IF EXISTS select_dissonance_verdicts ON dissonance_verdicts;
+CREATE POLICY select_dissonance_verdicts ON dissonance_verdicts
+FOR SELECT
+USING (
+    CASE (SELECT get_rls_mode())
+        WHEN 'pending' THEN TRUE
+        WHEN 'shadow' THEN TRUE
+        WHEN 'enforcing' THEN project_id::TEXT = ANY ((SELECT get_allowed_projects())::TEXT[])
+        WHEN 'complete' THEN project_id::TEXT = ANY ((SELECT get_allowed_projects())::TEXT[])
+        ELSE TRUE
+    END
+);
+
+DROP POLICY IF EXISTS insert_dissonance_verdicts ON dissonance_verdicts;
+CREATE POLICY insert_dissonance_verdicts ON dissonance_verdicts
+FOR INSERT
+WITH CHECK (project_id = (SELECT get_current_project()));
+
+DROP POLICY IF EXISTS update_dissonance_verdicts ON dissonance_verdicts;
+CREATE POLICY update_dissonance_verdicts ON dissonance_verdicts
+FOR UPDATE
+USING (project_id = (SELECT get_current_project()))
+WITH CHECK (project_id = (SELECT get_current_project()));
+
+DROP POLICY IF EXISTS delete_dissonance_verdicts ON dissonance_verdicts;
+CREATE POLICY delete_dissonance_verdicts ON dissonance_verdicts
+FOR DELETE
+USING (project_id = (SELECT get_current_project()));
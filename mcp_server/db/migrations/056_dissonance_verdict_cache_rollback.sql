@@ -0,0 +1,10 @@
+-- Rollback Migration 056: Persistent cache of Haiku dissonance verdicts
+-- Safe: the cache only holds derived data; dissonance_check() falls back to Haiku.
+
+DROP POLICY IF EXISTS delete_dissonance_verdicts ON dissonance_verdicts;
+DROP POLICY IF EXISTS update_dissonance_verdicts ON dissonance_verdicts;
+DROP POLICY IF EXISTS insert_dissonance_verdicts ON dissonance_verdicts;
+DROP POLICY IF EXISTS select_dissonance_verdicts ON dissonance_verdicts;
+DROP POLICY IF EXISTS require_project_id ON dissonance_verdicts;
+DROP INDEX IF EXISTS idx_dissonance_verdicts_edge_b;
+DROP TABLE IF EXISTS dissonance_verdicts;
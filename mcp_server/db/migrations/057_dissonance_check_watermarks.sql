@@ -0,0 +1,56 @@
+-- Migration 057: Per-context-node watermark for incremental dissonance checks
+--
+-- Problem: dissonance_check(scope="recent") reselected every edge touched in
+-- the last 30 days and paired them from scratch on every call, so the work
+-- grew with the total number of recent edges instead of with what changed
+-- since the previous check.
+--
+-- Solution: dissonance_check_watermarks stores a watermark per context node.
+-- The next "recent" check only pairs edges created or modified after it
+-- against the existing recent edges. A check advances the watermark to its
+-- start time, or only to just before the oldest pair it left out (cut by
+-- DISSONANCE_MAX_CANDIDATES or the time budget), so no pair is skipped.
+-- scope="full" always re-checks all pairs and also advances the watermark.
+--
+-- Dependencies: Migration 012 (nodes), Migration 034 (RLS helper functions)
+-- Breaking Changes: KEINE - New table, migration is idempotent
+-- Rollback: 057_dissonance_check_watermarks_rollback.sql
+
+CREATE TABLE IF NOT EXISTS dissonance_check_watermarks (
+    project_id VARCHAR(50) NOT NULL,
+    context_node_id UUID NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+    checked_at TIMESTAMPTZ NOT NULL,       -- all pairs of edges older than this were checked
+    PRIMARY KEY (project_id, context_node_id)
+);
+
+ALTER TABLE dissonance_check_watermarks ENABLE ROW LEVEL SECURITY;
+ALTER TABLE dissonance_check_watermarks FORCE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS require_project_id ON dissonance_check_watermarks;
+CREATE POLICY require_project_id ON dissonance_check_watermarks
+AS RESTRICTIVE
+FOR ALL
+USING (project_id IS NOT NULL);
+
+-- Watermarks are per project: a shared read of another project's node must
+-- not skip pairs the reader has never checked
+DROP POLICY IF EXISTS select_dissonance_check_watermarks ON dissonance_check_watermarks;
+CREATE POLICY select_dissonance_check_watermarks ON dissonance_check_watermarks
+FOR SELECT
+USING (project_id = (SELECT get_current_project()));
+
+DROP POLICY IF EXISTS insert_dissonance_check_watermarks ON dissonance_check_watermarks;
+CREATE POLICY insert_dissonance_check_watermarks ON dissonance_check_watermarks
+FOR INSERT
+WITH CHECK (project_id = (SELECT get_current_project()));
+
+DROP POLICY IF EXISTS update_dissonance_check_watermarks ON dissonance_check_watermarks;
+CREATE POLICY update_dissonance_check_watermarks ON dissonance_check_watermarks
+FOR UPDATE
+USING (project_id = (SELECT get_current_project()))
+WITH CHECK (project_id = (SELECT get_current_project()));
+
+DROP POLICY IF EXISTS delete_dissonance_check_watermarks ON dissonance_check_watermarks;
+CREATE POLICY delete_dissonance_check_watermarks ON dissonance_check_watermarks
+FOR DELETE
+USING (project_id = (SELECT get_current_project()));
@@ -0,0 +1,9 @@
+-- Rollback Migration 057: Per-context-node watermark for incremental dissonance checks
+-- Safe: without watermarks every "recent" check pairs all recent edges again.
+
+DROP POLICY IF EXISTS delete_dissonance_check_watermarks ON dissonance_check_watermarks;
+DROP POLICY IF EXISTS update_dissonance_check_watermarks ON dissonance_check_watermarks;
+DROP POLICY IF EXISTS insert_dissonance_check_watermarks ON dissonance_check_watermarks;
+DROP POLICY IF EXISTS select_dissonance_check_watermarks ON dissonance_check_watermarks;
+DROP POLICY IF EXISTS require_project_id ON dissonance_check_watermarks;
+DROP TABLE IF EXISTS dissonance_check_watermarks;
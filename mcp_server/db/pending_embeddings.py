@@ -0,0 +1,215 @@
+"""
+Pending Embeddings Module
+
+SQL helpers for the write-behind embedding pipeline (Migration 052).
+compress_to_l2_insight and store_episode can insert rows with
+embedding = NULL and embedding_status = 'pending'; the embedding worker
+(mcp_server/external/embedding_worker.py) uses these helpers to find such
+rows, store their vectors and record failed attempts. Graph nodes
+(Migration 055) are always embedded this way, which also backfills the
+nodes that existed before the migration in worker-sized batches.
+
+All helpers are blocking psycopg2 calls taking a connection; async callers
+run them through run_in_db_executor().
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from psycopg2.extensions import connection
+from psycopg2.extras import execute_values
+
+logger = logging.getLogger(__name__)
+
+# Tables with write-behind embeddings: table -> SQL expression of the embedded
+# text (whitelist, never user input). Must match what the synchronous path
+# embeds: compress_to_l2_insight embeds content, add_episode "query reflection".
+# Nodes are only embedded here (Migration 055): every insert and every change
+# of the embedded text marks the node pending.
+PENDING_EMBEDDING_TABLES: dict[str, str] = {
+    "l2_insights": "content",
+    "episode_memory": "query || ' ' || reflection",
+    "nodes": "node_embedding_text(name, label, properties)",
+}
+
+# SQL type of each table's id column (nodes use UUIDs)
+_ID_TYPES: dict[str, str] = {
+    "l2_insights": "integer",
+    "episode_memory": "integer",
+    "nodes": "uuid",
+}
+
+EMBEDDING_STATUSES = ("pending", "success", "failed")
+
+
+def _text_expr(table: str) -> str:
+    if table not in PENDING_EMBEDDING_TABLES:
+        raise ValueError(f"Unknown embedding table: {table}")
+    return PENDING_EMBEDDING_TABLES[table]
+
+
+def fetch_pending_embeddings(
+    conn: connection, table: str, limit: int, max_attempts: int
+) -> list[dict[str, Any]]:
+    """
+    Fetch the oldest rows still waiting for an embedding.
+
+    Args:
+        conn: Database connection (no project context needed; the worker
+              serves all projects)
+        table: One of PENDING_EMBEDDING_TABLES
+        limit: Max rows to return
+        max_attempts: Skip rows that already failed this many times
+
+    Returns:
+        List of dicts with id, project_id and text
+    """
+    text_expr = _text_expr(table)
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        SELECT id, project_id, {text_expr} AS text
+        FROM {table}
+        WHERE embedding_status = 'pending'
+          AND embedding_attempts < %s
+        ORDER BY id
+        LIMIT %s
+        """,
+        (max_attempts, limit),
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+    return [{"id": row["id"], "project_id": row["project_id"], "text": row["text"]} for row in rows]
+
+
+def store_embeddings(
+    conn: connection, table: str, embeddings: list[tuple[Any, list[float]]]
+) -> int:
+    """
+    Write vectors for pending rows and mark them 'success' in one statement.
+
+    Rows that are no longer pending (e.g. re-embedded by another worker)
+    are left untouched. Does not commit.
+
+    Args:
+        conn: Database connection with the rows' project context
+        table: One of PENDING_EMBEDDING_TABLES
+        embeddings: (row id, embedding) pairs
+
+    Returns:
+        Number of rows updated
+    """
+    _text_expr(table)
+    if not embeddings:
+        return 0
+    cursor = conn.cursor()
+    execute_values(
+        cursor,
+        f"""
+        UPDATE {table} AS t
+        SET embedding = v.embedding, embedding_status = 'success'
+        FROM (VALUES %s) AS v(id, embedding)
+        WHERE t.id = v.id AND t.embedding_status = 'pending'
+        """,
+        embeddings,
+        template=f"(%s::{_ID_TYPES[table]}, %s::vector)",
+    )
+    updated = cursor.rowcount
+    cursor.close()
+    return updated
+
+
+def record_embedding_failures(
+    conn: connection, table: str, ids: list[Any], max_attempts: int
+) -> int:
+    """
+    Count a failed embedding attempt; rows reaching max_attempts become 'failed'.
+
+    Does not commit.
+
+    Args:
+        conn: Database connection with the rows' project context
+        table: One of PENDING_EMBEDDING_TABLES
+        ids: Row IDs of the failed batch
+        max_attempts: Attempts after which a row is given up
+
+    Returns:
+        Number of rows marked 'failed'
+    """
+    _text_expr(table)
+    if not ids:
+        return 0
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        UPDATE {table}
+        SET embedding_attempts = embedding_attempts + 1,
+            embedding_status = CASE
+                WHEN embedding_attempts + 1 >= %s THEN 'failed' ELSE 'pending'
+            END
+        WHERE id = ANY(%s::{_ID_TYPES[table]}[]) AND embedding_status = 'pending'
+        RETURNING embedding_status
+        """,
+        (max_attempts, ids),
+    )
+    failed = sum(1 for row in cursor.fetchall() if row["embedding_status"] == "failed")
+    cursor.close()
+    return failed
+
+
+def get_embedding_statuses(conn: connection, table: str, ids: list[Any]) -> dict[Any, str]:
+    """
+    Look up embedding_status for rows of the current project(s).
+
+    Args:
+        conn: Database connection with project context
+        table: One of PENDING_EMBEDDING_TABLES
+        ids: Row IDs to look up
+
+    Returns:
+        Dict row id -> 'pending' | 'success' | 'failed' (unknown IDs are absent)
+    """
+    _text_expr(table)
+    if not ids:
+        return {}
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        SELECT id, embedding_status
+        FROM {table}
+        WHERE id = ANY(%s::{_ID_TYPES[table]}[])
+          AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+        """,
+        (ids,),
+    )
+    statuses = {row["id"]: row["embedding_status"] for row in cursor.fetchall()}
+    cursor.close()
+    return statuses
+
+
+def count_pending_embeddings(conn: connection) -> dict[str, int]:
+    """
+    Count pending rows per table for the current project(s).
+
+    Args:
+        conn: Database connection with project context
+
+    Returns:
+        Dict table -> number of rows with embedding_status = 'pending'
+    """
+    cursor = conn.cursor()
+    counts: dict[str, int] = {}
+    for table in PENDING_EMBEDDING_TABLES:
+        cursor.execute(
+            f"""
+            SELECT COUNT(*) AS pending
+            FROM {table}
+            WHERE embedding_status = 'pending'
+              AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+            """
+        )
+        counts[table] = int(cursor.fetchone()["pending"])
+    cursor.close()
+    return counts
@@ -0,0 +1,121 @@
+"""
+Per-Project Snapshot Cache.
+
+Shared store behind the in-process read caches that hold one immutable
+snapshot per project (graph_cache.py: GraphSnapshot, entity_linker.py:
+EntityAutomaton). A snapshot is built by a loader callback under the
+project's RLS context, served until it is older than the TTL and dropped
+by invalidate() after writes in this process.
+
+Snapshots expose:
+- loaded_at: time.monotonic() of the load (TTL reference)
+- projects: project ids whose rows the snapshot contains, so a write to a
+  shared project drops every snapshot that includes it
+
+A loader returns None if the project is too large to cache; that result is
+remembered for one TTL so every call does not reload the project.
+
+Usage:
+    cache = ProjectSnapshotCache(load_snapshot, ttl_seconds=300)
+    snapshot = await cache.get(project_id)
+    cache.invalidate(project_id)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, Generic, Protocol, TypeVar
+
+
+class ProjectSnapshot(Protocol):
+    loaded_at: float
+    projects: set[str]
+
+
+_S = TypeVar("_S", bound=ProjectSnapshot)
+
+
+class ProjectSnapshotCache(Generic[_S]):
+    """
+    Per-project TTL store of snapshots built by a loader callback.
+
+    Thread-safe: invalidation runs on the event loop and in DB executor
+    threads. A generation counter keeps a load that raced with a write from
+    publishing a stale snapshot.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Awaitable[_S | None]],
+        ttl_seconds: float,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._loader = loader
+        self._snapshots: dict[str, _S] = {}
+        # Projects too large to cache: monotonic time of the check
+        self._oversized: dict[str, float] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "loads": 0, "invalidations": 0, "oversized": 0}
+
+    def _fresh(self, loaded_at: float) -> bool:
+        return time.monotonic() - loaded_at < self.ttl_seconds
+
+    async def get(self, project_id: str) -> _S | None:
+        """
+        Snapshot for project_id, loading it on a miss.
+
+        Returns:
+            Snapshot, or None if the project is too large to cache
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(project_id)
+            if snapshot is not None and self._fresh(snapshot.loaded_at):
+                self._stats["hits"] += 1
+                return snapshot
+            checked_at = self._oversized.get(project_id)
+            if checked_at is not None and self._fresh(checked_at):
+                return None
+            generation = self._generation
+
+        snapshot = await self._loader(project_id)
+
+        with self._lock:
+            self._stats["loads"] += 1
+            if snapshot is None:
+                self._stats["oversized"] += 1
+                self._oversized[project_id] = time.monotonic()
+            elif self._generation == generation:
+                self._snapshots[project_id] = snapshot
+        return snapshot
+
+    def invalidate(self, project_id: str | None = None) -> None:
+        """Drop snapshots containing project_id's rows (all snapshots if None)."""
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            self._oversized.clear()
+            if project_id is None:
+                self._snapshots.clear()
+                return
+            for key in [
+                key for key, snapshot in self._snapshots.items()
+                if key == project_id or project_id in snapshot.projects
+            ]:
+                del self._snapshots[key]
+
+    def update_each(self, update: Callable[[_S], Any]) -> None:
+        """Apply an in-place update to every cached snapshot (racing loads are discarded)."""
+        with self._lock:
+            self._generation += 1
+            for snapshot in self._snapshots.values():
+                update(snapshot)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Hit/load counters and the number of cached projects."""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["projects"] = len(self._snapshots)
+        return stats
@@ -0,0 +1,302 @@
+"""
+Vector Index Management Module
+
+Lifecycle helpers for the HNSW indexes on l2_insights and episode_memory
+(Migration 050) and nodes (Migration 055): concurrent build with configurable m / ef_construction,
+build progress from pg_stat_progress_create_index, index size/validity
+reporting and the per-query hnsw.ef_search knob used by hybrid_search.
+
+CREATE/DROP INDEX CONCURRENTLY cannot run inside a transaction block, so the
+build/drop helpers expect a connection in autocommit mode (see
+open_admin_connection()). Pooled connections from connection.py are always
+transactional and must not be used for builds.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any
+
+import psycopg2
+from psycopg2 import sql
+from psycopg2.extensions import connection
+from psycopg2.extras import DictCursor
+
+logger = logging.getLogger(__name__)
+
+# Managed HNSW indexes: table -> index definition (whitelist, never user input)
+VECTOR_INDEXES: dict[str, dict[str, str]] = {
+    "l2_insights": {"index_name": "idx_l2_embedding_hnsw", "column": "embedding"},
+    "episode_memory": {"index_name": "idx_episode_embedding_hnsw", "column": "embedding"},
+    "nodes": {"index_name": "idx_nodes_embedding_hnsw", "column": "embedding"},
+}
+
+# pgvector defaults and limits
+DEFAULT_HNSW_M = 16
+DEFAULT_HNSW_EF_CONSTRUCTION = 64
+HNSW_M_RANGE = (2, 100)
+HNSW_EF_CONSTRUCTION_RANGE = (4, 1000)
+EF_SEARCH_RANGE = (1, 1000)
+
+
+def validate_hnsw_params(m: int, ef_construction: int) -> None:
+    """
+    Validate HNSW build parameters against pgvector limits.
+
+    Args:
+        m: Max connections per layer
+        ef_construction: Candidate list size during build
+
+    Raises:
+        ValueError: If a parameter is out of range or ef_construction < 2 * m
+    """
+    if not isinstance(m, int) or not HNSW_M_RANGE[0] <= m <= HNSW_M_RANGE[1]:
+        raise ValueError(f"m must be an integer between {HNSW_M_RANGE[0]} and {HNSW_M_RANGE[1]}, got {m}")
+    if (
+        not isinstance(ef_construction, int)
+        or not HNSW_EF_CONSTRUCTION_RANGE[0] <= ef_construction <= HNSW_EF_CONSTRUCTION_RANGE[1]
+    ):
+        raise ValueError(
+            f"ef_construction must be an integer between {HNSW_EF_CONSTRUCTION_RANGE[0]} "
+            f"and {HNSW_EF_CONSTRUCTION_RANGE[1]}, got {ef_construction}"
+        )
+    if ef_construction < 2 * m:
+        raise ValueError(f"ef_construction ({ef_construction}) must be >= 2 * m ({2 * m})")
+
+
+def validate_ef_search(ef_search: Any) -> None:
+    """
+    Validate a per-query hnsw.ef_search value.
+
+    Raises:
+        ValueError: If ef_search is not an integer in pgvector's allowed range
+    """
+    if (
+        isinstance(ef_search, bool)
+        or not isinstance(ef_search, int)
+        or not EF_SEARCH_RANGE[0] <= ef_search <= EF_SEARCH_RANGE[1]
+    ):
+        raise ValueError(
+            f"ef_search must be an integer between {EF_SEARCH_RANGE[0]} and {EF_SEARCH_RANGE[1]}"
+        )
+
+
+def apply_ef_search(conn: connection, ef_search: int) -> None:
+    """
+    Set hnsw.ef_search for the current transaction only.
+
+    Uses SET LOCAL so the value never leaks into the next user of the pooled
+    connection. Must be called inside get_connection_with_project_context()
+    (which always runs an explicit transaction).
+
+    Args:
+        conn: Connection with an open transaction
+        ef_search: Candidate list size for HNSW scans (higher = better recall)
+    """
+    validate_ef_search(ef_search)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SET LOCAL hnsw.ef_search = %s", (ef_search,))
+    finally:
+        cursor.close()
+
+
+def open_admin_connection() -> connection:
+    """
+    Open a dedicated autocommit connection for index builds.
+
+    Returns:
+        psycopg2 connection with autocommit enabled
+
+    Raises:
+        RuntimeError: If DATABASE_URL is not set
+    """
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        raise RuntimeError("DATABASE_URL environment variable not set")
+    conn = psycopg2.connect(database_url, cursor_factory=DictCursor)
+    conn.autocommit = True
+    return conn
+
+
+def _index_definition(table: str) -> dict[str, str]:
+    if table not in VECTOR_INDEXES:
+        raise ValueError(f"Unknown vector table '{table}'. Must be one of {list(VECTOR_INDEXES)}")
+    return VECTOR_INDEXES[table]
+
+
+def build_hnsw_index(
+    conn: connection,
+    table: str,
+    m: int = DEFAULT_HNSW_M,
+    ef_construction: int = DEFAULT_HNSW_EF_CONSTRUCTION,
+    concurrently: bool = True,
+    rebuild: bool = False,
+    maintenance_work_mem: str | None = None,
+) -> None:
+    """
+    Build the HNSW index for a managed table.
+
+    Args:
+        conn: Autocommit connection (see open_admin_connection())
+        table: "l2_insights" or "episode_memory"
+        m: Max connections per layer
+        ef_construction: Candidate list size during build
+        concurrently: Use CREATE INDEX CONCURRENTLY (no write lock on the table)
+        rebuild: Drop an existing index first (e.g. to change m/ef_construction)
+        maintenance_work_mem: Optional session value, e.g. "1GB" (faster builds)
+
+    Raises:
+        ValueError: On invalid table or parameters
+        psycopg2.Error: If the build fails
+    """
+    validate_hnsw_params(m, ef_construction)
+    definition = _index_definition(table)
+    if concurrently and not conn.autocommit:
+        raise ValueError("Concurrent index builds require an autocommit connection")
+
+    index = sql.Identifier(definition["index_name"])
+    concurrent_kw = sql.SQL("CONCURRENTLY ") if concurrently else sql.SQL("")
+
+    cursor = conn.cursor()
+    try:
+        if maintenance_work_mem:
+            cursor.execute("SET maintenance_work_mem = %s", (maintenance_work_mem,))
+
+        if rebuild:
+            cursor.execute(
+                sql.SQL("DROP INDEX {}IF EXISTS {}").format(concurrent_kw, index)
+            )
+
+        logger.info(
+            f"Building HNSW index {definition['index_name']} on {table} "
+            f"(m={m}, ef_construction={ef_construction}, concurrently={concurrently})"
+        )
+        cursor.execute(
+            sql.SQL(
+                "CREATE INDEX {}IF NOT EXISTS {} ON {} USING hnsw ({} vector_cosine_ops) "
+                "WITH (m = {}, ef_construction = {})"
+            ).format(
+                concurrent_kw,
+                index,
+                sql.Identifier(table),
+                sql.Identifier(definition["column"]),
+                sql.Literal(m),
+                sql.Literal(ef_construction),
+            )
+        )
+    finally:
+        cursor.close()
+
+
+def drop_hnsw_index(conn: connection, table: str, concurrently: bool = True) -> None:
+    """Drop the managed HNSW index of a table (no-op if it does not exist)."""
+    definition = _index_definition(table)
+    concurrent_kw = sql.SQL("CONCURRENTLY ") if concurrently else sql.SQL("")
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            sql.SQL("DROP INDEX {}IF EXISTS {}").format(
+                concurrent_kw, sql.Identifier(definition["index_name"])
+            )
+        )
+    finally:
+        cursor.close()
+
+
+def get_index_build_progress(conn: connection) -> list[dict[str, Any]]:
+    """
+    Report running index builds on the managed tables.
+
+    Reads pg_stat_progress_create_index (PostgreSQL 12+). HNSW builds report
+    tuples_done/tuples_total during the loading phase.
+
+    Returns:
+        List of dicts with table, index_name, phase, tuples/blocks counters and
+        percent (None when the current phase reports no totals)
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT t.relname AS table_name,
+                   i.relname AS index_name,
+                   p.phase,
+                   p.tuples_done, p.tuples_total,
+                   p.blocks_done, p.blocks_total
+            FROM pg_stat_progress_create_index p
+            JOIN pg_class t ON t.oid = p.relid
+            LEFT JOIN pg_class i ON i.oid = p.index_relid
+            WHERE t.relname = ANY(%s)
+            """,
+            (list(VECTOR_INDEXES),),
+        )
+        progress = []
+        for row in cursor.fetchall():
+            percent = None
+            if row["tuples_total"]:
+                percent = round(100.0 * row["tuples_done"] / row["tuples_total"], 1)
+            elif row["blocks_total"]:
+                percent = round(100.0 * row["blocks_done"] / row["blocks_total"], 1)
+            progress.append({
+                "table": row["table_name"],
+                "index_name": row["index_name"],
+                "phase": row["phase"],
+                "tuples_done": row["tuples_done"],
+                "tuples_total": row["tuples_total"],
+                "blocks_done": row["blocks_done"],
+                "blocks_total": row["blocks_total"],
+                "percent": percent,
+            })
+        return progress
+    finally:
+        cursor.close()
+
+
+def get_vector_index_status(conn: connection) -> list[dict[str, Any]]:
+    """
+    Report existence, validity, build options and size of the managed indexes.
+
+    An index left behind by a failed CONCURRENTLY build exists but is invalid
+    (indisvalid = false) and is ignored by the planner; rebuild it.
+
+    Returns:
+        One dict per managed table with index_name, exists, valid, options,
+        size_bytes, size_pretty and the table's estimated row count
+    """
+    cursor = conn.cursor()
+    try:
+        cursor.execute(
+            """
+            SELECT c.relname AS index_name,
+                   i.indisvalid AS valid,
+                   c.reloptions AS options,
+                   pg_relation_size(c.oid) AS size_bytes,
+                   pg_size_pretty(pg_relation_size(c.oid)) AS size_pretty,
+                   t.reltuples::BIGINT AS table_rows
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            JOIN pg_class t ON t.oid = i.indrelid
+            WHERE c.relname = ANY(%s)
+            """,
+            ([d["index_name"] for d in VECTOR_INDEXES.values()],),
+        )
+        found = {row["index_name"]: row for row in cursor.fetchall()}
+    finally:
+        cursor.close()
+
+    status = []
+    for table, definition in VECTOR_INDEXES.items():
+        row = found.get(definition["index_name"])
+        status.append({
+            "table": table,
+            "index_name": definition["index_name"],
+            "exists": row is not None,
+            "valid": bool(row["valid"]) if row else False,
+            "options": list(row["options"] or []) if row else [],
+            "size_bytes": row["size_bytes"] if row else 0,
+            "size_pretty": row["size_pretty"] if row else "0 bytes",
+            "table_rows": row["table_rows"] if row else None,
+        })
+    return status
@@ -0,0 +1,249 @@
+"""
+Query Embedding Cache.
+
+Two-tier cache for OpenAI embeddings keyed by (model, sha256 of normalized text):
+
+1. In-process LRU (OrderedDict, bounded by EMBEDDING_CACHE_SIZE)
+2. Postgres table embedding_cache (Migration 051), shared across processes
+   and restarts, so daily-recurring queries skip the embeddings API entirely
+
+Only the text hash is stored, never the text itself, so the persistent tier
+holds no project content and needs no RLS. Persistent-tier failures (pool not
+initialized, table missing, DB down) are logged and treated as a miss; the
+cache never makes an embedding call fail.
+
+Usage:
+    from mcp_server.external.embedding_cache import get_embedding_cache
+
+    cache = get_embedding_cache()
+    embedding = cache.get(query_text)
+    if embedding is None:
+        embedding = ...  # call the embeddings API
+        cache.put(query_text, embedding)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from mcp_server.db.connection import get_connection_sync, run_in_db_executor
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+DEFAULT_EMBEDDING_CACHE_SIZE = 1024
+
+
+def normalize_embedding_text(text: str) -> str:
+    """Collapse whitespace runs and strip; case is preserved (embeddings are case-sensitive)."""
+    return " ".join(text.split())
+
+
+def embedding_cache_key(text: str, model: str = EMBEDDING_MODEL) -> tuple[str, str]:
+    """Return the (model, sha256 hex of normalized text) cache key."""
+    digest = hashlib.sha256(normalize_embedding_text(text).encode("utf-8")).hexdigest()
+    return model, digest
+
+
+class EmbeddingCache:
+    """
+    In-process LRU in front of the Postgres embedding_cache table.
+
+    Thread-safe: the LRU is guarded by a lock because sync callers run on
+    the event loop and in DB executor threads.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_EMBEDDING_CACHE_SIZE, persistent: bool = True) -> None:
+        self.max_entries = max_entries
+        self.persistent = persistent
+        self._lru: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {
+            "lru_hits": 0,
+            "persistent_hits": 0,
+            "misses": 0,
+            "writes": 0,
+            "persistent_errors": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # LRU tier
+    # ------------------------------------------------------------------
+
+    def _lru_get(self, key: tuple[str, str]) -> list[float] | None:
+        with self._lock:
+            embedding = self._lru.get(key)
+            if embedding is not None:
+                self._lru.move_to_end(key)
+            return embedding
+
+    def _lru_put(self, key: tuple[str, str], embedding: list[float]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._lru[key] = embedding
+            self._lru.move_to_end(key)
+            while len(self._lru) > self.max_entries:
+                self._lru.popitem(last=False)
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    # ------------------------------------------------------------------
+    # Persistent tier
+    # ------------------------------------------------------------------
+
+    def _persistent_get(self, key: tuple[str, str]) -> list[float] | None:
+        model, text_hash = key
+        try:
+            with get_connection_sync() as conn:
+                cursor = conn.cursor()
+                # Read and touch in one round trip (last_used_at drives pruning)
+                cursor.execute(
+                    """
+                    UPDATE embedding_cache
+                    SET last_used_at = NOW(), hit_count = hit_count + 1
+                    WHERE model = %s AND text_hash = %s
+                    RETURNING embedding::real[] AS embedding;
+                    """,
+                    (model, text_hash),
+                )
+                row = cursor.fetchone()
+                conn.commit()
+        except Exception as e:
+            self._count("persistent_errors")
+            logger.warning(f"Embedding cache lookup failed, treating as miss: {e}")
+            return None
+        return list(row["embedding"]) if row else None
+
+    def _persistent_put(self, key: tuple[str, str], embedding: list[float]) -> None:
+        model, text_hash = key
+        try:
+            with get_connection_sync() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    INSERT INTO embedding_cache (model, text_hash, embedding)
+                    VALUES (%s, %s, %s::real[]::vector)
+                    ON CONFLICT (model, text_hash) DO UPDATE SET last_used_at = NOW();
+                    """,
+                    (model, text_hash, embedding),
+                )
+                conn.commit()
+        except Exception as e:
+            self._count("persistent_errors")
+            logger.warning(f"Embedding cache write failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def get(self, text: str, model: str = EMBEDDING_MODEL) -> list[float] | None:
+        """
+        Look up an embedding: LRU first, then the persistent tier.
+
+        Persistent hits are promoted into the LRU.
+
+        Returns:
+            Cached embedding or None on miss
+        """
+        key = embedding_cache_key(text, model)
+
+        embedding = self._lru_get(key)
+        if embedding is not None:
+            self._count("lru_hits")
+            return embedding
+
+        if self.persistent:
+            embedding = self._persistent_get(key)
+            if embedding is not None:
+                self._count("persistent_hits")
+                self._lru_put(key, embedding)
+                return embedding
+
+        self._count("misses")
+        return None
+
+    def put(self, text: str, embedding: list[float], model: str = EMBEDDING_MODEL) -> None:
+        """Store an embedding in both tiers."""
+        key = embedding_cache_key(text, model)
+        self._lru_put(key, embedding)
+        if self.persistent:
+            self._persistent_put(key, embedding)
+        self._count("writes")
+
+    async def aget(self, text: str, model: str = EMBEDDING_MODEL) -> list[float] | None:
+        """Async get(): LRU hits return immediately, the persistent tier runs on the DB executor."""
+        embedding = self._lru_get(embedding_cache_key(text, model))
+        if embedding is not None:
+            self._count("lru_hits")
+            return embedding
+        return await run_in_db_executor(self.get, text, model)
+
+    async def aput(self, text: str, embedding: list[float], model: str = EMBEDDING_MODEL) -> None:
+        """Async put(): the persistent write runs on the DB executor."""
+        await run_in_db_executor(self.put, text, embedding, model)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (the persistent tier is left untouched)."""
+        with self._lock:
+            self._lru.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Hit/miss metrics for both tiers.
+
+        Returns:
+            Dict with lru_hits, persistent_hits, misses, writes, persistent_errors,
+            lru_size, max_entries and hit_rate (hits / lookups)
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["lru_size"] = len(self._lru)
+        stats["max_entries"] = self.max_entries
+        stats["persistent"] = self.persistent
+        hits = stats["lru_hits"] + stats["persistent_hits"]
+        lookups = hits + stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+
+# Singleton instance for module-level access
+_cache_instance: EmbeddingCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """
+    Get the shared EmbeddingCache, configured from the environment on first use.
+
+    Environment:
+        EMBEDDING_CACHE_SIZE: LRU capacity in entries (default: 1024, 0 disables the LRU)
+        EMBEDDING_CACHE_PERSISTENT: "false" disables the Postgres tier (default: true)
+
+    Returns:
+        Shared EmbeddingCache instance
+    """
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                try:
+                    max_entries = int(os.getenv("EMBEDDING_CACHE_SIZE", str(DEFAULT_EMBEDDING_CACHE_SIZE)))
+                except ValueError:
+                    logger.warning("Invalid EMBEDDING_CACHE_SIZE, using default")
+                    max_entries = DEFAULT_EMBEDDING_CACHE_SIZE
+                persistent = os.getenv("EMBEDDING_CACHE_PERSISTENT", "true").strip().lower() not in ("0", "false", "no")
+                _cache_instance = EmbeddingCache(max_entries=max_entries, persistent=persistent)
+    return _cache_instance
+
+
+def get_embedding_cache_stats() -> dict[str, Any]:
+    """Hit/miss metrics of the shared cache (see EmbeddingCache.get_stats)."""
+    return get_embedding_cache().get_stats()
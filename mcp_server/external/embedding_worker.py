@@ -0,0 +1,160 @@
+"""
+Write-Behind Embedding Worker.
+
+Background task that fills embeddings for rows inserted in async ingest mode
+(compress_to_l2_insight / store_episode with async_embedding=true, Migration 052)
+and for graph nodes whose name, label or description changed (Migration 055).
+
+Each cycle, per table:
+1. Fetch up to EMBEDDING_WORKER_BATCH_SIZE pending rows (short connection)
+2. Embed all texts in one batched API call (no connection held meanwhile)
+3. Store the vectors per project under that project's RLS context
+
+A failed batch increments embedding_attempts; rows are marked 'failed' after
+EMBEDDING_MAX_ATTEMPTS. The worker polls every EMBEDDING_WORKER_INTERVAL
+seconds and is woken immediately by notify_pending_embeddings() after an
+async insert.
+
+Usage:
+    asyncio.create_task(run_embedding_worker())
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import defaultdict
+from typing import Any
+
+from mcp_server.db.connection import (
+    get_connection,
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.db.pending_embeddings import (
+    PENDING_EMBEDDING_TABLES,
+    fetch_pending_embeddings,
+    record_embedding_failures,
+    store_embeddings,
+)
+from mcp_server.external.openai_client import get_embeddings_client
+from mcp_server.middleware.context import set_project_id
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_WORKER_INTERVAL = float(os.getenv("EMBEDDING_WORKER_INTERVAL", "5"))
+EMBEDDING_WORKER_BATCH_SIZE = int(os.getenv("EMBEDDING_WORKER_BATCH_SIZE", "64"))
+EMBEDDING_MAX_ATTEMPTS = int(os.getenv("EMBEDDING_MAX_ATTEMPTS", "5"))
+
+_wake_event: asyncio.Event | None = None
+
+
+def notify_pending_embeddings() -> None:
+    """Wake the worker after inserting pending rows (no-op if it is not running)."""
+    if _wake_event is not None:
+        _wake_event.set()
+
+
+async def _write_per_project(
+    table: str, rows: list[dict[str, Any]], func: Any, *args: Any
+) -> int:
+    """
+    Run func(conn, table, <payloads>, *args) once per project under its RLS context.
+
+    UPDATE policies only allow writes to the current project's rows, so a
+    batch spanning projects is split.
+    """
+    by_project: dict[str, list[Any]] = defaultdict(list)
+    for row in rows:
+        by_project[row["project_id"]].append(row["payload"])
+
+    total = 0
+    for project_id, payload in by_project.items():
+        set_project_id(project_id)
+        async with get_connection_with_project_context() as conn:
+            total += await run_in_db_executor(func, conn, table, payload, *args)
+    return total
+
+
+async def process_pending_embeddings(
+    batch_size: int = EMBEDDING_WORKER_BATCH_SIZE,
+    max_attempts: int = EMBEDDING_MAX_ATTEMPTS,
+) -> int:
+    """
+    Run one worker cycle over all write-behind tables.
+
+    Args:
+        batch_size: Max rows embedded per table (one API call each)
+        max_attempts: Attempts after which a row is marked 'failed'
+
+    Returns:
+        Number of rows whose embedding was stored
+    """
+    stored = 0
+    for table in PENDING_EMBEDDING_TABLES:
+        async with get_connection() as conn:
+            rows = await run_in_db_executor(
+                fetch_pending_embeddings, conn, table, batch_size, max_attempts
+            )
+        if not rows:
+            continue
+
+        try:
+            client = await get_embeddings_client()
+            embeddings = await client.create_embeddings([row["text"] for row in rows])
+        except Exception as e:
+            logger.warning(f"Embedding batch for {len(rows)} {table} rows failed: {e}")
+            failed = await _write_per_project(
+                table,
+                [{"project_id": r["project_id"], "payload": r["id"]} for r in rows],
+                record_embedding_failures,
+                max_attempts,
+            )
+            if failed:
+                logger.error(f"{failed} {table} rows marked embedding_status='failed'")
+            continue
+
+        stored += await _write_per_project(
+            table,
+            [
+                {"project_id": r["project_id"], "payload": (r["id"], embedding)}
+                for r, embedding in zip(rows, embeddings, strict=True)
+            ],
+            store_embeddings,
+        )
+        logger.info(f"Stored {len(rows)} write-behind embeddings for {table}")
+    return stored
+
+
+async def run_embedding_worker(interval: float = EMBEDDING_WORKER_INTERVAL) -> None:
+    """
+    Fill pending embeddings until cancelled.
+
+    Full batches are followed immediately by the next cycle; otherwise the
+    worker sleeps for interval seconds or until notify_pending_embeddings().
+    Never raises: errors are logged and the loop continues.
+
+    Args:
+        interval: Idle poll interval in seconds
+    """
+    global _wake_event
+    _wake_event = asyncio.Event()
+    logger.info(
+        f"Embedding worker started (interval={interval}s, batch_size={EMBEDDING_WORKER_BATCH_SIZE})"
+    )
+
+    while True:
+        _wake_event.clear()
+        try:
+            stored = await process_pending_embeddings()
+        except Exception as e:
+            logger.error(f"Error in embedding worker: {type(e).__name__}: {e}", exc_info=True)
+            stored = 0
+
+        if stored >= EMBEDDING_WORKER_BATCH_SIZE:
+            continue
+        try:
+            await asyncio.wait_for(_wake_event.wait(), timeout=interval)
+        except TimeoutError:
+            pass
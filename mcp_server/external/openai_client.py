@@ -3,22 +3,44 @@ OpenAI API Client for Embeddings.
 
 Provides text embeddings using OpenAI's text-embedding-3-small model (1536 dimensions).
 Includes automatic retry logic with exponential backoff for transient failures.
+
+Shared Embeddings Service:
+    embed() is the entry point for all server-side embedding calls. Identical
+    texts that are already in flight share one request (coalescing), and
+    concurrent requests arriving within EMBEDDING_BATCH_WINDOW_MS are merged
+    into a single embeddings.create(input=[...]) call (micro-batching).
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import List
+import weakref
+from typing import Any, List
 
 from openai import AsyncOpenAI
 
 from mcp_server.config import calculate_api_cost
+from mcp_server.db.connection import run_in_db_executor
 from mcp_server.db.cost_logger import insert_cost_log
-from mcp_server.utils.retry_logic import retry_with_backoff
+from mcp_server.utils.retry_logic import _is_retryable_error, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_WINDOW_MS = 5.0
+DEFAULT_MAX_BATCH_SIZE = 64  # OpenAI accepts up to 2048 inputs per request
+
+
+def _env_number(name: str, default: float) -> float:
+    """Read a positive number from the environment, falling back to default."""
+    try:
+        value = float(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning(f"Invalid {name}, using default {default}")
+        return default
+    return value if value >= 0 else default
+
 
 class OpenAIEmbeddingsClient:
     """
@@ -28,26 +50,218 @@ class OpenAIEmbeddingsClient:
     Includes automatic retry on transient failures (rate limits, service unavailable).
     """
 
-    def __init__(self) -> None:
-        """Initialize OpenAI client with API key from environment."""
-        self.api_key = os.getenv("OPENAI_API_KEY")
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        batch_window_ms: float | None = None,
+        max_batch_size: int | None = None,
+    ) -> None:
+        """
+        Initialize OpenAI client with API key from environment.
 
-        if not self.api_key or self.api_key == "sk-your-openai-api-key-here":
-            raise RuntimeError(
-                "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
-            )
+        Args:
+            client: Pre-built AsyncOpenAI client (default: one built from OPENAI_API_KEY)
+            batch_window_ms: Micro-batching window (default: EMBEDDING_BATCH_WINDOW_MS or 5ms;
+                0 flushes on the next loop iteration)
+            max_batch_size: Texts per API call (default: EMBEDDING_BATCH_MAX_SIZE or 64)
+        """
+        if client is None:
+            self.api_key = os.getenv("OPENAI_API_KEY")
+
+            if not self.api_key or self.api_key == "sk-your-openai-api-key-here":
+                raise RuntimeError(
+                    "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
+                )
 
-        # Initialize async client
-        self.client = AsyncOpenAI(api_key=self.api_key)
+            # Initialize async client
+            client = AsyncOpenAI(api_key=self.api_key)
+        self.client = client
 
         # Model configuration
         self.model = "text-embedding-3-small"  # 1536 dimensions
         self.embedding_dims = 1536
 
+        # Micro-batching configuration
+        if batch_window_ms is None:
+            batch_window_ms = _env_number("EMBEDDING_BATCH_WINDOW_MS", DEFAULT_BATCH_WINDOW_MS)
+        if max_batch_size is None:
+            max_batch_size = int(_env_number("EMBEDDING_BATCH_MAX_SIZE", DEFAULT_MAX_BATCH_SIZE))
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch_size = max(1, max_batch_size)
+
+        # text -> future; queued = waiting for the next flush, in_flight = sent to the API
+        self._queued: dict[str, asyncio.Future[List[float]]] = {}
+        self._in_flight: dict[str, asyncio.Future[List[float]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task[None]] = set()
+        self._stats = {"requests": 0, "coalesced": 0, "api_calls": 0, "texts_sent": 0}
+
         logger.info(
             f"OpenAI Embeddings Client initialized: model={self.model}, "
-            f"dims={self.embedding_dims}"
+            f"dims={self.embedding_dims}, batch_window={batch_window_ms}ms, "
+            f"max_batch_size={self.max_batch_size}"
+        )
+
+    # ------------------------------------------------------------------
+    # Coalescing + micro-batching
+    # ------------------------------------------------------------------
+
+    async def embed(self, text: str) -> List[float]:
+        """
+        Embed a single text through the shared batching queue.
+
+        Concurrent callers asking for the same text await the same future;
+        distinct texts queued within the batch window go out in one API call.
+        A caller being cancelled does not cancel the shared request.
+
+        Args:
+            text: Input text to embed
+
+        Returns:
+            1536-dimensional embedding vector
+
+        Raises:
+            Whatever create_embeddings() raised for the batch (after retries),
+            or for this text alone if the API rejected the batch
+        """
+        self._stats["requests"] += 1
+
+        future = self._queued.get(text) or self._in_flight.get(text)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        # Mark exceptions as retrieved: if every waiter was cancelled, nobody awaits the future
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._queued[text] = future
+
+        if len(self._queued) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+
+        return await asyncio.shield(future)
+
+    def _flush(self) -> None:
+        """Send everything queued so far as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._queued = self._queued, {}
+        if not batch:
+            return
+        self._in_flight.update(batch)
+
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(self, batch: dict[str, asyncio.Future[List[float]]]) -> None:
+        texts = list(batch)
+        try:
+            embeddings = await self.create_embeddings(texts)
+        except Exception as e:
+            if len(texts) > 1 and not _is_retryable_error(e):
+                # One invalid or oversized text rejects the whole request: embed
+                # each text on its own so only the offending callers fail
+                logger.warning(
+                    f"Embedding batch of {len(texts)} texts rejected ({type(e).__name__}), "
+                    f"retrying texts individually"
+                )
+                results = await asyncio.gather(
+                    *(self.create_embeddings([text]) for text in texts), return_exceptions=True
+                )
+                for text, result in zip(texts, results, strict=True):
+                    if batch[text].done():
+                        continue
+                    if isinstance(result, BaseException):
+                        batch[text].set_exception(result)
+                    else:
+                        batch[text].set_result(result[0])
+            else:
+                for future in batch.values():
+                    if not future.done():
+                        future.set_exception(e)
+        else:
+            for text, embedding in zip(texts, embeddings, strict=True):
+                if not batch[text].done():
+                    batch[text].set_result(embedding)
+        finally:
+            for text in texts:
+                # Cancelled (also while retrying texts individually): waiters see it
+                if not batch[text].done():
+                    batch[text].cancel()
+                if self._in_flight.get(text) is batch[text]:
+                    del self._in_flight[text]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Coalescing/batching metrics.
+
+        Returns:
+            Dict with requests, coalesced, api_calls, texts_sent and
+            avg_batch_size (texts per API call)
+        """
+        stats: dict[str, Any] = dict(self._stats)
+        stats["avg_batch_size"] = (
+            stats["texts_sent"] / stats["api_calls"] if stats["api_calls"] else 0.0
         )
+        return stats
+
+    @retry_with_backoff(max_retries=4, base_delays=[1.0, 2.0, 4.0, 8.0], jitter=True)
+    async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Create embeddings for several texts in one API call, with automatic retry.
+
+        Args:
+            texts: Input texts (each max 8191 tokens)
+
+        Returns:
+            Embedding vectors in input order
+
+        Raises:
+            Same as create_embedding()
+        """
+        try:
+            response = await self.client.embeddings.create(
+                model=self.model,
+                input=texts,
+                encoding_format="float",
+            )
+            self._stats["api_calls"] += 1
+            self._stats["texts_sent"] += len(texts)
+
+            # The API returns one item per input, tagged with its input index
+            embeddings = [item.embedding for item in sorted(response.data, key=lambda d: d.index)]
+            if len(embeddings) != len(texts):
+                raise RuntimeError(
+                    f"Embeddings API returned {len(embeddings)} vectors for {len(texts)} inputs"
+                )
+
+            usage = getattr(response, "usage", None)
+            token_count = usage.total_tokens if usage else sum(len(t) for t in texts) // 4
+            estimated_cost = calculate_api_cost("openai_embeddings", token_count)
+            await run_in_db_executor(
+                insert_cost_log,
+                api_name="openai_embeddings",
+                num_calls=1,
+                token_count=token_count,
+                estimated_cost=estimated_cost,
+            )
+
+            logger.debug(
+                f"Embedding batch created: inputs={len(texts)}, "
+                f"tokens={token_count}, cost=€{estimated_cost:.6f}"
+            )
+
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"OpenAI Embeddings API error: {type(e).__name__}: {e}")
+            raise
 
     @retry_with_backoff(max_retries=4, base_delays=[1.0, 2.0, 4.0, 8.0], jitter=True)
     async def create_embedding(self, text: str) -> List[float]:
@@ -123,23 +337,33 @@ class OpenAIEmbeddingsClient:
             raise
 
 
-# Singleton instance for module-level access
-_client_instance: OpenAIEmbeddingsClient | None = None
+# One instance per event loop: the AsyncOpenAI connection pool and the
+# batching futures are bound to the loop that created them. The MCP server
+# runs a single loop; sync library callers using asyncio.run() get a fresh
+# instance per run instead of a client tied to a closed loop.
+_client_instances: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, OpenAIEmbeddingsClient
+] = weakref.WeakKeyDictionary()
 
 
 async def get_embeddings_client() -> OpenAIEmbeddingsClient:
     """
-    Get singleton OpenAI Embeddings client instance.
+    Get the shared OpenAI Embeddings client for the running event loop.
 
     Lazily initializes client on first call.
 
     Returns:
         Shared OpenAIEmbeddingsClient instance
+
+    Raises:
+        RuntimeError: If OPENAI_API_KEY is not configured
     """
-    global _client_instance
-    if _client_instance is None:
-        _client_instance = OpenAIEmbeddingsClient()
-    return _client_instance
+    loop = asyncio.get_running_loop()
+    client = _client_instances.get(loop)
+    if client is None:
+        client = OpenAIEmbeddingsClient()
+        _client_instances[loop] = client
+    return client
 
 
 async def create_embedding(text: str) -> List[float]:
@@ -162,3 +386,20 @@ async def create_embedding(text: str) -> List[float]:
     """
     client = await get_embeddings_client()
     return await client.create_embedding(text)
+
+
+async def embed_text(text: str) -> List[float]:
+    """
+    Embed text through the shared client's coalescing/batching queue.
+
+    Prefer this over create_embedding() on request paths: concurrent calls
+    share API requests.
+
+    Args:
+        text: Input text to embed
+
+    Returns:
+        1536-dimensional embedding vector
+    """
+    client = await get_embeddings_client()
+    return await client.embed(text)
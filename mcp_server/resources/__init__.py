@@ -30,7 +30,6 @@ from urllib.parse import ParseResult, parse_qs, urlparse
 
 from fastmcp import FastMCP
 from fastmcp.server.dependencies import get_http_headers
-from openai import OpenAI
 from pgvector.psycopg2 import register_vector  # type: ignore
 from psycopg2.extensions import connection as Psycopg2Connection
 from psycopg2.extras import DictCursor
@@ -41,9 +40,10 @@ from mcp_server.db.connection import (
     get_pool_status,
 )
 from mcp_server.exceptions import ProjectNotFoundError
+from mcp_server.external.openai_client import get_embeddings_client
 from mcp_server.middleware.context import get_project_id, set_project_id
 from mcp_server.middleware.tenant import validate_project_id
-from mcp_server.tools import get_embedding_with_retry
+from mcp_server.tools import get_query_embedding_cached
 
 _resource_logger = logging.getLogger(__name__)
 
@@ -257,7 +257,7 @@ async def handle_l2_insights(uri: str) -> list[dict[str, Any]] | dict[str, Any]:
     if not api_key or api_key == "sk-your-openai-api-key-here":
         raise RuntimeError("OpenAI API key not configured")
 
-    client = OpenAI(api_key=api_key)
+    client = await get_embeddings_client()
 
     try:
         project_id = await _resolve_project_id_for_resource()
@@ -266,7 +266,7 @@ async def handle_l2_insights(uri: str) -> list[dict[str, Any]] | dict[str, Any]:
             register_vector(conn)
 
             # Generate embedding for query
-            embedding = await get_embedding_with_retry(client, query.strip())
+            embedding = await get_query_embedding_cached(client, query.strip())
 
             # Execute semantic search. Explicit project_id WHERE for defense
             # in depth — the app DB user has BYPASSRLS so RLS alone isn't
@@ -277,6 +277,7 @@ async def handle_l2_insights(uri: str) -> list[dict[str, Any]] | dict[str, Any]:
                 SELECT id, content, embedding <=> %s::vector AS distance, source_ids
                 FROM l2_insights
                 WHERE project_id = %s
+                  AND embedding IS NOT NULL
                 ORDER BY distance
                 LIMIT %s
             """,
@@ -431,7 +432,7 @@ async def handle_episode_memory(uri: str) -> list[dict[str, Any]] | dict[str, An
     if not api_key or api_key == "sk-your-openai-api-key-here":
         raise RuntimeError("OpenAI API key not configured")
 
-    client = OpenAI(api_key=api_key)
+    client = await get_embeddings_client()
 
     try:
         project_id = await _resolve_project_id_for_resource()
@@ -440,7 +441,7 @@ async def handle_episode_memory(uri: str) -> list[dict[str, Any]] | dict[str, An
             register_vector(conn)
 
             # Generate embedding for query
-            embedding = await get_embedding_with_retry(client, query.strip())
+            embedding = await get_query_embedding_cached(client, query.strip())
 
             # Execute semantic search with similarity filter, project_id filter,
             # and Top-3 limit. Explicit project_id WHERE for defense in depth.
@@ -739,13 +740,13 @@ def register_resources(server: FastMCP) -> list[str]:
                 "resource": "memory://l2-insights",
             })
 
-        client = OpenAI(api_key=api_key)
+        client = await get_embeddings_client()
 
         try:
             project_id = await _resolve_project_id_for_resource()
             async with get_connection_with_project_context() as conn:
                 register_vector(conn)
-                embedding = await get_embedding_with_retry(client, query.strip())
+                embedding = await get_query_embedding_cached(client, query.strip())
 
                 cursor = conn.cursor()
                 cursor.execute(
@@ -753,6 +754,7 @@ def register_resources(server: FastMCP) -> list[str]:
                     SELECT id, content, embedding <=> %s::vector AS distance, source_ids
                     FROM l2_insights
                     WHERE project_id = %s
+                      AND embedding IS NOT NULL
                     ORDER BY distance
                     LIMIT %s
                     """,
@@ -870,13 +872,13 @@ def register_resources(server: FastMCP) -> list[str]:
                 "resource": "memory://episode-memory",
             })
 
-        client = OpenAI(api_key=api_key)
+        client = await get_embeddings_client()
 
         try:
             project_id = await _resolve_project_id_for_resource()
             async with get_connection_with_project_context() as conn:
                 register_vector(conn)
-                embedding = await get_embedding_with_retry(client, query.strip())
+                embedding = await get_query_embedding_cached(client, query.strip())
 
                 cursor = conn.cursor()
                 cursor.execute(
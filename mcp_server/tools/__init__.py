@@ -5,7 +5,7 @@ Provides tool registration and implementation for the Cognitive Memory System.
 Includes 29 tools: store_raw_dialogue, compress_to_l2_insight, hybrid_search,
 update_working_memory, delete_working_memory, store_episode, store_dual_judge_scores,
 get_golden_test_results, ping, graph_add_node, graph_update_node, graph_add_edge,
-graph_query_neighbors, graph_find_path, get_node_by_name, get_edge, count_by_type,
+graph_add_nodes_batch, graph_add_edges_batch, graph_query_neighbors, graph_find_path, get_node_by_name, get_edge, count_by_type,
 list_episodes, list_insights, get_insight_by_id, update_insight, delete_insight,
 submit_insight_feedback, dissonance_check, resolve_dissonance, smf_pending_proposals,
 smf_review, smf_approve, smf_reject, smf_undo, smf_bulk_approve, suggest_lateral_edges,
@@ -19,8 +19,7 @@ import json
 import logging
 import os
 import re
-import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime
 from typing import Any
 
@@ -38,10 +37,17 @@ from pgvector.psycopg2 import register_vector
 from psycopg2.extensions import cursor as cursor_type
 from psycopg2.extras import DictRow
 
+from mcp_server.analysis.ief import get_insight_feedback_adjustments
 from mcp_server.db.connection import (
     get_connection,
     get_connection_with_project_context,
+    get_free_connection_count,
+    run_in_db_executor,
 )
+from mcp_server.db.vector_indexes import apply_ef_search, validate_ef_search
+from mcp_server.external.embedding_cache import get_embedding_cache
+from mcp_server.external.embedding_worker import notify_pending_embeddings
+from mcp_server.external.openai_client import OpenAIEmbeddingsClient, get_embeddings_client
 from mcp_server.middleware.context import get_current_project
 from mcp_server.tools.count_by_type import handle_count_by_type
 from mcp_server.tools.dissonance_check import DISSONANCE_CHECK_TOOL
@@ -50,11 +56,14 @@ from mcp_server.tools.dissonance_check import (
 )
 from mcp_server.tools.dual_judge import DualJudgeEvaluator
 from mcp_server.tools.get_edge import handle_get_edge
+from mcp_server.tools.get_embedding_status import handle_get_embedding_status
 from mcp_server.tools.get_golden_test_results import handle_get_golden_test_results
 from mcp_server.tools.get_insight_by_id import handle_get_insight_by_id
 from mcp_server.tools.get_node_by_name import handle_get_node_by_name
 from mcp_server.tools.graph_add_edge import handle_graph_add_edge
+from mcp_server.tools.graph_add_edges_batch import handle_graph_add_edges_batch
 from mcp_server.tools.graph_add_node import handle_graph_add_node
+from mcp_server.tools.graph_add_nodes_batch import handle_graph_add_nodes_batch
 from mcp_server.tools.graph_update_node import handle_graph_update_node
 from mcp_server.tools.graph_find_path import handle_graph_find_path
 from mcp_server.tools.graph_query_neighbors import handle_graph_query_neighbors
@@ -90,6 +99,7 @@ def rrf_fusion(
     weights: dict,
     k: int = 60,
     graph_results: list[dict] | None = None,
+    feedback_adjustments: dict[int, float] | None = None,
 ) -> list[dict]:
     """
     Reciprocal Rank Fusion mit gewichteten Scores für 2 oder 3 Quellen.
@@ -105,6 +115,9 @@ def rrf_fusion(
         weights: {"semantic": 0.6, "keyword": 0.2, "graph": 0.2} (must sum to 1.0)
         k: Constant (60 is standard in literature)
         graph_results: Optional results from graph search (Story 4.6)
+        feedback_adjustments: Optional precomputed insight_id -> feedback adjustment
+            (see get_insight_feedback_adjustments). If None, feedback for all fused
+            L2 results is fetched with one batched query.
 
     Returns:
         Merged and sorted results by final RRF score
@@ -174,27 +187,38 @@ def rrf_fusion(
     # Story 26.1: Apply memory_strength multiplier for IEF Integration
     # Insights with higher memory_strength rank higher in results
     # Story 26.4: Apply Context Critic feedback adjustments (EP-4 Lazy Evaluation)
-    from mcp_server.analysis.ief import apply_insight_feedback_to_score
-
-    for result in sorted_results:
-        # Only apply to l2_insights (not episode memories or graph results)
-        if isinstance(result.get("id"), int) and result.get("source_type") != "episode_memory":
-            # Get memory_strength from result if available, default to 0.5
-            memory_strength = result.get("memory_strength", 0.5)
-            # Calculate final score: rrf_score * (0.5 + memory_strength)
-            # Fix N1 (2026-02-11): memory_strength as additive offset, not pure multiplier.
-            # At ms=0.5 (default): factor 1.0 (neutral). ms=0.9: 1.4. ms=0.1: 0.6. ms=0.0: 0.5.
-            # No insight becomes invisible through scoring alone — deletion is explicit.
-            result["rrf_score"] = result["score"]  # Store original RRF score
-            result["score"] = result["score"] * (0.5 + memory_strength)  # Apply offset multiplier
-
-            # Story 26.4: Apply IEF feedback adjustment (lazy evaluation)
-            insight_id = result.get("id")
-            if insight_id:
-                result["score"] = apply_insight_feedback_to_score(
-                    base_score=result["score"],
-                    insight_id=insight_id
-                )
+    from mcp_server.analysis.ief import (
+        apply_feedback_adjustment,
+        get_insight_feedback_adjustments,
+    )
+
+    # Only apply to l2_insights (not episode memories or graph results)
+    insight_results = [
+        result for result in sorted_results
+        if isinstance(result.get("id"), int) and result.get("source_type") != "episode_memory"
+    ]
+
+    # Batched feedback lookup: at most one query for all fused L2 results
+    if feedback_adjustments is None:
+        insight_ids = [result["id"] for result in insight_results if result["id"]]
+        feedback_adjustments = get_insight_feedback_adjustments(insight_ids) if insight_ids else {}
+
+    for result in insight_results:
+        # Get memory_strength from result if available, default to 0.5
+        memory_strength = result.get("memory_strength", 0.5)
+        # Calculate final score: rrf_score * (0.5 + memory_strength)
+        # Fix N1 (2026-02-11): memory_strength as additive offset, not pure multiplier.
+        # At ms=0.5 (default): factor 1.0 (neutral). ms=0.9: 1.4. ms=0.1: 0.6. ms=0.0: 0.5.
+        # No insight becomes invisible through scoring alone — deletion is explicit.
+        result["rrf_score"] = result["score"]  # Store original RRF score
+        result["score"] = result["score"] * (0.5 + memory_strength)  # Apply offset multiplier
+
+        # Story 26.4: Apply IEF feedback adjustment (lazy evaluation)
+        insight_id = result.get("id")
+        if insight_id:
+            result["score"] = apply_feedback_adjustment(
+                result["score"], feedback_adjustments.get(insight_id, 0.0)
+            )
 
     # Re-sort by final score (after memory_strength multiplier and feedback applied)
     sorted_results = sorted(
@@ -232,6 +256,77 @@ def _build_filter_clause(filter_params: dict | None) -> tuple[str, list]:
     return " AND " + " AND ".join(clauses), values
 
 
+def _build_l2_filter_clause(
+    filter_params: dict | None,
+    sector_filter: list[str] | None,
+    tags_filter: list[str] | None,
+    date_from: datetime | None,
+    date_to: datetime | None,
+) -> tuple[str, list]:
+    """
+    Build the l2_insights WHERE clause shared by semantic and keyword search.
+
+    Returns:
+        Tuple of (" AND ..." clause or "", parameter values)
+    """
+    # Build filter clause
+    filter_clause, filter_values = _build_filter_clause(filter_params)
+
+    # Story 9-4: Build sector filter clause for L2 insights
+    # L2 insights store memory_sector in metadata JSONB column
+    sector_clause = ""
+    sector_params = []
+    if sector_filter is not None:
+        sector_clause = " AND metadata->>'memory_sector' = ANY(%s::text[])"
+        sector_params = [sector_filter]
+
+    # Story 9.3.1: Build pre-filter clause for tags and date range
+    pre_filter_clauses = []
+    pre_filter_params = []
+
+    # Tags filter using GIN index on tags column
+    if tags_filter is not None:
+        pre_filter_clauses.append("tags @> %s::text[]")
+        pre_filter_params.append(tags_filter)
+
+    # Date range filtering using B-tree index on created_at
+    if date_from is not None:
+        pre_filter_clauses.append("created_at >= %s")
+        pre_filter_params.append(date_from)
+
+    if date_to is not None:
+        pre_filter_clauses.append("created_at <= %s")
+        pre_filter_params.append(date_to)
+
+    pre_filter_clause = ""
+    if pre_filter_clauses:
+        pre_filter_clause = " AND " + " AND ".join(pre_filter_clauses)
+
+    return (
+        f"{filter_clause}{sector_clause}{pre_filter_clause}",
+        filter_values + sector_params + pre_filter_params,
+    )
+
+
+def _l2_result(row: Any) -> dict:
+    """
+    Result fields shared by all l2_insights search channels.
+
+    Story 11.6.1: Include project_id in result metadata
+    """
+    return {
+        "id": row["id"],
+        "content": row["content"],
+        "source_ids": row["source_ids"],
+        "metadata": row["metadata"] or {},
+        "io_category": row["io_category"],
+        "is_identity": row["is_identity"],
+        "source_file": row["source_file"],
+        "memory_strength": row["memory_strength"],  # Story 26.1: I/O's Bedeutungszuweisung
+        "project_id": row["project_id"],  # Story 11.6.1: Track source project
+    }
+
+
 def semantic_search(
     query_embedding: list[float],
     top_k: int,
@@ -271,38 +366,9 @@ def semantic_search(
     if sector_filter is not None and len(sector_filter) == 0:
         return []
 
-    # Build filter clause
-    filter_clause, filter_values = _build_filter_clause(filter_params)
-
-    # Story 9-4: Build sector filter clause for L2 insights
-    # L2 insights store memory_sector in metadata JSONB column
-    sector_clause = ""
-    sector_params = []
-    if sector_filter is not None:
-        sector_clause = " AND metadata->>'memory_sector' = ANY(%s::text[])"
-        sector_params = [sector_filter]
-
-    # Story 9.3.1: Build pre-filter clause for tags and date range
-    pre_filter_clauses = []
-    pre_filter_params = []
-
-    # Tags filter using GIN index on tags column
-    if tags_filter is not None:
-        pre_filter_clauses.append("tags @> %s::text[]")
-        pre_filter_params.append(tags_filter)
-
-    # Date range filtering using B-tree index on created_at
-    if date_from is not None:
-        pre_filter_clauses.append("created_at >= %s")
-        pre_filter_params.append(date_from)
-
-    if date_to is not None:
-        pre_filter_clauses.append("created_at <= %s")
-        pre_filter_params.append(date_to)
-
-    pre_filter_clause = ""
-    if pre_filter_clauses:
-        pre_filter_clause = " AND " + " AND ".join(pre_filter_clauses)
+    l2_filter_clause, l2_filter_params = _build_l2_filter_clause(
+        filter_params, sector_filter, tags_filter, date_from, date_to
+    )
 
     # Cosine distance: <=> operator
     # Lower distance = higher similarity
@@ -313,14 +379,15 @@ def semantic_search(
                embedding <=> %s::vector AS distance
         FROM l2_insights
         WHERE is_deleted = FALSE
+          AND embedding IS NOT NULL
           AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
-          {filter_clause}{sector_clause}{pre_filter_clause}
+          {l2_filter_clause}
         ORDER BY distance
         LIMIT %s;
         """
 
-    # Combine parameters: embedding, filter_values, sector_params, pre_filter_params, top_k
-    params = [query_embedding] + filter_values + sector_params + pre_filter_params + [top_k]
+    # Combine parameters: embedding, filter params, top_k
+    params = [query_embedding] + l2_filter_params + [top_k]
 
     cursor.execute(query, params)
     results = cursor.fetchall()
@@ -338,21 +405,8 @@ def semantic_search(
         )
 
     # Add rank position (1-indexed)
-    # Story 11.6.1: Include project_id in result metadata
     return [
-        {
-            "id": row["id"],
-            "content": row["content"],
-            "source_ids": row["source_ids"],
-            "metadata": row["metadata"] or {},
-            "io_category": row["io_category"],
-            "is_identity": row["is_identity"],
-            "source_file": row["source_file"],
-            "memory_strength": row["memory_strength"],  # Story 26.1: I/O's Bedeutungszuweisung
-            "distance": row["distance"],
-            "rank": idx + 1,
-            "project_id": row["project_id"],  # Story 11.6.1: Track source project
-        }
+        {**_l2_result(row), "distance": row["distance"], "rank": idx + 1}
         for idx, row in enumerate(results)
     ]
 
@@ -403,38 +457,9 @@ def keyword_search(
     if sector_filter is not None and len(sector_filter) == 0:
         return []
 
-    # Build filter clause
-    filter_clause, filter_values = _build_filter_clause(filter_params)
-
-    # Story 9-4: Build sector filter clause for L2 insights
-    # L2 insights store memory_sector in metadata JSONB column
-    sector_clause = ""
-    sector_params = []
-    if sector_filter is not None:
-        sector_clause = " AND metadata->>'memory_sector' = ANY(%s::text[])"
-        sector_params = [sector_filter]
-
-    # Story 9.3.1: Build pre-filter clause for tags and date range
-    pre_filter_clauses = []
-    pre_filter_params = []
-
-    # Tags filter using GIN index on tags column
-    if tags_filter is not None:
-        pre_filter_clauses.append("tags @> %s::text[]")
-        pre_filter_params.append(tags_filter)
-
-    # Date range filtering using B-tree index on created_at
-    if date_from is not None:
-        pre_filter_clauses.append("created_at >= %s")
-        pre_filter_params.append(date_from)
-
-    if date_to is not None:
-        pre_filter_clauses.append("created_at <= %s")
-        pre_filter_params.append(date_to)
-
-    pre_filter_clause = ""
-    if pre_filter_clauses:
-        pre_filter_clause = " AND " + " AND ".join(pre_filter_clauses)
+    l2_filter_clause, l2_filter_params = _build_l2_filter_clause(
+        filter_params, sector_filter, tags_filter, date_from, date_to
+    )
 
     # ts_rank: Relevance score (higher = better match)
     # plainto_tsquery: Converts plain text to tsquery (handles spaces, punctuation)
@@ -451,13 +476,13 @@ def keyword_search(
         WHERE is_deleted = FALSE
           AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
           AND to_tsvector('{language}', content) @@ plainto_tsquery('{language}', %s)
-        {filter_clause}{sector_clause}{pre_filter_clause}
+        {l2_filter_clause}
         ORDER BY rank DESC
         LIMIT %s;
         """
 
-    # Combine parameters: query_text, query_text, filter_values, sector_params, pre_filter_params, top_k
-    params = [query_text, query_text] + filter_values + sector_params + pre_filter_params + [top_k]
+    # Combine parameters: query_text, query_text, filter params, top_k
+    params = [query_text, query_text] + l2_filter_params + [top_k]
 
     cursor.execute(query, params)
     results = cursor.fetchall()
@@ -480,15 +505,11 @@ def keyword_search(
             WHERE is_deleted = FALSE
               AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
               AND word_similarity(%s, content) > 0.3
-            {filter_clause}{sector_clause}{pre_filter_clause}
+            {l2_filter_clause}
             ORDER BY rank DESC
             LIMIT %s;
             """
-        trigram_params = (
-            [query_text, query_text]
-            + filter_values + sector_params + pre_filter_params
-            + [top_k]
-        )
+        trigram_params = [query_text, query_text] + l2_filter_params + [top_k]
         cursor.execute(trigram_query, trigram_params)
         results = cursor.fetchall()
         if results:
@@ -513,21 +534,8 @@ def keyword_search(
         )
 
     # Add rank position (1-indexed)
-    # Story 11.6.1: Include project_id in result metadata
     return [
-        {
-            "id": row["id"],
-            "content": row["content"],
-            "source_ids": row["source_ids"],
-            "metadata": row["metadata"] or {},
-            "io_category": row["io_category"],
-            "is_identity": row["is_identity"],
-            "source_file": row["source_file"],
-            "memory_strength": row["memory_strength"],  # Story 26.1: I/O's Bedeutungszuweisung
-            "rank": row["rank"],
-            "rank_position": idx + 1,
-            "project_id": row["project_id"],  # Story 11.6.1: Track source project
-        }
+        {**_l2_result(row), "rank": row["rank"], "rank_position": idx + 1}
         for idx, row in enumerate(results)
     ]
 
@@ -537,43 +545,18 @@ def keyword_search(
 # ============================================================================
 
 
-def episode_semantic_search(
-    query_embedding: list[float],
-    top_k: int,
-    conn: Any,
-    date_from: datetime | None = None,  # Story 9.3.1
-    date_to: datetime | None = None,  # Story 9.3.1
-    tags_filter: list[str] | None = None,
-    sector_filter: list[str] | None = None,
-) -> list[dict]:
+def _build_episode_filter_clause(
+    date_from: datetime | None,
+    date_to: datetime | None,
+    tags_filter: list[str] | None,
+    sector_filter: list[str] | None,
+) -> tuple[str, list]:
     """
-    Semantic search in episode_memory using pgvector cosine distance.
-
-    Bug Fix 2025-12-06: Added to include episode memories in hybrid search.
-    Episodes contain valuable lessons (query + reward + reflection) that
-    should be searchable.
-
-    Story 9.3.1: Extended with date_from, date_to for pre-filtering.
-    Hybrid-search-fix: Extended with tags_filter, sector_filter.
-
-    Args:
-        query_embedding: 1536-dim vector from OpenAI
-        top_k: Number of results to return
-        conn: PostgreSQL connection
-        date_from: Optional start date for filtering (Story 9.3.1)
-        date_to: Optional end date for filtering (Story 9.3.1)
-        tags_filter: Optional list of tags to filter by (GIN index)
-        sector_filter: Optional list of memory sectors to filter by
+    Build the episode_memory WHERE clause shared by episode semantic and keyword search.
 
     Returns:
-        List of dicts with id, query, reflection, reward, distance, rank
+        Tuple of (" AND ..." clause or "", parameter values)
     """
-    # Register pgvector type (required once per connection)
-    register_vector(conn)
-
-    cursor = conn.cursor()
-    logger = logging.getLogger(__name__)
-
     # Story 9.3.1: Build date range filter clause
     date_filter_clause = ""
     date_params: list[Any] = []
@@ -608,6 +591,72 @@ def episode_semantic_search(
             sector_filter_clause = " AND (metadata->>'memory_sector' = ANY(%s::text[]) OR metadata->>'memory_sector' IS NULL)"
             sector_params = [sector_filter]
 
+    return (
+        f"{date_filter_clause}{tags_filter_clause}{sector_filter_clause}",
+        date_params + tags_params + sector_params,
+    )
+
+
+def _episode_result(row: Any) -> dict:
+    """
+    Result fields shared by all episode_memory search channels.
+
+    Story 11.6.1: Include project_id in result metadata
+    """
+    return {
+        "id": f"episode_{row['id']}",  # Prefix to distinguish from l2_insights
+        "content": f"Episode: {row['query']} → Reflection: {row['reflection']}",
+        "source_type": "episode_memory",
+        "episode_id": row["id"],
+        "query": row["query"],
+        "reflection": row["reflection"],
+        "reward": row["reward"],
+        "created_at": row["created_at"].isoformat() if row["created_at"] else None,
+        "project_id": row["project_id"],  # Story 11.6.1: Track source project
+    }
+
+
+def episode_semantic_search(
+    query_embedding: list[float],
+    top_k: int,
+    conn: Any,
+    date_from: datetime | None = None,  # Story 9.3.1
+    date_to: datetime | None = None,  # Story 9.3.1
+    tags_filter: list[str] | None = None,
+    sector_filter: list[str] | None = None,
+) -> list[dict]:
+    """
+    Semantic search in episode_memory using pgvector cosine distance.
+
+    Bug Fix 2025-12-06: Added to include episode memories in hybrid search.
+    Episodes contain valuable lessons (query + reward + reflection) that
+    should be searchable.
+
+    Story 9.3.1: Extended with date_from, date_to for pre-filtering.
+    Hybrid-search-fix: Extended with tags_filter, sector_filter.
+
+    Args:
+        query_embedding: 1536-dim vector from OpenAI
+        top_k: Number of results to return
+        conn: PostgreSQL connection
+        date_from: Optional start date for filtering (Story 9.3.1)
+        date_to: Optional end date for filtering (Story 9.3.1)
+        tags_filter: Optional list of tags to filter by (GIN index)
+        sector_filter: Optional list of memory sectors to filter by
+
+    Returns:
+        List of dicts with id, query, reflection, reward, distance, rank
+    """
+    # Register pgvector type (required once per connection)
+    register_vector(conn)
+
+    cursor = conn.cursor()
+    logger = logging.getLogger(__name__)
+
+    episode_filter_clause, episode_filter_params = _build_episode_filter_clause(
+        date_from, date_to, tags_filter, sector_filter
+    )
+
     # Cosine distance: <=> operator
     # Lower distance = higher similarity
     # Story 11.6.1: Include project_id in SELECT for result metadata tracking
@@ -617,14 +666,13 @@ def episode_semantic_search(
                embedding <=> %s::vector AS distance
         FROM episode_memory
         WHERE project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
-        {date_filter_clause}
-        {tags_filter_clause}
-        {sector_filter_clause}
+          AND embedding IS NOT NULL
+        {episode_filter_clause}
         ORDER BY distance
         LIMIT %s;
         """
 
-    params = [query_embedding] + date_params + tags_params + sector_params + [top_k]
+    params = [query_embedding] + episode_filter_params + [top_k]
     cursor.execute(query, params)
     results = cursor.fetchall()
 
@@ -642,21 +690,8 @@ def episode_semantic_search(
         )
 
     # Format results for RRF fusion (needs 'id' and 'content' keys)
-    # Story 11.6.1: Include project_id in result metadata
     return [
-        {
-            "id": f"episode_{row['id']}",  # Prefix to distinguish from l2_insights
-            "content": f"Episode: {row['query']} → Reflection: {row['reflection']}",
-            "source_type": "episode_memory",
-            "episode_id": row["id"],
-            "query": row["query"],
-            "reflection": row["reflection"],
-            "reward": row["reward"],
-            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
-            "distance": row["distance"],
-            "rank": idx + 1,
-            "project_id": row["project_id"],  # Story 11.6.1: Track source project
-        }
+        {**_episode_result(row), "distance": row["distance"], "rank": idx + 1}
         for idx, row in enumerate(results)
     ]
 
@@ -697,39 +732,9 @@ def episode_keyword_search(
     cursor = conn.cursor()
     logger = logging.getLogger(__name__)
 
-    # Story 9.3.1: Build date range filter clause
-    date_filter_clause = ""
-    date_params: list[Any] = []
-
-    if date_from is not None:
-        date_filter_clause += " AND created_at >= %s"
-        date_params.append(date_from)
-
-    if date_to is not None:
-        date_filter_clause += " AND created_at <= %s"
-        date_params.append(date_to)
-
-    # Tags filter using GIN index on tags column (Migration 041)
-    # tags_filter=[] means "match nothing" (consistent with sector_filter=[])
-    tags_filter_clause = ""
-    tags_params: list[Any] = []
-    if tags_filter is not None:
-        if len(tags_filter) == 0:
-            tags_filter_clause = " AND FALSE"
-        else:
-            tags_filter_clause = " AND tags @> %s::text[]"
-            tags_params = [tags_filter]
-
-    # Sector filter: NULL-safe — unclassified episodes (metadata.memory_sector=NULL)
-    # pass the filter, since most existing episodes lack sector classification
-    sector_filter_clause = ""
-    sector_params: list[Any] = []
-    if sector_filter is not None:
-        if len(sector_filter) == 0:
-            sector_filter_clause = " AND FALSE"
-        else:
-            sector_filter_clause = " AND (metadata->>'memory_sector' = ANY(%s::text[]) OR metadata->>'memory_sector' IS NULL)"
-            sector_params = [sector_filter]
+    episode_filter_clause, episode_filter_params = _build_episode_filter_clause(
+        date_from, date_to, tags_filter, sector_filter
+    )
 
     # Search in both query and reflection fields
     # Using 'simple' language for better multi-language support
@@ -745,14 +750,12 @@ def episode_keyword_search(
         WHERE to_tsvector('{language}', query || ' ' || reflection)
               @@ plainto_tsquery('{language}', %s)
           AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
-        {date_filter_clause}
-        {tags_filter_clause}
-        {sector_filter_clause}
+        {episode_filter_clause}
         ORDER BY rank DESC
         LIMIT %s;
         """
 
-    params = [query_text, query_text] + date_params + tags_params + sector_params + [top_k]
+    params = [query_text, query_text] + episode_filter_params + [top_k]
     cursor.execute(query, params)
     results = cursor.fetchall()
 
@@ -767,17 +770,11 @@ def episode_keyword_search(
             FROM episode_memory
             WHERE word_similarity(%s, query || ' ' || reflection) > 0.3
               AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
-            {date_filter_clause}
-            {tags_filter_clause}
-            {sector_filter_clause}
+            {episode_filter_clause}
             ORDER BY rank DESC
             LIMIT %s;
             """
-        trigram_params = (
-            [query_text, query_text]
-            + date_params + tags_params + sector_params
-            + [top_k]
-        )
+        trigram_params = [query_text, query_text] + episode_filter_params + [top_k]
         cursor.execute(trigram_query, trigram_params)
         results = cursor.fetchall()
         if results:
@@ -803,40 +800,298 @@ def episode_keyword_search(
         )
 
     # Format results for RRF fusion
-    # Story 11.6.1: Include project_id in result metadata
     return [
-        {
-            "id": f"episode_{row['id']}",  # Prefix to distinguish from l2_insights
-            "content": f"Episode: {row['query']} → Reflection: {row['reflection']}",
-            "source_type": "episode_memory",
-            "episode_id": row["id"],
-            "query": row["query"],
-            "reflection": row["reflection"],
-            "reward": row["reward"],
-            "created_at": row["created_at"].isoformat() if row["created_at"] else None,
-            "rank": row["rank"],
-            "rank_position": idx + 1,
-            "project_id": row["project_id"],  # Story 11.6.1: Track source project
-        }
+        {**_episode_result(row), "rank": row["rank"], "rank_position": idx + 1}
         for idx, row in enumerate(results)
     ]
 
 
-# Default relational keywords for query routing (Story 4.6)
-DEFAULT_RELATIONAL_KEYWORDS = {
-    "de": [
-        "nutzt", "verwendet", "verbunden", "abhängig", "Projekt", "Technologie",
-        "gehört zu", "hat", "benutzt", "verknüpft", "zusammenhängt", "basiert auf"
-    ],
-    "en": [
-        "uses", "connected", "dependent", "project", "technology", "belongs to",
-        "has", "relates to", "linked", "associated", "based on", "depends on"
-    ],
-}
+# ============================================================================
+# Set-wise Search Channels (hybrid_search_batch)
+# ============================================================================
+# Each function answers N queries with one statement: the queries are unnested
+# into a derived table and the per-query top-k scan runs as a LATERAL subquery
+# (same WHERE clauses and ordering as the single-query channel functions).
 
 
-def extract_entities_from_query(query_text: str) -> list[str]:
-    """
+def _vector_literal(embedding: list[float]) -> str:
+    """Format an embedding as pgvector text input ('[x,y,...]')."""
+    return "[" + ",".join(str(float(x)) for x in embedding) + "]"
+
+
+def _fetch_per_query(cursor: Any, query: str, params: list, query_count: int) -> list[list[Any]]:
+    """Execute a batch query and group its rows by the 1-based query_idx column."""
+    cursor.execute(query, params)
+    grouped: list[list[Any]] = [[] for _ in range(query_count)]
+    for row in cursor.fetchall():
+        grouped[row["query_idx"] - 1].append(row)
+    return grouped
+
+
+def semantic_search_batch(
+    query_embeddings: list[list[float]],
+    top_k: int,
+    conn: Any,
+    filter_params: dict | None = None,
+    sector_filter: list[str] | None = None,
+    tags_filter: list[str] | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+) -> list[list[dict]]:
+    """
+    semantic_search() for several query embeddings in one statement.
+
+    Returns:
+        One result list per query embedding, in input order
+    """
+    if sector_filter is not None and len(sector_filter) == 0:
+        return [[] for _ in query_embeddings]
+    if not query_embeddings:
+        return []
+
+    l2_filter_clause, l2_filter_params = _build_l2_filter_clause(
+        filter_params, sector_filter, tags_filter, date_from, date_to
+    )
+    query = f"""
+        SELECT q.query_idx, r.*
+        FROM unnest(%s::vector[]) WITH ORDINALITY AS q(query_embedding, query_idx)
+        CROSS JOIN LATERAL (
+            SELECT id, content, source_ids, metadata, io_category, is_identity, source_file,
+                   memory_strength, project_id,
+                   embedding <=> q.query_embedding AS distance
+            FROM l2_insights
+            WHERE is_deleted = FALSE
+              AND embedding IS NOT NULL
+              AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+              {l2_filter_clause}
+            ORDER BY distance
+            LIMIT %s
+        ) r
+        ORDER BY q.query_idx, r.distance;
+        """
+    params = [[_vector_literal(e) for e in query_embeddings]] + l2_filter_params + [top_k]
+
+    cursor = conn.cursor()
+    grouped = _fetch_per_query(cursor, query, params, len(query_embeddings))
+    return [
+        [{**_l2_result(row), "distance": row["distance"], "rank": idx + 1} for idx, row in enumerate(rows)]
+        for rows in grouped
+    ]
+
+
+def keyword_search_batch(
+    query_texts: list[str],
+    top_k: int,
+    conn: Any,
+    filter_params: dict | None = None,
+    sector_filter: list[str] | None = None,
+    tags_filter: list[str] | None = None,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    language: str = "simple",
+) -> list[list[dict]]:
+    """
+    keyword_search() for several query texts in one statement.
+
+    Queries without a full-text match get the trigram fallback of
+    keyword_search(), again in one statement for all of them.
+
+    Returns:
+        One result list per query text, in input order
+    """
+    if sector_filter is not None and len(sector_filter) == 0:
+        return [[] for _ in query_texts]
+    if not query_texts:
+        return []
+
+    l2_filter_clause, l2_filter_params = _build_l2_filter_clause(
+        filter_params, sector_filter, tags_filter, date_from, date_to
+    )
+    select = """
+        SELECT q.query_idx, r.*
+        FROM unnest(%s::text[], %s::int[]) AS q(query_text, query_idx)
+        CROSS JOIN LATERAL (
+            SELECT id, content, source_ids, metadata, io_category, is_identity, source_file,
+                   memory_strength, project_id, {rank} AS rank
+            FROM l2_insights
+            WHERE is_deleted = FALSE
+              AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+              AND {match}
+              {filters}
+            ORDER BY rank DESC
+            LIMIT %s
+        ) r
+        ORDER BY q.query_idx, r.rank DESC;
+        """
+    fts_query = select.format(
+        rank=f"ts_rank(to_tsvector('{language}', content), plainto_tsquery('{language}', q.query_text))",
+        match=f"to_tsvector('{language}', content) @@ plainto_tsquery('{language}', q.query_text)",
+        filters=l2_filter_clause,
+    )
+    cursor = conn.cursor()
+    indexes = list(range(1, len(query_texts) + 1))
+    grouped = _fetch_per_query(
+        cursor, fts_query, [query_texts, indexes] + l2_filter_params + [top_k], len(query_texts)
+    )
+
+    # Story B3: Trigram fallback for queries without full-text matches
+    empty = [i for i, rows in enumerate(grouped) if not rows]
+    if empty:
+        trigram_query = select.format(
+            rank="word_similarity(q.query_text, content)",
+            match="word_similarity(q.query_text, content) > 0.3",
+            filters=l2_filter_clause,
+        )
+        fallback = _fetch_per_query(
+            cursor,
+            trigram_query,
+            [[query_texts[i] for i in empty], [i + 1 for i in empty]] + l2_filter_params + [top_k],
+            len(query_texts),
+        )
+        for i in empty:
+            grouped[i] = fallback[i]
+
+    return [
+        [{**_l2_result(row), "rank": row["rank"], "rank_position": idx + 1} for idx, row in enumerate(rows)]
+        for rows in grouped
+    ]
+
+
+def episode_semantic_search_batch(
+    query_embeddings: list[list[float]],
+    top_k: int,
+    conn: Any,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    tags_filter: list[str] | None = None,
+    sector_filter: list[str] | None = None,
+) -> list[list[dict]]:
+    """
+    episode_semantic_search() for several query embeddings in one statement.
+
+    Returns:
+        One result list per query embedding, in input order
+    """
+    if not query_embeddings:
+        return []
+
+    episode_filter_clause, episode_filter_params = _build_episode_filter_clause(
+        date_from, date_to, tags_filter, sector_filter
+    )
+    query = f"""
+        SELECT q.query_idx, r.*
+        FROM unnest(%s::vector[]) WITH ORDINALITY AS q(query_embedding, query_idx)
+        CROSS JOIN LATERAL (
+            SELECT id, query, reflection, reward, created_at, project_id,
+                   embedding <=> q.query_embedding AS distance
+            FROM episode_memory
+            WHERE project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+              AND embedding IS NOT NULL
+              {episode_filter_clause}
+            ORDER BY distance
+            LIMIT %s
+        ) r
+        ORDER BY q.query_idx, r.distance;
+        """
+    params = [[_vector_literal(e) for e in query_embeddings]] + episode_filter_params + [top_k]
+
+    cursor = conn.cursor()
+    grouped = _fetch_per_query(cursor, query, params, len(query_embeddings))
+    return [
+        [{**_episode_result(row), "distance": row["distance"], "rank": idx + 1} for idx, row in enumerate(rows)]
+        for rows in grouped
+    ]
+
+
+def episode_keyword_search_batch(
+    query_texts: list[str],
+    top_k: int,
+    conn: Any,
+    date_from: datetime | None = None,
+    date_to: datetime | None = None,
+    tags_filter: list[str] | None = None,
+    sector_filter: list[str] | None = None,
+    language: str = "simple",
+) -> list[list[dict]]:
+    """
+    episode_keyword_search() for several query texts in one statement.
+
+    Queries without a full-text match get the trigram fallback, again in
+    one statement for all of them.
+
+    Returns:
+        One result list per query text, in input order
+    """
+    if not query_texts:
+        return []
+
+    episode_filter_clause, episode_filter_params = _build_episode_filter_clause(
+        date_from, date_to, tags_filter, sector_filter
+    )
+    select = """
+        SELECT q.query_idx, r.*
+        FROM unnest(%s::text[], %s::int[]) AS q(query_text, query_idx)
+        CROSS JOIN LATERAL (
+            SELECT id, query, reflection, reward, created_at, project_id, {rank} AS rank
+            FROM episode_memory
+            WHERE {match}
+              AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+              {filters}
+            ORDER BY rank DESC
+            LIMIT %s
+        ) r
+        ORDER BY q.query_idx, r.rank DESC;
+        """
+    document = "query || ' ' || reflection"
+    fts_query = select.format(
+        rank=f"ts_rank(to_tsvector('{language}', {document}), plainto_tsquery('{language}', q.query_text))",
+        match=f"to_tsvector('{language}', {document}) @@ plainto_tsquery('{language}', q.query_text)",
+        filters=episode_filter_clause,
+    )
+    cursor = conn.cursor()
+    indexes = list(range(1, len(query_texts) + 1))
+    grouped = _fetch_per_query(
+        cursor, fts_query, [query_texts, indexes] + episode_filter_params + [top_k], len(query_texts)
+    )
+
+    # Story B3: Trigram fallback for queries without full-text matches
+    empty = [i for i, rows in enumerate(grouped) if not rows]
+    if empty:
+        trigram_query = select.format(
+            rank=f"word_similarity(q.query_text, {document})",
+            match=f"word_similarity(q.query_text, {document}) > 0.3",
+            filters=episode_filter_clause,
+        )
+        fallback = _fetch_per_query(
+            cursor,
+            trigram_query,
+            [[query_texts[i] for i in empty], [i + 1 for i in empty]] + episode_filter_params + [top_k],
+            len(query_texts),
+        )
+        for i in empty:
+            grouped[i] = fallback[i]
+
+    return [
+        [{**_episode_result(row), "rank": row["rank"], "rank_position": idx + 1} for idx, row in enumerate(rows)]
+        for rows in grouped
+    ]
+
+
+# Default relational keywords for query routing (Story 4.6)
+DEFAULT_RELATIONAL_KEYWORDS = {
+    "de": [
+        "nutzt", "verwendet", "verbunden", "abhängig", "Projekt", "Technologie",
+        "gehört zu", "hat", "benutzt", "verknüpft", "zusammenhängt", "basiert auf"
+    ],
+    "en": [
+        "uses", "connected", "dependent", "project", "technology", "belongs to",
+        "has", "relates to", "linked", "associated", "based on", "depends on"
+    ],
+}
+
+
+def extract_entities_from_query(query_text: str) -> list[str]:
+    """
     Extract entities from query text using simple pattern matching.
 
     Patterns:
@@ -959,13 +1214,14 @@ async def graph_search(
     Story 9-4: Extended with sector_filter parameter.
 
     Steps:
-    1. Extract entities from query (capitalized words, quoted strings)
-    2. For each entity, lookup node by name
-    3. For found nodes, query direct neighbors (depth=1)
-    4. For neighbors with vector_id, fetch L2 Insight
-    5. Apply sector filter to results (Story 9-4)
-    6. Calculate relevance score based on edge weight
-    7. Return ranked results
+    1. Link node names mentioned in the query (entity_linker.py), falling
+       back to capitalized words and quoted strings without an automaton
+    2. Resolve entities -> nodes -> depth-1 neighbors -> L2 Insights in one
+       set-based query (query_entity_neighbor_insights)
+    3. Keep the most relevant edge per neighbor (relevance_score), dedupe insights
+    4. Apply sector filter to results (Story 9-4)
+    5. Calculate relevance score based on edge weight
+    6. Return ranked results
 
     Args:
         query_text: Query text to search for entities
@@ -976,7 +1232,8 @@ async def graph_search(
     Returns:
         List of L2 Insight dicts with graph-based relevance scores
     """
-    from mcp_server.db.graph import get_node_by_name, query_neighbors
+    from mcp_server.db.entity_linker import link_entity_names
+    from mcp_server.db.graph import query_entity_neighbor_insights
 
     logger = logging.getLogger(__name__)
 
@@ -984,8 +1241,11 @@ async def graph_search(
     if sector_filter is not None and len(sector_filter) == 0:
         return []
 
-    # Step 1: Extract entities from query
-    entities = extract_entities_from_query(query_text)
+    # Step 1: Link node names mentioned in the query (entity automaton); without
+    # an automaton, guess entities from capitalized words and quoted strings
+    entities = await link_entity_names(query_text)
+    if entities is None:
+        entities = extract_entities_from_query(query_text)
 
     if not entities:
         logger.debug(f"No entities extracted from query: {query_text[:100]}")
@@ -993,95 +1253,62 @@ async def graph_search(
 
     logger.debug(f"Extracted entities: {entities}")
 
-    results: list[dict] = []
-    seen_ids: set[int] = set()
-
-    # Step 2-4: For each entity, lookup nodes and neighbors
-    for entity in entities:
-        # Lookup node by name
-        node = await get_node_by_name(entity)
-
-        if not node:
-            logger.debug(f"No node found for entity: {entity}")
-            continue
+    # Step 2: One round trip on the caller's connection (no per-entity,
+    # per-neighbor or per-insight pooled connections)
+    rows = await run_in_db_executor(query_entity_neighbor_insights, conn, entities)
 
-        logger.debug(f"Found node for entity '{entity}': {node['name']} (id={node['id']})")
+    rows_by_entity: dict[int, list[dict]] = {}
+    for row in rows:
+        rows_by_entity.setdefault(row["entity_ord"], []).append(row)
 
-        # Query neighbors (depth=1 for performance)
-        try:
-            neighbors = await query_neighbors(node["id"], relation_type=None, max_depth=1)
-        except Exception as e:
-            logger.warning(f"Failed to query neighbors for node {node['id']}: {e}")
-            continue
+    results: list[dict] = []
+    seen_ids: set[int] = set()
 
-        # Step 4: For neighbors with vector_id, fetch L2 Insight
-        for neighbor in neighbors:
-            vector_id = neighbor.get("properties", {}).get("vector_id") if neighbor.get("properties") else None
+    for entity_ord in sorted(rows_by_entity):
+        entity_rows = rows_by_entity[entity_ord]
 
-            # Also check if the node itself has a vector_id
-            # Need to look up the actual node to get its vector_id
-            neighbor_node = await get_node_by_name(neighbor["name"])
-            if neighbor_node and neighbor_node.get("vector_id"):
-                vector_id = neighbor_node["vector_id"]
+        # Step 3: Same edge selection as query_neighbors(): rows arrive sorted by
+        # relevance_score, weight DESC, name ASC (in SQL); keep one edge per node
+        seen_nodes: set[str] = set()
 
-            if not vector_id:
+        for row in entity_rows:
+            neighbor_id = str(row["neighbor_id"])
+            if neighbor_id in seen_nodes:
                 continue
+            seen_nodes.add(neighbor_id)
 
             # Skip duplicates
-            if vector_id in seen_ids:
-                continue
-            seen_ids.add(vector_id)
-
-            # Fetch L2 Insight from database
-            # Story 11.6.1: Include project_id in SELECT for result metadata tracking
-            # Defense-in-depth: explicit project_id filter (Story 11.7)
-            try:
-                cursor = conn.cursor()
-                cursor.execute(
-                    """
-                    SELECT id, content, source_ids, metadata, io_category, is_identity, source_file, project_id
-                    FROM l2_insights
-                    WHERE id = %s
-                        AND project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[]);
-                    """,
-                    (vector_id,)
-                )
-                insight = cursor.fetchone()
-
-                # Story 9-4: Apply sector filter to L2 insights from graph search
-                if insight:
-                    if sector_filter is not None:
-                        # Check if insight's memory_sector is in the filter
-                        insight_sector = insight.get("metadata", {}).get("memory_sector") if insight.get("metadata") else None
-                        if insight_sector not in sector_filter:
-                            # Skip this insight if it doesn't match the sector filter
-                            continue
-                    # Calculate graph relevance score based on edge weight and distance
-                    edge_weight = neighbor.get("weight", 1.0)
-                    distance = neighbor.get("distance", 1)
-                    # Score formula: edge_weight / distance (closer + stronger = higher score)
-                    graph_score = edge_weight / distance
-
-                    results.append({
-                        "id": insight["id"],
-                        "content": insight["content"],
-                        "source_ids": insight["source_ids"],
-                        "metadata": insight["metadata"] or {},
-                        "io_category": insight.get("io_category"),
-                        "is_identity": insight.get("is_identity"),
-                        "source_file": insight.get("source_file"),
-                        "graph_score": graph_score,
-                        "graph_distance": distance,
-                        "source_entity": entity,
-                        "source_relation": neighbor.get("relation", "UNKNOWN"),
-                        "project_id": insight["project_id"],  # Story 11.6.1: Track source project
-                    })
-
-            except Exception as e:
-                logger.warning(f"Failed to fetch L2 insight {vector_id}: {e}")
+            if row["id"] in seen_ids:
                 continue
-
-    # Step 5-6: Sort by graph_score and add rank
+            seen_ids.add(row["id"])
+
+            # Story 9-4: Apply sector filter to L2 insights from graph search
+            if sector_filter is not None:
+                insight_sector = row["metadata"].get("memory_sector") if row["metadata"] else None
+                if insight_sector not in sector_filter:
+                    continue
+
+            # Calculate graph relevance score based on edge weight and distance
+            # Score formula: edge_weight / distance (closer + stronger = higher score)
+            distance = 1
+            graph_score = float(row["weight"]) / distance
+
+            results.append({
+                "id": row["id"],
+                "content": row["content"],
+                "source_ids": row["source_ids"],
+                "metadata": row["metadata"] or {},
+                "io_category": row.get("io_category"),
+                "is_identity": row.get("is_identity"),
+                "source_file": row.get("source_file"),
+                "graph_score": graph_score,
+                "graph_distance": distance,
+                "source_entity": row["entity"],
+                "source_relation": row["relation"] or "UNKNOWN",
+                "project_id": row["project_id"],  # Story 11.6.1: Track source project
+            })
+
+    # Step 6: Sort by graph_score and add rank
     results.sort(key=lambda x: x["graph_score"], reverse=True)
     for idx, result in enumerate(results):
         result["rank"] = idx + 1
@@ -1242,16 +1469,32 @@ def calculate_fidelity(content: str) -> float:
     return min(1.0, density)  # Clamp to 1.0
 
 
+def _write_behind_default() -> bool:
+    """
+    Default for the async_embedding argument of compress_to_l2_insight and store_episode.
+
+    Environment Variables:
+        EMBEDDING_WRITE_BEHIND: "true"/"1"/"yes" stores new rows with embedding_status
+            'pending' and leaves embedding to the background worker (default: false)
+    """
+    return os.getenv("EMBEDDING_WRITE_BEHIND", "false").strip().lower() in ("1", "true", "yes")
+
+
 async def get_embedding_with_retry(
-    client: OpenAI, text: str, max_retries: int = 3
+    client: OpenAI | OpenAIEmbeddingsClient, text: str, max_retries: int = 3
 ) -> list[float]:
     """
     Call OpenAI Embeddings API with exponential backoff retry.
 
+    Server code passes the shared OpenAIEmbeddingsClient (get_embeddings_client()),
+    which coalesces and micro-batches concurrent requests and retries with its own
+    backoff policy. A sync OpenAI client (library, scripts) is called directly
+    with the retry loop below.
+
     Args:
-        client: OpenAI client instance
+        client: Shared OpenAIEmbeddingsClient or OpenAI client instance
         text: Text to embed
-        max_retries: Maximum number of retry attempts
+        max_retries: Maximum number of retry attempts (sync OpenAI client only)
 
     Returns:
         1536-dimensional embedding vector
@@ -1263,6 +1506,22 @@ async def get_embedding_with_retry(
     delays = [1, 2, 4]  # Exponential backoff in seconds
     logger = logging.getLogger(__name__)
 
+    if isinstance(client, OpenAIEmbeddingsClient):
+        try:
+            embedding = await client.embed(text)
+        except RateLimitError as e:
+            raise RuntimeError(
+                "Failed to get embedding after retries due to rate limiting"
+            ) from e
+        except APIConnectionError as e:
+            raise RuntimeError(
+                "Failed to get embedding after retries due to connection errors"
+            ) from e
+        except Exception as e:
+            raise RuntimeError(f"OpenAI API error: {e}") from e
+        logger.info(f"Successfully generated embedding for {len(text)} characters")
+        return embedding
+
     for attempt in range(max_retries):
         try:
             response = client.embeddings.create(
@@ -1305,6 +1564,36 @@ async def get_embedding_with_retry(
     raise RuntimeError(f"Failed to get embedding after {max_retries} attempts")
 
 
+async def get_query_embedding_cached(
+    client: OpenAI | OpenAIEmbeddingsClient, text: str, max_retries: int = 3
+) -> list[float]:
+    """
+    get_embedding_with_retry() behind the query-embedding cache.
+
+    Used for read paths (search queries) where the same text recurs; stored
+    content is embedded directly since it is rarely embedded twice.
+
+    Args:
+        client: Shared OpenAIEmbeddingsClient or OpenAI client (only used on a cache miss)
+        text: Text to embed
+        max_retries: Maximum number of retry attempts on a cache miss
+
+    Returns:
+        1536-dimensional embedding vector
+
+    Raises:
+        RuntimeError: If all retries fail
+    """
+    cache = get_embedding_cache()
+    embedding = await cache.aget(text)
+    if embedding is not None:
+        return embedding
+
+    embedding = await get_embedding_with_retry(client, text, max_retries)
+    await cache.aput(text, embedding)
+    return embedding
+
+
 async def handle_store_raw_dialogue(arguments: dict[str, Any]) -> dict[str, Any]:
     """
     Store raw dialogue data to L0 memory.
@@ -1465,7 +1754,17 @@ async def handle_compress_to_l2_insight(arguments: dict[str, Any]) -> dict[str,
                 "tool": "compress_to_l2_insight",
             }, project_id)
 
-        # Initialize OpenAI client
+        async_embedding = arguments.get("async_embedding")
+        if async_embedding is None:
+            async_embedding = _write_behind_default()
+        if not isinstance(async_embedding, bool):
+            return add_response_metadata({
+                "error": "Parameter validation failed",
+                "details": "async_embedding must be a boolean",
+                "tool": "compress_to_l2_insight",
+            }, project_id)
+
+        # Initialize OpenAI client (also required in async mode: the worker embeds later)
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key or api_key == "sk-your-openai-api-key-here":
             return add_response_metadata({
@@ -1474,7 +1773,7 @@ async def handle_compress_to_l2_insight(arguments: dict[str, Any]) -> dict[str,
                 "tool": "compress_to_l2_insight",
             }, project_id)
 
-        client = OpenAI(api_key=api_key)
+        client = await get_embeddings_client()
 
         # Calculate semantic fidelity
         fidelity_score = calculate_fidelity(content)
@@ -1492,19 +1791,22 @@ async def handle_compress_to_l2_insight(arguments: dict[str, Any]) -> dict[str,
                 f"Low information density ({fidelity_score:.2f} < {fidelity_threshold}) - consider more detailed compression"
             )
 
-        logger.info(
-            f"Computing embedding for content (fidelity: {fidelity_score:.2f}, warning: {metadata['fidelity_warning']})"
-        )
-
-        # Get embedding with retry logic
+        # Get embedding with retry logic, or leave it to the embedding worker
         embedding_status = "success"
-        try:
-            embedding = await get_embedding_with_retry(client, content)
-        except RuntimeError as e:
-            if "rate limiting" in str(e).lower():
-                embedding_status = "retried"
-            else:
-                raise e
+        embedding: list[float] | None = None
+        if async_embedding:
+            embedding_status = "pending"
+        else:
+            logger.info(
+                f"Computing embedding for content (fidelity: {fidelity_score:.2f}, warning: {metadata['fidelity_warning']})"
+            )
+            try:
+                embedding = await get_embedding_with_retry(client, content)
+            except RuntimeError as e:
+                if "rate limiting" in str(e).lower():
+                    embedding_status = "retried"
+                else:
+                    raise e
 
         # Store in database
         try:
@@ -1516,13 +1818,17 @@ async def handle_compress_to_l2_insight(arguments: dict[str, Any]) -> dict[str,
 
                 # Story 11.5.2: Insert insight with project_id for namespace isolation
                 # Story 9.1.1: Add tags column for structured retrieval
+                # Migration 052: async mode inserts embedding = NULL, status 'pending'
                 cursor.execute(
                     """
-                    INSERT INTO l2_insights (project_id, content, embedding, source_ids, metadata, memory_strength, tags)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                    INSERT INTO l2_insights (project_id, content, embedding, source_ids, metadata, memory_strength, tags, embedding_status)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
                     RETURNING id, project_id, created_at;
                     """,
-                    (project_id, content, embedding, source_ids, json.dumps(metadata), memory_strength, tags),
+                    (
+                        project_id, content, embedding, source_ids, json.dumps(metadata), memory_strength, tags,
+                        "pending" if embedding is None else "success",
+                    ),
                 )
 
                 result = cursor.fetchone()
@@ -1531,9 +1837,15 @@ async def handle_compress_to_l2_insight(arguments: dict[str, Any]) -> dict[str,
                 insight_id = int(result["id"])
                 created_project_id = result["project_id"]
                 created_at = result["created_at"].isoformat()
-                logger.info(
-                    f"Successfully stored L2 insight {insight_id} with {len(embedding)}-dimensional embedding for project {created_project_id}"
-                )
+                if embedding is None:
+                    logger.info(
+                        f"Stored L2 insight {insight_id} for project {created_project_id}, embedding pending"
+                    )
+                    notify_pending_embeddings()
+                else:
+                    logger.info(
+                        f"Successfully stored L2 insight {insight_id} with {len(embedding)}-dimensional embedding for project {created_project_id}"
+                    )
 
                 return add_response_metadata({
                     "id": insight_id,
@@ -1560,7 +1872,7 @@ async def handle_compress_to_l2_insight(arguments: dict[str, Any]) -> dict[str,
         }, get_current_project())
 
 
-def generate_query_embedding(query_text: str) -> list[float]:
+async def generate_query_embedding(query_text: str) -> list[float]:
     """
     Generate embedding for query text using OpenAI API.
 
@@ -1568,6 +1880,11 @@ def generate_query_embedding(query_text: str) -> list[float]:
     Mock embeddings caused semantic search failures because query vectors
     didn't match stored document vectors.
 
+    Results are served from / written to the query-embedding cache
+    (mcp_server/external/embedding_cache.py), so repeated queries skip
+    the API round trip. Misses go through the shared embeddings client,
+    so concurrent searches share batched API calls.
+
     Args:
         query_text: The query text to embed
 
@@ -1579,6 +1896,12 @@ def generate_query_embedding(query_text: str) -> list[float]:
     """
     logger = logging.getLogger(__name__)
 
+    cache = get_embedding_cache()
+    cached = await cache.aget(query_text)
+    if cached is not None:
+        logger.debug(f"Embedding cache hit for query ({len(query_text)} chars)")
+        return cached
+
     # Get OpenAI API key
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key or api_key == "sk-your-openai-api-key-here":
@@ -1587,35 +1910,475 @@ def generate_query_embedding(query_text: str) -> list[float]:
         )
 
     try:
-        client = OpenAI(api_key=api_key)
-        response = client.embeddings.create(
-            model="text-embedding-3-small",
-            input=query_text,
-            encoding_format="float"
-        )
-        embedding = response.data[0].embedding
-        logger.debug(f"Generated real embedding for query ({len(query_text)} chars)")
-        return embedding
+        client = await get_embeddings_client()
+        embedding = await client.embed(query_text)
+    except APIConnectionError as e:
+        raise RuntimeError(f"OpenAI API connection failed: {e}") from e
+    except Exception as e:
+        raise RuntimeError(f"Embedding generation failed: {e}") from e
+
+    logger.debug(f"Generated real embedding for query ({len(query_text)} chars)")
+    await cache.aput(query_text, embedding)
+    return embedding
+
+
+async def generate_query_embeddings(query_texts: list[str]) -> list[list[float]]:
+    """
+    Generate embeddings for several query texts with at most one API call.
+
+    Cached texts are served from the query-embedding cache; all distinct
+    misses are embedded together in one embeddings request.
+
+    Args:
+        query_texts: Query texts to embed
+
+    Returns:
+        One 1536-dimensional embedding per query text, in input order
+
+    Raises:
+        RuntimeError: If OpenAI API key is not configured or API call fails
+    """
+    logger = logging.getLogger(__name__)
+
+    cache = get_embedding_cache()
+    embeddings: dict[str, list[float]] = {}
+    for text in dict.fromkeys(query_texts):
+        cached = await cache.aget(text)
+        if cached is not None:
+            embeddings[text] = cached
+
+    misses = [text for text in dict.fromkeys(query_texts) if text not in embeddings]
+    if misses:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key or api_key == "sk-your-openai-api-key-here":
+            raise RuntimeError(
+                "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
+            )
 
-    except RateLimitError as e:
-        logger.warning(f"OpenAI rate limit hit, retrying once: {e}")
-        # Single retry with backoff
-        time.sleep(1)
         try:
-            response = client.embeddings.create(
-                model="text-embedding-3-small",
-                input=query_text,
-                encoding_format="float"
+            client = await get_embeddings_client()
+            generated = await client.create_embeddings(misses)
+        except APIConnectionError as e:
+            raise RuntimeError(f"OpenAI API connection failed: {e}") from e
+        except Exception as e:
+            raise RuntimeError(f"Embedding generation failed: {e}") from e
+
+        for text, embedding in zip(misses, generated, strict=True):
+            embeddings[text] = embedding
+            await cache.aput(text, embedding)
+
+    logger.debug(
+        f"Embedded {len(query_texts)} queries ({len(misses)} API, "
+        f"{len(query_texts) - len(misses)} cached)"
+    )
+    return [embeddings[text] for text in query_texts]
+
+
+def _fetch_allowed_projects(conn: Any) -> list[str]:
+    """Return get_allowed_projects() for the current RLS context (isolation guard)."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT get_allowed_projects() AS allowed")
+    row = cursor.fetchone()
+    cursor.close()
+    return row["allowed"] if row and row["allowed"] else []
+
+
+def _fetch_fusion_context(conn: Any, l2_results: list[dict]) -> tuple[list[str], dict[int, float]]:
+    """
+    Fetch the isolation guard and batched feedback adjustments for fusion.
+
+    Args:
+        conn: Connection with RLS project context active
+        l2_results: Semantic, keyword and graph results that can reach fusion
+
+    Returns:
+        Tuple of (allowed_projects, insight_id -> feedback adjustment)
+    """
+    allowed_projects = _fetch_allowed_projects(conn)
+
+    # Story 26.4: One batched feedback lookup for every L2 candidate that can
+    # reach fusion (instead of one connection per fused result)
+    candidate_insight_ids = [
+        r["id"] for r in l2_results
+        if isinstance(r.get("id"), int) and r.get("source_type") != "episode_memory"
+    ]
+    feedback_adjustments = get_insight_feedback_adjustments(
+        candidate_insight_ids, conn
+    ) if candidate_insight_ids else {}
+    return allowed_projects, feedback_adjustments
+
+
+def resolve_search_weights(weights: dict | None, is_relational: bool) -> dict:
+    """
+    Determine the RRF weights for a hybrid_search query.
+
+    Args:
+        weights: User-provided weights (old 2-source or new 3-source format) or None
+        is_relational: Result of detect_relational_query() for query routing
+
+    Returns:
+        Dict with semantic, keyword and graph weights
+    """
+    # Story 4.6: Backwards-compatible weight handling
+    # Bug #1 fix: User-provided weights should always be respected
+    if weights is None:
+        # No weights provided → use query routing to determine weights
+        return get_adjusted_weights(is_relational)
+    elif isinstance(weights, dict):
+        # Weights provided - check for backwards compatibility (old 2-source format)
+        if "graph" not in weights:
+            # Old format: {"semantic": 0.7, "keyword": 0.3}
+            # Bug #1 fix: Convert old format to new format, preserving user intent
+            # Scale down semantic/keyword proportionally to add 0.2 graph weight
+            semantic_weight = weights.get("semantic", 0.7)
+            keyword_weight = weights.get("keyword", 0.3)
+
+            # Normalize to make room for default graph weight (0.2)
+            # Preserve the ratio between semantic and keyword weights
+            total_old = semantic_weight + keyword_weight
+            if total_old > 0:
+                # Scale down to 0.8 total, add 0.2 for graph
+                scale_factor = 0.8 / total_old
+                return {
+                    "semantic": semantic_weight * scale_factor,
+                    "keyword": keyword_weight * scale_factor,
+                    "graph": 0.2,
+                }
+            else:
+                # Edge case: both weights are 0 → use defaults
+                return get_adjusted_weights(is_relational)
+        else:
+            # New format: {"semantic": 0.6, "keyword": 0.2, "graph": 0.2}
+            return {
+                "semantic": weights.get("semantic", 0.6),
+                "keyword": weights.get("keyword", 0.2),
+                "graph": weights.get("graph", 0.2),
+            }
+    else:
+        # Invalid weights format → use defaults
+        return get_adjusted_weights(is_relational)
+
+
+def parse_search_date_range(
+    date_from_raw: Any, date_to_raw: Any, tool: str
+) -> tuple[datetime | None, datetime | None, dict | None]:
+    """
+    Parse the date_from/date_to search parameters.
+
+    ISO strings are parsed; a date-only date_to is extended to the end of
+    that day. Non-string values are passed through for validate_filter_params().
+
+    Returns:
+        Tuple of (date_from, date_to, error response or None)
+    """
+    date_from = None
+    date_to = None
+    if date_from_raw is not None:
+        if isinstance(date_from_raw, str):
+            try:
+                date_from = datetime.fromisoformat(date_from_raw)
+            except ValueError:
+                return None, None, {
+                    "error": "Parameter validation failed",
+                    "details": f"Invalid date_from format: '{date_from_raw}'. Expected ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)",
+                    "tool": tool,
+                }
+        else:
+            date_from = date_from_raw
+    if date_to_raw is not None:
+        if isinstance(date_to_raw, str):
+            try:
+                date_to = datetime.fromisoformat(date_to_raw)
+                # Fix: When date-only string provided (no time component),
+                # set to end of day so the entire day is included
+                if "T" not in date_to_raw and date_to.hour == 0 and date_to.minute == 0 and date_to.second == 0:
+                    date_to = date_to.replace(hour=23, minute=59, second=59, microsecond=999999)
+            except ValueError:
+                return None, None, {
+                    "error": "Parameter validation failed",
+                    "details": f"Invalid date_to format: '{date_to_raw}'. Expected ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)",
+                    "tool": tool,
+                }
+        else:
+            date_to = date_to_raw
+    return date_from, date_to, None
+
+
+def validate_sector_filter(sector_filter: Any, tool: str) -> dict | None:
+    """
+    Validate a sector_filter parameter (Story 9-4).
+
+    Returns:
+        Error response, or None if sector_filter is a list of valid sectors
+    """
+    if not isinstance(sector_filter, list):
+        return {
+            "error": "Parameter validation failed",
+            "details": "Invalid 'sector_filter' parameter (must be array of sector names)",
+            "tool": tool,
+        }
+    # Valid sector values from MemorySector Literal type
+    valid_sectors = {"emotional", "episodic", "semantic", "procedural", "reflective"}
+    invalid_sectors = set(sector_filter) - valid_sectors
+    if invalid_sectors:
+        return {
+            "error": "Parameter validation failed",
+            "details": f"Invalid sector(s): {invalid_sectors}. Must be one of: {valid_sectors}",
+            "tool": tool,
+        }
+    return None
+
+
+def fuse_search_channels(
+    channel_results: dict[str, list[dict]],
+    applied_weights: dict,
+    top_k: int,
+    feedback_adjustments: dict[int, float],
+    allowed_projects: list[str],
+) -> list[dict]:
+    """
+    Fuse hybrid_search channel results into the final top-k result list.
+
+    Applies RRF fusion over L2 and episode results, the Python-level
+    isolation guard, and moves each result's project_id into its metadata.
+
+    Args:
+        channel_results: Channel name -> results (semantic, keyword,
+                         episode_semantic, episode_keyword, graph)
+        applied_weights: RRF weights from resolve_search_weights()
+        top_k: Number of fused results to keep
+        feedback_adjustments: insight_id -> feedback adjustment for rrf_fusion
+        allowed_projects: get_allowed_projects() of the search transaction
+
+    Returns:
+        Final fused results
+    """
+    logger = logging.getLogger(__name__)
+
+    semantic_results = channel_results.get("semantic", [])
+    keyword_results = channel_results.get("keyword", [])
+    episode_semantic_results = channel_results.get("episode_semantic", [])
+    episode_keyword_results = channel_results.get("episode_keyword", [])
+    graph_results = channel_results.get("graph", [])
+
+    # Bug Fix 2025-12-06: Merge episode results with L2 results for RRF fusion
+    # Episodes use prefixed IDs ("episode_49") to distinguish from l2_insights IDs
+    all_semantic_results = semantic_results + episode_semantic_results
+    all_keyword_results = keyword_results + episode_keyword_results
+
+    # Apply RRF fusion with all sources (including episodes)
+    fused_results = rrf_fusion(
+        all_semantic_results,
+        all_keyword_results,
+        applied_weights,
+        k=60,
+        graph_results=graph_results,
+        feedback_adjustments=feedback_adjustments,
+    )
+
+    # Select top-k results
+    final_results = fused_results[:top_k]
+
+    # Defense-in-depth: Python-level isolation guard (6th layer)
+    # Catches any isolation breach that bypasses SQL WHERE clauses + RLS policies.
+    # Uses the exact allowed_projects value queried from the same transaction.
+    _breach_count = 0
+    for result in final_results[:]:  # Iterate over copy for safe removal
+        result_pid = result.get("project_id")
+        if result_pid and allowed_projects and result_pid not in allowed_projects:
+            _breach_count += 1
+            logger.critical(
+                "ISOLATION BREACH DETECTED in hybrid_search: "
+                "result id=%s project_id=%s not in allowed_projects=%s "
+                "(requesting_project=%s). Result removed.",
+                result.get("id", "unknown"), result_pid,
+                allowed_projects, get_current_project()
             )
-            return response.data[0].embedding
-        except Exception as retry_error:
-            raise RuntimeError(f"Embedding generation failed after retry: {retry_error}") from retry_error
+            final_results.remove(result)
+    if _breach_count > 0:
+        logger.critical(
+            "ISOLATION GUARD: Removed %d cross-project results. "
+            "This indicates a SQL-layer filtering gap — investigate immediately.",
+            _breach_count
+        )
 
-    except APIConnectionError as e:
-        raise RuntimeError(f"OpenAI API connection failed: {e}") from e
+    # Story 11.6.1: Move result's project_id to metadata
+    # AC #Response Metadata: "each result includes project_id in metadata"
+    # All search functions (semantic_search, keyword_search, graph_search) return
+    # project_id at the result level - move it from result root into metadata dict
+    requesting_project = get_current_project()
+    for result in final_results:
+        # Ensure metadata dict exists
+        if "metadata" not in result:
+            result["metadata"] = {}
+        # Move the result's source project_id into metadata
+        if "project_id" in result:
+            result["metadata"]["project_id"] = result.pop("project_id")
+        else:
+            # This should never happen - all search functions return project_id
+            # Log warning but don't assign wrong value (requesting_project != source project)
+            logger.warning(
+                f"Result missing project_id: id={result.get('id', 'unknown')}, "
+                f"content={result.get('content', 'unknown')[:50]}, "
+                f"requesting_project={requesting_project}"
+            )
 
-    except Exception as e:
-        raise RuntimeError(f"Embedding generation failed: {e}") from e
+    return final_results
+
+
+# Parallel hybrid_search: channels run on separate pooled connections.
+# Enabled per call via `parallel` or globally via HYBRID_SEARCH_PARALLEL.
+DEFAULT_SEARCH_CHANNEL_CONCURRENCY = 5
+DEFAULT_SEARCH_CHANNEL_TIMEOUT = 5.0
+_SEARCH_CHANNEL_CANCEL_INTERVAL = 0.05
+
+SearchChannel = Callable[[Any], Awaitable[list[dict]]]
+
+
+class _SearchChannelTimeout(Exception):
+    """Raised when a hybrid_search channel exceeds its per-channel timeout."""
+
+
+def get_parallel_search_settings() -> tuple[bool, int, float]:
+    """
+    Read the parallel hybrid_search settings from the environment.
+
+    Environment:
+        HYBRID_SEARCH_PARALLEL: "true"/"1"/"yes" enables parallel mode by default
+        HYBRID_SEARCH_MAX_CONCURRENCY: Max channels holding a connection at once (default: 5)
+        HYBRID_SEARCH_CHANNEL_TIMEOUT: Seconds before a slow channel is dropped (default: 5.0)
+
+    Invalid values fall back to the defaults with a warning.
+
+    Returns:
+        Tuple of (parallel_default, max_concurrency, channel_timeout)
+    """
+    logger = logging.getLogger(__name__)
+
+    parallel = os.getenv("HYBRID_SEARCH_PARALLEL", "false").strip().lower() in ("1", "true", "yes")
+
+    max_concurrency = DEFAULT_SEARCH_CHANNEL_CONCURRENCY
+    raw_concurrency = os.getenv("HYBRID_SEARCH_MAX_CONCURRENCY")
+    if raw_concurrency:
+        try:
+            max_concurrency = int(raw_concurrency)
+            if max_concurrency < 1:
+                raise ValueError("must be >= 1")
+        except ValueError as e:
+            logger.warning(f"Invalid HYBRID_SEARCH_MAX_CONCURRENCY={raw_concurrency!r} ({e}), using default")
+            max_concurrency = DEFAULT_SEARCH_CHANNEL_CONCURRENCY
+
+    channel_timeout = DEFAULT_SEARCH_CHANNEL_TIMEOUT
+    raw_timeout = os.getenv("HYBRID_SEARCH_CHANNEL_TIMEOUT")
+    if raw_timeout:
+        try:
+            channel_timeout = float(raw_timeout)
+            if channel_timeout <= 0:
+                raise ValueError("must be > 0")
+        except ValueError as e:
+            logger.warning(f"Invalid HYBRID_SEARCH_CHANNEL_TIMEOUT={raw_timeout!r} ({e}), using default")
+            channel_timeout = DEFAULT_SEARCH_CHANNEL_TIMEOUT
+
+    return parallel, max_concurrency, channel_timeout
+
+
+async def _run_channel_on_own_connection(
+    name: str,
+    channel: SearchChannel,
+    semaphore: asyncio.Semaphore,
+    channel_timeout: float,
+    ef_search: int | None = None,
+) -> list[dict]:
+    """
+    Run one search channel on its own pooled connection with RLS context.
+
+    The timeout covers the channel's queries, not the wait for a free slot.
+    On timeout the server-side query is cancelled and the transaction rolled
+    back before the connection goes back to the pool. Cancelling repeats
+    until the channel returns, so a query the channel only sends after the
+    timeout fired is aborted as well.
+
+    Raises:
+        _SearchChannelTimeout: If the channel does not finish within channel_timeout
+    """
+    async with semaphore:
+        async with get_connection_with_project_context(read_only=True) as conn:
+            # Migration 050: SET LOCAL is per transaction, so apply on every connection
+            if ef_search is not None:
+                await run_in_db_executor(apply_ef_search, conn, ef_search)
+
+            work = asyncio.ensure_future(channel(conn))
+            try:
+                async with asyncio.timeout(channel_timeout):
+                    return await asyncio.shield(work)
+            except TimeoutError:
+                # Abort the running query, then wait until the worker releases conn
+                while not work.done():
+                    await run_in_db_executor(conn.cancel)
+                    await asyncio.wait({work}, timeout=_SEARCH_CHANNEL_CANCEL_INTERVAL)
+                await asyncio.gather(work, return_exceptions=True)
+                raise _SearchChannelTimeout(name) from None
+
+
+async def run_search_channels_parallel(
+    channels: dict[str, SearchChannel],
+    max_concurrency: int = DEFAULT_SEARCH_CHANNEL_CONCURRENCY,
+    channel_timeout: float = DEFAULT_SEARCH_CHANNEL_TIMEOUT,
+    ef_search: int | None = None,
+) -> tuple[dict[str, list[dict]], list[str]]:
+    """
+    Run hybrid_search channels concurrently on separate pooled connections.
+
+    Every channel gets its own get_connection_with_project_context()
+    connection, so each runs under the same RLS project context as the
+    sequential path. At most max_concurrency channels hold a connection at
+    once, and never more than the pool has free: the pool raises PoolError
+    instead of waiting, so with no free connection the channels run one
+    after another. A channel that exceeds channel_timeout is dropped (empty
+    results) instead of failing the search; any other channel error is
+    re-raised.
+
+    Args:
+        channels: Channel name -> async callable taking a connection
+        max_concurrency: Max channels running at the same time
+        channel_timeout: Per-channel timeout in seconds
+        ef_search: Optional HNSW ef_search applied on every connection
+
+    Returns:
+        Tuple of (channel name -> results, names of dropped channels)
+    """
+    logger = logging.getLogger(__name__)
+
+    free_connections = get_free_connection_count()
+    if free_connections is not None and free_connections < max_concurrency:
+        logger.debug(
+            f"hybrid_search: {free_connections} free pool connections, "
+            f"capping channel concurrency at {max(1, free_connections)}"
+        )
+        max_concurrency = max(1, free_connections)
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    names = list(channels)
+    outcomes = await asyncio.gather(
+        *(
+            _run_channel_on_own_connection(name, channels[name], semaphore, channel_timeout, ef_search)
+            for name in names
+        ),
+        return_exceptions=True,
+    )
+
+    results: dict[str, list[dict]] = {}
+    dropped: list[str] = []
+    for name, outcome in zip(names, outcomes, strict=True):
+        if isinstance(outcome, _SearchChannelTimeout):
+            logger.warning(f"hybrid_search channel '{name}' exceeded {channel_timeout:.1f}s timeout, dropped")
+            results[name] = []
+            dropped.append(name)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            results[name] = outcome
+    return results, dropped
 
 
 async def handle_hybrid_search(arguments: dict[str, Any]) -> dict[str, Any]:
@@ -1650,38 +2413,18 @@ async def handle_hybrid_search(arguments: dict[str, Any]) -> dict[str, Any]:
         date_from_raw = arguments.get("date_from")
         date_to_raw = arguments.get("date_to")
         source_type_filter = arguments.get("source_type_filter")
+        # Migration 050: Optional per-query HNSW candidate list size
+        ef_search = arguments.get("ef_search")
+        # Parallel channels: per-call override of HYBRID_SEARCH_PARALLEL
+        parallel_default, max_channel_concurrency, channel_timeout = get_parallel_search_settings()
+        parallel = arguments.get("parallel", parallel_default)
 
         # Parse ISO-format strings to datetime objects (hybrid-search-fix Fix 1)
-        date_from = None
-        date_to = None
-        if date_from_raw is not None:
-            if isinstance(date_from_raw, str):
-                try:
-                    date_from = datetime.fromisoformat(date_from_raw)
-                except ValueError:
-                    return {
-                        "error": "Parameter validation failed",
-                        "details": f"Invalid date_from format: '{date_from_raw}'. Expected ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)",
-                        "tool": "hybrid_search",
-                    }
-            else:
-                date_from = date_from_raw
-        if date_to_raw is not None:
-            if isinstance(date_to_raw, str):
-                try:
-                    date_to = datetime.fromisoformat(date_to_raw)
-                    # Fix: When date-only string provided (no time component),
-                    # set to end of day so the entire day is included
-                    if "T" not in date_to_raw and date_to.hour == 0 and date_to.minute == 0 and date_to.second == 0:
-                        date_to = date_to.replace(hour=23, minute=59, second=59, microsecond=999999)
-                except ValueError:
-                    return {
-                        "error": "Parameter validation failed",
-                        "details": f"Invalid date_to format: '{date_to_raw}'. Expected ISO format (YYYY-MM-DD or YYYY-MM-DDTHH:MM:SS)",
-                        "tool": "hybrid_search",
-                    }
-            else:
-                date_to = date_to_raw
+        date_from, date_to, date_error = parse_search_date_range(
+            date_from_raw, date_to_raw, "hybrid_search"
+        )
+        if date_error:
+            return date_error
 
         # Story 9.3.1: Validate new filter parameters
         filter_validation = validate_filter_params(
@@ -1695,21 +2438,9 @@ async def handle_hybrid_search(arguments: dict[str, Any]) -> dict[str, Any]:
 
         # Story 9-4: Validate sector_filter parameter
         if sector_filter is not None:
-            if not isinstance(sector_filter, list):
-                return {
-                    "error": "Parameter validation failed",
-                    "details": "Invalid 'sector_filter' parameter (must be array of sector names)",
-                    "tool": "hybrid_search",
-                }
-            # Valid sector values from MemorySector Literal type
-            valid_sectors = {"emotional", "episodic", "semantic", "procedural", "reflective"}
-            invalid_sectors = set(sector_filter) - valid_sectors
-            if invalid_sectors:
-                return {
-                    "error": "Parameter validation failed",
-                    "details": f"Invalid sector(s): {invalid_sectors}. Must be one of: {valid_sectors}",
-                    "tool": "hybrid_search",
-                }
+            sector_error = validate_sector_filter(sector_filter, "hybrid_search")
+            if sector_error:
+                return sector_error
 
             # Early return for empty filter (AC #4)
             if len(sector_filter) == 0:
@@ -1745,7 +2476,7 @@ async def handle_hybrid_search(arguments: dict[str, Any]) -> dict[str, Any]:
         # Generate embedding if not provided
         if not query_embedding:
             logger.info(f"Generating embedding for query: {query_text}")
-            query_embedding = generate_query_embedding(query_text)
+            query_embedding = await generate_query_embedding(query_text)
         elif not isinstance(query_embedding, list):
             return {
                 "error": "Parameter validation failed",
@@ -1756,226 +2487,406 @@ async def handle_hybrid_search(arguments: dict[str, Any]) -> dict[str, Any]:
         if not isinstance(top_k, int) or top_k <= 0 or top_k > 100:
             return {
                 "error": "Parameter validation failed",
-                "details": "Invalid 'top_k' parameter (must be integer between 1 and 100)",
-                "tool": "hybrid_search",
+                "details": "Invalid 'top_k' parameter (must be integer between 1 and 100)",
+                "tool": "hybrid_search",
+            }
+
+        if ef_search is not None:
+            try:
+                validate_ef_search(ef_search)
+            except ValueError as e:
+                return {
+                    "error": "Parameter validation failed",
+                    "details": f"Invalid 'ef_search' parameter ({e})",
+                    "tool": "hybrid_search",
+                }
+
+        if not isinstance(parallel, bool):
+            return {
+                "error": "Parameter validation failed",
+                "details": "Invalid 'parallel' parameter (must be boolean)",
+                "tool": "hybrid_search",
+            }
+
+        # Validate embedding dimension (1536 for OpenAI text-embedding-3-small)
+        if len(query_embedding) != 1536:
+            return {
+                "error": "Parameter validation failed",
+                "details": f"Invalid embedding dimension: {len(query_embedding)}. Expected 1536 for OpenAI text-embedding-3-small",
+                "tool": "hybrid_search",
+            }
+
+        # Story 4.6: Query Routing - detect relational queries
+        is_relational, matched_keywords = detect_relational_query(query_text)
+        query_type = "relational" if is_relational else "standard"
+
+        applied_weights = resolve_search_weights(weights, is_relational)
+
+        # Execute searches
+        # Story 11.6.1: Use get_connection_with_project_context for RLS filtering
+        # This ensures:
+        # 1. RLS context is set from project_context contextvar
+        # 2. pgvector iterative scans are configured
+        # 3. Queries automatically respect project boundaries
+        # Story 9.3.1: Check source_type_filter before running searches
+        run_semantic = should_include_source_type("l2_insight", source_type_filter)
+        run_keyword = should_include_source_type("l2_insight", source_type_filter)
+        run_episode_semantic = should_include_source_type("episode_memory", source_type_filter)
+        run_episode_keyword = should_include_source_type("episode_memory", source_type_filter)
+        run_graph = should_include_source_type("graph", source_type_filter)
+
+        # Run L2 Insights searches (Story 9-4: Pass sector_filter; Story 9.3.1: Pass new filters)
+        # Bug Fix 2025-12-06: Run Episode Memory searches
+        # Episodes contain valuable lessons that should be searchable
+        # Episodes filtered by all available filters (date, tags, sector)
+        # Story 4.6: Run graph search (Story 9-4: Pass sector_filter)
+        # RLS filters results by project_id automatically in every channel
+        # Async Pool Backend: the blocking scans run on the DB executor so a slow
+        # pgvector scan does not stall other concurrent tool calls
+        channels: dict[str, SearchChannel] = {}
+        if run_semantic:
+            channels["semantic"] = lambda conn: run_in_db_executor(
+                semantic_search, query_embedding, top_k, conn, filter_params, sector_filter,
+                tags_filter, date_from, date_to
+            )
+        if run_keyword:
+            channels["keyword"] = lambda conn: run_in_db_executor(
+                keyword_search, query_text, top_k, conn, filter_params, sector_filter,
+                tags_filter, date_from, date_to
+            )
+        if run_episode_semantic:
+            channels["episode_semantic"] = lambda conn: run_in_db_executor(
+                episode_semantic_search, query_embedding, top_k, conn, date_from, date_to,
+                tags_filter, sector_filter
+            )
+        if run_episode_keyword:
+            channels["episode_keyword"] = lambda conn: run_in_db_executor(
+                episode_keyword_search, query_text, top_k, conn, date_from, date_to,
+                tags_filter, sector_filter
+            )
+        if run_graph:
+            channels["graph"] = lambda conn: graph_search(
+                query_text, top_k, conn, sector_filter
+            )
+
+        dropped_channels: list[str] = []
+        if parallel:
+            # Each channel runs on its own pooled connection with the same RLS
+            # project context; slow channels are dropped after channel_timeout
+            channel_results, dropped_channels = await run_search_channels_parallel(
+                channels, max_channel_concurrency, channel_timeout, ef_search
+            )
+            l2_results = [
+                *channel_results.get("semantic", []),
+                *channel_results.get("keyword", []),
+                *channel_results.get("graph", []),
+            ]
+            # allowed_projects depends only on the project context, which is
+            # identical on every channel connection
+            async with get_connection_with_project_context(read_only=True) as conn:
+                _allowed_projects_guard, feedback_adjustments = await run_in_db_executor(
+                    _fetch_fusion_context, conn, l2_results
+                )
+        else:
+            async with get_connection_with_project_context(read_only=True) as conn:
+                # Migration 050: SET LOCAL hnsw.ef_search for this transaction only
+                if ef_search is not None:
+                    await run_in_db_executor(apply_ef_search, conn, ef_search)
+
+                channel_results = {}
+                for name, channel in channels.items():
+                    channel_results[name] = await channel(conn)
+                l2_results = [
+                    *channel_results.get("semantic", []),
+                    *channel_results.get("keyword", []),
+                    *channel_results.get("graph", []),
+                ]
+
+                # Defense-in-depth: Query allowed_projects for Python-level isolation guard
+                # This captures the EXACT same value used by SQL WHERE clauses
+                _allowed_projects_guard, feedback_adjustments = await run_in_db_executor(
+                    _fetch_fusion_context, conn, l2_results
+                )
+
+        semantic_results = channel_results.get("semantic", [])
+        keyword_results = channel_results.get("keyword", [])
+        episode_semantic_results = channel_results.get("episode_semantic", [])
+        episode_keyword_results = channel_results.get("episode_keyword", [])
+        graph_results = channel_results.get("graph", [])
+
+        final_results = fuse_search_channels(
+            channel_results, applied_weights, top_k, feedback_adjustments,
+            _allowed_projects_guard,
+        )
+        requesting_project = get_current_project()
+
+        logger.info(
+            f"Hybrid search completed: {len(semantic_results)} l2_semantic, "
+            f"{len(episode_semantic_results)} episode_semantic, "
+            f"{len(keyword_results)} l2_keyword, {len(episode_keyword_results)} episode_keyword, "
+            f"{len(graph_results)} graph, {len(final_results)} fused (query_type={query_type}, requesting_project={requesting_project})"
+        )
+
+        # Extended response format with episode counts and project metadata
+        return {
+            "results": final_results,
+            "query_embedding_dimension": len(query_embedding),
+            "semantic_results_count": len(semantic_results),
+            "keyword_results_count": len(keyword_results),
+            "graph_results_count": len(graph_results),
+            # Bug Fix 2025-12-06: Episode memory search counts
+            "episode_semantic_count": len(episode_semantic_results),
+            "episode_keyword_count": len(episode_keyword_results),
+            "final_results_count": len(final_results),
+            "query_type": query_type,
+            "matched_keywords": matched_keywords if is_relational else [],
+            "applied_weights": applied_weights,
+            "weights": applied_weights,                 # Backwards-compatible alias
+            # Story 9-4: Include sector_filter in response
+            "sector_filter": sector_filter,
+            # Story 9.3.1: Include new filter parameters in response metadata
+            "applied_filters": {
+                "tags_filter": tags_filter,
+                "date_from": date_from.isoformat() if date_from else None,
+                "date_to": date_to.isoformat() if date_to else None,
+                "source_type_filter": source_type_filter,
+            },
+            # Migration 050: Echo the HNSW ef_search override (None = server default)
+            "ef_search": ef_search,
+            # Parallel channels: mode used and channels dropped after timeout
+            "parallel": parallel,
+            "dropped_channels": dropped_channels,
+            # Story 11.6.1: Add requesting project_id to response metadata
+            "project_id": requesting_project,
+            "status": "success",
+        }
+
+    except psycopg2.Error as e:
+        logger.error(f"Database error in hybrid_search: {e}")
+        return {
+            "error": "Database operation failed",
+            "details": str(e),
+            "tool": "hybrid_search",
+        }
+    except Exception as e:
+        logger.error(f"Unexpected error in hybrid_search: {e}")
+        return {
+            "error": "Tool execution failed",
+            "details": str(e),
+            "tool": "hybrid_search",
+        }
+
+
+# hybrid_search_batch: max queries per call (one embeddings request, one connection)
+MAX_BATCH_SEARCH_QUERIES = 20
+
+
+async def handle_hybrid_search_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    Run hybrid_search for several queries in one call.
+
+    All query texts are embedded with one API call (cache hits skipped),
+    all channels run on one RLS-scoped connection, and the semantic/keyword
+    channels answer every query with one set-wise statement each. The graph
+    channel runs per query on the same connection. Fusion, query routing
+    and the isolation guard are the same as in hybrid_search.
+
+    Args:
+        arguments: Tool arguments containing queries (list of query texts) and the
+                   shared hybrid_search parameters (top_k, weights, filter,
+                   sector_filter, tags_filter, date_from, date_to,
+                   source_type_filter, ef_search)
+
+    Returns:
+        Per-query fused results in input order, plus the applied filters
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        queries = arguments.get("queries")
+        top_k = arguments.get("top_k", 5)
+        weights = arguments.get("weights")
+        filter_params = arguments.get("filter")
+        sector_filter = arguments.get("sector_filter")
+        tags_filter = arguments.get("tags_filter")
+        source_type_filter = arguments.get("source_type_filter")
+        ef_search = arguments.get("ef_search")
+
+        if (
+            not isinstance(queries, list)
+            or not queries
+            or not all(isinstance(q, str) and q.strip() for q in queries)
+        ):
+            return {
+                "error": "Parameter validation failed",
+                "details": "'queries' must be a non-empty array of non-empty strings",
+                "tool": "hybrid_search_batch",
+            }
+        if len(queries) > MAX_BATCH_SEARCH_QUERIES:
+            return {
+                "error": "Parameter validation failed",
+                "details": f"At most {MAX_BATCH_SEARCH_QUERIES} queries per call, got {len(queries)}",
+                "tool": "hybrid_search_batch",
             }
 
-        # Validate embedding dimension (1536 for OpenAI text-embedding-3-small)
-        if len(query_embedding) != 1536:
+        if not isinstance(top_k, int) or top_k <= 0 or top_k > 100:
             return {
                 "error": "Parameter validation failed",
-                "details": f"Invalid embedding dimension: {len(query_embedding)}. Expected 1536 for OpenAI text-embedding-3-small",
-                "tool": "hybrid_search",
+                "details": "Invalid 'top_k' parameter (must be integer between 1 and 100)",
+                "tool": "hybrid_search_batch",
             }
 
-        # Story 4.6: Query Routing - detect relational queries
-        is_relational, matched_keywords = detect_relational_query(query_text)
-        query_type = "relational" if is_relational else "standard"
+        date_from, date_to, date_error = parse_search_date_range(
+            arguments.get("date_from"), arguments.get("date_to"), "hybrid_search_batch"
+        )
+        if date_error:
+            return date_error
 
-        # Story 4.6: Backwards-compatible weight handling
-        # Bug #1 fix: User-provided weights should always be respected
-        if weights is None:
-            # No weights provided → use query routing to determine weights
-            applied_weights = get_adjusted_weights(is_relational)
-        elif isinstance(weights, dict):
-            # Weights provided - check for backwards compatibility (old 2-source format)
-            if "graph" not in weights:
-                # Old format: {"semantic": 0.7, "keyword": 0.3}
-                # Bug #1 fix: Convert old format to new format, preserving user intent
-                # Scale down semantic/keyword proportionally to add 0.2 graph weight
-                semantic_weight = weights.get("semantic", 0.7)
-                keyword_weight = weights.get("keyword", 0.3)
-
-                # Normalize to make room for default graph weight (0.2)
-                # Preserve the ratio between semantic and keyword weights
-                total_old = semantic_weight + keyword_weight
-                if total_old > 0:
-                    # Scale down to 0.8 total, add 0.2 for graph
-                    scale_factor = 0.8 / total_old
-                    applied_weights = {
-                        "semantic": semantic_weight * scale_factor,
-                        "keyword": keyword_weight * scale_factor,
-                        "graph": 0.2,
-                    }
-                else:
-                    # Edge case: both weights are 0 → use defaults
-                    applied_weights = get_adjusted_weights(is_relational)
-            else:
-                # New format: {"semantic": 0.6, "keyword": 0.2, "graph": 0.2}
-                applied_weights = {
-                    "semantic": weights.get("semantic", 0.6),
-                    "keyword": weights.get("keyword", 0.2),
-                    "graph": weights.get("graph", 0.2),
-                }
-        else:
-            # Invalid weights format → use defaults
-            applied_weights = get_adjusted_weights(is_relational)
+        filter_validation = validate_filter_params(
+            tags_filter=tags_filter,
+            date_from=date_from,
+            date_to=date_to,
+            source_type_filter=source_type_filter,
+        )
+        if "error" in filter_validation:
+            return filter_validation
 
-        # Execute searches
-        # Story 11.6.1: Use get_connection_with_project_context for RLS filtering
-        # This ensures:
-        # 1. RLS context is set from project_context contextvar
-        # 2. pgvector iterative scans are configured
-        # 3. Queries automatically respect project boundaries
-        # Story 9.3.1: Check source_type_filter before running searches
-        run_semantic = should_include_source_type("l2_insight", source_type_filter)
-        run_keyword = should_include_source_type("l2_insight", source_type_filter)
-        run_episode_semantic = should_include_source_type("episode_memory", source_type_filter)
-        run_episode_keyword = should_include_source_type("episode_memory", source_type_filter)
-        run_graph = should_include_source_type("graph", source_type_filter)
+        if sector_filter is not None:
+            sector_error = validate_sector_filter(sector_filter, "hybrid_search_batch")
+            if sector_error:
+                return sector_error
 
-        async with get_connection_with_project_context(read_only=True) as conn:
-            # Run L2 Insights searches (Story 9-4: Pass sector_filter; Story 9.3.1: Pass new filters)
-            # RLS filters results by project_id automatically
-            semantic_results = semantic_search(
-                query_embedding, top_k, conn, filter_params, sector_filter,
-                tags_filter, date_from, date_to
-            ) if run_semantic else []
-            keyword_results = keyword_search(
-                query_text, top_k, conn, filter_params, sector_filter,
-                tags_filter, date_from, date_to
-            ) if run_keyword else []
-
-            # Bug Fix 2025-12-06: Run Episode Memory searches
-            # Episodes contain valuable lessons that should be searchable
-            # Episodes filtered by all available filters (date, tags, sector)
-            # RLS filters results by project_id automatically
-            episode_semantic_results = episode_semantic_search(
-                query_embedding, top_k, conn, date_from, date_to,
-                tags_filter, sector_filter
-            ) if run_episode_semantic else []
-            episode_keyword_results = episode_keyword_search(
-                query_text, top_k, conn, date_from, date_to,
-                tags_filter, sector_filter
-            ) if run_episode_keyword else []
+        if ef_search is not None:
+            try:
+                validate_ef_search(ef_search)
+            except ValueError as e:
+                return {
+                    "error": "Parameter validation failed",
+                    "details": f"Invalid 'ef_search' parameter ({e})",
+                    "tool": "hybrid_search_batch",
+                }
 
-            # Story 4.6: Run graph search (Story 9-4: Pass sector_filter)
-            # RLS filters results by project_id automatically
-            graph_results = await graph_search(
-                query_text, top_k, conn, sector_filter
-            ) if run_graph else []
-
-            # Defense-in-depth: Query allowed_projects for Python-level isolation guard
-            # This captures the EXACT same value used by SQL WHERE clauses
-            _guard_cursor = conn.cursor()
-            _guard_cursor.execute("SELECT get_allowed_projects() AS allowed")
-            _guard_row = _guard_cursor.fetchone()
-            _allowed_projects_guard = _guard_row["allowed"] if _guard_row and _guard_row["allowed"] else []
-            _guard_cursor.close()
-
-        # Bug Fix 2025-12-06: Merge episode results with L2 results for RRF fusion
-        # Episodes use prefixed IDs ("episode_49") to distinguish from l2_insights IDs
-        all_semantic_results = semantic_results + episode_semantic_results
-        all_keyword_results = keyword_results + episode_keyword_results
-
-        # Apply RRF fusion with all sources (including episodes)
-        fused_results = rrf_fusion(
-            all_semantic_results,
-            all_keyword_results,
-            applied_weights,
-            k=60,
-            graph_results=graph_results
-        )
+        no_results: list[list[dict]] = [[] for _ in queries]
+        if sector_filter == []:
+            # Story 9-4: sector_filter=[] matches nothing, so every query gets
+            # empty results without embedding calls or database round trips
+            semantic = keyword = episode_semantic = episode_keyword = graph = no_results
+            allowed_projects: list[str] = []
+            feedback_adjustments: dict[int, float] = {}
+        else:
+            query_embeddings = await generate_query_embeddings(queries)
+
+            run_semantic = should_include_source_type("l2_insight", source_type_filter)
+            run_keyword = should_include_source_type("l2_insight", source_type_filter)
+            run_episode_semantic = should_include_source_type("episode_memory", source_type_filter)
+            run_episode_keyword = should_include_source_type("episode_memory", source_type_filter)
+            run_graph = should_include_source_type("graph", source_type_filter)
+
+            async with get_connection_with_project_context(read_only=True) as conn:
+                # Migration 050: SET LOCAL hnsw.ef_search for this transaction only
+                if ef_search is not None:
+                    await run_in_db_executor(apply_ef_search, conn, ef_search)
+
+                semantic = await run_in_db_executor(
+                    semantic_search_batch, query_embeddings, top_k, conn, filter_params,
+                    sector_filter, tags_filter, date_from, date_to
+                ) if run_semantic else no_results
+                keyword = await run_in_db_executor(
+                    keyword_search_batch, queries, top_k, conn, filter_params,
+                    sector_filter, tags_filter, date_from, date_to
+                ) if run_keyword else no_results
+                episode_semantic = await run_in_db_executor(
+                    episode_semantic_search_batch, query_embeddings, top_k, conn,
+                    date_from, date_to, tags_filter, sector_filter
+                ) if run_episode_semantic else no_results
+                episode_keyword = await run_in_db_executor(
+                    episode_keyword_search_batch, queries, top_k, conn,
+                    date_from, date_to, tags_filter, sector_filter
+                ) if run_episode_keyword else no_results
+
+                graph = []
+                for query_text in queries:
+                    graph.append(
+                        await graph_search(query_text, top_k, conn, sector_filter) if run_graph else []
+                    )
 
-        # Select top-k results
-        final_results = fused_results[:top_k]
-
-        # Defense-in-depth: Python-level isolation guard (6th layer)
-        # Catches any isolation breach that bypasses SQL WHERE clauses + RLS policies.
-        # Uses the exact allowed_projects value queried from the same transaction.
-        _breach_count = 0
-        for result in final_results[:]:  # Iterate over copy for safe removal
-            result_pid = result.get("project_id")
-            if result_pid and _allowed_projects_guard and result_pid not in _allowed_projects_guard:
-                _breach_count += 1
-                logger.critical(
-                    "ISOLATION BREACH DETECTED in hybrid_search: "
-                    "result id=%s project_id=%s not in allowed_projects=%s "
-                    "(requesting_project=%s). Result removed.",
-                    result.get("id", "unknown"), result_pid,
-                    _allowed_projects_guard, get_current_project()
+                # One isolation guard and one feedback lookup for all queries
+                l2_results = [r for per_query in (*semantic, *keyword, *graph) for r in per_query]
+                allowed_projects, feedback_adjustments = await run_in_db_executor(
+                    _fetch_fusion_context, conn, l2_results
                 )
-                final_results.remove(result)
-        if _breach_count > 0:
-            logger.critical(
-                "ISOLATION GUARD: Removed %d cross-project results. "
-                "This indicates a SQL-layer filtering gap — investigate immediately.",
-                _breach_count
+
+        query_responses = []
+        for i, query_text in enumerate(queries):
+            is_relational, matched_keywords = detect_relational_query(query_text)
+            applied_weights = resolve_search_weights(weights, is_relational)
+            channel_results = {
+                "semantic": semantic[i],
+                "keyword": keyword[i],
+                "episode_semantic": episode_semantic[i],
+                "episode_keyword": episode_keyword[i],
+                "graph": graph[i],
+            }
+            final_results = fuse_search_channels(
+                channel_results, applied_weights, top_k, feedback_adjustments, allowed_projects
             )
+            query_responses.append({
+                "query_text": query_text,
+                "results": final_results,
+                "semantic_results_count": len(semantic[i]),
+                "keyword_results_count": len(keyword[i]),
+                "graph_results_count": len(graph[i]),
+                "episode_semantic_count": len(episode_semantic[i]),
+                "episode_keyword_count": len(episode_keyword[i]),
+                "final_results_count": len(final_results),
+                "query_type": "relational" if is_relational else "standard",
+                "matched_keywords": matched_keywords if is_relational else [],
+                "applied_weights": applied_weights,
+            })
 
-        # Story 11.6.1: Move result's project_id to metadata
-        # AC #Response Metadata: "each result includes project_id in metadata"
-        # All search functions (semantic_search, keyword_search, graph_search) return
-        # project_id at the result level - move it from result root into metadata dict
         requesting_project = get_current_project()
-        for result in final_results:
-            # Ensure metadata dict exists
-            if "metadata" not in result:
-                result["metadata"] = {}
-            # Move the result's source project_id into metadata
-            if "project_id" in result:
-                result["metadata"]["project_id"] = result.pop("project_id")
-            else:
-                # This should never happen - all search functions return project_id
-                # Log warning but don't assign wrong value (requesting_project != source project)
-                logger.warning(
-                    f"Result missing project_id: id={result.get('id', 'unknown')}, "
-                    f"content={result.get('content', 'unknown')[:50]}, "
-                    f"requesting_project={requesting_project}"
-                )
-
         logger.info(
-            f"Hybrid search completed: {len(semantic_results)} l2_semantic, "
-            f"{len(episode_semantic_results)} episode_semantic, "
-            f"{len(keyword_results)} l2_keyword, {len(episode_keyword_results)} episode_keyword, "
-            f"{len(graph_results)} graph, {len(final_results)} fused (query_type={query_type}, requesting_project={requesting_project})"
+            f"Hybrid search batch completed: {len(queries)} queries "
+            f"(requesting_project={requesting_project})"
         )
 
-        # Extended response format with episode counts and project metadata
         return {
-            "results": final_results,
-            "query_embedding_dimension": len(query_embedding),
-            "semantic_results_count": len(semantic_results),
-            "keyword_results_count": len(keyword_results),
-            "graph_results_count": len(graph_results),
-            # Bug Fix 2025-12-06: Episode memory search counts
-            "episode_semantic_count": len(episode_semantic_results),
-            "episode_keyword_count": len(episode_keyword_results),
-            "final_results_count": len(final_results),
-            "query_type": query_type,
-            "matched_keywords": matched_keywords if is_relational else [],
-            "applied_weights": applied_weights,
-            "weights": applied_weights,                 # Backwards-compatible alias
-            # Story 9-4: Include sector_filter in response
+            "queries": query_responses,
+            "query_count": len(queries),
             "sector_filter": sector_filter,
-            # Story 9.3.1: Include new filter parameters in response metadata
             "applied_filters": {
                 "tags_filter": tags_filter,
                 "date_from": date_from.isoformat() if date_from else None,
                 "date_to": date_to.isoformat() if date_to else None,
                 "source_type_filter": source_type_filter,
             },
-            # Story 11.6.1: Add requesting project_id to response metadata
+            "ef_search": ef_search,
             "project_id": requesting_project,
             "status": "success",
         }
 
     except psycopg2.Error as e:
-        logger.error(f"Database error in hybrid_search: {e}")
+        logger.error(f"Database error in hybrid_search_batch: {e}")
         return {
             "error": "Database operation failed",
             "details": str(e),
-            "tool": "hybrid_search",
+            "tool": "hybrid_search_batch",
         }
     except Exception as e:
-        logger.error(f"Unexpected error in hybrid_search: {e}")
+        logger.error(f"Unexpected error in hybrid_search_batch: {e}")
         return {
             "error": "Tool execution failed",
             "details": str(e),
-            "tool": "hybrid_search",
+            "tool": "hybrid_search_batch",
         }
 
 
+def _execute_fetchone(cursor: Any, query: str, params: tuple[Any, ...]) -> Any:
+    """Execute a statement and fetch its first row; runs on the DB executor."""
+    cursor.execute(query, params)
+    return cursor.fetchone()
+
+
 async def add_working_memory_item(
     content: str,
     importance: float,
@@ -2012,7 +2923,9 @@ async def add_working_memory_item(
 
     # Insert item with project_id and automatic timestamp
     # Story 11.5.3: Explicitly include project_id in INSERT for namespace isolation
-    cursor.execute(
+    result = await run_in_db_executor(
+        _execute_fetchone,
+        cursor,
         """
         INSERT INTO working_memory (content, importance, last_accessed, project_id)
         VALUES (%s, %s, NOW(), %s)
@@ -2020,8 +2933,6 @@ async def add_working_memory_item(
         """,
         (content, importance, project_id),
     )
-
-    result = cursor.fetchone()
     if not result:
         raise RuntimeError("INSERT into working_memory did not return ID")
 
@@ -2054,7 +2965,9 @@ async def evict_lru_item(
 
     # Find oldest non-critical item in the current project
     # Story 11.5.3: Eviction MUST be scoped to project to avoid cross-project data loss
-    cursor.execute(
+    result = await run_in_db_executor(
+        _execute_fetchone,
+        cursor,
         """
         SELECT id, content, importance, last_accessed
         FROM working_memory
@@ -2065,8 +2978,6 @@ async def evict_lru_item(
         (project_id,),
     )
 
-    result = cursor.fetchone()
-
     if not result:
         # All items are critical (importance >0.8)
         # No eviction possible
@@ -2104,7 +3015,9 @@ async def force_evict_oldest_critical(
 
     # Find oldest item in the current project, IGNORING importance
     # Story 11.5.3: Eviction MUST be scoped to project to avoid cross-project data loss
-    cursor.execute(
+    result = await run_in_db_executor(
+        _execute_fetchone,
+        cursor,
         """
         SELECT id
         FROM working_memory
@@ -2115,8 +3028,6 @@ async def force_evict_oldest_critical(
         (project_id,),
     )
 
-    result = cursor.fetchone()
-
     if not result:
         raise RuntimeError("Working Memory is empty, cannot evict")
 
@@ -2150,18 +3061,21 @@ async def archive_to_stale_memory(
         project_id = get_current_project()
 
     # Load item from working_memory (scoped to project)
-    cursor.execute(
+    item = await run_in_db_executor(
+        _execute_fetchone,
+        cursor,
         "SELECT content, importance FROM working_memory WHERE id=%s AND project_id=%s;",
-        (item_id, project_id)
+        (item_id, project_id),
     )
-    item = cursor.fetchone()
 
     if not item:
         raise ValueError(f"Working Memory item {item_id} not found in project {project_id}")
 
     # Insert into stale_memory with project_id
     # Story 11.5.3: Explicitly include project_id in INSERT for namespace isolation
-    cursor.execute(
+    archive_result = await run_in_db_executor(
+        _execute_fetchone,
+        cursor,
         """
         INSERT INTO stale_memory
         (project_id, original_content, importance, reason, archived_at)
@@ -2170,8 +3084,6 @@ async def archive_to_stale_memory(
         """,
         (project_id, item["content"], item["importance"], reason),
     )
-
-    archive_result = cursor.fetchone()
     archive_id = int(archive_result["id"])
     logger = logging.getLogger(__name__)
     logger.info(f"Archived to stale memory: id={archive_id}, project_id={project_id}, reason={reason}")
@@ -2228,11 +3140,12 @@ async def handle_update_working_memory(arguments: dict[str, Any]) -> dict[str, A
 
                 # 2. Check capacity (scoped to current project)
                 # Story 11.5.3: Capacity check MUST include project_id filter
-                cursor.execute(
+                count_result = await run_in_db_executor(
+                    _execute_fetchone,
+                    cursor,
                     "SELECT COUNT(*) as count FROM working_memory WHERE project_id = %s;",
-                    (project_id,)
+                    (project_id,),
                 )
-                count_result = cursor.fetchone()
                 count = int(count_result["count"])
                 # 3. Evict if needed (with fallback)
                 evicted_id = None
@@ -2251,12 +3164,14 @@ async def handle_update_working_memory(arguments: dict[str, Any]) -> dict[str, A
                     archived_id = await archive_to_stale_memory(
                         evicted_id, "LRU_EVICTION", conn, project_id
                     )
-                    cursor.execute(
-                        "DELETE FROM working_memory WHERE id=%s AND project_id=%s;", (evicted_id, project_id)
+                    await run_in_db_executor(
+                        cursor.execute,
+                        "DELETE FROM working_memory WHERE id=%s AND project_id=%s;",
+                        (evicted_id, project_id),
                     )
 
                 # SINGLE COMMIT for entire operation
-                conn.commit()
+                await run_in_db_executor(conn.commit)
 
                 logger.info(
                     f"Updated working memory: added_id={added_id}, evicted_id={evicted_id}"
@@ -2271,7 +3186,7 @@ async def handle_update_working_memory(arguments: dict[str, Any]) -> dict[str, A
 
             except Exception:
                 # Rollback on ANY error
-                conn.rollback()
+                await run_in_db_executor(conn.rollback)
                 raise
 
     except ValueError as e:
@@ -2386,9 +3301,40 @@ async def handle_delete_working_memory(arguments: dict[str, Any]) -> dict[str, A
         }, get_current_project())
 
 
+async def embed_episode(query: str, reflection: str) -> list[float]:
+    """
+    Compute the embedding stored with an episode.
+
+    Embeds query + reflection combined for full semantic search coverage.
+    Fix: Previously only query was embedded — reflection (the actual lesson) was unsearchable
+    Note: episode_keyword_search already concatenates query||reflection (line ~740)
+
+    Raises:
+        RuntimeError: If the API key is missing or embedding fails after all retries
+    """
+    logger = logging.getLogger(__name__)
+
+    # Initialize OpenAI client
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key or api_key == "sk-your-openai-api-key-here":
+        raise RuntimeError("OpenAI API key not configured")
+
+    client = await get_embeddings_client()
+
+    combined_text = f"{query} {reflection}" if reflection else query
+    logger.info(f"Computing embedding for combined query+reflection: {combined_text[:100]}...")
+    try:
+        return await get_embedding_with_retry(client, combined_text)
+    except RuntimeError as e:
+        logger.error(f"Failed to generate embedding after all retries: {e}")
+        # Critical: embedding is required for retrieval, so we fail the entire operation
+        raise RuntimeError(f"Embedding generation failed: {e}") from e
+
+
 async def add_episode(
     query: str, reward: float, reflection: str, conn: Any, project_id: str | None = None,
-    tags: list[str] | None = None
+    tags: list[str] | None = None, embedding: list[float] | None = None,
+    async_embedding: bool = False,
 ) -> dict[str, Any]:
     """
     Store episode in database with embedding.
@@ -2396,6 +3342,10 @@ async def add_episode(
     Story 11.5.3: Memory Write Operations - Added project_id parameter for namespace isolation
     Story 9.1.1: Tags Schema Migration - Added tags parameter for structured retrieval
 
+    Pass a precomputed embedding to avoid holding conn during the API call.
+    With async_embedding=True the episode is stored with embedding_status
+    'pending' and embedded later by the embedding worker (Migration 052).
+
     Args:
         query: User query that triggered the episode
         reward: Reward score (-1.0 to 1.0)
@@ -2403,6 +3353,8 @@ async def add_episode(
         conn: Database connection
         project_id: Project ID for namespace isolation (uses current_project context if None)
         tags: Optional list of string tags for structured retrieval
+        embedding: Precomputed embedding from embed_episode() (computed here if None)
+        async_embedding: Store without embedding and leave it to the worker
 
     Returns:
         Dictionary with episode ID, embedding status, and episode data
@@ -2413,24 +3365,9 @@ async def add_episode(
     if project_id is None:
         project_id = get_current_project()
 
-    # Initialize OpenAI client
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key or api_key == "sk-your-openai-api-key-here":
-        raise RuntimeError("OpenAI API key not configured")
-
-    client = OpenAI(api_key=api_key)
-
-    # Get embedding for query + reflection combined for full semantic search coverage
-    # Fix: Previously only query was embedded — reflection (the actual lesson) was unsearchable
-    # Note: episode_keyword_search already concatenates query||reflection (line ~740)
-    combined_text = f"{query} {reflection}" if reflection else query
-    logger.info(f"Computing embedding for combined query+reflection: {combined_text[:100]}...")
-    try:
-        embedding = await get_embedding_with_retry(client, combined_text)
-    except RuntimeError as e:
-        logger.error(f"Failed to generate embedding after all retries: {e}")
-        # Critical: embedding is required for retrieval, so we fail the entire operation
-        raise RuntimeError(f"Embedding generation failed: {e}") from e
+    if embedding is None and not async_embedding:
+        embedding = await embed_episode(query, reflection)
+    embedding_status = "pending" if embedding is None else "success"
 
     # Register vector type for pgvector
     register_vector(conn)
@@ -2444,13 +3381,14 @@ async def add_episode(
     # Insert episode with embedding, project_id, and tags
     # Story 11.5.3: Explicitly include project_id in INSERT for namespace isolation
     # Story 9.1.1: Add tags column for structured retrieval
+    # Migration 052: async mode inserts embedding = NULL, status 'pending'
     cursor.execute(
         """
-        INSERT INTO episode_memory (query, reward, reflection, embedding, created_at, project_id, tags)
-        VALUES (%s, %s, %s, %s, NOW(), %s, %s)
+        INSERT INTO episode_memory (query, reward, reflection, embedding, created_at, project_id, tags, embedding_status)
+        VALUES (%s, %s, %s, %s, NOW(), %s, %s, %s)
         RETURNING id, created_at;
         """,
-        (query, reward, reflection, embedding, project_id, tags),
+        (query, reward, reflection, embedding, project_id, tags, embedding_status),
     )
 
     result = cursor.fetchone()
@@ -2462,9 +3400,12 @@ async def add_episode(
     # CRITICAL: Explicit commit required - connection pool does NOT auto-commit
     conn.commit()
 
+    if embedding is None:
+        notify_pending_embeddings()
+
     return {
         "id": episode_id,
-        "embedding_status": "success",
+        "embedding_status": embedding_status,
         "query": query,
         "reward": reward,
         "created_at": created_at.isoformat(),
@@ -2489,6 +3430,7 @@ async def handle_store_episode(arguments: dict[str, Any]) -> dict[str, Any]:
         reward = arguments["reward"]
         reflection = arguments["reflection"]
         tags = arguments.get("tags")  # Story 9.1.1: Optional tags parameter
+        async_embedding = arguments.get("async_embedding")
     except KeyError as e:
         return add_response_metadata({
             "error": f"Missing required parameter: {e}",
@@ -2541,6 +3483,16 @@ async def handle_store_episode(arguments: dict[str, Any]) -> dict[str, Any]:
                     "embedding_status": "failed",
                 }, project_id)
 
+    if async_embedding is None:
+        async_embedding = _write_behind_default()
+    if not isinstance(async_embedding, bool):
+        return add_response_metadata({
+            "error": "Invalid async_embedding parameter",
+            "details": "async_embedding must be a boolean",
+            "tool": "store_episode",
+            "embedding_status": "failed",
+        }, project_id)
+
     # Validate reward range BEFORE API call (save costs on invalid input)
     if reward < -1.0 or reward > 1.0:
         return add_response_metadata({
@@ -2552,10 +3504,17 @@ async def handle_store_episode(arguments: dict[str, Any]) -> dict[str, Any]:
 
     # Store episode in database
     try:
+        # Embed before checking out a pooled connection so it is not held
+        # for the duration of the API call
+        embedding = None if async_embedding else await embed_episode(query, reflection)
+
         # Story 11.5.3: Use get_connection_with_project_context for RLS context
         # Story 9.1.1: Pass tags parameter to add_episode
         async with get_connection_with_project_context() as conn:
-            result = await add_episode(query, reward, reflection, conn, project_id, tags)
+            result = await add_episode(
+                query, reward, reflection, conn, project_id, tags,
+                embedding=embedding, async_embedding=async_embedding,
+            )
             logger.info(f"Successfully stored episode with ID: {result['id']}")
             return add_response_metadata(result, project_id)
 
@@ -2793,6 +3752,16 @@ async def handle_dissonance_check(arguments: dict[str, Any]) -> dict[str, Any]:
             "fallback": result.fallback,
             "api_calls": result.api_calls,
             "estimated_cost_eur": result.estimated_cost_eur,
+            "pairs_analyzed": result.pairs_analyzed,
+            "pairs_total": result.pairs_total,
+            "cache_hits": result.cache_hits,
+            "cache_misses": result.cache_misses,
+            "incremental": result.incremental,
+            "changed_edges": result.changed_edges,
+            "cache_hit_rate": (
+                result.cache_hits / (result.cache_hits + result.cache_misses)
+                if result.cache_hits + result.cache_misses else 0.0
+            ),
             "tool": "dissonance_check",
             "status": result.status,
         }
@@ -2898,6 +3867,10 @@ def register_tools(server) -> list:
                         "items": {"type": "string"},
                         "description": "Optional tags for structured retrieval (e.g., ['relationship', 'ethr'])",
                     },
+                    "async_embedding": {
+                        "type": "boolean",
+                        "description": "Store immediately with embedding_status 'pending' and embed in the background (default: EMBEDDING_WRITE_BEHIND). Keyword search sees the insight at once, semantic search once embedded.",
+                    },
                 },
                 "required": ["content", "source_ids"],
             },
@@ -2979,10 +3952,85 @@ def register_tools(server) -> list:
                         },
                         "description": "Optional: Filter results by source type(s). Allowed values: 'l2_insight', 'episode_memory', 'graph'. If null or omitted, returns all source types (Story 9.3.1).",
                     },
+                    "ef_search": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "description": "Optional: HNSW candidate list size for this query (pgvector hnsw.ef_search, default 40). Higher values improve recall at the cost of latency.",
+                    },
+                    "parallel": {
+                        "type": "boolean",
+                        "description": "Optional: Run the retrieval channels concurrently on separate pooled connections (default: HYBRID_SEARCH_PARALLEL env, false). Channels slower than HYBRID_SEARCH_CHANNEL_TIMEOUT seconds are dropped and listed in 'dropped_channels'.",
+                    },
                 },
                 "required": ["query_text"],
             },
         ),
+        Tool(
+            name="hybrid_search_batch",
+            description="Run hybrid_search for several queries in one call: one embeddings request, one database connection, set-wise channel queries. Filters, top_k and weights apply to every query; query routing and RRF fusion are per query. Returns per-query results in input order.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "items": {"type": "string", "minLength": 1},
+                        "minItems": 1,
+                        "maxItems": MAX_BATCH_SEARCH_QUERIES,
+                        "description": f"Query texts (1-{MAX_BATCH_SEARCH_QUERIES})",
+                    },
+                    "top_k": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 100,
+                        "default": 5,
+                        "description": "Maximum number of results per query",
+                    },
+                    "weights": {
+                        "type": "object",
+                        "description": "Optional: RRF weights for all queries (same format as hybrid_search). If omitted, weights are routed per query.",
+                    },
+                    "sector_filter": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": ["emotional", "episodic", "semantic", "procedural", "reflective"],
+                        },
+                        "description": "Optional: Filter results by memory sector(s). Empty array returns no results.",
+                    },
+                    "tags_filter": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Optional: Filter results by tag names.",
+                    },
+                    "date_from": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Optional: Filter results to entries on or after this date (ISO 8601 format).",
+                    },
+                    "date_to": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Optional: Filter results to entries on or before this date (ISO 8601 format).",
+                    },
+                    "source_type_filter": {
+                        "type": "array",
+                        "items": {
+                            "type": "string",
+                            "enum": ["l2_insight", "episode_memory", "graph"],
+                        },
+                        "description": "Optional: Filter results by source type(s).",
+                    },
+                    "ef_search": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 1000,
+                        "description": "Optional: HNSW candidate list size (pgvector hnsw.ef_search, default 40).",
+                    },
+                },
+                "required": ["queries"],
+            },
+        ),
         Tool(
             name="update_working_memory",
             description="Add item to Working Memory with atomic eviction handling. Returns {added_id: int, evicted_id: Optional[int], archived_id: Optional[int]}",
@@ -3041,6 +4089,10 @@ def register_tools(server) -> list:
                         "minLength": 1,
                         "description": "Verbalized lesson learned (format: 'Problem: ... Lesson: ...')",
                     },
+                    "async_embedding": {
+                        "type": "boolean",
+                        "description": "Store immediately with embedding_status 'pending' and embed in the background (default: EMBEDDING_WRITE_BEHIND)",
+                    },
                 },
                 "required": ["query", "reward", "reflection"],
             },
@@ -3190,6 +4242,61 @@ def register_tools(server) -> list:
                 "required": ["source_name", "target_name", "relation"],
             },
         ),
+        Tool(
+            name="graph_add_nodes_batch",
+            description="Create or find many graph nodes in one transaction (bulk graph_add_node for imports). Returns a per-item status in input order; invalid items are skipped, not fatal.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "nodes": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "description": "Nodes to upsert (same fields as graph_add_node)",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "label": {"type": "string", "description": "Node type/category"},
+                                "name": {"type": "string", "description": "Unique node name"},
+                                "properties": {"type": "object", "description": "Flexible metadata"},
+                                "vector_id": {"type": "integer", "minimum": 1, "description": "Optional L2 insight ID"},
+                            },
+                            "required": ["label", "name"],
+                        },
+                    },
+                },
+                "required": ["nodes"],
+            },
+        ),
+        Tool(
+            name="graph_add_edges_batch",
+            description="Create or update many edges in one transaction (bulk graph_add_edge for imports). Node names are resolved in one query and missing nodes are created. Returns a per-item status in input order; invalid items are skipped, not fatal.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "edges": {
+                        "type": "array",
+                        "minItems": 1,
+                        "maxItems": 1000,
+                        "description": "Edges to upsert (same fields as graph_add_edge)",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "source_name": {"type": "string", "description": "Source node name (created if not exists)"},
+                                "target_name": {"type": "string", "description": "Target node name (created if not exists)"},
+                                "relation": {"type": "string", "description": "Relationship type"},
+                                "source_label": {"type": "string", "description": "Label for auto-created source node (default: 'Entity')"},
+                                "target_label": {"type": "string", "description": "Label for auto-created target node (default: 'Entity')"},
+                                "weight": {"type": "number", "minimum": 0.0, "maximum": 1.0, "description": "Edge weight (default: 1.0)"},
+                                "properties": {"type": "object", "description": "Flexible metadata"},
+                            },
+                            "required": ["source_name", "target_name", "relation"],
+                        },
+                    },
+                },
+                "required": ["edges"],
+            },
+        ),
         Tool(
             name="graph_query_neighbors",
             description="Find neighbor nodes of a given node with single-hop and multi-hop traversal. Supports filtering by relation type, depth-limited traversal, cycle detection, and bidirectional traversal (both/outgoing/incoming).",
@@ -3247,7 +4354,11 @@ def register_tools(server) -> list:
                     "limit": {
                         "type": "integer",
                         "minimum": 1,
-                        "description": "Optional maximum number of neighbor results to return. Applied after sorting by relevance. Useful to cap token usage for high-connectivity nodes.",
+                        "description": "Optional maximum number of neighbor results to return (page size). Neighbors are ranked by relevance and cut to the page inside the database. Useful to cap token usage for high-connectivity nodes.",
+                    },
+                    "cursor": {
+                        "type": "string",
+                        "description": "Optional next_cursor from a previous response to fetch the following page (keeps that page size unless limit is given).",
                     },
                 },
                 "required": ["node_name"],
@@ -3475,6 +4586,26 @@ def register_tools(server) -> list:
                 "required": ["id"],
             },
         ),
+        Tool(
+            name="get_embedding_status",
+            description="Check write-behind embeddings: embedding_status (pending/success/failed) of insights and episodes stored with async_embedding, plus pending counts for the current project.",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "insight_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "L2 insight IDs to check",
+                    },
+                    "episode_ids": {
+                        "type": "array",
+                        "items": {"type": "integer"},
+                        "description": "Episode IDs to check",
+                    },
+                },
+                "required": [],
+            },
+        ),
         Tool(
             name="update_insight",
             description="Update an existing L2 insight. I/O can update directly, ethr requires bilateral consent via SMF. Implements EP-1 (Consent-Aware) and EP-3 (History-on-Mutation) patterns.",
@@ -3764,6 +4895,7 @@ def register_tools(server) -> list:
         "store_raw_dialogue": handle_store_raw_dialogue,
         "compress_to_l2_insight": handle_compress_to_l2_insight,
         "hybrid_search": handle_hybrid_search,
+        "hybrid_search_batch": handle_hybrid_search_batch,
         "update_working_memory": handle_update_working_memory,
         "delete_working_memory": handle_delete_working_memory,
         "store_episode": handle_store_episode,
@@ -3773,6 +4905,8 @@ def register_tools(server) -> list:
         "graph_add_node": handle_graph_add_node,
         "graph_update_node": handle_graph_update_node,
         "graph_add_edge": handle_graph_add_edge,
+        "graph_add_nodes_batch": handle_graph_add_nodes_batch,
+        "graph_add_edges_batch": handle_graph_add_edges_batch,
         "graph_query_neighbors": handle_graph_query_neighbors,
         "graph_find_path": handle_graph_find_path,
         "get_node_by_name": handle_get_node_by_name,
@@ -3782,6 +4916,7 @@ def register_tools(server) -> list:
         "list_episodes": handle_list_episodes,
         "list_insights": handle_list_insights,
         "get_insight_by_id": handle_get_insight_by_id,
+        "get_embedding_status": handle_get_embedding_status,
         "update_insight": handle_update_insight,
         "delete_insight": handle_delete_insight,
         "submit_insight_feedback": handle_submit_insight_feedback,
@@ -3814,6 +4949,7 @@ def register_tools(server) -> list:
             source_ids: list[int],
             memory_strength: float | None = 0.5,
             tags: list[str] | None = None,
+            async_embedding: bool | None = None,
         ) -> dict[str, Any]:
             """Compress dialogue to L2 insight with embedding and tags."""
             arguments = {
@@ -3821,6 +4957,7 @@ def register_tools(server) -> list:
                 "source_ids": source_ids,
                 "memory_strength": memory_strength,
                 "tags": tags,
+                "async_embedding": async_embedding,
             }
             return await handle_compress_to_l2_insight(arguments)
 
@@ -3834,6 +4971,14 @@ def register_tools(server) -> list:
         async def hybrid_search(arguments: dict[str, Any]) -> dict[str, Any]:
             return await handle_hybrid_search(arguments)
 
+        @server.tool(
+            description="Run hybrid_search for several queries in one call "
+                        "(one embeddings request, one connection, set-wise channel queries). "
+                        "Returns per-query fused results in input order."
+        )
+        async def hybrid_search_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+            return await handle_hybrid_search_batch(arguments)
+
         @server.tool()
         async def update_working_memory(arguments: dict[str, Any]) -> dict[str, Any]:
             return await handle_update_working_memory(arguments)
@@ -3870,6 +5015,14 @@ def register_tools(server) -> list:
         async def graph_add_edge(arguments: dict[str, Any]) -> dict[str, Any]:
             return await handle_graph_add_edge(arguments)
 
+        @server.tool()
+        async def graph_add_nodes_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+            return await handle_graph_add_nodes_batch(arguments)
+
+        @server.tool()
+        async def graph_add_edges_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+            return await handle_graph_add_edges_batch(arguments)
+
         @server.tool()
         async def graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, Any]:
             return await handle_graph_query_neighbors(arguments)
@@ -3906,6 +5059,10 @@ def register_tools(server) -> list:
         async def get_insight_by_id(arguments: dict[str, Any]) -> dict[str, Any]:
             return await handle_get_insight_by_id(arguments)
 
+        @server.tool()
+        async def get_embedding_status(arguments: dict[str, Any]) -> dict[str, Any]:
+            return await handle_get_embedding_status(arguments)
+
         @server.tool()
         async def update_insight(arguments: dict[str, Any]) -> dict[str, Any]:
             return await handle_update_insight(arguments)
@@ -29,7 +29,7 @@ DISSONANCE_CHECK_TOOL = Tool(
                 "type": "string",
                 "enum": ["recent", "full"],
                 "default": "recent",
-                "description": "'recent' = letzte 30 Tage, 'full' = alle Edges"
+                "description": "'recent' = letzte 30 Tage, nur seit dem letzten Check geänderte Edges werden neu gepaart; 'full' = alle Edges"
             }
         },
         "required": ["context_node"]
@@ -0,0 +1,88 @@
+"""
+get_embedding_status Tool Implementation
+
+MCP tool for checking write-behind embeddings (Migration 052). Rows stored
+with async_embedding=true are keyword-searchable immediately and become
+visible to semantic search once the embedding worker has filled them.
+
+Returns the embedding_status of the requested insights/episodes and the
+number of rows still pending in the current project.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.db.pending_embeddings import (
+    count_pending_embeddings,
+    get_embedding_statuses,
+)
+from mcp_server.middleware.context import get_current_project
+from mcp_server.utils.response import add_response_metadata
+
+_ID_ARGUMENTS = {"insight_ids": "l2_insights", "episode_ids": "episode_memory"}
+
+
+async def handle_get_embedding_status(arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    Report embedding_status for insights/episodes and pending counts.
+
+    Args:
+        arguments: Tool arguments with optional 'insight_ids' and 'episode_ids'
+                   (lists of integer IDs)
+
+    Returns:
+        Dict with per-ID statuses ('pending' | 'success' | 'failed';
+        unknown IDs are "not_found"), pending counts per table, and
+        all_live = True when none of the requested rows is still pending.
+    """
+    logger = logging.getLogger(__name__)
+    project_id = get_current_project()
+
+    requested: dict[str, list[int]] = {}
+    for argument, table in _ID_ARGUMENTS.items():
+        ids = arguments.get(argument) or []
+        if not isinstance(ids, list) or not all(
+            isinstance(i, int) and not isinstance(i, bool) for i in ids
+        ):
+            return add_response_metadata({
+                "error": "Parameter validation failed",
+                "details": f"'{argument}' must be an array of integers",
+                "tool": "get_embedding_status",
+            }, project_id)
+        requested[table] = ids
+
+    try:
+        async with get_connection_with_project_context(read_only=True) as conn:
+            statuses: dict[str, dict[str, str]] = {}
+            for argument, table in _ID_ARGUMENTS.items():
+                ids = requested[table]
+                found = await run_in_db_executor(get_embedding_statuses, conn, table, ids)
+                statuses[argument] = {str(i): found.get(i, "not_found") for i in ids}
+            pending = await run_in_db_executor(count_pending_embeddings, conn)
+
+        all_live = all(
+            status != "pending"
+            for table_statuses in statuses.values()
+            for status in table_statuses.values()
+        )
+        return add_response_metadata({
+            "insights": statuses["insight_ids"],
+            "episodes": statuses["episode_ids"],
+            "pending": pending,
+            "all_live": all_live,
+            "status": "success",
+        }, project_id)
+
+    except Exception as e:
+        logger.error(f"Error in get_embedding_status: {e}")
+        return add_response_metadata({
+            "error": "Database operation failed",
+            "details": str(e),
+            "tool": "get_embedding_status",
+        }, project_id)
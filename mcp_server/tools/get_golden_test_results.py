@@ -29,6 +29,7 @@ from mcp_server.db.connection import (
     get_connection_sync,
     get_connection_with_project_context_sync,
 )
+from mcp_server.external.embedding_cache import EMBEDDING_MODEL
 from mcp_server.middleware.context import get_current_project
 from mcp_server.utils.response import add_response_metadata
 
@@ -173,10 +174,12 @@ def execute_golden_test(project_id: str | None = None) -> dict[str, Any]:
 
         logger.info(f"Processing query {idx}/{query_count}: {query_text[:50]}...")
 
-        # Step 1: Create embedding via OpenAI API
+        # Step 1: Create embedding via OpenAI API. Deliberately bypasses the
+        # embedding cache: the golden test exists to detect model drift, so
+        # the query vectors must come from the live model on every run.
         try:
             embedding_response = openai_client.embeddings.create(
-                model="text-embedding-3-small",
+                model=EMBEDDING_MODEL,
                 input=query_text,
                 encoding_format="float",
             )
@@ -206,6 +209,7 @@ def execute_golden_test(project_id: str | None = None) -> dict[str, Any]:
                 """
                 SELECT id
                 FROM l2_insights
+                WHERE embedding IS NOT NULL
                 ORDER BY embedding <=> %s::vector
                 LIMIT 5
                 """,
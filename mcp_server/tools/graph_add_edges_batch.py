@@ -0,0 +1,148 @@
+"""
+graph_add_edges_batch Tool Implementation
+
+MCP tool for creating or updating many edges between named nodes in one
+call. Endpoint names are resolved (and missing nodes created) with one
+query and all valid edges are upserted in the same transaction
+(add_edges_batch); invalid items are reported per item and skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from mcp_server.db.graph import add_edges_batch
+from mcp_server.middleware.context import get_current_project
+from mcp_server.tools.graph_add_edge import STANDARD_RELATIONS
+from mcp_server.tools.graph_add_nodes_batch import MAX_GRAPH_BATCH_ITEMS
+from mcp_server.utils.response import add_response_metadata
+from mcp_server.utils.sector_classifier import classify_memory_sector
+
+logger = logging.getLogger(__name__)
+
+
+def _validate_edge_item(item: Any) -> str | None:
+    """Return the validation error of one edge item (graph_add_edge rules), or None."""
+    if not isinstance(item, dict):
+        return "Edge must be an object"
+    for field in ("source_name", "target_name", "relation"):
+        value = item.get(field)
+        if not value or not isinstance(value, str):
+            return f"Missing or invalid '{field}' (must be non-empty string)"
+    for field in ("source_label", "target_label"):
+        value = item.get(field)
+        if value is not None and not isinstance(value, str):
+            return f"Invalid '{field}' (must be string)"
+    weight = item.get("weight", 1.0)
+    if isinstance(weight, bool) or not isinstance(weight, int | float) or not 0.0 <= weight <= 1.0:
+        return "Invalid 'weight' (must be float between 0.0 and 1.0)"
+    properties = item.get("properties")
+    if properties is not None and not isinstance(properties, dict):
+        return "Invalid 'properties' (must be object/dict)"
+    return None
+
+
+async def handle_graph_add_edges_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create or update many edges with auto-upsert of their nodes in one transaction.
+
+    Args:
+        arguments: Tool arguments containing edges (array of objects with
+                   source_name, target_name, relation, optional source_label,
+                   target_label, weight and properties)
+
+    Returns:
+        Dict with one result per edge in input order (status "success" with
+        edge_id/created/memory_sector, or status "error" with details),
+        counts, plus metadata containing project_id
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        project_id = get_current_project()
+        edges = arguments.get("edges")
+
+        if not isinstance(edges, list) or not edges:
+            return add_response_metadata({
+                "error": "Parameter validation failed",
+                "details": "'edges' must be a non-empty array of edge objects",
+                "tool": "graph_add_edges_batch",
+            }, project_id)
+
+        if len(edges) > MAX_GRAPH_BATCH_ITEMS:
+            return add_response_metadata({
+                "error": "Parameter validation failed",
+                "details": f"At most {MAX_GRAPH_BATCH_ITEMS} edges per call, got {len(edges)}",
+                "tool": "graph_add_edges_batch",
+            }, project_id)
+
+        results: list[dict[str, Any] | None] = [None] * len(edges)
+        valid: list[tuple[int, dict[str, Any]]] = []
+        for index, item in enumerate(edges):
+            error = _validate_edge_item(item)
+            if error:
+                results[index] = {"index": index, "status": "error", "details": error}
+                continue
+            # Story 8.3: Classify memory sector based on relation and properties
+            valid.append((index, {
+                **item,
+                "weight": float(item.get("weight", 1.0)),
+                "memory_sector": classify_memory_sector(item["relation"], item.get("properties") or {}),
+            }))
+
+        non_standard = sorted({item["relation"] for _, item in valid} - STANDARD_RELATIONS)
+        if non_standard:
+            logger.warning(f"Non-standard relations used: {non_standard}. Standard relations: {sorted(STANDARD_RELATIONS)}")
+
+        try:
+            upserted = await add_edges_batch([item for _, item in valid])
+        except Exception as db_error:
+            logger.error(f"Database error in graph_add_edges_batch: {db_error}")
+            return add_response_metadata({
+                "error": "Database operation failed",
+                "details": str(db_error),
+                "tool": "graph_add_edges_batch",
+            }, project_id)
+
+        for (index, _), edge in zip(valid, upserted, strict=True):
+            result = {
+                "index": index,
+                "status": "success",
+                "edge_id": edge["edge_id"],
+                "created": edge["created"],
+                "source_id": edge["source_id"],
+                "target_id": edge["target_id"],
+                "relation": edge["relation"],
+                "weight": edge["weight"],
+                "memory_sector": edge["memory_sector"],
+            }
+            # Add node creation info for transparency (as in graph_add_edge)
+            if edge["source_node_created"]:
+                result["source_node_created"] = True
+            if edge["target_node_created"]:
+                result["target_node_created"] = True
+            results[index] = result
+
+        created_count = sum(1 for edge in upserted if edge["created"])
+        logger.info(
+            f"Edge batch: {len(valid)}/{len(edges)} upserted, {created_count} created, "
+            f"{len(edges) - len(valid)} invalid"
+        )
+
+        return add_response_metadata({
+            "results": results,
+            "total": len(edges),
+            "succeeded": len(valid),
+            "failed": len(edges) - len(valid),
+            "created": created_count,
+            "status": "success",
+        }, project_id)
+
+    except Exception as e:
+        logger.error(f"Unexpected error in graph_add_edges_batch: {e}")
+        return add_response_metadata({
+            "error": "Tool execution failed",
+            "details": str(e),
+            "tool": "graph_add_edges_batch",
+        }, get_current_project())
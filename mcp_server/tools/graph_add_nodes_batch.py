@@ -0,0 +1,131 @@
+"""
+graph_add_nodes_batch Tool Implementation
+
+MCP tool for creating or finding many graph nodes in one call. All valid
+nodes are upserted in one transaction with one multi-row statement
+(add_nodes_batch); invalid items are reported per item and skipped.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from mcp_server.db.graph import add_nodes_batch
+from mcp_server.middleware.context import get_current_project
+from mcp_server.tools.graph_add_node import STANDARD_LABELS
+from mcp_server.utils.response import add_response_metadata
+
+logger = logging.getLogger(__name__)
+
+# Upper bound per call; larger imports are split by the client
+MAX_GRAPH_BATCH_ITEMS = 1000
+
+
+def _validate_node_item(item: Any) -> str | None:
+    """Return the validation error of one node item (graph_add_node rules), or None."""
+    if not isinstance(item, dict):
+        return "Node must be an object"
+    label = item.get("label")
+    name = item.get("name")
+    properties = item.get("properties")
+    vector_id = item.get("vector_id")
+    if not label or not isinstance(label, str):
+        return "Missing or invalid 'label' (must be non-empty string)"
+    if not name or not isinstance(name, str):
+        return "Missing or invalid 'name' (must be non-empty string)"
+    if properties is not None and not isinstance(properties, dict):
+        return "Invalid 'properties' (must be object/dict)"
+    if vector_id is not None and (not isinstance(vector_id, int) or vector_id <= 0):
+        return "Invalid 'vector_id' (must be positive integer)"
+    return None
+
+
+async def handle_graph_add_nodes_batch(arguments: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create or find many graph nodes in one transaction.
+
+    Args:
+        arguments: Tool arguments containing nodes (array of objects with
+                   label, name, optional properties and vector_id)
+
+    Returns:
+        Dict with one result per node in input order (status "success" with
+        node_id/created, or status "error" with details), counts, plus
+        metadata containing project_id
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        project_id = get_current_project()
+        nodes = arguments.get("nodes")
+
+        if not isinstance(nodes, list) or not nodes:
+            return add_response_metadata({
+                "error": "Parameter validation failed",
+                "details": "'nodes' must be a non-empty array of node objects",
+                "tool": "graph_add_nodes_batch",
+            }, project_id)
+
+        if len(nodes) > MAX_GRAPH_BATCH_ITEMS:
+            return add_response_metadata({
+                "error": "Parameter validation failed",
+                "details": f"At most {MAX_GRAPH_BATCH_ITEMS} nodes per call, got {len(nodes)}",
+                "tool": "graph_add_nodes_batch",
+            }, project_id)
+
+        results: list[dict[str, Any] | None] = [None] * len(nodes)
+        valid: list[tuple[int, dict[str, Any]]] = []
+        for index, item in enumerate(nodes):
+            error = _validate_node_item(item)
+            if error:
+                results[index] = {"index": index, "status": "error", "details": error}
+            else:
+                valid.append((index, item))
+
+        non_standard = sorted({item["label"] for _, item in valid} - STANDARD_LABELS)
+        if non_standard:
+            logger.warning(f"Non-standard labels used: {non_standard}. Standard labels: {sorted(STANDARD_LABELS)}")
+
+        try:
+            created = await add_nodes_batch([item for _, item in valid])
+        except Exception as db_error:
+            logger.error(f"Database error in graph_add_nodes_batch: {db_error}")
+            return add_response_metadata({
+                "error": "Database operation failed",
+                "details": str(db_error),
+                "tool": "graph_add_nodes_batch",
+            }, project_id)
+
+        for (index, _), node in zip(valid, created, strict=True):
+            results[index] = {
+                "index": index,
+                "status": "success",
+                "node_id": node["node_id"],
+                "created": node["created"],
+                "label": node["label"],
+                "name": node["name"],
+            }
+
+        created_count = sum(1 for node in created if node["created"])
+        logger.info(
+            f"Node batch: {len(valid)}/{len(nodes)} upserted, {created_count} created, "
+            f"{len(nodes) - len(valid)} invalid"
+        )
+
+        return add_response_metadata({
+            "results": results,
+            "total": len(nodes),
+            "succeeded": len(valid),
+            "failed": len(nodes) - len(valid),
+            "created": created_count,
+            "status": "success",
+        }, project_id)
+
+    except Exception as e:
+        logger.error(f"Unexpected error in graph_add_nodes_batch: {e}")
+        return add_response_metadata({
+            "error": "Tool execution failed",
+            "details": str(e),
+            "tool": "graph_add_nodes_batch",
+        }, get_current_project())
@@ -2,8 +2,9 @@
 graph_find_path Tool Implementation
 
 MCP tool for finding the shortest path between two nodes in a graph.
-Uses BFS-based pathfinding via PostgreSQL WITH RECURSIVE CTE with
-bidirectional traversal, cycle detection, and performance protection.
+Uses a bidirectional BFS (start and end frontiers meet in the middle,
+one adjacency query per level) with batched node/edge hydration and a
+per-query statement timeout.
 
 Story 4.5: graph_find_path Tool Implementation
 Story 11.4.3: Tool Handler Refactoring - Added project context usage and metadata
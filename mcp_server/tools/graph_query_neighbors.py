@@ -12,6 +12,8 @@ Story 11.4.3: Tool Handler Refactoring - Added project context usage and metadat
 
 from __future__ import annotations
 
+import base64
+import binascii
 import json
 import logging
 import time
@@ -25,12 +27,38 @@ from mcp_server.utils.response import add_response_metadata
 logger = logging.getLogger(__name__)
 
 
+def encode_neighbors_cursor(offset: int, limit: int) -> str:
+    """Opaque cursor for the next page of graph_query_neighbors results."""
+    payload = json.dumps({"offset": offset, "limit": limit}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_neighbors_cursor(cursor: str) -> dict[str, int]:
+    """
+    Decode a cursor produced by encode_neighbors_cursor().
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("malformed cursor") from e
+    if not isinstance(payload, dict):
+        raise ValueError("malformed cursor")
+    offset, limit = payload.get("offset"), payload.get("limit")
+    if not isinstance(offset, int) or offset < 0 or not isinstance(limit, int) or limit < 1:
+        raise ValueError("malformed cursor")
+    return {"offset": offset, "limit": limit}
+
+
 async def handle_graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, Any]:
     """
     Find neighbor nodes of a given node with single-hop and multi-hop traversal.
 
     Args:
-        arguments: Tool arguments containing node_name, relation_type, depth, direction, properties_filter
+        arguments: Tool arguments containing node_name, relation_type, depth, direction, properties_filter,
+                   limit and cursor (pagination: next_cursor of the previous page)
 
     Returns:
         Dict with array of neighbor nodes with relation, distance, weight, and edge_direction data,
@@ -51,6 +79,7 @@ async def handle_graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, A
         relation_type = arguments.get("relation_type")  # Optional
         depth = arguments.get("depth", 1)  # Optional, default 1
         limit = arguments.get("limit")  # Optional, Fix 2026-02-12: cap result count
+        cursor = arguments.get("cursor")  # Optional, next_cursor of the previous page
         direction = arguments.get("direction", "both")  # Optional, default "both"
         include_superseded = arguments.get("include_superseded", False)  # Optional, default False
         properties_filter = arguments.get("properties_filter")  # Optional, Story 7.6
@@ -155,6 +184,30 @@ async def handle_graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, A
                     "tool": "graph_query_neighbors",
                 }, project_id)
 
+        # Pagination: a cursor carries offset and page size of the next page;
+        # an explicit limit overrides the cursor's page size
+        offset = 0
+        if cursor is not None:
+            if not isinstance(cursor, str):
+                return add_response_metadata({
+                    "error": "Parameter validation failed",
+                    "details": "Invalid 'cursor' parameter (must be a next_cursor string)",
+                    "tool": "graph_query_neighbors",
+                }, project_id)
+            try:
+                page = decode_neighbors_cursor(cursor)
+            except ValueError:
+                return add_response_metadata({
+                    "error": "Parameter validation failed",
+                    "details": "Invalid 'cursor' parameter (must be a next_cursor string)",
+                    "tool": "graph_query_neighbors",
+                }, project_id)
+            offset = page["offset"]
+            if not (isinstance(limit, int) and limit > 0):
+                limit = page["limit"]
+
+        paginate = isinstance(limit, int) and not isinstance(limit, bool) and limit > 0
+
         # Start performance timing
         start_time = time.time()
 
@@ -172,6 +225,10 @@ async def handle_graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, A
             # Query neighbors with the specified parameters
             # Story 7.6: Added properties_filter parameter
             # Story 9-3: Added sector_filter parameter
+            # Pages are ranked and cut in SQL; one extra row tells whether more follow
+            page_kwargs: dict[str, Any] = {}
+            if paginate:
+                page_kwargs = {"limit": limit + 1, "offset": offset}
             result = await query_neighbors(
                 node_id=start_node["id"],
                 relation_type=relation_type,
@@ -181,15 +238,17 @@ async def handle_graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, A
                 properties_filter=properties_filter,
                 sector_filter=sector_filter,
                 use_ief=use_ief,
-                query_embedding=query_embedding
+                query_embedding=query_embedding,
+                **page_kwargs,
             )
 
             # Fix 2026-02-12: Apply limit to neighbor results after sorting
             # query_neighbors returns a list of neighbor dicts, sorted by
             # relevance_score. Limit caps the response size to save tokens.
-            if limit is not None and isinstance(limit, int) and limit > 0:
-                if isinstance(result, list) and len(result) > limit:
-                    result = result[:limit]
+            next_cursor = None
+            if paginate and isinstance(result, list) and len(result) > limit:
+                result = result[:limit]
+                next_cursor = encode_neighbors_cursor(offset + limit, limit)
 
             # Story 11.3.2: Shadow audit for SELECT operations
             # Log cross-project violations if in shadow mode (non-blocking)
@@ -244,6 +303,8 @@ async def handle_graph_query_neighbors(arguments: dict[str, Any]) -> dict[str, A
                 },
                 "execution_time_ms": round(execution_time, 2),
                 "neighbor_count": len(result),
+                "next_cursor": next_cursor,
+                "has_more": next_cursor is not None,
                 "status": "success",
             }, project_id)
 
@@ -15,6 +15,7 @@ from datetime import datetime, timezone
 from typing import Any
 
 from mcp_server.db.connection import get_connection
+from mcp_server.db.graph_cache import invalidate_graph_cache
 from mcp_server.middleware.context import get_current_project
 from mcp_server.utils.response import add_response_metadata
 from mcp_server.utils.sector_classifier import MemorySector
@@ -377,6 +378,9 @@ async def _update_edge_sector(
 
             conn.commit()
 
+        # Sector filters of cached graph traversals depend on memory_sector
+        invalidate_graph_cache()
+
     except Exception as e:
         logger.error("Failed to update edge sector", extra={
             "edge_id": edge_id,
@@ -11,69 +11,56 @@ Story: Phase 3b - Lateral Edge Suggestions (Graph-Nutzung-Request 2026-01-02)
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 from typing import Any
 
-from openai import APIConnectionError, OpenAI, RateLimitError
-
 from mcp_server.db.graph import get_node_by_name, query_neighbors
 from mcp_server.db.connection import get_connection_with_project_context
+from mcp_server.db.entity_linker import EntityAutomaton, get_entity_automaton
+from mcp_server.external.embedding_cache import get_embedding_cache
+from mcp_server.external.openai_client import get_embeddings_client
 from mcp_server.middleware.context import get_current_project
 from mcp_server.utils.response import add_response_metadata
 
 
 async def _get_embedding(text: str) -> list[float] | None:
     """
-    Generate embedding for text using OpenAI API with retry logic.
+    Generate embedding for text via the shared embeddings client.
+
+    Node names recur across calls, so results go through the query-embedding cache.
+    Retries are handled by the shared client.
 
     Returns None if embedding generation fails.
     """
     logger = logging.getLogger(__name__)
-    api_key = os.environ.get("OPENAI_API_KEY")
 
-    if not api_key:
+    cache = get_embedding_cache()
+    cached = await cache.aget(text)
+    if cached is not None:
+        return cached
+
+    if not os.environ.get("OPENAI_API_KEY"):
         logger.error("OPENAI_API_KEY not set")
         return None
 
-    client = OpenAI(api_key=api_key)
-    delays = [1, 2, 4]
-    max_retries = 3
+    try:
+        client = await get_embeddings_client()
+        embedding = await client.embed(text)
+    except Exception as e:
+        logger.error(f"Embedding error: {e}")
+        return None
 
-    for attempt in range(max_retries):
-        try:
-            response = client.embeddings.create(
-                model="text-embedding-3-small",
-                input=text,
-                encoding_format="float"
-            )
-            return response.data[0].embedding
-        except RateLimitError:
-            if attempt < max_retries - 1:
-                await asyncio.sleep(delays[attempt])
-            else:
-                logger.error(f"Rate limit after {max_retries} attempts")
-                return None
-        except APIConnectionError:
-            if attempt < max_retries - 1:
-                await asyncio.sleep(delays[attempt])
-            else:
-                logger.error(f"API connection error after {max_retries} attempts")
-                return None
-        except Exception as e:
-            logger.error(f"Embedding error: {e}")
-            return None
-
-    return None
+    await cache.aput(text, embedding)
+    return embedding
 
 
 async def handle_suggest_lateral_edges(arguments: dict[str, Any]) -> dict[str, Any]:
     """
     Suggest potential lateral edges for a given node.
 
-    Performs semantic search to find nodes that might be related,
-    then filters out already-connected nodes and suggests relation types.
+    Finds the nearest nodes by embedding (one ANN query that excludes
+    already-connected nodes) and suggests relation types.
 
     Args:
         arguments: Tool arguments containing:
@@ -122,118 +109,72 @@ async def handle_suggest_lateral_edges(arguments: dict[str, Any]) -> dict[str, A
         connected_node_ids = {n.get("node_id") for n in connected_neighbors}
         connected_node_ids.add(source_node_id)  # Also exclude self
 
-        # 3. Perform semantic search for related nodes
-        # We use hybrid_search via direct DB query for graph nodes only
-        # Story 11.6.2: Use project-scoped connection for RLS filtering
-
-        # Get embedding for the node name
-        query_embedding = await _get_embedding(node_name)
-
-        if query_embedding is None:
-            return add_response_metadata({
-                "error": "Embedding generation failed",
-                "details": f"Could not generate embedding for '{node_name}'",
-                "tool": "suggest_lateral_edges",
-            }, project_id)
-
-        # Story 11.6.2: Use project-scoped connection for RLS filtering
-        # Search for semantically similar L2 insights and check if they have graph connections
+        # 3. One ANN query over node embeddings (Migration 055), excluding the
+        # node itself and its existing neighbors. The node's stored vector is
+        # the reference; nodes still waiting for the embedding worker are
+        # embedded from the same text on the fly.
         async with get_connection_with_project_context(read_only=True) as conn:
             cursor = conn.cursor()
-
-            # First, search L2 insights for semantic matches
-            # Note: RLS policy filters by project_id at database level (defense in depth)
             cursor.execute(
-                """
-                SELECT
-                    l2.id,
-                    l2.content,
-                    l2.project_id,
-                    1 - (l2.embedding <=> %s::vector) as similarity
-                FROM l2_insights l2
-                WHERE l2.embedding IS NOT NULL
-                ORDER BY l2.embedding <=> %s::vector
-                LIMIT %s;
-                """,
-                (query_embedding, query_embedding, top_k * 3)  # Get more, we'll filter
+                "SELECT embedding IS NOT NULL AS embedded FROM nodes WHERE id = %s::uuid;",
+                (source_node_id,),
             )
-            l2_results = cursor.fetchall()
+            row = cursor.fetchone()
+            embedded = bool(row and row["embedded"])
+
+        if embedded:
+            reference_sql = "(SELECT embedding FROM nodes WHERE id = %s::uuid)"
+            reference_param: Any = source_node_id
+        else:
+            query_embedding = await _get_embedding(_node_embedding_text(source_node))
+            if query_embedding is None:
+                return add_response_metadata({
+                    "error": "Embedding generation failed",
+                    "details": f"Could not generate embedding for '{node_name}'",
+                    "tool": "suggest_lateral_edges",
+                }, project_id)
+            reference_sql = "%s::vector"
+            reference_param = query_embedding
 
-            # Also search graph nodes directly by name similarity (keyword-based)
-            # Note: RLS policy filters by project_id at database level (defense in depth)
+        # Story 11.6.2: Use project-scoped connection for RLS filtering
+        async with get_connection_with_project_context(read_only=True) as conn:
+            cursor = conn.cursor()
             cursor.execute(
-                """
+                f"""
                 SELECT
-                    n.id::text as node_id,
+                    n.id::text AS node_id,
                     n.name,
                     n.label,
-                    n.properties,
-                    n.project_id,
-                    ts_rank(to_tsvector('german', n.name), plainto_tsquery('german', %s)) as rank
+                    1 - (n.embedding <=> {reference_sql}) AS similarity
                 FROM nodes n
-                WHERE to_tsvector('german', n.name) @@ plainto_tsquery('german', %s)
-                   OR n.name ILIKE %s
-                ORDER BY rank DESC
+                WHERE n.embedding IS NOT NULL
+                  AND n.id <> ALL(%s::uuid[])
+                  AND n.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+                ORDER BY n.embedding <=> {reference_sql}
                 LIMIT %s;
                 """,
-                (node_name, node_name, f"%{node_name}%", top_k * 2)
+                (reference_param, list(connected_node_ids), reference_param, top_k),
+            )
+            similar_nodes = cursor.fetchall()
+
+        # 4. Collect candidate nodes
+        candidates = [
+            {
+                "node_id": row["node_id"],
+                "name": row["name"],
+                "label": row["label"],
+                "match_type": "semantic_node",
+                "score": float(row["similarity"]),
+            }
+            for row in similar_nodes
+        ]
+
+        # No embedded candidates yet (backfill after Migration 055 still
+        # running): keyword matches and nodes mentioned in similar insights
+        if not candidates:
+            candidates = await _candidates_from_insights(
+                node_name, reference_sql, reference_param, connected_node_ids, top_k, project_id
             )
-            keyword_node_results = cursor.fetchall()
-
-        # 4. Collect candidate nodes (from graph nodes + L2-linked nodes)
-        candidates = []
-        seen_names = set()
-
-        # Add keyword-matched nodes
-        for row in keyword_node_results:
-            if row["node_id"] not in connected_node_ids and row["name"] not in seen_names:
-                seen_names.add(row["name"])
-                candidates.append({
-                    "node_id": row["node_id"],
-                    "name": row["name"],
-                    "label": row["label"],
-                    "match_type": "keyword",
-                    "score": float(row["rank"]) if row["rank"] else 0.5,
-                })
-
-        # For L2 insights, check if they're linked to graph nodes
-        # (This is a simplified approach - in production, we'd have vector_id links)
-        for row in l2_results:
-            # Extract potential node names from L2 content
-            content = row["content"]
-            similarity = float(row["similarity"])
-
-            # Story 11.6.2: Use project-scoped connection for RLS filtering
-            # Search for nodes mentioned in the L2 content
-            async with get_connection_with_project_context(read_only=True) as conn:
-                cursor = conn.cursor()
-                # Find nodes whose names appear in this insight's content
-                cursor.execute(
-                    """
-                    SELECT
-                        n.id::text as node_id,
-                        n.name,
-                        n.label,
-                        n.properties
-                    FROM nodes n
-                    WHERE %s ILIKE '%%' || n.name || '%%'
-                      AND n.id::text NOT IN (SELECT unnest(%s::text[]))
-                    LIMIT 3;
-                    """,
-                    (content, list(connected_node_ids))
-                )
-                mentioned_nodes = cursor.fetchall()
-
-                for node in mentioned_nodes:
-                    if node["name"] not in seen_names:
-                        seen_names.add(node["name"])
-                        candidates.append({
-                            "node_id": node["node_id"],
-                            "name": node["name"],
-                            "label": node["label"],
-                            "match_type": "semantic_l2",
-                            "score": similarity,
-                        })
 
         # 5. Sort by score and take top_k
         candidates.sort(key=lambda x: x["score"], reverse=True)
@@ -277,6 +218,153 @@ async def handle_suggest_lateral_edges(arguments: dict[str, Any]) -> dict[str, A
         }, get_current_project())  # Still get project_id even in catch block
 
 
+def _node_embedding_text(node: dict[str, Any]) -> str:
+    """Python twin of node_embedding_text() (Migration 055)."""
+    properties = node.get("properties") or {}
+    parts = [
+        node["name"],
+        f"({node['label']})" if node.get("label") else None,
+        properties.get("description"),
+        properties.get("summary"),
+    ]
+    return " ".join(str(part) for part in parts if part is not None)
+
+
+async def _candidates_from_insights(
+    node_name: str,
+    reference_sql: str,
+    reference_param: Any,
+    connected_node_ids: set[str],
+    top_k: int,
+    project_id: str,
+) -> list[dict[str, Any]]:
+    """
+    Candidates from node-name keyword matches and from nodes mentioned in
+    semantically similar L2 insights (used until nodes are embedded).
+    """
+    # Story 11.6.2: Use project-scoped connection for RLS filtering
+    async with get_connection_with_project_context(read_only=True) as conn:
+        cursor = conn.cursor()
+
+        # Search L2 insights for semantic matches
+        cursor.execute(
+            f"""
+            SELECT
+                l2.id,
+                l2.content,
+                l2.project_id,
+                1 - (l2.embedding <=> {reference_sql}) as similarity
+            FROM l2_insights l2
+            WHERE l2.embedding IS NOT NULL
+              AND l2.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+            ORDER BY l2.embedding <=> {reference_sql}
+            LIMIT %s;
+            """,
+            (reference_param, reference_param, top_k * 3)  # Get more, we'll filter
+        )
+        l2_results = cursor.fetchall()
+
+        # Also search graph nodes directly by name similarity (keyword-based)
+        cursor.execute(
+            """
+            SELECT
+                n.id::text as node_id,
+                n.name,
+                n.label,
+                n.properties,
+                n.project_id,
+                ts_rank(to_tsvector('german', n.name), plainto_tsquery('german', %s)) as rank
+            FROM nodes n
+            WHERE (to_tsvector('german', n.name) @@ plainto_tsquery('german', %s)
+                   OR n.name ILIKE %s)
+              AND n.project_id::TEXT = ANY((SELECT get_allowed_projects())::TEXT[])
+            ORDER BY rank DESC
+            LIMIT %s;
+            """,
+            (node_name, node_name, f"%{node_name}%", top_k * 2)
+        )
+        keyword_node_results = cursor.fetchall()
+
+    candidates = []
+    seen_names = set()
+
+    # Add keyword-matched nodes
+    for row in keyword_node_results:
+        if row["node_id"] not in connected_node_ids and row["name"] not in seen_names:
+            seen_names.add(row["name"])
+            candidates.append({
+                "node_id": row["node_id"],
+                "name": row["name"],
+                "label": row["label"],
+                "match_type": "keyword",
+                "score": float(row["rank"]) if row["rank"] else 0.5,
+            })
+
+    # For L2 insights, link the graph nodes mentioned in their content:
+    # one automaton pass per insight (entity_linker.py); the per-insight
+    # ILIKE scan over nodes is only used without an automaton
+    automaton = await get_entity_automaton(project_id)
+    for row in l2_results:
+        content = row["content"]
+        similarity = float(row["similarity"])
+
+        if automaton is not None:
+            mentioned_nodes = _mentioned_nodes(automaton, content, connected_node_ids)
+        else:
+            mentioned_nodes = await _find_mentioned_nodes_sql(content, connected_node_ids)
+
+        for node in mentioned_nodes:
+            if node["name"] not in seen_names:
+                seen_names.add(node["name"])
+                candidates.append({
+                    "node_id": node["node_id"],
+                    "name": node["name"],
+                    "label": node["label"],
+                    "match_type": "semantic_l2",
+                    "score": similarity,
+                })
+
+    return candidates
+
+
+def _mentioned_nodes(
+    automaton: EntityAutomaton, content: str, excluded_node_ids: set[str], limit: int = 3
+) -> list[dict[str, Any]]:
+    """First `limit` distinct nodes mentioned in content, excluding excluded_node_ids."""
+    nodes: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for mention in automaton.find_mentions(content):
+        if mention["node_id"] in excluded_node_ids or mention["node_id"] in seen:
+            continue
+        seen.add(mention["node_id"])
+        nodes.append(mention)
+        if len(nodes) == limit:
+            break
+    return nodes
+
+
+async def _find_mentioned_nodes_sql(content: str, excluded_node_ids: set[str]) -> list[Any]:
+    """Nodes whose names appear in content, via a full scan of nodes (fallback)."""
+    # Story 11.6.2: Use project-scoped connection for RLS filtering
+    async with get_connection_with_project_context(read_only=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            """
+            SELECT
+                n.id::text as node_id,
+                n.name,
+                n.label,
+                n.properties
+            FROM nodes n
+            WHERE %s ILIKE '%%' || n.name || '%%'
+              AND n.id::text NOT IN (SELECT unnest(%s::text[]))
+            LIMIT 3;
+            """,
+            (content, list(excluded_node_ids))
+        )
+        return cursor.fetchall()
+
+
 def _suggest_relations(source_label: str, target_label: str, target_name: str) -> list[str]:
     """
     Suggest appropriate relation types based on node labels and names.
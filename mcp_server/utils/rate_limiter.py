@@ -0,0 +1,67 @@
+"""
+Async Request Rate Limiter for External API Calls.
+
+Spaces request starts to a fixed rate with a small burst allowance (GCRA /
+virtual scheduling), so concurrent workers calling the same API share one
+budget instead of each hammering it and running into 429 retries.
+
+The limiter state is guarded by a threading.Lock and waiting happens with
+asyncio.sleep outside of it, so one instance can be shared across event
+loops (tests, scripts) without binding to a loop.
+
+Usage:
+    limiter = AsyncRateLimiter(requests_per_minute=120, burst=4)
+    await limiter.acquire()        # returns when this request may start
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Process-wide limiter for request starts (requests per minute + burst).
+
+    Each acquire() reserves the next free start slot; up to `burst`
+    requests may start back to back after an idle period.
+    """
+
+    def __init__(self, requests_per_minute: float, burst: int = 1) -> None:
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be > 0")
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+        self._interval = 60.0 / requests_per_minute
+        self._tolerance = (burst - 1) * self._interval
+        self._lock = threading.Lock()
+        self._theoretical_arrival = 0.0
+
+    def reserve(self, max_delay: float | None = None) -> float | None:
+        """
+        Reserve the next start slot without waiting.
+
+        Args:
+            max_delay: If the wait would reach this many seconds, nothing is
+                       reserved (the slot stays free for other callers)
+
+        Returns:
+            Seconds the caller has to wait before starting (0.0 if none),
+            or None if the wait would exceed max_delay
+        """
+        with self._lock:
+            now = time.monotonic()
+            arrival = max(self._theoretical_arrival, now)
+            start = max(now, arrival - self._tolerance)
+            if max_delay is not None and start - now >= max_delay:
+                return None
+            self._theoretical_arrival = arrival + self._interval
+            return start - now
+
+    async def acquire(self) -> None:
+        """Wait until one more request may start."""
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
@@ -6,6 +6,10 @@ This module provides:
 - Backward compatibility for legacy edges without memory_sector
 - Performance logging for monitoring (NFR16)
 
+SQL traversals read the score from edge_relevance_score() instead
+(Migration 054, mcp_server/db/decay_scores.py); this function scores rows
+that come from the adjacency cache or callers outside the database.
+
 Story 9-2: Extracted from mcp_server/db/graph.py to enable sector-specific decay.
 
 Usage:
@@ -46,7 +50,8 @@ def calculate_relevance_score(edge_data: dict[str, Any]) -> float:
     Returns:
         float between 0.0 and 1.0
     """
-    start_time = time.perf_counter()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    start_time = time.perf_counter() if debug else 0.0
 
     properties = edge_data.get("edge_properties") or edge_data.get("properties") or {}
 
@@ -87,7 +92,10 @@ def calculate_relevance_score(edge_data: dict[str, Any]) -> float:
     # Exponential Decay
     score = max(0.0, min(1.0, math.exp(-days_since / S)))
 
-    # Performance logging (NFR16)
+    # Performance logging (NFR16), skipped unless DEBUG is enabled
+    if not debug:
+        return score
+
     elapsed_ms = (time.perf_counter() - start_time) * 1000
     logger.debug(
         "Calculated relevance_score",
@@ -104,3 +112,4 @@ def calculate_relevance_score(edge_data: dict[str, Any]) -> float:
     )
 
     return score
+
@@ -213,6 +213,7 @@ def _extract_api_name(func: Callable) -> str:
         "_call_haiku_judge": "haiku_judge",
         "_call_gpt4o_judge": "gpt4o_judge",
         "create_embedding": "openai_embeddings",
+        "create_embeddings": "openai_embeddings",
     }
 
     return api_name_mapping.get(func_name, func_name)
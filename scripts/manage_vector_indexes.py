@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Manage HNSW vector indexes on l2_insights, episode_memory (Migration 050) and nodes (Migration 055).
+
+Builds run with CREATE INDEX CONCURRENTLY on a dedicated autocommit connection
+while a second connection polls pg_stat_progress_create_index, so progress is
+reported during long builds and the tables stay writable.
+
+Usage:
+    python scripts/manage_vector_indexes.py status
+    python scripts/manage_vector_indexes.py build                      # all tables, m=16, ef_construction=64
+    python scripts/manage_vector_indexes.py build --table l2_insights --m 24 --ef-construction 128
+    python scripts/manage_vector_indexes.py build --rebuild --maintenance-work-mem 1GB
+    python scripts/manage_vector_indexes.py drop --table episode_memory
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import threading
+import time
+
+from dotenv import load_dotenv
+
+# Load environment before imports
+load_dotenv(".env.development")
+
+from mcp_server.db.vector_indexes import (  # noqa: E402
+    DEFAULT_HNSW_EF_CONSTRUCTION,
+    DEFAULT_HNSW_M,
+    VECTOR_INDEXES,
+    build_hnsw_index,
+    drop_hnsw_index,
+    get_index_build_progress,
+    get_vector_index_status,
+    open_admin_connection,
+    validate_hnsw_params,
+)
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s [%(levelname)s] %(message)s",
+    datefmt="%H:%M:%S",
+)
+logger = logging.getLogger(__name__)
+
+
+def print_status() -> None:
+    """Print existence, validity, options and size of all managed indexes."""
+    conn = open_admin_connection()
+    try:
+        print(f"{'Table':<16} {'Index':<28} {'Valid':<6} {'Size':>10} {'Rows':>10}  Options")
+        print("-" * 90)
+        for entry in get_vector_index_status(conn):
+            valid = "yes" if entry["valid"] else ("NO" if entry["exists"] else "-")
+            rows = entry["table_rows"] if entry["table_rows"] is not None else "-"
+            options = ", ".join(entry["options"]) if entry["exists"] else "(missing)"
+            print(
+                f"{entry['table']:<16} {entry['index_name']:<28} {valid:<6} "
+                f"{entry['size_pretty']:>10} {rows!s:>10}  {options}"
+            )
+    finally:
+        conn.close()
+
+
+def build(tables: list[str], args: argparse.Namespace) -> int:
+    """Build indexes sequentially, printing progress every poll interval."""
+    validate_hnsw_params(args.m, args.ef_construction)
+
+    def _run(build_conn, table: str, errors: list[Exception]) -> None:
+        try:
+            build_hnsw_index(
+                build_conn,
+                table,
+                m=args.m,
+                ef_construction=args.ef_construction,
+                concurrently=not args.no_concurrently,
+                rebuild=args.rebuild,
+                maintenance_work_mem=args.maintenance_work_mem,
+            )
+        except Exception as e:  # reported after join
+            errors.append(e)
+
+    for table in tables:
+        errors: list[Exception] = []
+        build_conn = open_admin_connection()
+
+        started = time.monotonic()
+        worker = threading.Thread(
+            target=_run, args=(build_conn, table, errors), name=f"hnsw-build-{table}"
+        )
+        worker.start()
+
+        progress_conn = open_admin_connection()
+        try:
+            while worker.is_alive():
+                worker.join(timeout=args.poll_interval)
+                for entry in get_index_build_progress(progress_conn):
+                    if entry["table"] != table:
+                        continue
+                    percent = f"{entry['percent']:.1f}%" if entry["percent"] is not None else "n/a"
+                    logger.info(
+                        f"{table}: {entry['phase']} ({percent}, "
+                        f"tuples {entry['tuples_done']}/{entry['tuples_total']})"
+                    )
+        finally:
+            progress_conn.close()
+            build_conn.close()
+
+        elapsed = time.monotonic() - started
+        if errors:
+            logger.error(f"{table}: build failed after {elapsed:.1f}s: {errors[0]}")
+            return 1
+        logger.info(f"{table}: build finished in {elapsed:.1f}s")
+
+    print_status()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage HNSW vector indexes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("status", help="Show index existence, validity, options and size")
+
+    build_parser = sub.add_parser("build", help="Build HNSW indexes")
+    build_parser.add_argument("--table", choices=list(VECTOR_INDEXES), help="Only this table (default: all)")
+    build_parser.add_argument("--m", type=int, default=DEFAULT_HNSW_M)
+    build_parser.add_argument("--ef-construction", type=int, default=DEFAULT_HNSW_EF_CONSTRUCTION)
+    build_parser.add_argument("--rebuild", action="store_true", help="Drop existing index first")
+    build_parser.add_argument("--no-concurrently", action="store_true", help="Plain CREATE INDEX (locks writes)")
+    build_parser.add_argument("--maintenance-work-mem", help="e.g. 1GB for faster builds")
+    build_parser.add_argument("--poll-interval", type=float, default=5.0, help="Progress poll interval in seconds")
+
+    drop_parser = sub.add_parser("drop", help="Drop HNSW indexes")
+    drop_parser.add_argument("--table", choices=list(VECTOR_INDEXES), help="Only this table (default: all)")
+
+    args = parser.parse_args()
+
+    if args.command == "status":
+        print_status()
+        return 0
+
+    tables = [args.table] if args.table else list(VECTOR_INDEXES)
+
+    if args.command == "build":
+        return build(tables, args)
+
+    conn = open_admin_connection()
+    try:
+        for table in tables:
+            drop_hnsw_index(conn, table)
+            logger.info(f"{table}: index dropped")
+    finally:
+        conn.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
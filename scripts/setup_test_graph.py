@@ -18,12 +18,13 @@ Story 4.7: Integration Testing mit BMAD-BMM Use Cases
 from __future__ import annotations
 
 import argparse
+import asyncio
 import logging
 import sys
 from typing import Any
 
 from mcp_server.db.connection import get_connection
-from mcp_server.db.graph import add_node, add_edge, get_node_by_name
+from mcp_server.db.graph import add_edges_batch, add_nodes_batch
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
@@ -90,6 +91,9 @@ def setup_test_graph() -> dict[str, int]:
     """
     Create test graph data for integration testing.
 
+    Nodes and edges are each written with one bulk upsert
+    (add_nodes_batch / add_edges_batch).
+
     Returns:
         Dict with counts: {"nodes_created": int, "edges_created": int}
     """
@@ -99,55 +103,36 @@ def setup_test_graph() -> dict[str, int]:
     edges_created = 0
 
     # Create nodes
-    for node_data in TEST_NODES:
-        try:
-            import json
-            result = add_node(
-                label=node_data["label"],
-                name=node_data["name"],
-                properties=json.dumps(node_data.get("properties", {})),
-                vector_id=node_data.get("vector_id")
-            )
-
+    try:
+        node_results = asyncio.run(add_nodes_batch(TEST_NODES))
+        for result in node_results:
             if result["created"]:
                 nodes_created += 1
-                logger.info(f"Created node: {node_data['name']} (label={node_data['label']})")
+                logger.info(f"Created node: {result['name']} (label={result['label']})")
             else:
-                logger.info(f"Node already exists: {node_data['name']}")
-
-        except Exception as e:
-            logger.error(f"Failed to create node {node_data['name']}: {e}")
-
-    # Create edges
-    for edge_data in TEST_EDGES:
-        try:
-            # Get node IDs
-            source_node = get_node_by_name(edge_data["source"])
-            target_node = get_node_by_name(edge_data["target"])
-
-            if not source_node:
-                logger.warning(f"Source node not found: {edge_data['source']}")
-                continue
-            if not target_node:
-                logger.warning(f"Target node not found: {edge_data['target']}")
-                continue
-
-            result = add_edge(
-                source_id=source_node["id"],
-                target_id=target_node["id"],
-                relation=edge_data["relation"],
-                weight=edge_data.get("weight", 1.0),
-                properties="{}"
-            )
+                logger.info(f"Node already exists: {result['name']}")
+    except Exception as e:
+        logger.error(f"Failed to create nodes: {e}")
 
+    # Create edges (endpoint names are resolved in the same transaction)
+    try:
+        edge_results = asyncio.run(add_edges_batch([
+            {
+                "source_name": edge_data["source"],
+                "target_name": edge_data["target"],
+                "relation": edge_data["relation"],
+                "weight": edge_data.get("weight", 1.0),
+            }
+            for edge_data in TEST_EDGES
+        ]))
+        for edge_data, result in zip(TEST_EDGES, edge_results, strict=True):
             if result["created"]:
                 edges_created += 1
                 logger.info(f"Created edge: {edge_data['source']} --[{edge_data['relation']}]--> {edge_data['target']}")
             else:
                 logger.info(f"Edge already exists: {edge_data['source']} -> {edge_data['target']}")
-
-        except Exception as e:
-            logger.error(f"Failed to create edge {edge_data['source']} -> {edge_data['target']}: {e}")
+    except Exception as e:
+        logger.error(f"Failed to create edges: {e}")
 
     logger.info(f"Test graph setup complete: {nodes_created} nodes created, {edges_created} edges created")
 
@@ -28,6 +28,9 @@ pytest_plugins = ("pytest_asyncio",)
 # Load environment at module level
 load_dotenv(".env.development")
 
+# Mocked embeddings must not land in the shared Postgres embedding cache
+os.environ.setdefault("EMBEDDING_CACHE_PERSISTENT", "false")
+
 # ============================================================================
 # FIXTURE: UTILITY FUNCTIONS
 # ============================================================================
@@ -163,8 +166,10 @@ def mock_db_pool():
 @pytest.fixture(autouse=True)
 def reset_environment():
     """Reset environment state between tests."""
+    from mcp_server.external import embedding_cache
     from mcp_server.middleware.context import clear_context
     clear_context()
+    embedding_cache._cache_instance = None
     yield
     # Cleanup after test if needed
     from mcp_server.middleware.context import clear_context
@@ -358,26 +363,6 @@ async def async_pool(database_url: str):
             await pool.close()
 
 
-@pytest.fixture
-def get_connection_mock():
-    """
-    Mock the get_connection() async context manager.
-
-    Use this fixture when you want to mock the entire get_connection()
-    call without actually connecting to a database.
-
-    Usage:
-        def test_handler_with_mock(get_connection_mock):
-            get_connection_mock.return_value.__aenter__.return_value = mock_conn
-            result = handle_store_episode({"query": "test"})
-            assert result["query"] == "test"
-    """
-    from unittest.mock import patch
-
-    with patch("mcp_server.db.connection.get_connection") as mock:
-        yield mock
-
-
 @pytest.fixture
 def isolate_conn(conn, request):
     """
@@ -287,48 +287,21 @@ class TestGraphSearch:
     @pytest.mark.asyncio
     async def test_graph_search_with_matching_node(self):
         """Test graph search when entity matches a node."""
-        with patch('mcp_server.db.graph.get_node_by_name') as mock_get_node, \
-             patch('mcp_server.db.graph.query_neighbors') as mock_neighbors:
-
-            # Node lookup function - called multiple times
-            def node_lookup(name):
-                if name == "Python":
-                    return {
-                        "id": "python-node-id",
-                        "label": "Technology",
-                        "name": "Python",
-                        "properties": {},
-                        "vector_id": None,
-                    }
-                elif name == "Django":
-                    return {
-                        "id": "django-node-id",
-                        "label": "Framework",
-                        "name": "Django",
-                        "properties": {},
-                        "vector_id": 42,
-                    }
-                return None
-
-            mock_get_node.side_effect = node_lookup
-
-            mock_neighbors.return_value = [
-                {
-                    "node_id": "django-node-id",
-                    "label": "Framework",
-                    "name": "Django",
-                    "relation": "USES",
-                    "weight": 0.9,
-                    "distance": 1,
-                    "properties": {}
-                }
-            ]
-
-            # Mock database connection and cursor
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_conn.cursor.return_value = mock_cursor
-            mock_cursor.fetchone.return_value = {
+        # Set-based graph channel: one query returns entity -> neighbor -> insight rows
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {
+                "entity_ord": 1,
+                "entity": "Python",
+                "neighbor_id": "django-node-id",
+                "neighbor_name": "Django",
+                "relation": "USES",
+                "weight": 0.9,
+                "edge_properties": {},
+                "last_accessed": None,
+                "access_count": 0,
                 "id": 42,
                 "content": "Django is a Python web framework",
                 "source_ids": [1, 2],
@@ -336,28 +309,70 @@ class TestGraphSearch:
                 "io_category": None,
                 "is_identity": False,
                 "source_file": None,
+                "project_id": "io",
             }
+        ]
 
-            query = "What does Python use?"
-            results = await graph_search(query, top_k=5, conn=mock_conn)
+        query = "What does Python use?"
+        results = await graph_search(query, top_k=5, conn=mock_conn)
 
-            assert len(results) == 1
-            assert results[0]["id"] == 42
-            assert results[0]["content"] == "Django is a Python web framework"
-            assert results[0]["graph_score"] == 0.9  # weight / distance = 0.9 / 1
-            assert results[0]["rank"] == 1
+        # Single round trip for the whole channel
+        mock_cursor.execute.assert_called_once()
+        assert mock_cursor.execute.call_args.args[1] == (["What", "Python"],)
+        assert len(results) == 1
+        assert results[0]["id"] == 42
+        assert results[0]["content"] == "Django is a Python web framework"
+        assert results[0]["graph_score"] == 0.9  # weight / distance = 0.9 / 1
+        assert results[0]["source_entity"] == "Python"
+        assert results[0]["rank"] == 1
+
+    @pytest.mark.asyncio
+    async def test_graph_search_keeps_one_edge_per_neighbor(self):
+        """Duplicate edges to the same neighbor/insight yield one result."""
+        base_row = {
+            "entity_ord": 1,
+            "entity": "Python",
+            "neighbor_id": "django-node-id",
+            "neighbor_name": "Django",
+            "edge_properties": {},
+            "last_accessed": None,
+            "access_count": 0,
+            "id": 42,
+            "content": "Django is a Python web framework",
+            "source_ids": [1],
+            "metadata": {},
+            "io_category": None,
+            "is_identity": False,
+            "source_file": None,
+            "project_id": "io",
+        }
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {**base_row, "relation": "USES", "weight": 0.9},
+            {**base_row, "relation": "RELATED_TO", "weight": 0.4},
+            {**base_row, "entity_ord": 2, "entity": "Django", "relation": "USES", "weight": 0.8},
+        ]
+
+        results = await graph_search("What does Python use with Django?", top_k=5, conn=mock_conn)
+
+        assert len(results) == 1
+        assert results[0]["source_relation"] == "USES"
+        assert results[0]["graph_score"] == 0.9
 
     @pytest.mark.asyncio
     async def test_graph_search_no_matching_nodes(self):
         """Test graph search when no entities match nodes."""
-        with patch('mcp_server.db.graph.get_node_by_name') as mock_get_node:
-            mock_get_node.return_value = None  # No node found
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []  # No node found
 
-            mock_conn = MagicMock()
-            query = "What does Python use?"
-            results = await graph_search(query, top_k=5, conn=mock_conn)
+        query = "What does Python use?"
+        results = await graph_search(query, top_k=5, conn=mock_conn)
 
-            assert results == []
+        assert results == []
 
     @pytest.mark.asyncio
     async def test_graph_search_no_entities_extracted(self):
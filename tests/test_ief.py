@@ -11,8 +11,11 @@ import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch
 
+import numpy as np
+
 from mcp_server.analysis.ief import (
-    calculate_ief_score, _calculate_recency_boost, _cosine_similarity,
+    calculate_ief_score, calculate_ief_scores, get_insight_embeddings,
+    _calculate_recency_boost, _cosine_similarity, _cosine_similarities,
     CONSTITUTIVE_BOOST, NUANCE_PENALTY, W_MIN_CONSTITUTIVE,
     on_feedback_received, recalibrate_weights, get_feedback_count,
     RECALIBRATION_THRESHOLD, _feedback_count_since_calibration
@@ -271,6 +274,85 @@ class TestIEFIntegration:
         assert 0.0 <= result["ief_score"] <= 1.5
 
 
+class TestBatchedIEF:
+    """calculate_ief_scores(): one embedding query, vectorized similarity."""
+
+    EMBEDDINGS = {
+        1: [1.0, 0.0, 0.0, 1.0],
+        2: [0.0, 1.0, 1.0, 0.0],
+        3: [-1.0, 0.5, 0.0, 2.0],
+        4: [0.0, 0.0, 0.0, 0.0],
+        5: [1.0, 2.0],  # dimension mismatch
+    }
+
+    def _edges(self):
+        return [
+            {
+                "edge_id": f"edge-{vector_id}",
+                "edge_properties": {"vector_id": vector_id} if vector_id else {},
+                "modified_at": datetime.now(timezone.utc) - timedelta(days=3),
+                "access_count": 2,
+                "last_accessed": datetime.now(timezone.utc),
+            }
+            for vector_id in [1, 2, 3, 4, 5, 6, None, 1]
+        ]
+
+    def _conn(self):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [
+            {"id": vector_id, "embedding": embedding}
+            for vector_id, embedding in self.EMBEDDINGS.items()
+        ]
+        return conn
+
+    def test_matches_single_edge_scores(self):
+        query_embedding = [0.5, -0.2, 0.3, 1.0]
+        conn = self._conn()
+
+        batched = calculate_ief_scores(
+            self._edges(), query_embedding, pending_nuance_edge_ids={"edge-2"}, conn=conn
+        )
+
+        with patch('mcp_server.analysis.ief._get_insight_embedding',
+                   side_effect=lambda vector_id: self.EMBEDDINGS.get(vector_id)):
+            single = [
+                calculate_ief_score(edge, query_embedding, pending_nuance_edge_ids={"edge-2"})
+                for edge in self._edges()
+            ]
+
+        for batch_result, single_result in zip(batched, single, strict=True):
+            assert batch_result["ief_score"] == pytest.approx(single_result["ief_score"])
+            for name, value in single_result["components"].items():
+                assert batch_result["components"][name] == pytest.approx(value, rel=1e-6)
+        assert conn.cursor.return_value.execute.call_count == 1
+
+    def test_no_query_embedding_skips_lookup(self):
+        conn = self._conn()
+
+        results = calculate_ief_scores(self._edges(), None, conn=conn)
+
+        assert {r["components"]["semantic_similarity"] for r in results} == {0.5}
+        conn.cursor.assert_not_called()
+
+    def test_embeddings_in_text_format(self):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [{"id": 7, "embedding": "[1,0,0.5]"}]
+
+        embeddings = get_insight_embeddings([7, 7], conn=conn)
+
+        assert embeddings[7].tolist() == [1.0, 0.0, 0.5]
+        conn.cursor.return_value.execute.assert_called_once()
+        assert conn.cursor.return_value.execute.call_args[0][1] == ([7],)
+
+    def test_cosine_similarities_match_scalar_version(self):
+        query = [0.3, -1.0, 2.0]
+        matrix = [[1.0, 2.0, 3.0], [-0.3, 1.0, -2.0], [0.0, 0.0, 0.0]]
+
+        vectorized = _cosine_similarities(np.array(query), np.array(matrix))
+
+        assert vectorized.tolist() == pytest.approx([_cosine_similarity(query, row) for row in matrix])
+
+
 class TestNuancePenaltyIntegration:
     """Integration tests for IEF nuance penalty components."""
 
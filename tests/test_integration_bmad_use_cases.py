@@ -123,37 +123,20 @@ class TestUseCaseArchitectureCheck:
     @pytest.mark.asyncio
     async def test_graph_search_architecture_pattern(self):
         """Test graph search with architecture query pattern."""
-        with patch('mcp_server.db.graph.get_node_by_name') as mock_get_node, \
-             patch('mcp_server.db.graph.query_neighbors') as mock_neighbors:
-
-            # Setup: High Volume Requirement node exists
-            def node_lookup(name):
-                if name == "Volume" or name == "High":
-                    # Entity extraction might extract "High" or "Volume"
-                    return None  # No exact match
-                elif name == "PostgreSQL":
-                    return {
-                        "id": "pg-node-id",
-                        "label": "Technology",
-                        "name": "PostgreSQL",
-                        "properties": {},
-                        "vector_id": 101,
-                    }
-                return None
-
-            mock_get_node.side_effect = node_lookup
-            mock_neighbors.return_value = []
+        # Setup: only the PostgreSQL node exists and it has no insight-backed neighbors
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = []
 
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_conn.cursor.return_value = mock_cursor
+        # Query that should extract "PostgreSQL" as entity
+        query = "Does PostgreSQL handle high volume well?"
+        results = await graph_search(query, top_k=5, conn=mock_conn)
 
-            # Query that should extract "PostgreSQL" as entity
-            query = "Does PostgreSQL handle high volume well?"
-            results = await graph_search(query, top_k=5, conn=mock_conn)
-
-            # Should call get_node_by_name for extracted entities
-            mock_get_node.assert_called()
+        # All extracted entities are resolved in a single set-based query
+        mock_cursor.execute.assert_called_once()
+        assert "PostgreSQL" in mock_cursor.execute.call_args.args[1][0]
+        assert results == []
 
     @pytest.mark.asyncio
     async def test_hybrid_search_architecture_use_case(self):
@@ -219,48 +202,21 @@ class TestUseCaseRiskAnalysis:
     @pytest.mark.asyncio
     async def test_graph_search_finds_related_project(self):
         """Test that graph search finds Projekt A via Stripe API relationship."""
-        with patch('mcp_server.db.graph.get_node_by_name') as mock_get_node, \
-             patch('mcp_server.db.graph.query_neighbors') as mock_neighbors:
-
-            # Setup: Stripe API node exists with project neighbor
-            def node_lookup(name):
-                if name == "Stripe":
-                    return {
-                        "id": "stripe-node-id",
-                        "label": "Technology",
-                        "name": "Stripe API",
-                        "properties": {},
-                        "vector_id": None,
-                    }
-                elif name == "Projekt A":
-                    return {
-                        "id": "projekt-a-id",
-                        "label": "Project",
-                        "name": "Projekt A",
-                        "properties": {},
-                        "vector_id": 201,
-                    }
-                return None
-
-            mock_get_node.side_effect = node_lookup
-
-            # Stripe API has neighbor "Projekt A" via USES relation
-            mock_neighbors.return_value = [
-                {
-                    "node_id": "projekt-a-id",
-                    "label": "Project",
-                    "name": "Projekt A",
-                    "relation": "USES",
-                    "weight": 0.95,
-                    "distance": 1,
-                    "properties": {}
-                }
-            ]
-
-            mock_conn = MagicMock()
-            mock_cursor = MagicMock()
-            mock_conn.cursor.return_value = mock_cursor
-            mock_cursor.fetchone.return_value = {
+        # Setup: Stripe node has neighbor "Projekt A" (vector_id 201) via USES relation
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_cursor.fetchall.return_value = [
+            {
+                "entity_ord": 2,
+                "entity": "Stripe",
+                "neighbor_id": "projekt-a-id",
+                "neighbor_name": "Projekt A",
+                "relation": "USES",
+                "weight": 0.95,
+                "edge_properties": {},
+                "last_accessed": None,
+                "access_count": 0,
                 "id": 201,
                 "content": "Projekt A verwendet Stripe API für Payment Processing",
                 "source_ids": [1, 2],
@@ -268,14 +224,16 @@ class TestUseCaseRiskAnalysis:
                 "io_category": None,
                 "is_identity": False,
                 "source_file": None,
+                "project_id": "io",
             }
+        ]
 
-            query = "Erfahrung mit Stripe API?"
-            results = await graph_search(query, top_k=5, conn=mock_conn)
+        query = "Erfahrung mit Stripe API?"
+        results = await graph_search(query, top_k=5, conn=mock_conn)
 
-            # Should find Projekt A via Stripe API relationship
-            assert len(results) >= 1
-            assert any(r["id"] == 201 for r in results)
+        # Should find Projekt A via Stripe API relationship
+        assert len(results) >= 1
+        assert any(r["id"] == 201 for r in results)
 
     @pytest.mark.asyncio
     async def test_hybrid_search_risk_analysis_use_case(self):
@@ -327,13 +327,11 @@ class TestGraphProjectIsolation:
 
         await query_neighbors("00000000-0000-0000-0000-000000000001")
 
-        # CTE query should have project filter in each edge query block
+        # Every query of the level-by-level traversal filters its edges by project
         calls = mock_cursor.execute.call_args_list
         assert len(calls) >= 1
-        sql = calls[0][0][0]
-        # Should appear at least 4 times (outgoing base, outgoing rec, incoming base, incoming rec)
-        filter_count = sql.count("get_allowed_projects")
-        assert filter_count >= 4, (
-            f"Expected get_allowed_projects filter at least 4 times in CTE, "
-            f"found {filter_count} times"
-        )
+        for call in calls:
+            sql = call[0][0]
+            assert "get_allowed_projects" in sql, (
+                f"Expected get_allowed_projects filter in traversal query: {sql}"
+            )
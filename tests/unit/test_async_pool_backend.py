@@ -0,0 +1,128 @@
+"""
+Unit tests for the async pool backend in mcp_server/db/connection.py.
+
+Verifies that blocking psycopg2 work behind get_connection_with_project_context()
+runs off the event loop, so concurrent tool calls overlap, while retry/RLS
+semantics stay unchanged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    run_in_db_executor,
+)
+from mcp_server.middleware.context import get_project_id, project_context
+
+
+def _slow_pool(delay: float) -> MagicMock:
+    """Mock pool whose connections block for `delay` seconds on every execute."""
+    mock_pool = MagicMock()
+
+    def make_conn():
+        conn = MagicMock()
+        cursor = MagicMock()
+        cursor.execute.side_effect = lambda *a, **kw: time.sleep(delay)
+        cursor.fetchone.return_value = {"health_check": 1}
+        conn.cursor.return_value = cursor
+        return conn
+
+    mock_pool.getconn.side_effect = make_conn
+    return mock_pool
+
+
+class TestRunInDbExecutor:
+    """Tests for run_in_db_executor()."""
+
+    async def test_runs_off_event_loop_thread(self):
+        """Blocking callables must not execute on the event loop thread."""
+        loop_thread = threading.get_ident()
+
+        worker_thread = await run_in_db_executor(threading.get_ident)
+
+        assert worker_thread != loop_thread
+
+    async def test_propagates_project_context(self):
+        """contextvars (project context) are visible inside the worker."""
+        token = project_context.set("ctx-project")
+        try:
+            assert await run_in_db_executor(get_project_id) == "ctx-project"
+        finally:
+            project_context.reset(token)
+
+    async def test_passes_args_and_kwargs(self):
+        """Positional and keyword arguments are forwarded."""
+        result = await run_in_db_executor(lambda a, b=0: a + b, 2, b=3)
+        assert result == 5
+
+
+class TestConcurrentAcquisition:
+    """Concurrent connection acquisition overlaps instead of serializing."""
+
+    @patch("mcp_server.middleware.context.get_project_id", return_value="test-project")
+    async def test_acquisitions_overlap(self, mock_project):
+        """Four acquisitions with a 0.1s-per-statement connection finish in parallel."""
+        delay = 0.1
+        with patch("mcp_server.db.connection._connection_pool", _slow_pool(delay)):
+
+            async def acquire():
+                async with get_connection_with_project_context(read_only=True):
+                    pass
+
+            start = time.perf_counter()
+            await asyncio.gather(*[acquire() for _ in range(4)])
+            elapsed = time.perf_counter() - start
+
+        # Each fresh connection issues 2 statements (health check, combined
+        # session settings + RLS) = 0.2s. Serialized on the loop this would take 0.8s.
+        assert elapsed < 0.6
+
+    @patch("mcp_server.middleware.context.get_project_id", return_value="test-project")
+    async def test_event_loop_stays_responsive(self, mock_project):
+        """A heartbeat task keeps ticking while a slow acquisition is in progress."""
+        ticks = 0
+
+        async def heartbeat():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        with patch("mcp_server.db.connection._connection_pool", _slow_pool(0.1)):
+            beat = asyncio.create_task(heartbeat())
+            async with get_connection_with_project_context(read_only=True):
+                pass
+            beat.cancel()
+
+        assert ticks >= 10
+
+    @patch("mcp_server.middleware.context.get_project_id", return_value="test-project")
+    async def test_commit_and_checkin_on_success(self, mock_project):
+        """Successful blocks commit and return the connection exactly once."""
+        mock_pool = _slow_pool(0)
+        with patch("mcp_server.db.connection._connection_pool", mock_pool):
+            async with get_connection_with_project_context() as conn:
+                pass
+
+        conn.commit.assert_called_once()
+        mock_pool.putconn.assert_called_once_with(conn)
+
+    @patch("mcp_server.middleware.context.get_project_id", return_value="test-project")
+    async def test_rollback_on_error(self, mock_project):
+        """Exceptions inside the block roll back and still check the connection in."""
+        mock_pool = _slow_pool(0)
+        with patch("mcp_server.db.connection._connection_pool", mock_pool):
+            with pytest.raises(ValueError):
+                async with get_connection_with_project_context() as conn:
+                    raise ValueError("boom")
+
+        conn.rollback.assert_called_once()
+        conn.commit.assert_not_called()
+        mock_pool.putconn.assert_called_once_with(conn)
@@ -0,0 +1,152 @@
+"""
+Unit tests for materialized decay scores (Migration 054).
+
+refresh_decay_scores() syncs decay_sector_config from the YAML config and
+rewrites edges.memory_strength only after a sector change or for edges that
+were never computed; traversal rows that carry a SQL relevance_score are not
+rescored in Python.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+from mcp_server.db import decay_scores, graph
+from mcp_server.db.decay_scores import (
+    edge_relevance_sql,
+    fetch_strength_refresh_projects,
+    refresh_decay_scores,
+    sync_decay_sector_config,
+)
+from mcp_server.utils.decay_config import SectorDecay
+
+
+def _neighbor_row(**overrides):
+    row = {
+        "node_id": "n1",
+        "edge_id": "e1",
+        "label": "Entity",
+        "name": "N1",
+        "node_properties": {},
+        "edge_properties": {},
+        "memory_sector": "semantic",
+        "relation": "RELATED",
+        "weight": 1.0,
+        "distance": 1,
+        "edge_direction": "outgoing",
+        "last_accessed": None,
+        "access_count": 0,
+        "modified_at": None,
+    }
+    row.update(overrides)
+    return row
+
+
+class TestSyncDecaySectorConfig:
+    def test_upserts_every_sector_and_returns_changed(self):
+        conn = MagicMock()
+        config = {
+            "semantic": SectorDecay(S_base=100.0),
+            "emotional": SectorDecay(S_base=200.0, S_floor=150),
+        }
+
+        with patch.object(decay_scores, "execute_values", return_value=[("emotional",)]) as ev:
+            changed = sync_decay_sector_config(conn, config)
+
+        assert changed == ["emotional"]
+        sql, values = ev.call_args.args[1:3]
+        assert "IS DISTINCT FROM" in sql
+        assert values == [("semantic", 100.0, None), ("emotional", 200.0, 150.0)]
+        conn.commit.assert_called_once()
+
+    def test_refresh_projects_query(self):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = [("io",), ("aa",)]
+
+        assert fetch_strength_refresh_projects(conn, all_projects=False) == ["io", "aa"]
+        sql = conn.cursor.return_value.execute.call_args.args[0]
+        assert "memory_strength IS NULL" in sql
+
+
+class TestRefreshDecayScores:
+    def _patches(self, changed, projects, updated_per_project=3):
+        contexts: list[str] = []
+
+        @asynccontextmanager
+        async def connection(*args, **kwargs):
+            yield MagicMock()
+
+        @asynccontextmanager
+        async def project_connection(*args, **kwargs):
+            yield MagicMock()
+
+        async def run(func, *args):
+            if func is sync_decay_sector_config:
+                return changed
+            if func is fetch_strength_refresh_projects:
+                assert args[1] is bool(changed)
+                return projects
+            return updated_per_project
+
+        return contexts, (
+            patch.object(decay_scores, "get_connection", connection),
+            patch.object(decay_scores, "get_connection_with_project_context", project_connection),
+            patch.object(decay_scores, "run_in_db_executor", run),
+            patch.object(decay_scores, "set_project_id", side_effect=contexts.append),
+        )
+
+    async def test_sector_change_refreshes_every_project(self):
+        contexts, patches = self._patches(["semantic"], ["io", "aa"])
+
+        with patches[0], patches[1], patches[2], patches[3]:
+            updated = await refresh_decay_scores({"semantic": SectorDecay(S_base=90.0)})
+
+        assert updated == 6
+        assert contexts == ["io", "aa"]
+
+    async def test_unchanged_config_without_stale_edges_is_a_no_op(self):
+        contexts, patches = self._patches([], [])
+
+        with patches[0], patches[1], patches[2], patches[3]:
+            updated = await refresh_decay_scores({"semantic": SectorDecay(S_base=100.0)})
+
+        assert updated == 0
+        assert contexts == []
+
+    async def test_errors_are_logged_not_raised(self):
+        @asynccontextmanager
+        async def broken(*args, **kwargs):
+            raise RuntimeError("pool not initialized")
+            yield
+
+        with patch.object(decay_scores, "get_connection", broken):
+            assert await refresh_decay_scores() == 0
+
+
+class TestSqlRelevanceInTraversals:
+    def test_edge_relevance_sql(self):
+        assert edge_relevance_sql("e") == (
+            "edge_relevance_score(e.memory_strength, COALESCE(e.last_engaged, e.last_accessed))"
+        )
+
+    async def test_sql_score_is_not_recomputed(self):
+        rows = [
+            _neighbor_row(node_id="a", relevance_score=0.25),
+            _neighbor_row(node_id="b", relevance_score=0.75),
+        ]
+
+        with patch.object(graph, "calculate_relevance_score") as calculate:
+            neighbors = await graph._rank_neighbor_rows(rows, False, None)
+
+        calculate.assert_not_called()
+        assert [(n["node_id"], n["relevance_score"]) for n in neighbors] == [("b", 0.75), ("a", 0.25)]
+
+    async def test_cache_rows_fall_back_to_python(self):
+        rows = [_neighbor_row(node_id="a")]
+
+        with patch.object(graph, "calculate_relevance_score", return_value=0.4) as calculate:
+            neighbors = await graph._rank_neighbor_rows(rows, False, None)
+
+        calculate.assert_called_once()
+        assert neighbors[0]["relevance_score"] == 0.4
@@ -0,0 +1,123 @@
+"""
+Unit tests for batched dissonance classification (_analyze_dissonance_batch).
+
+DISSONANCE_BATCH_SIZE pairs share one Haiku call; pairs missing from an
+unparseable or incomplete batched answer fall back to single-pair calls.
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import combinations
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp_server.analysis import dissonance
+from mcp_server.analysis.dissonance import DissonanceEngine, DissonanceType
+from mcp_server.utils.rate_limiter import AsyncRateLimiter
+
+
+def _edges(count):
+    return [
+        {"id": f"edge-{i}", "relation": "PREFERS", "source_name": "I/O", "target_name": f"topic-{i}"}
+        for i in range(count)
+    ]
+
+
+def _verdict(pair, dissonance_type="NONE"):
+    return {
+        "pair": pair,
+        "dissonance_type": dissonance_type,
+        "confidence_score": 0.8,
+        "description": f"pair {pair}",
+        "reasoning": "r",
+    }
+
+
+def _single_verdict(dissonance_type="NONE"):
+    verdict = _verdict(0, dissonance_type)
+    del verdict["pair"]
+    return json.dumps(verdict)
+
+
+def _engine(*responses):
+    client = MagicMock()
+    client.generate_response = AsyncMock(side_effect=list(responses))
+    return DissonanceEngine(haiku_client=client, project_id="io"), client
+
+
+class TestAnalyzeDissonanceBatch:
+    async def test_one_call_for_all_pairs(self):
+        edges = _edges(3)
+        batch = [(edges[0], edges[1]), (edges[0], edges[2]), (edges[1], edges[2])]
+        response = "Hier die Analyse:\n" + json.dumps(
+            [_verdict(2, "CONTRADICTION"), _verdict(1), _verdict(3, "NUANCE")]
+        )
+        engine, client = _engine(response)
+
+        results, calls = await engine._analyze_dissonance_batch(batch)
+
+        assert calls == 1
+        prompt = client.generate_response.await_args.kwargs["prompt"]
+        assert "### Paar 1" in prompt and "### Paar 3" in prompt and "topic-2" in prompt
+        assert [r.dissonance_type for r in results] == [
+            DissonanceType.NONE, DissonanceType.CONTRADICTION, DissonanceType.NUANCE,
+        ]
+        assert (results[1].edge_a_id, results[1].edge_b_id) == ("edge-0", "edge-2")
+
+    async def test_missing_and_malformed_verdicts_fall_back_to_single_calls(self):
+        edges = _edges(3)
+        batch = [(edges[0], edges[1]), (edges[0], edges[2]), (edges[1], edges[2])]
+        response = json.dumps([_verdict(1), {"pair": 2, "dissonance_type": "BOGUS"}])
+        engine, client = _engine(response, _single_verdict("EVOLUTION"), _single_verdict())
+
+        with patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            results, calls = await engine._analyze_dissonance_batch(batch)
+
+        assert calls == 3
+        assert [r.dissonance_type for r in results] == [
+            DissonanceType.NONE, DissonanceType.EVOLUTION, DissonanceType.NONE,
+        ]
+
+    async def test_unparseable_response_falls_back_for_every_pair(self):
+        edges = _edges(2)
+        batch = [(edges[0], edges[1]), (edges[1], edges[0])]
+        engine, _ = _engine("Keine Konflikte.", _single_verdict(), _single_verdict("NUANCE"))
+
+        with patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            results, calls = await engine._analyze_dissonance_batch(batch)
+
+        assert calls == 3
+        assert results[1].dissonance_type == DissonanceType.NUANCE
+
+    async def test_api_failure_marks_batch_failed_without_retrying_pairs(self):
+        edges = _edges(2)
+        engine, client = _engine(RuntimeError("overloaded"))
+
+        results, calls = await engine._analyze_dissonance_batch([(edges[0], edges[1]), (edges[1], edges[0])])
+
+        assert calls == 1 and client.generate_response.await_count == 1
+        assert all(r.description == "Analysis failed" and "error" in r.context for r in results)
+
+
+class TestBatchedPool:
+    async def test_pool_sends_pairs_in_batches(self):
+        edges = _edges(4)
+        pairs = list(combinations(range(4), 2))
+        batches = []
+
+        async def analyze_batch(batch):
+            batches.append(len(batch))
+            return [dissonance._failed_result(a, b, ValueError("x")) for a, b in batch], 1
+
+        engine, _ = _engine()
+        engine._analyze_dissonance_batch = analyze_batch
+
+        with patch.object(dissonance, "DISSONANCE_BATCH_SIZE", 4), \
+             patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            analyzed, calls = await engine._analyze_pairs(edges, pairs)
+
+        assert sorted(batches) == [2, 4]
+        assert calls == 2
+        assert [(a["id"], b["id"]) for a, b, _ in analyzed] == [
+            (edges[i]["id"], edges[j]["id"]) for i, j in pairs
+        ]
@@ -0,0 +1,68 @@
+"""
+Unit tests for dissonance candidate pre-ranking (rank_dissonance_candidates).
+
+All edge pairs are scored without LLM calls (far endpoint embedding
+similarity plus shared endpoint / relation bonuses) and only the best
+DISSONANCE_MAX_CANDIDATES uncached pairs are sent to Haiku.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from mcp_server.analysis.dissonance import DissonanceEngine, rank_dissonance_candidates
+
+CONTEXT = "ctx"
+
+
+def _edge(edge_id, target_id, relation="RELATES_TO", outgoing=True):
+    if outgoing:
+        return {"id": edge_id, "source_id": CONTEXT, "target_id": target_id, "relation": relation}
+    return {"id": edge_id, "source_id": target_id, "target_id": CONTEXT, "relation": relation}
+
+
+class TestRankDissonanceCandidates:
+    def test_similar_far_endpoints_rank_first(self):
+        edges = [
+            _edge("e0", "coffee"),
+            _edge("e1", "weather"),
+            _edge("e2", "tea", outgoing=False),
+        ]
+        vectors = {"coffee": [1.0, 0.1], "tea": [0.9, 0.2], "weather": [0.0, 1.0]}
+
+        pairs = rank_dissonance_candidates(edges, vectors, CONTEXT, limit=3)
+
+        assert pairs[0] == (0, 2)
+        assert set(pairs) == {(0, 1), (0, 2), (1, 2)}
+
+    def test_shared_endpoint_and_relation_bonuses_without_vectors(self):
+        edges = [
+            _edge("e0", "python", "LIKES"),
+            _edge("e1", "rust", "PREFERS"),
+            _edge("e2", "python", "DISLIKES"),
+            _edge("e3", "go", "PREFERS"),
+        ]
+
+        pairs = rank_dissonance_candidates(edges, {}, CONTEXT, limit=2)
+
+        assert pairs == [(0, 2), (1, 3)]
+
+    def test_limit_and_tie_order(self):
+        edges = [_edge(f"e{i}", f"n{i}") for i in range(6)]
+
+        pairs = rank_dissonance_candidates(edges, {}, CONTEXT, limit=4)
+
+        # Equal scores keep the (i, j) order of the modified_at DESC edge list
+        assert pairs == [(0, 1), (0, 2), (0, 3), (0, 4)]
+        assert rank_dissonance_candidates(edges[:1], {}, CONTEXT) == []
+
+
+class TestEngineRanking:
+    def test_embedding_failure_falls_back_to_heuristics(self):
+        engine = DissonanceEngine(haiku_client=MagicMock(), project_id="io")
+        engine._fetch_endpoint_vectors = MagicMock(side_effect=RuntimeError("column does not exist"))
+        edges = [_edge("e0", "a", "LIKES"), _edge("e1", "b"), _edge("e2", "a", "AVOIDS")]
+
+        assert engine._rank_candidate_pairs(edges, CONTEXT)[0] == (0, 2)
+
+        engine._fetch_endpoint_vectors.assert_called_once_with(["a", "b"])
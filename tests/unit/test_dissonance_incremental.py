@@ -0,0 +1,167 @@
+"""
+Unit tests for incremental dissonance checks (Migration 057).
+
+scope="recent" only pairs edges created or modified since the context
+node's watermark against the existing set; the watermark only advances
+past pairs a check actually processed.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+from mcp_server.analysis import dissonance
+from mcp_server.analysis.dissonance import (
+    DissonanceEngine,
+    DissonanceResult,
+    DissonanceType,
+    _changed_edge_indices,
+    rank_dissonance_candidates,
+)
+from mcp_server.utils.rate_limiter import AsyncRateLimiter
+
+CONTEXT = "00000000-0000-0000-0000-0000000000cc"
+WATERMARK = datetime(2026, 3, 1, tzinfo=timezone.utc)
+OLD = WATERMARK - timedelta(days=2)
+NEW = WATERMARK + timedelta(hours=1)
+
+
+def _edges(*stamps):
+    return [
+        {"id": f"edge-{i}", "source_id": CONTEXT, "target_id": f"n{i}", "relation": "TEST",
+         "created_at": OLD, "modified_at": modified_at}
+        for i, modified_at in enumerate(stamps)
+    ]
+
+
+def _engine(edges, watermark):
+    analyzed = []
+
+    async def analyze(edge_a, edge_b):
+        analyzed.append((edge_a["id"], edge_b["id"]))
+        return DissonanceResult(
+            edge_a_id=edge_a["id"], edge_b_id=edge_b["id"], dissonance_type=DissonanceType.NONE,
+            confidence_score=0.9, description="", context={"reasoning": ""},
+        )
+
+    engine = DissonanceEngine(haiku_client=MagicMock(), project_id="io")
+    engine._analyze_dissonance_pair = analyze
+    engine._fetch_edges = MagicMock(return_value=edges)
+    engine._fetch_endpoint_vectors = MagicMock(return_value={})
+    engine._load_cached_verdicts = MagicMock(return_value={})
+    engine._store_verdicts = MagicMock()
+    engine._load_watermark = MagicMock(return_value=watermark)
+    engine._store_watermark = MagicMock()
+    return engine, analyzed
+
+
+@contextmanager
+def _fast_pool():
+    with patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)), \
+         patch.object(dissonance, "DISSONANCE_BATCH_SIZE", 1):
+        yield
+
+
+class TestChangedEdges:
+    def test_created_or_modified_after_watermark(self):
+        edges = _edges(OLD, NEW, None)
+        edges[2]["created_at"] = NEW
+        edges.append({"id": "edge-x"})
+
+        assert _changed_edge_indices(edges, WATERMARK) == {1, 2, 3}
+
+    def test_ranking_keeps_only_pairs_with_a_changed_edge(self):
+        edges = _edges(OLD, OLD, NEW, OLD)
+
+        pairs = rank_dissonance_candidates(edges, {}, CONTEXT, limit=10, changed={2})
+
+        assert sorted(pairs) == [(0, 2), (1, 2), (2, 3)]
+
+
+class TestIncrementalCheck:
+    async def test_recent_check_pairs_changed_edges_only(self):
+        edges = _edges(NEW, OLD, OLD, OLD)
+        engine, analyzed = _engine(edges, WATERMARK)
+
+        with _fast_pool():
+            result = await engine.dissonance_check(CONTEXT, scope="recent")
+
+        assert sorted(analyzed) == [("edge-0", "edge-1"), ("edge-0", "edge-2"), ("edge-0", "edge-3")]
+        assert result.incremental is True
+        assert (result.changed_edges, result.pairs_total) == (1, 3)
+        (node_id, checked_at), _ = engine._store_watermark.call_args
+        assert node_id == CONTEXT
+        assert datetime.now(timezone.utc) - checked_at < timedelta(minutes=1)
+
+    async def test_no_changes_means_no_haiku_calls(self):
+        engine, analyzed = _engine(_edges(OLD, OLD, OLD), WATERMARK)
+
+        with _fast_pool():
+            result = await engine.dissonance_check(CONTEXT, scope="recent")
+
+        assert analyzed == [] and result.api_calls == 0
+        engine._store_watermark.assert_called_once()
+
+    async def test_full_scope_ignores_watermark(self):
+        engine, analyzed = _engine(_edges(NEW, OLD, OLD), WATERMARK)
+
+        with _fast_pool():
+            result = await engine.dissonance_check(CONTEXT, scope="full")
+
+        engine._load_watermark.assert_not_called()
+        assert len(analyzed) == 3 and result.incremental is False
+
+    async def test_truncated_check_keeps_unprocessed_edges_changed(self):
+        engine, _ = _engine(_edges(NEW, OLD, OLD), WATERMARK)
+
+        with _fast_pool(), patch.object(dissonance, "DISSONANCE_TIME_BUDGET", 0):
+            result = await engine.dissonance_check(CONTEXT, scope="recent")
+
+        assert result.pairs_analyzed == 0 and result.pairs_total == 2
+        # Still stored: nothing was processed, so the edge stays changed
+        (_, checked_at), _ = engine._store_watermark.call_args
+        assert checked_at < NEW
+
+    async def test_pairs_cut_by_max_candidates_stay_eligible(self):
+        edges = _edges(NEW + timedelta(hours=3), NEW + timedelta(hours=2), NEW + timedelta(hours=1), OLD)
+        engine, analyzed = _engine(edges, WATERMARK)
+
+        with _fast_pool(), patch.object(dissonance, "DISSONANCE_MAX_CANDIDATES", 2):
+            await engine.dissonance_check(CONTEXT, scope="recent")
+
+        assert analyzed == [("edge-0", "edge-1"), ("edge-0", "edge-2")]
+        (_, checked_at), _ = engine._store_watermark.call_args
+        assert checked_at == NEW + timedelta(hours=1) - timedelta(microseconds=1)
+        assert _changed_edge_indices(edges, checked_at) == {0, 1, 2}
+
+    async def test_repeated_checks_work_through_all_pairs_once(self):
+        # 20 edges = 190 eligible pairs, 50 per check; the verdict cache keeps
+        # processed pairs from taking the slots of later ones
+        edges = _edges(*(NEW + timedelta(minutes=i) for i in range(20)))
+        engine, analyzed = _engine(edges, WATERMARK)
+        verdicts = {}
+        watermark = [WATERMARK]
+
+        def load_cached(edges, pairs, prompt_version):
+            return {
+                (i, j): verdicts[(edges[i]["id"], edges[j]["id"])]
+                for i, j in pairs if (edges[i]["id"], edges[j]["id"]) in verdicts
+            }
+
+        def store(fresh, prompt_version):
+            verdicts.update({(a["id"], b["id"]): result for a, b, result in fresh})
+
+        engine._load_cached_verdicts = load_cached
+        engine._store_verdicts = store
+        engine._load_watermark = lambda context_node_id: watermark[0]
+        engine._store_watermark = lambda context_node_id, checked_at: watermark.__setitem__(0, checked_at)
+
+        with _fast_pool():
+            results = [await engine.dissonance_check(CONTEXT, scope="recent") for _ in range(5)]
+
+        assert [result.api_calls for result in results] == [50, 50, 50, 40, 0]
+        assert len(analyzed) == len(set(analyzed)) == 190
+        assert results[4].changed_edges == 0
+        assert watermark[0] > edges[19]["modified_at"]
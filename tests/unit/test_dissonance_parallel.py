@@ -0,0 +1,177 @@
+"""
+Unit tests for concurrent dissonance pair analysis (DissonanceEngine._analyze_pairs)
+and the shared request rate limiter.
+
+Pairs run through a bounded worker pool under one process-wide rate limit;
+the pair budget is wall-clock time instead of a fixed pair count.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from itertools import combinations
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server.analysis import dissonance
+from mcp_server.analysis.dissonance import (
+    DissonanceEngine,
+    DissonanceResult,
+    DissonanceType,
+)
+from mcp_server.utils.rate_limiter import AsyncRateLimiter
+
+
+def _edges(count):
+    return [{"id": f"edge-{i}", "relation": "TEST"} for i in range(count)]
+
+
+def _pairs(count):
+    return list(combinations(range(count), 2))
+
+
+def _none_result(edge_a, edge_b):
+    return DissonanceResult(
+        edge_a_id=edge_a["id"],
+        edge_b_id=edge_b["id"],
+        dissonance_type=DissonanceType.NONE,
+        confidence_score=0.0,
+        description="",
+        context={},
+    )
+
+
+@pytest.fixture(autouse=True)
+def single_pair_calls(monkeypatch):
+    # Batching is covered in test_dissonance_batching.py
+    monkeypatch.setattr(dissonance, "DISSONANCE_BATCH_SIZE", 1)
+
+
+def _engine(analyze):
+    engine = DissonanceEngine(haiku_client=MagicMock(), project_id="io")
+    engine._analyze_dissonance_pair = analyze
+    return engine
+
+
+class TestAsyncRateLimiter:
+    def test_burst_then_spaced_reservations(self):
+        limiter = AsyncRateLimiter(requests_per_minute=60, burst=3)
+
+        delays = [limiter.reserve() for _ in range(5)]
+
+        assert delays[:3] == [0.0, 0.0, 0.0]
+        assert delays[3] == pytest.approx(1.0, abs=0.05)
+        assert delays[4] == pytest.approx(2.0, abs=0.05)
+
+    def test_slot_past_max_delay_is_not_reserved(self):
+        limiter = AsyncRateLimiter(requests_per_minute=60, burst=1)
+        limiter.reserve()
+
+        assert limiter.reserve(max_delay=0.5) is None
+        assert limiter.reserve(max_delay=5) == pytest.approx(1.0, abs=0.05)
+
+    def test_invalid_settings_rejected(self):
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(requests_per_minute=0)
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(requests_per_minute=60, burst=0)
+
+
+class TestAnalyzePairs:
+    async def test_pairs_run_concurrently_and_return_in_pair_order(self):
+        running = 0
+        peak = 0
+
+        async def analyze(edge_a, edge_b):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return _none_result(edge_a, edge_b)
+
+        with patch.object(dissonance, "DISSONANCE_MAX_CONCURRENCY", 3), \
+             patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            analyzed, api_calls = await _engine(analyze)._analyze_pairs(_edges(5), _pairs(5))
+
+        assert peak == 3
+        assert [(a["id"], b["id"]) for a, b, _ in analyzed][:3] == [
+            ("edge-0", "edge-1"), ("edge-0", "edge-2"), ("edge-0", "edge-3"),
+        ]
+        assert len(analyzed) == api_calls == 10
+
+    async def test_no_pair_starts_after_time_budget(self):
+        async def analyze(edge_a, edge_b):
+            await asyncio.sleep(0.05)
+            return _none_result(edge_a, edge_b)
+
+        with patch.object(dissonance, "DISSONANCE_MAX_CONCURRENCY", 2), \
+             patch.object(dissonance, "DISSONANCE_TIME_BUDGET", 0.12), \
+             patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            analyzed, _ = await _engine(analyze)._analyze_pairs(_edges(10), _pairs(10))
+
+        # 2 workers x 3 rounds of 50ms start within 120ms
+        assert 2 <= len(analyzed) <= 6
+
+    async def test_exhausted_budget_reserves_no_rate_limit_slot(self):
+        limiter = MagicMock(wraps=AsyncRateLimiter(60000, burst=100))
+
+        async def analyze(edge_a, edge_b):
+            return _none_result(edge_a, edge_b)
+
+        with patch.object(dissonance, "DISSONANCE_TIME_BUDGET", 0), \
+             patch.object(dissonance, "_rate_limiter", limiter):
+            analyzed, api_calls = await _engine(analyze)._analyze_pairs(_edges(3), _pairs(3))
+
+        assert analyzed == [] and api_calls == 0
+        limiter.reserve.assert_not_called()
+
+    async def test_in_flight_calls_cancelled_after_grace(self):
+        async def analyze(edge_a, edge_b):
+            await asyncio.sleep(10)
+
+        with patch.object(dissonance, "DISSONANCE_TIME_BUDGET", 0.01), \
+             patch.object(dissonance, "DISSONANCE_IN_FLIGHT_GRACE", 0.05), \
+             patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            analyzed, _ = await asyncio.wait_for(_engine(analyze)._analyze_pairs(_edges(3), _pairs(3)), 1)
+
+        assert analyzed == []
+
+    async def test_api_error_stops_pool_and_propagates(self):
+        calls = 0
+
+        async def analyze(edge_a, edge_b):
+            nonlocal calls
+            calls += 1
+            if edge_b["id"] == "edge-2":
+                raise Exception("Haiku API unavailable")
+            if edge_a["id"] == "edge-0" and edge_b["id"] == "edge-1":
+                raise ValueError("bad edge")
+            await asyncio.sleep(0.01)
+            return _none_result(edge_a, edge_b)
+
+        with patch.object(dissonance, "DISSONANCE_MAX_CONCURRENCY", 2), \
+             patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            with pytest.raises(Exception, match="Haiku API"):
+                await _engine(analyze)._analyze_pairs(_edges(20), _pairs(20))
+
+        assert calls < 190
+
+    async def test_check_reports_pair_coverage(self):
+        async def analyze(edge_a, edge_b):
+            return _none_result(edge_a, edge_b)
+
+        engine = _engine(analyze)
+        engine._fetch_edges = MagicMock(return_value=_edges(4))
+        engine._fetch_endpoint_vectors = MagicMock(return_value={})
+        engine._load_cached_verdicts = MagicMock(return_value={})
+        engine._store_verdicts = MagicMock()
+        engine._store_watermark = MagicMock()
+
+        with patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)):
+            result = await engine.dissonance_check(
+                "00000000-0000-0000-0000-000000000001", scope="full"
+            )
+
+        assert (result.pairs_analyzed, result.pairs_total, result.api_calls) == (6, 6, 6)
@@ -0,0 +1,148 @@
+"""
+Unit tests for the dissonance verdict cache (Migration 056).
+
+Verdicts are keyed by (edge_a id + version, edge_b id + version, prompt
+version) with version = COALESCE(modified_at, created_at); unchanged pairs
+skip the Haiku call and the hit rate is reported in DissonanceCheckResult.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from mcp_server.analysis import dissonance
+from mcp_server.analysis.dissonance import (
+    DissonanceEngine,
+    DissonanceResult,
+    DissonanceType,
+)
+from mcp_server.utils.rate_limiter import AsyncRateLimiter
+
+EDGE_IDS = [f"00000000-0000-0000-0000-00000000000{i}" for i in range(3)]
+
+
+def _edges():
+    return [
+        {"id": edge_id, "relation": "TEST", "project_id": "io", "modified_at": f"2026-01-0{i + 1}"}
+        for i, edge_id in enumerate(EDGE_IDS)
+    ]
+
+
+def _result(edge_a, edge_b, dissonance_type=DissonanceType.NONE, **context):
+    return DissonanceResult(
+        edge_a_id=edge_a["id"],
+        edge_b_id=edge_b["id"],
+        dissonance_type=dissonance_type,
+        confidence_score=0.9,
+        description="verdict",
+        context={"reasoning": "because", **context},
+    )
+
+
+def _connection(cursor):
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @contextmanager
+    def connection(*args, **kwargs):
+        yield conn
+
+    return connection
+
+
+class TestVerdictCache:
+    def test_load_matches_edge_versions(self):
+        engine = DissonanceEngine(haiku_client=MagicMock(model="haiku"), project_id="io")
+        edges = _edges()
+        cursor = MagicMock()
+        cursor.fetchall.return_value = [{
+            "edge_a_id": EDGE_IDS[0], "edge_b_id": EDGE_IDS[2], "dissonance_type": "nuance",
+            "confidence_score": 0.7, "description": "cached", "reasoning": "r",
+        }]
+
+        with patch.object(dissonance, "get_connection_with_project_context_sync", _connection(cursor)):
+            cached = engine._load_cached_verdicts(edges, [(0, 1), (0, 2)], "v1")
+
+        params = cursor.execute.call_args.args[1]
+        assert params[1] == [EDGE_IDS[0], EDGE_IDS[0]]
+        assert params[3] == ["2026-01-01", "2026-01-01"]
+        assert params[4] == ["2026-01-02", "2026-01-03"]
+        assert params[5] == "v1"
+        assert list(cached) == [(0, 2)]
+        assert cached[(0, 2)].dissonance_type == DissonanceType.NUANCE
+        assert cached[(0, 2)].context["cached"] is True
+
+    def test_created_at_versions_edges_without_modified_at(self):
+        engine = DissonanceEngine(haiku_client=MagicMock(model="haiku"), project_id="io")
+        edges = _edges()
+        edges[1] = {**edges[1], "modified_at": None, "created_at": "2025-12-24"}
+        edges[2] = {**edges[2], "modified_at": None}
+        cursor = MagicMock()
+        cursor.fetchall.return_value = []
+
+        with patch.object(dissonance, "get_connection_with_project_context_sync", _connection(cursor)):
+            engine._load_cached_verdicts(edges, [(0, 1), (0, 2)], "v1")
+
+        # (0, 2) has no version at all and is never looked up
+        params = cursor.execute.call_args.args[1]
+        assert params[2] == [EDGE_IDS[1]]
+        assert params[4] == ["2025-12-24"]
+        assert "IS NOT DISTINCT FROM" not in cursor.execute.call_args.args[0]
+
+    def test_store_skips_failed_and_foreign_pairs(self):
+        engine = DissonanceEngine(haiku_client=MagicMock(), project_id="io")
+        edges = _edges()
+        foreign = {**edges[2], "project_id": "aa"}
+        unversioned = {**edges[1], "modified_at": None}
+
+        with patch.object(dissonance, "get_connection_with_project_context_sync", _connection(MagicMock())), \
+             patch.object(dissonance, "execute_values") as ev:
+            engine._store_verdicts([
+                (edges[0], edges[1], _result(edges[0], edges[1], DissonanceType.EVOLUTION)),
+                (edges[0], edges[2], _result(edges[0], edges[2], error="timeout")),
+                (edges[1], foreign, _result(edges[1], foreign)),
+                (edges[0], unversioned, _result(edges[0], unversioned)),
+            ], "v1")
+
+        (row,) = ev.call_args.args[2]
+        assert row[:7] == ("io", EDGE_IDS[0], EDGE_IDS[1], "v1", "2026-01-01", "2026-01-02", "evolution")
+        assert "ON CONFLICT (project_id, edge_a_id, edge_b_id, prompt_version) DO UPDATE" in ev.call_args.args[1]
+
+    def test_prompt_version_depends_on_model(self):
+        a = DissonanceEngine(haiku_client=MagicMock(model="haiku-a"))
+        b = DissonanceEngine(haiku_client=MagicMock(model="haiku-b"))
+
+        assert a._prompt_version() != b._prompt_version()
+        assert len(a._prompt_version()) == 16
+
+
+class TestCheckWithCache:
+    async def test_only_misses_reach_haiku_and_hits_are_reported(self):
+        edges = _edges()
+        analyzed_pairs = []
+
+        async def analyze(edge_a, edge_b):
+            analyzed_pairs.append((edge_a["id"], edge_b["id"]))
+            return _result(edge_a, edge_b)
+
+        engine = DissonanceEngine(haiku_client=MagicMock(), project_id="io")
+        engine._analyze_dissonance_pair = analyze
+        engine._fetch_edges = MagicMock(return_value=edges)
+        engine._fetch_endpoint_vectors = MagicMock(return_value={})
+        engine._load_cached_verdicts = MagicMock(return_value={
+            (0, 1): _result(edges[0], edges[1]),
+            (0, 2): _result(edges[0], edges[2]),
+        })
+        engine._store_verdicts = MagicMock()
+        engine._store_watermark = MagicMock()
+
+        with patch.object(dissonance, "_rate_limiter", AsyncRateLimiter(60000, burst=100)), \
+             patch.object(dissonance, "DISSONANCE_BATCH_SIZE", 1):
+            result = await engine.dissonance_check(EDGE_IDS[0], scope="full")
+
+        assert analyzed_pairs == [(EDGE_IDS[1], EDGE_IDS[2])]
+        (stored, _), _ = engine._store_verdicts.call_args
+        assert [(a["id"], b["id"]) for a, b, _ in stored] == analyzed_pairs
+        assert (result.cache_hits, result.cache_misses, result.api_calls) == (2, 1, 1)
+        assert result.pairs_analyzed == 3
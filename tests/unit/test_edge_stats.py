@@ -0,0 +1,124 @@
+"""
+Unit tests for the write-behind edge access stats aggregator (edge_stats.py).
+
+Reads only buffer (project_id, edge_id) counts; flush_edge_stats() writes
+them with one bulk UPDATE per project and requeues a failed project.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+from mcp_server.db import edge_stats, graph
+from mcp_server.db.edge_stats import (
+    EdgeStatsAggregator,
+    apply_edge_stats,
+    flush_edge_stats,
+    record_edge_access,
+)
+
+EDGE_A = "00000000-0000-0000-0000-00000000000a"
+EDGE_B = "00000000-0000-0000-0000-00000000000b"
+
+
+class TestEdgeStatsAggregator:
+    def test_counts_are_aggregated_per_project_and_edge(self):
+        aggregator = EdgeStatsAggregator()
+
+        aggregator.record([EDGE_A, EDGE_B], "io")
+        aggregator.record([EDGE_A, "not-a-uuid"], "io")
+        aggregator.record([EDGE_A], "aa", engaged=True)
+
+        drained = aggregator.drain()
+        hits = {p: {row[0]: row[1] for row in rows} for p, rows in drained.items()}
+        assert hits == {"io": {EDGE_A: 2, EDGE_B: 1}, "aa": {EDGE_A: 1}}
+        assert drained["io"][0][3] is None
+        assert drained["aa"][0][3] is not None
+        assert aggregator.get_stats()["pending"] == 0
+
+    def test_full_buffer_wakes_flusher_and_drops_new_edges(self):
+        aggregator = EdgeStatsAggregator(max_pending=2)
+
+        assert aggregator.record([EDGE_A], "io") is True
+        aggregator.record([EDGE_B], "io")
+        aggregator.record(["00000000-0000-0000-0000-00000000000c", EDGE_A], "io")
+
+        stats = aggregator.get_stats()
+        assert stats["pending"] == 2 and stats["dropped"] == 1
+        assert {row[0]: row[1] for row in aggregator.drain()["io"]}[EDGE_A] == 2
+
+    def test_requeue_merges_with_newer_events(self):
+        aggregator = EdgeStatsAggregator()
+        aggregator.record([EDGE_A], "io")
+        rows = aggregator.drain()["io"]
+
+        aggregator.record([EDGE_A], "io", engaged=True)
+        aggregator.requeue("io", rows)
+
+        (edge_id, hits, _, engaged_at), = aggregator.drain()["io"]
+        assert (edge_id, hits) == (EDGE_A, 2) and engaged_at is not None
+
+
+class TestFlush:
+    def test_apply_is_one_bulk_update(self):
+        conn = MagicMock()
+        rows = [(EDGE_A, 3, "t1", None)]
+
+        with patch.object(edge_stats, "execute_values") as ev:
+            apply_edge_stats(conn, rows)
+
+        sql = ev.call_args.args[1]
+        assert "UPDATE edges AS e" in sql and "FROM (VALUES %s)" in sql
+        assert "last_engaged = GREATEST(e.last_engaged, v.engaged_at)" in sql
+        assert ev.call_args.kwargs["page_size"] == 1
+        conn.commit.assert_called_once()
+
+    async def test_flush_per_project_and_requeue_on_failure(self):
+        aggregator = EdgeStatsAggregator()
+        aggregator.record([EDGE_A], "io")
+        aggregator.record([EDGE_B], "aa")
+        contexts: list[str] = []
+
+        @asynccontextmanager
+        async def connection(*args, **kwargs):
+            yield MagicMock()
+
+        async def run(func, conn, rows):
+            if contexts[-1] == "aa":
+                raise RuntimeError("connection lost")
+            return len(rows)
+
+        with patch.object(edge_stats, "_aggregator_instance", aggregator), \
+             patch.object(edge_stats, "get_connection_with_project_context", connection), \
+             patch.object(edge_stats, "run_in_db_executor", run), \
+             patch.object(edge_stats, "set_project_id", side_effect=contexts.append):
+            assert await flush_edge_stats() == 1
+
+        assert contexts == ["io", "aa"]
+        assert list(aggregator.drain()) == ["aa"]
+        assert aggregator.get_stats()["flushed"] == 1
+
+
+class TestReadPathRecording:
+    async def test_access_helper_buffers_instead_of_writing(self):
+        aggregator = EdgeStatsAggregator()
+        conn = MagicMock()
+
+        with patch.object(edge_stats, "_aggregator_instance", aggregator), \
+             patch.object(edge_stats, "get_current_project", return_value="io"):
+            await graph._update_edge_access_stats([EDGE_A], conn)
+            await graph._update_edge_engagement([EDGE_A], conn)
+
+        conn.cursor.assert_not_called()
+        (edge_id, hits, _, engaged_at), = aggregator.drain()["io"]
+        assert (edge_id, hits) == (EDGE_A, 2) and engaged_at is not None
+
+    def test_access_recording_can_be_disabled(self, monkeypatch):
+        aggregator = EdgeStatsAggregator()
+        monkeypatch.setenv("EDGE_ACCESS_STATS", "false")
+
+        with patch.object(edge_stats, "_aggregator_instance", aggregator):
+            record_edge_access([EDGE_A])
+
+        assert aggregator.get_stats()["pending"] == 0
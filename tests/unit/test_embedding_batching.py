@@ -0,0 +1,114 @@
+"""
+Unit tests for the shared embeddings client's coalescing and micro-batching.
+
+Concurrent embed() calls must share API requests: identical texts are
+deduplicated and distinct texts within the batch window go out together.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.external.openai_client import OpenAIEmbeddingsClient
+
+
+def _response(texts: list[str]) -> MagicMock:
+    """Fake embeddings response; items come back out of order like the real API may."""
+    items = [MagicMock(index=i, embedding=[float(len(t))]) for i, t in enumerate(texts)]
+    return MagicMock(data=list(reversed(items)), usage=MagicMock(total_tokens=len(texts)))
+
+
+@pytest.fixture
+def api():
+    async def create(model, input, encoding_format):
+        return _response(input)
+
+    client = MagicMock()
+    client.embeddings.create = AsyncMock(side_effect=create)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def no_cost_log():
+    with patch("mcp_server.external.openai_client.calculate_api_cost", return_value=0.0), \
+         patch("mcp_server.external.openai_client.insert_cost_log"):
+        yield
+
+
+class TestMicroBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_texts_share_one_call(self, api):
+        client = OpenAIEmbeddingsClient(client=api, batch_window_ms=5, max_batch_size=64)
+
+        results = await asyncio.gather(*(client.embed("x" * n) for n in (1, 2, 3)))
+
+        assert results == [[1.0], [2.0], [3.0]]
+        api.embeddings.create.assert_awaited_once()
+        assert api.embeddings.create.call_args.kwargs["input"] == ["x", "xx", "xxx"]
+        assert client.get_stats()["avg_batch_size"] == 3
+
+    @pytest.mark.asyncio
+    async def test_full_batch_flushes_without_waiting(self, api):
+        client = OpenAIEmbeddingsClient(client=api, batch_window_ms=10_000, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(client.embed("a"), client.embed("bb")), timeout=1.0
+        )
+
+        assert results == [[1.0], [2.0]]
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_are_coalesced(self, api):
+        client = OpenAIEmbeddingsClient(client=api, batch_window_ms=5)
+
+        first, second = await asyncio.gather(client.embed("same"), client.embed("same"))
+
+        assert first == second == [4.0]
+        assert api.embeddings.create.call_args.kwargs["input"] == ["same"]
+        assert client.get_stats()["coalesced"] == 1
+
+
+class TestFailures:
+    @pytest.mark.asyncio
+    async def test_batch_error_reaches_every_waiter(self, api):
+        api.embeddings.create = AsyncMock(side_effect=ValueError("invalid input"))
+        client = OpenAIEmbeddingsClient(client=api, batch_window_ms=5)
+
+        results = await asyncio.gather(
+            client.embed("a"), client.embed("b"), return_exceptions=True
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+        assert client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_rejected_batch_only_fails_the_offending_text(self, api):
+        async def create(model, input, encoding_format):
+            if "bad" in input:
+                raise ValueError("Error code: 400 - input too long")
+            return _response(input)
+
+        api.embeddings.create = AsyncMock(side_effect=create)
+        client = OpenAIEmbeddingsClient(client=api, batch_window_ms=5)
+
+        results = await asyncio.gather(
+            client.embed("a"), client.embed("bad"), client.embed("ccc"), return_exceptions=True
+        )
+
+        assert results[0] == [1.0] and results[2] == [3.0]
+        assert isinstance(results[1], ValueError)
+        assert api.embeddings.create.await_count == 4
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self, api):
+        client = OpenAIEmbeddingsClient(client=api, batch_window_ms=5)
+
+        impatient = asyncio.ensure_future(client.embed("shared"))
+        patient = asyncio.ensure_future(client.embed("shared"))
+        await asyncio.sleep(0)
+        impatient.cancel()
+
+        assert await patient == [6.0]
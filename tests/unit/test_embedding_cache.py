@@ -0,0 +1,124 @@
+"""
+Unit tests for the two-tier query-embedding cache.
+
+Repeated query texts must be answered from the in-process LRU or the
+Postgres tier without calling the embeddings API.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.external.embedding_cache import (
+    EmbeddingCache,
+    embedding_cache_key,
+    get_embedding_cache,
+)
+from mcp_server.tools import generate_query_embedding
+
+
+def _fake_connection(row: dict | None = None):
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value = cursor
+    cursor.fetchone.return_value = row
+
+    @contextmanager
+    def _ctx():
+        yield conn
+
+    return _ctx, cursor
+
+
+class TestEmbeddingCacheKey:
+    def test_whitespace_normalized(self):
+        assert embedding_cache_key("  hello \n world ") == embedding_cache_key("hello world")
+
+    def test_case_and_model_distinguish(self):
+        assert embedding_cache_key("Hello") != embedding_cache_key("hello")
+        assert embedding_cache_key("x", "model-a") != embedding_cache_key("x", "model-b")
+
+
+class TestLruTier:
+    def test_hit_after_put(self):
+        cache = EmbeddingCache(max_entries=4, persistent=False)
+        assert cache.get("query") is None
+        cache.put("query", [0.1, 0.2])
+
+        assert cache.get("query ") == [0.1, 0.2]
+        stats = cache.get_stats()
+        assert stats["lru_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == pytest.approx(0.5)
+
+    def test_evicts_least_recently_used(self):
+        cache = EmbeddingCache(max_entries=2, persistent=False)
+        cache.put("a", [1.0])
+        cache.put("b", [2.0])
+        cache.get("a")
+        cache.put("c", [3.0])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0]
+        assert cache.get_stats()["lru_size"] == 2
+
+
+class TestPersistentTier:
+    def test_persistent_hit_is_promoted(self):
+        ctx, cursor = _fake_connection({"embedding": [0.5, 0.5]})
+        cache = EmbeddingCache(max_entries=4, persistent=True)
+
+        with patch("mcp_server.external.embedding_cache.get_connection_sync", ctx):
+            assert cache.get("daily query") == [0.5, 0.5]
+            assert cache.get("daily query") == [0.5, 0.5]
+
+        cursor.execute.assert_called_once()
+        model, text_hash = embedding_cache_key("daily query")
+        assert cursor.execute.call_args.args[1] == (model, text_hash)
+        stats = cache.get_stats()
+        assert stats["persistent_hits"] == 1
+        assert stats["lru_hits"] == 1
+
+    def test_database_error_is_a_miss(self):
+        cache = EmbeddingCache(max_entries=4, persistent=True)
+
+        with patch(
+            "mcp_server.external.embedding_cache.get_connection_sync",
+            side_effect=RuntimeError("pool not initialized"),
+        ):
+            assert cache.get("query") is None
+            cache.put("query", [0.1])
+
+        stats = cache.get_stats()
+        assert stats["misses"] == 1
+        assert stats["persistent_errors"] == 2
+        assert cache.get("query") == [0.1]
+
+    @pytest.mark.asyncio
+    async def test_async_lru_hit_skips_executor(self):
+        cache = EmbeddingCache(max_entries=4, persistent=True)
+        cache._lru_put(embedding_cache_key("query"), [0.3])
+
+        with patch("mcp_server.external.embedding_cache.run_in_db_executor") as executor:
+            assert await cache.aget("query") == [0.3]
+        executor.assert_not_called()
+
+
+class TestGenerateQueryEmbedding:
+    @pytest.mark.asyncio
+    async def test_repeated_query_calls_api_once(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("EMBEDDING_CACHE_PERSISTENT", "false")
+        client = MagicMock()
+        client.embed = AsyncMock(return_value=[0.1] * 1536)
+
+        with patch("mcp_server.tools.get_embeddings_client", AsyncMock(return_value=client)):
+            first = await generate_query_embedding("what did we decide?")
+            second = await generate_query_embedding("what did  we decide?")
+
+        assert first == second == [0.1] * 1536
+        client.embed.assert_awaited_once()
+        assert get_embedding_cache().get_stats()["lru_hits"] == 1
@@ -0,0 +1,186 @@
+"""
+Unit tests for the write-behind embedding pipeline (Migration 052).
+
+Rows stored with async_embedding=true skip the embeddings API, are inserted
+with embedding_status 'pending', and are filled later by the worker.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.db.pending_embeddings import store_embeddings
+from mcp_server.external import embedding_worker
+from mcp_server.tools import add_episode, handle_store_episode
+from mcp_server.tools.get_embedding_status import handle_get_embedding_status
+
+
+def _fake_connection():
+    conn = MagicMock()
+    cursor = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @asynccontextmanager
+    async def _ctx(*args, **kwargs):
+        yield conn
+
+    return _ctx, conn, cursor
+
+
+async def _run_inline(func, *args):
+    return func(*args)
+
+
+class TestAsyncIngest:
+    @pytest.mark.asyncio
+    async def test_add_episode_async_skips_embedding(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        _, conn, cursor = _fake_connection()
+        cursor.fetchone.return_value = {"id": 7, "created_at": MagicMock(isoformat=lambda: "t")}
+
+        with patch("mcp_server.tools.register_vector"), \
+             patch("mcp_server.tools.get_embedding_with_retry") as embed, \
+             patch("mcp_server.tools.notify_pending_embeddings") as notify:
+            result = await add_episode(
+                "query", 0.5, "reflection", conn, "proj", async_embedding=True
+            )
+
+        embed.assert_not_called()
+        notify.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert "embedding_status" in sql
+        assert params[3] is None
+        assert params[-1] == "pending"
+        assert result["embedding_status"] == "pending"
+
+    @pytest.mark.asyncio
+    async def test_store_episode_embeds_before_taking_connection(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        events: list[str] = []
+        ctx, conn, cursor = _fake_connection()
+        cursor.fetchone.return_value = {"id": 1, "created_at": MagicMock(isoformat=lambda: "t")}
+
+        @asynccontextmanager
+        async def tracking_ctx(*args, **kwargs):
+            events.append("connection")
+            async with ctx() as c:
+                yield c
+
+        async def fake_embed(client, text):
+            events.append("embed")
+            return [0.1] * 1536
+
+        with patch("mcp_server.tools.get_connection_with_project_context", tracking_ctx), \
+             patch("mcp_server.tools.get_embeddings_client", AsyncMock()), \
+             patch("mcp_server.tools.get_embedding_with_retry", side_effect=fake_embed), \
+             patch("mcp_server.tools.register_vector"):
+            result = await handle_store_episode(
+                {"query": "q", "reward": 0.5, "reflection": "r"}
+            )
+
+        assert events == ["embed", "connection"]
+        assert result["embedding_status"] == "success"
+
+    @pytest.mark.asyncio
+    async def test_store_episode_rejects_non_boolean_flag(self):
+        result = await handle_store_episode(
+            {"query": "q", "reward": 0.5, "reflection": "r", "async_embedding": "yes"}
+        )
+        assert result["error"] == "Invalid async_embedding parameter"
+
+
+class TestEmbeddingWorker:
+    @pytest.mark.asyncio
+    async def test_cycle_embeds_batch_and_stores_per_project(self):
+        ctx, _, _ = _fake_connection()
+        pending = {
+            "l2_insights": [
+                {"id": 1, "project_id": "a", "text": "one"},
+                {"id": 2, "project_id": "b", "text": "two"},
+            ],
+            "episode_memory": [],
+            "nodes": [],
+        }
+        client = MagicMock()
+        client.create_embeddings = AsyncMock(return_value=[[1.0], [2.0]])
+        stored_calls: list[tuple] = []
+
+        async def executor(func, conn, table, *args):
+            if func is embedding_worker.fetch_pending_embeddings:
+                return pending[table]
+            stored_calls.append((table, args[0]))
+            return len(args[0])
+
+        with patch.object(embedding_worker, "get_connection", ctx), \
+             patch.object(embedding_worker, "get_connection_with_project_context", ctx), \
+             patch.object(embedding_worker, "run_in_db_executor", side_effect=executor), \
+             patch.object(embedding_worker, "get_embeddings_client", AsyncMock(return_value=client)), \
+             patch.object(embedding_worker, "set_project_id"):
+            stored = await embedding_worker.process_pending_embeddings(batch_size=10)
+
+        assert stored == 2
+        client.create_embeddings.assert_awaited_once_with(["one", "two"])
+        assert stored_calls == [
+            ("l2_insights", [(1, [1.0])]),
+            ("l2_insights", [(2, [2.0])]),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_records_attempts(self):
+        ctx, _, _ = _fake_connection()
+        client = MagicMock()
+        client.create_embeddings = AsyncMock(side_effect=RuntimeError("API down"))
+        failure_calls: list[tuple] = []
+
+        async def executor(func, conn, table, *args):
+            if func is embedding_worker.fetch_pending_embeddings:
+                return [{"id": 5, "project_id": "a", "text": "x"}] if table == "episode_memory" else []
+            failure_calls.append((func, table, *args))
+            return 0
+
+        with patch.object(embedding_worker, "get_connection", ctx), \
+             patch.object(embedding_worker, "get_connection_with_project_context", ctx), \
+             patch.object(embedding_worker, "run_in_db_executor", side_effect=executor), \
+             patch.object(embedding_worker, "get_embeddings_client", AsyncMock(return_value=client)), \
+             patch.object(embedding_worker, "set_project_id"):
+            stored = await embedding_worker.process_pending_embeddings(max_attempts=3)
+
+        assert stored == 0
+        assert failure_calls == [
+            (embedding_worker.record_embedding_failures, "episode_memory", [5], 3)
+        ]
+
+    def test_store_embeddings_rejects_unknown_table(self):
+        with pytest.raises(ValueError):
+            store_embeddings(MagicMock(), "users; DROP TABLE x", [(1, [0.1])])
+
+
+class TestGetEmbeddingStatus:
+    @pytest.mark.asyncio
+    async def test_reports_statuses_and_pending_counts(self):
+        ctx, _, _ = _fake_connection()
+
+        async def executor(func, conn, *args):
+            if func.__name__ == "get_embedding_statuses":
+                table, ids = args
+                return {1: "pending"} if table == "l2_insights" else {4: "success"}
+            return {"l2_insights": 1, "episode_memory": 0}
+
+        with patch("mcp_server.tools.get_embedding_status.get_connection_with_project_context", ctx), \
+             patch("mcp_server.tools.get_embedding_status.run_in_db_executor", side_effect=executor):
+            result = await handle_get_embedding_status(
+                {"insight_ids": [1, 2], "episode_ids": [4]}
+            )
+
+        assert result["insights"] == {"1": "pending", "2": "not_found"}
+        assert result["episodes"] == {"4": "success"}
+        assert result["pending"] == {"l2_insights": 1, "episode_memory": 0}
+        assert result["all_live"] is False
+
+    @pytest.mark.asyncio
+    async def test_rejects_non_integer_ids(self):
+        result = await handle_get_embedding_status({"insight_ids": ["1"]})
+        assert result["error"] == "Parameter validation failed"
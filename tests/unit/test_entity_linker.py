@@ -0,0 +1,165 @@
+"""
+Unit tests for the Aho-Corasick entity linker (mcp_server/db/entity_linker.py).
+
+EntityAutomaton.find_mentions() is checked against a brute-force scan and
+for the matching rules (case folding, multi-word names, compounds, longest
+match); the cache is checked for loading, invalidation and fallback.
+"""
+
+from __future__ import annotations
+
+import random
+from contextlib import asynccontextmanager
+from itertools import pairwise
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server.db import entity_linker
+from mcp_server.db.entity_linker import (
+    EntityAutomaton,
+    EntityLinkerCache,
+    get_entity_automaton,
+    link_entity_names,
+)
+
+
+def _rows(*names: str, project_id: str = "io") -> list[dict]:
+    return [
+        {"id": f"id-{i}", "project_id": project_id, "label": "Entity", "name": name}
+        for i, name in enumerate(names)
+    ]
+
+
+def _names(automaton: EntityAutomaton, text: str) -> list[str]:
+    return [m["name"] for m in automaton.find_mentions(text)]
+
+
+class TestEntityAutomaton:
+    def test_multi_word_lowercase_and_whitespace(self):
+        automaton = EntityAutomaton(_rows("Agentic Business", "Python"))
+
+        mentions = automaton.find_mentions("wie nutzt agentic\n  business PYTHON?")
+
+        assert [m["name"] for m in mentions] == ["Agentic Business", "Python"]
+        assert mentions[0]["text"] == "agentic\n  business"
+        assert mentions[1]["text"] == "PYTHON"
+
+    def test_german_compounds(self):
+        automaton = EntityAutomaton(_rows("Datenbank", "Migration", "Rust"))
+
+        assert _names(automaton, "Die Datenbankmigration lief") == ["Datenbank", "Migration"]
+        assert _names(automaton, "Trust und Rust") == ["Rust"]
+
+    def test_compound_requires_one_boundary(self):
+        automaton = EntityAutomaton(_rows("daten"))
+
+        assert _names(automaton, "Kundendatenbank") == []
+        assert _names(automaton, "Datenbank") == ["daten"]
+
+    def test_longest_match_wins(self):
+        automaton = EntityAutomaton(_rows("Business", "Agentic Business", "Agentic"))
+
+        assert _names(automaton, "Agentic Business heute, Business morgen") == [
+            "Agentic Business",
+            "Business",
+        ]
+
+    def test_punctuated_names(self):
+        automaton = EntityAutomaton(_rows("Next.js", "C++"))
+
+        assert _names(automaton, "Next.js oder C++?") == ["Next.js", "C++"]
+
+    def test_casefold_offsets(self):
+        automaton = EntityAutomaton(_rows("Straße"))
+
+        mentions = automaton.find_mentions("Die STRASSE ist lang")
+
+        assert [(m["start"], m["end"], m["text"]) for m in mentions] == [(4, 11, "STRASSE")]
+
+    def test_same_name_in_several_nodes(self):
+        automaton = EntityAutomaton(_rows("Python", "python"))
+
+        assert sorted(_names(automaton, "python")) == ["Python", "python"]
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_matches_brute_force_on_whole_words(self, seed):
+        rng = random.Random(seed)
+        vocabulary = ["ab", "abc", "bca", "cab", "b", "ca"]
+        names = sorted({" ".join(rng.choices(vocabulary, k=rng.randint(1, 2))) for _ in range(8)})
+        words = rng.choices(vocabulary, k=30)
+        text = " ".join(words)
+        automaton = EntityAutomaton(_rows(*names), min_compound_length=100)
+
+        found = {(m["start"], m["end"], m["name"]) for m in automaton.find_mentions(text)}
+
+        # Every whole-word occurrence is linked or overlaps a mention at least as long
+        for name in names:
+            parts = name.split()
+            for i in range(len(words) - len(parts) + 1):
+                if words[i:i + len(parts)] == parts:
+                    start = len(" ".join(words[:i])) + (1 if i else 0)
+                    end = start + len(name)
+                    assert (start, end, name) in found or any(
+                        s < end and start < e and e - s >= end - start for s, e, _ in found
+                    )
+        # Linked mentions never overlap
+        spans = sorted((s, e) for s, e, _ in found)
+        assert all(a[1] <= b[0] for a, b in pairwise(spans))
+
+
+class TestEntityLinkerCache:
+    def _connection(self, rows):
+        cursor = MagicMock()
+        cursor.fetchall.return_value = rows
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+
+        @asynccontextmanager
+        async def connection(*args, **kwargs):
+            yield conn
+
+        return connection, cursor
+
+    async def test_loads_once_until_invalidated(self):
+        connection, cursor = self._connection(_rows("Python"))
+        cache = EntityLinkerCache()
+
+        with patch.object(entity_linker, "get_connection_with_project_context", connection):
+            first = await cache.get("io")
+            assert await cache.get("io") is first
+            cache.invalidate("io")
+            assert await cache.get("io") is not first
+
+        assert cursor.execute.call_count == 2
+        assert cache.get_stats()["hits"] == 1
+
+    async def test_oversized_project_is_not_linked(self):
+        connection, _ = self._connection(_rows("a", "b", "c"))
+        cache = EntityLinkerCache(max_nodes=2)
+
+        with patch.object(entity_linker, "get_connection_with_project_context", connection):
+            assert await cache.get("io") is None
+
+        assert cache.get_stats()["oversized"] == 1
+
+    async def test_link_entity_names_in_mention_order(self):
+        automaton = EntityAutomaton(_rows("Python", "Django"))
+
+        with patch.object(entity_linker, "get_entity_automaton", return_value=automaton):
+            assert await link_entity_names("django, python und Django") == ["Django", "Python"]
+
+    async def test_disabled_or_failing_linker_returns_none(self, monkeypatch):
+        monkeypatch.setenv("ENTITY_LINKER", "false")
+        assert await get_entity_automaton("io") is None
+
+        monkeypatch.setenv("ENTITY_LINKER", "true")
+
+        @asynccontextmanager
+        async def broken(*args, **kwargs):
+            raise RuntimeError("pool not initialized")
+            yield
+
+        with patch.object(entity_linker, "get_connection_with_project_context", broken), \
+             patch.object(entity_linker, "_linker_instance", EntityLinkerCache()):
+            assert await link_entity_names("Python", project_id="io") is None
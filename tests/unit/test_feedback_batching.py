@@ -0,0 +1,83 @@
+"""
+Unit tests for batched insight feedback lookups in rrf_fusion.
+
+Story 26.4: Feedback adjustments must cost at most one query per fusion,
+independent of the number of fused L2 results.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server.analysis.ief import (
+    apply_feedback_adjustment,
+    get_insight_feedback_adjustments,
+)
+from mcp_server.tools import rrf_fusion
+
+
+def _results(ids: list[int]) -> list[dict]:
+    return [{"id": i, "content": f"insight {i}", "memory_strength": 0.5} for i in ids]
+
+
+class TestGetInsightFeedbackAdjustments:
+    def test_single_query_aggregates_by_insight(self):
+        conn = MagicMock()
+        cursor = MagicMock()
+        conn.cursor.return_value = cursor
+        cursor.fetchall.return_value = [
+            {"insight_id": 1, "feedback_type": "helpful", "cnt": 3},
+            {"insight_id": 1, "feedback_type": "not_relevant", "cnt": 1},
+            {"insight_id": 2, "feedback_type": "not_now", "cnt": 5},
+            {"insight_id": 3, "feedback_type": "not_relevant", "cnt": 2},
+        ]
+
+        adjustments = get_insight_feedback_adjustments([3, 1, 2, 1], conn)
+
+        cursor.execute.assert_called_once()
+        assert "ANY(%s)" in cursor.execute.call_args.args[0]
+        assert cursor.execute.call_args.args[1] == ([1, 2, 3],)
+        assert adjustments[1] == pytest.approx(0.2)
+        assert 2 not in adjustments
+        assert adjustments[3] == pytest.approx(-0.2)
+
+    def test_empty_ids_skip_query(self):
+        conn = MagicMock()
+        assert get_insight_feedback_adjustments([], conn) == {}
+        conn.cursor.assert_not_called()
+
+    @pytest.mark.parametrize("base,adj,expected", [(1.0, 0.8, 1.5), (0.05, -0.1, 0.0), (0.5, 0.1, 0.6)])
+    def test_apply_feedback_adjustment_clamps(self, base, adj, expected):
+        assert apply_feedback_adjustment(base, adj) == pytest.approx(expected)
+
+
+class TestRrfFusionFeedback:
+    def test_precomputed_adjustments_need_no_lookup(self):
+        with patch("mcp_server.analysis.ief.get_insight_feedback_adjustments") as lookup:
+            fused = rrf_fusion(
+                _results([1, 2]), [], {"semantic": 1.0, "keyword": 0.0, "graph": 0.0},
+                feedback_adjustments={2: 0.1},
+            )
+
+        lookup.assert_not_called()
+        assert fused[0]["id"] == 2  # feedback boost outranks rank-1 result
+
+    def test_single_batched_lookup_for_many_results(self):
+        ids = list(range(1, 51))
+        with patch(
+            "mcp_server.analysis.ief.get_insight_feedback_adjustments", return_value={}
+        ) as lookup:
+            fused = rrf_fusion(_results(ids), _results(ids), {"semantic": 0.5, "keyword": 0.5})
+
+        lookup.assert_called_once()
+        assert sorted(lookup.call_args.args[0]) == ids
+        assert len(fused) == 50
+
+    def test_episode_results_excluded_from_lookup(self):
+        episodes = [{"id": "episode_7", "content": "e", "source_type": "episode_memory"}]
+        with patch("mcp_server.analysis.ief.get_insight_feedback_adjustments") as lookup:
+            rrf_fusion(episodes, [], {"semantic": 1.0})
+
+        lookup.assert_not_called()
@@ -0,0 +1,234 @@
+"""
+Unit tests for the bidirectional find_path() search.
+
+bidirectional_shortest_paths() (mcp_server/db/graph_paths.py) is checked
+against a brute-force enumeration of shortest undirected simple paths;
+find_path() is run against an in-memory cursor to check that it issues one
+adjacency query per BFS level and hydrates nodes and edges in one query each.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+import threading
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_server.db import graph
+from mcp_server.db.graph_paths import bidirectional_shortest_paths
+
+
+def _random_edges(seed: int, nodes: int = 14, edges: int = 26) -> list[tuple[str, str, str, float]]:
+    rng = random.Random(seed)
+    return [
+        (f"e{i}", f"n{rng.randrange(nodes)}", f"n{rng.randrange(nodes)}", rng.random())
+        for i in range(edges)
+    ]
+
+
+def _expand_from(edges: list[tuple[str, str, str, float]], calls: list[list[str]] | None = None):
+    def expand(frontier):
+        if calls is not None:
+            calls.append(list(frontier))
+        members = set(frontier)
+        return [e for e in edges if e[1] in members or e[2] in members]
+
+    return expand
+
+
+def _brute_force(edges, start, end, max_depth, limit=10):
+    """Heaviest shortest undirected simple paths from start to end."""
+    found = []
+
+    def walk(v, nodes, edge_path, weight):
+        for edge_id, source, target, w in edges:
+            if source == v:
+                nxt = target
+            elif target == v:
+                nxt = source
+            else:
+                continue
+            if nxt in nodes:
+                continue
+            path = (nodes + [nxt], edge_path + [edge_id], weight + w)
+            if nxt == end:
+                found.append(path)
+            elif len(path[1]) < max_depth:
+                walk(nxt, *path)
+
+    walk(start, [start], [], 0.0)
+    if not found:
+        return []
+    shortest = min(len(p[1]) for p in found)
+    found = sorted((p for p in found if len(p[1]) == shortest), key=lambda p: -p[2])
+    return [(p[0], p[1]) for p in found[:limit]]
+
+
+class TestBidirectionalShortestPaths:
+    @pytest.mark.parametrize("seed", range(12))
+    @pytest.mark.parametrize("max_depth", [1, 2, 3, 5])
+    def test_matches_brute_force(self, seed, max_depth):
+        edges = _random_edges(seed)
+
+        paths = bidirectional_shortest_paths("n0", "n1", max_depth, _expand_from(edges))
+
+        assert [(p["node_path"], p["edge_path"]) for p in paths] == _brute_force(edges, "n0", "n1", max_depth)
+        for p in paths:
+            assert p["path_length"] == len(p["edge_path"])
+            assert p["total_weight"] == pytest.approx(sum(e[3] for e in edges if e[0] in p["edge_path"]))
+
+    def test_limit_keeps_heaviest_of_many_shortest_paths(self):
+        # 6 x 6 complete bipartite middle layers: 36 shortest paths of length 3
+        edges = []
+        for i in range(6):
+            edges.append((f"s{i}", "start", f"a{i}", i / 10))
+            edges.append((f"t{i}", f"b{i}", "end", i / 10))
+            for j in range(6):
+                edges.append((f"m{i}{j}", f"a{i}", f"b{j}", 0.0))
+
+        paths = bidirectional_shortest_paths("start", "end", 5, _expand_from(edges), limit=3)
+
+        assert len(paths) == 3
+        assert paths[0]["edge_path"] == ["s5", "m55", "t5"]
+        assert [p["total_weight"] for p in paths] == sorted((p["total_weight"] for p in paths), reverse=True)
+
+    def test_visited_nodes_are_not_expanded_again(self):
+        edges = _random_edges(7, nodes=30, edges=90)
+        calls: list[list[str]] = []
+
+        bidirectional_shortest_paths("n0", "n1", 6, _expand_from(edges, calls))
+
+        expanded = [node for frontier in calls for node in frontier]
+        assert len(expanded) == len(set(expanded))
+
+    def test_no_path_within_max_depth(self):
+        edges = [("e1", "a", "b", 1.0), ("e2", "b", "c", 1.0), ("e3", "c", "d", 1.0)]
+
+        assert bidirectional_shortest_paths("a", "d", 2, _expand_from(edges)) == []
+        assert len(bidirectional_shortest_paths("a", "d", 3, _expand_from(edges))) == 1
+
+    def test_disconnected_and_same_node(self):
+        edges = [("e1", "a", "b", 1.0), ("e2", "c", "d", 1.0)]
+
+        assert bidirectional_shortest_paths("a", "d", 5, _expand_from(edges)) == []
+        assert bidirectional_shortest_paths("a", "a", 5, _expand_from(edges)) == []
+
+    def test_parallel_edges_are_distinct_paths(self):
+        edges = [("e1", "a", "b", 0.2), ("e2", "b", "a", 0.9)]
+
+        paths = bidirectional_shortest_paths("a", "b", 3, _expand_from(edges))
+
+        assert [p["edge_path"] for p in paths] == [["e2"], ["e1"]]
+
+
+class _GraphCursor:
+    """DictCursor stand-in answering find_path()'s queries from edge tuples."""
+
+    def __init__(self, edges):
+        self.edges = edges
+        self.queries: list[str] = []
+        self.threads: set[int] = set()
+        self._rows: list[dict] = []
+
+    def execute(self, sql, params=None):
+        sql = " ".join(sql.split())
+        self.queries.append(sql)
+        self.threads.add(threading.get_ident())
+        if "source_id = ANY" in sql:
+            frontier = set(params[0])
+            self._rows = [
+                {"id": e[0], "source_id": e[1], "target_id": e[2], "weight": e[3]}
+                for e in self.edges if e[1] in frontier or e[2] in frontier
+            ]
+        elif re.search(r"FROM nodes WHERE id = ANY", sql):
+            self._rows = [
+                {"id": n, "label": "Entity", "name": n, "properties": {}} for n in params[0]
+            ]
+        elif re.search(r"FROM edges WHERE id = ANY", sql):
+            by_id = {e[0]: e for e in self.edges}
+            self._rows = [
+                {
+                    "id": edge_id,
+                    "relation": "RELATED",
+                    "weight": by_id[edge_id][3],
+                    "properties": {},
+                    "memory_sector": "semantic",
+                    "last_accessed": datetime(2026, 1, 1, tzinfo=UTC),
+                    "access_count": 0,
+                    "relevance_score": 0.5,
+                }
+                for edge_id in params[0]
+            ]
+        else:
+            self._rows = []
+
+    def fetchall(self):
+        return self._rows
+
+
+class _Conn:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def cursor(self, cursor_factory=None):
+        return self._cursor
+
+
+class TestFindPathSql:
+    async def test_level_queries_and_batched_hydration(self, monkeypatch):
+        monkeypatch.setenv("GRAPH_ADJACENCY_CACHE", "false")
+        # Chain n0 - n1 - ... - n6 plus a detour n0 - x - n2
+        edges = [(f"e{i}", f"n{i}", f"n{i + 1}", 0.5) for i in range(6)]
+        edges += [("d1", "n0", "x", 0.1), ("d2", "x", "n2", 0.1)]
+        cursor = _GraphCursor(edges)
+
+        @asynccontextmanager
+        async def connection(read_only=False):
+            yield _Conn(cursor)
+
+        async def node_by_name(name):
+            return {"id": name, "label": "Entity", "name": name, "properties": {}}
+
+        with patch.object(graph, "get_connection_with_project_context", connection), \
+             patch.object(graph, "get_node_by_name", AsyncMock(side_effect=node_by_name)), \
+             patch.object(graph, "get_edge_by_id", AsyncMock()) as get_edge_by_id:
+            result = await graph.find_path("n0", "n6", max_depth=6)
+
+        assert result["path_found"] is True
+        assert result["path_length"] == 6
+        assert [[n["node_id"] for n in p["nodes"]] for p in result["paths"]] == [
+            [f"n{i}" for i in range(7)],
+            ["n0", "x", "n2", "n3", "n4", "n5", "n6"],
+        ]
+        # relevance comes from edge_relevance_score() in the hydration query
+        assert [p["path_relevance"] for p in result["paths"]] == [0.5 ** 6, 0.5 ** 6]
+        get_edge_by_id.assert_not_awaited()
+
+        level_queries = [q for q in cursor.queries if "source_id = ANY" in q]
+        assert len(level_queries) == 6  # radius 3 from each side
+        assert sum("FROM nodes WHERE id = ANY" in q for q in cursor.queries) == 1
+        assert sum("FROM edges WHERE id = ANY" in q for q in cursor.queries) == 1
+        # search and hydration run on the DB executor, not the event loop
+        assert threading.get_ident() not in cursor.threads
+
+    async def test_no_path_skips_hydration(self, monkeypatch):
+        monkeypatch.setenv("GRAPH_ADJACENCY_CACHE", "false")
+        cursor = _GraphCursor([("e1", "a", "b", 1.0), ("e2", "c", "d", 1.0)])
+
+        @asynccontextmanager
+        async def connection(read_only=False):
+            yield _Conn(cursor)
+
+        async def node_by_name(name):
+            return {"id": name, "label": "Entity", "name": name, "properties": {}}
+
+        with patch.object(graph, "get_connection_with_project_context", connection), \
+             patch.object(graph, "get_node_by_name", AsyncMock(side_effect=node_by_name)):
+            result = await graph.find_path("a", "d", max_depth=5)
+
+        assert result == {"path_found": False, "path_length": 0, "paths": []}
+        assert not any("WHERE id = ANY" in q for q in cursor.queries)
@@ -0,0 +1,181 @@
+"""
+Unit tests for the graph adjacency cache (mcp_server/db/graph_cache.py).
+
+The CSR traversals must return what the WITH RECURSIVE CTE of
+query_neighbors() and the bidirectional search of find_path() return; they
+are checked against a brute-force enumeration of simple paths on random
+graphs.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_server.db import graph
+from mcp_server.db.graph_cache import GraphAdjacencyCache, GraphSnapshot
+
+
+def _random_graph(seed: int, nodes: int = 12, edges: int = 30) -> tuple[list[dict], list[dict]]:
+    rng = random.Random(seed)
+    node_rows = [
+        {"id": uuid.UUID(int=i + 1), "project_id": "io", "label": "Entity", "name": f"n{i}", "properties": {}}
+        for i in range(nodes)
+    ]
+    edge_rows = [
+        {
+            "id": uuid.UUID(int=1000 + i),
+            "project_id": "io",
+            "source_id": node_rows[rng.randrange(nodes)]["id"],
+            "target_id": node_rows[rng.randrange(nodes)]["id"],
+            "relation": rng.choice(["USES", "KNOWS"]),
+            "weight": rng.random(),
+            "memory_sector": rng.choice(["semantic", "episodic"]),
+            "properties": {},
+            "last_accessed": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "access_count": 0,
+            "modified_at": None,
+        }
+        for i in range(edges)
+    ]
+    return node_rows, edge_rows
+
+
+def _cte_neighbor_hits(edge_rows, start, max_depth, outgoing, relation=None):
+    """Brute force of the query_neighbors CTE: min distance per edge over all rows."""
+    near, far = ("source_id", "target_id") if outgoing else ("target_id", "source_id")
+    hits: dict[str, int] = {}
+
+    def walk(v, path, depth):
+        for e in edge_rows:
+            if str(e[near]) != v or (relation and e["relation"] != relation):
+                continue
+            w = str(e[far])
+            if depth > 1 and w in path:
+                continue
+            edge_id = str(e["id"])
+            hits[edge_id] = min(hits.get(edge_id, depth), depth)
+            if depth < max_depth:
+                walk(w, path + [w], depth + 1)
+
+    walk(start, [start], 1)
+    return hits
+
+
+def _cte_paths(edge_rows, start, end, max_depth):
+    """Brute force of find_path: heaviest shortest undirected simple paths to end."""
+    found = []
+
+    def walk(v, nodes, edges, weight):
+        for e in edge_rows:
+            if str(e["source_id"]) == v:
+                w = str(e["target_id"])
+            elif str(e["target_id"]) == v:
+                w = str(e["source_id"])
+            else:
+                continue
+            if edges and w in nodes:
+                continue
+            path = (nodes + [w], edges + [str(e["id"])], weight + e["weight"])
+            if w == end:
+                found.append(path)
+            if len(path[1]) < max_depth:
+                walk(w, *path)
+
+    walk(start, [start], [], 0.0)
+    found.sort(key=lambda p: (len(p[1]), -p[2]))
+    return [(p[0], p[1]) for p in found[:10] if len(p[1]) == len(found[0][1])]
+
+
+class TestNeighborRows:
+    @pytest.mark.parametrize("seed", range(8))
+    @pytest.mark.parametrize("max_depth", [1, 2, 3, 5])
+    def test_matches_cte_rows(self, seed, max_depth):
+        node_rows, edge_rows = _random_graph(seed)
+        snapshot = GraphSnapshot(node_rows, edge_rows)
+        start = str(node_rows[0]["id"])
+
+        for direction, outgoing in (("outgoing", True), ("incoming", False)):
+            rows = snapshot.neighbor_rows(start, max_depth=max_depth, direction=direction)
+            assert {r["edge_id"]: r["distance"] for r in rows} == _cte_neighbor_hits(
+                edge_rows, start, max_depth, outgoing
+            )
+
+    def test_relation_filter_applies_to_every_hop(self):
+        node_rows, edge_rows = _random_graph(3)
+        snapshot = GraphSnapshot(node_rows, edge_rows)
+        start = str(node_rows[0]["id"])
+
+        rows = snapshot.neighbor_rows(start, relation_type="USES", max_depth=3, direction="outgoing")
+
+        assert {r["edge_id"]: r["distance"] for r in rows} == _cte_neighbor_hits(
+            edge_rows, start, 3, True, relation="USES"
+        )
+        assert snapshot.neighbor_rows(start, relation_type="UNKNOWN", max_depth=3) == []
+
+    def test_rows_ordered_like_cte(self):
+        node_rows, edge_rows = _random_graph(5)
+        rows = GraphSnapshot(node_rows, edge_rows).neighbor_rows(str(node_rows[0]["id"]), max_depth=3)
+        keys = [(r["distance"], -r["weight"], r["name"]) for r in rows]
+        assert keys == sorted(keys)
+
+
+class TestFindPaths:
+    @pytest.mark.parametrize("seed", range(8))
+    def test_matches_cte_paths(self, seed):
+        node_rows, edge_rows = _random_graph(seed, nodes=10, edges=18)
+        snapshot = GraphSnapshot(node_rows, edge_rows)
+        start, end = str(node_rows[0]["id"]), str(node_rows[1]["id"])
+
+        paths = snapshot.find_paths(start, end, max_depth=4)
+
+        assert [(p["node_path"], p["edge_path"]) for p in paths] == _cte_paths(edge_rows, start, end, 4)
+
+
+class TestGraphAdjacencyCache:
+    async def test_write_invalidates_and_reloads(self):
+        cache = GraphAdjacencyCache()
+        rows = _random_graph(1)
+
+        with patch("mcp_server.db.graph_cache.get_connection_with_project_context"), \
+             patch("mcp_server.db.graph_cache.run_in_db_executor", AsyncMock(return_value=rows)) as load:
+            first = await cache.get("io")
+            assert await cache.get("io") is first
+            cache.invalidate("io")
+            assert await cache.get("io") is not first
+
+        assert load.await_count == 2
+
+    async def test_oversized_graph_is_not_cached(self):
+        cache = GraphAdjacencyCache()
+        with patch("mcp_server.db.graph_cache.get_connection_with_project_context"), \
+             patch("mcp_server.db.graph_cache.run_in_db_executor", AsyncMock(return_value=None)):
+            assert await cache.get("io") is None
+        assert cache.get_stats()["oversized"] == 1
+
+    def test_patch_node_updates_payload(self):
+        node_rows, edge_rows = _random_graph(2)
+        snapshot = GraphSnapshot(node_rows, edge_rows)
+        node_id = str(node_rows[4]["id"])
+
+        assert snapshot.patch_node(node_id, "Entity", "renamed", {"k": "v"})
+        assert snapshot.node_detail(node_id)["name"] == "renamed"
+
+
+class TestQueryNeighborsUsesCache:
+    async def test_served_from_snapshot_without_connection(self, monkeypatch):
+        monkeypatch.setenv("GRAPH_ADJACENCY_CACHE", "true")
+        node_rows, edge_rows = _random_graph(4)
+        snapshot = GraphSnapshot(node_rows, edge_rows)
+
+        with patch.object(graph, "get_graph_snapshot", AsyncMock(return_value=snapshot)), \
+             patch.object(graph, "get_connection_with_project_context") as ctx, \
+             patch("mcp_server.middleware.context.get_current_project", return_value="io"):
+            neighbors = await graph.query_neighbors(str(node_rows[0]["id"]), max_depth=2)
+
+        ctx.assert_not_called()
+        assert len({n["node_id"] for n in neighbors}) == len(neighbors)
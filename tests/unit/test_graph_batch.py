@@ -0,0 +1,163 @@
+"""
+Unit tests for bulk graph ingest (add_nodes_batch / add_edges_batch and the
+graph_add_nodes_batch / graph_add_edges_batch tools).
+
+Nodes and edges are upserted with one multi-row statement each inside one
+transaction; repeated items are merged like consecutive single calls and
+every input item gets its own status.
+"""
+
+from __future__ import annotations
+
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp_server.db import graph
+from mcp_server.db.graph import _merge_node_items, add_edges_batch, add_nodes_batch
+from mcp_server.tools import graph_add_edges_batch, graph_add_nodes_batch
+from mcp_server.tools.graph_add_edges_batch import handle_graph_add_edges_batch
+from mcp_server.tools.graph_add_nodes_batch import handle_graph_add_nodes_batch
+from mcp_server.utils.sector_classifier import classify_memory_sector
+
+
+def _node_row(name, was_inserted=True, label="Entity"):
+    return {"id": f"id-{name}", "label": label, "name": name, "project_id": "io", "was_inserted": was_inserted}
+
+
+def _patches(execute_values):
+    conn = MagicMock()
+
+    @asynccontextmanager
+    async def connection(*args, **kwargs):
+        yield conn
+
+    return conn, (
+        patch.object(graph, "get_connection_with_project_context", connection),
+        patch.object(graph, "execute_values", side_effect=execute_values),
+        patch("mcp_server.middleware.context.get_current_project", return_value="io"),
+        patch.object(graph, "invalidate_graph_cache"),
+        patch.object(graph, "invalidate_entity_linker"),
+        patch.object(graph, "notify_pending_embeddings"),
+    )
+
+
+class TestMergeNodeItems:
+    def test_repeated_names_merge_like_sequential_upserts(self):
+        merged = _merge_node_items([
+            {"name": "Python", "label": "Technology", "properties": {"a": 1}},
+            {"name": "Python", "label": "Entity", "properties": {"b": 2}, "vector_id": 7},
+            {"name": "Django"},
+        ])
+
+        assert merged == {
+            "Python": {"label": "Technology", "properties": {"a": 1, "b": 2}, "vector_id": 7},
+            "Django": {"label": "Entity", "properties": {}, "vector_id": None},
+        }
+
+
+class TestAddNodesBatch:
+    async def test_one_statement_per_batch_in_input_order(self):
+        calls = []
+
+        def execute_values(cursor, sql, rows, template, page_size, fetch):
+            calls.append((sql, rows, page_size))
+            return [_node_row("B", was_inserted=False), _node_row("A")]
+
+        conn, p = _patches(execute_values)
+        with p[0], p[1], p[2], p[3], p[4], p[5] as notify:
+            results = await add_nodes_batch([
+                {"name": "A", "label": "Entity"},
+                {"name": "B", "label": "Entity"},
+                {"name": "A", "label": "Entity"},
+            ])
+
+        assert len(calls) == 1
+        sql, rows, page_size = calls[0]
+        assert "ON CONFLICT (project_id, name)" in sql
+        assert [row[2] for row in rows] == ["A", "B"] and page_size == 2
+        conn.commit.assert_called_once()
+        notify.assert_called_once()
+        assert [(r["name"], r["created"]) for r in results] == [("A", True), ("B", False), ("A", False)]
+
+
+class TestAddEdgesBatch:
+    async def test_names_resolved_once_then_edges_upserted(self):
+        statements = []
+
+        def execute_values(cursor, sql, rows, template, page_size, fetch):
+            statements.append(rows)
+            if "INSERT INTO nodes" in sql:
+                return [_node_row("A"), _node_row("B", was_inserted=False)]
+            return [{
+                "id": "e1", "project_id": "io", "source_id": "id-A", "target_id": "id-B",
+                "relation": "USES", "weight": 0.5, "memory_sector": "semantic", "was_inserted": True,
+            }]
+
+        _, p = _patches(execute_values)
+        with p[0], p[1], p[2], p[3], p[4], p[5]:
+            results = await add_edges_batch([
+                {"source_name": "A", "target_name": "B", "relation": "USES", "weight": 0.9},
+                {"source_name": "A", "target_name": "B", "relation": "USES", "weight": 0.5,
+                 "properties": {"edge_type": "constitutive"}},
+            ])
+
+        node_rows, edge_rows = statements
+        assert [row[2] for row in node_rows] == ["A", "B"]
+        # Repeated triple collapses to the last occurrence
+        assert len(edge_rows) == 1
+        assert edge_rows[0][4] == 0.5
+        assert json.loads(edge_rows[0][5])["entrenchment_level"] == "maximal"
+        assert [r["created"] for r in results] == [True, False]
+        assert results[0]["source_node_created"] is True
+        assert results[0]["target_node_created"] is False
+        assert results[1]["source_node_created"] is False
+
+
+class TestBatchTools:
+    async def test_nodes_tool_reports_invalid_items_per_index(self):
+        add = AsyncMock(return_value=[
+            {"node_id": "n1", "created": True, "label": "Technology", "name": "Python", "project_id": "io"},
+        ])
+
+        with patch.object(graph_add_nodes_batch, "add_nodes_batch", add), \
+             patch.object(graph_add_nodes_batch, "get_current_project", return_value="io"):
+            result = await handle_graph_add_nodes_batch({"nodes": [
+                {"label": "Technology"},
+                {"label": "Technology", "name": "Python"},
+            ]})
+
+        add.assert_awaited_once_with([{"label": "Technology", "name": "Python"}])
+        assert result["results"][0]["status"] == "error"
+        assert result["results"][1] == {
+            "index": 1, "status": "success", "node_id": "n1", "created": True,
+            "label": "Technology", "name": "Python",
+        }
+        assert (result["succeeded"], result["failed"], result["created"]) == (1, 1, 1)
+
+    async def test_edges_tool_classifies_sector_and_rejects_bad_weight(self):
+        add = AsyncMock(return_value=[{
+            "edge_id": "e1", "created": True, "source_id": "a", "target_id": "b",
+            "relation": "USES", "weight": 1.0, "memory_sector": "semantic", "project_id": "io",
+            "source_node_created": True, "target_node_created": False,
+        }])
+
+        with patch.object(graph_add_edges_batch, "add_edges_batch", add), \
+             patch.object(graph_add_edges_batch, "get_current_project", return_value="io"):
+            result = await handle_graph_add_edges_batch({"edges": [
+                {"source_name": "A", "target_name": "B", "relation": "USES", "weight": 2},
+                {"source_name": "A", "target_name": "B", "relation": "USES"},
+            ]})
+
+        (item,), = add.await_args.args
+        assert item["memory_sector"] == classify_memory_sector("USES", {})
+        assert item["weight"] == 1.0
+        assert result["results"][0]["status"] == "error"
+        assert result["results"][1]["source_node_created"] is True
+        assert "target_node_created" not in result["results"][1]
+
+    async def test_batch_size_limit(self):
+        with patch.object(graph_add_nodes_batch, "get_current_project", return_value="io"):
+            result = await handle_graph_add_nodes_batch({"nodes": [{}] * 1001})
+
+        assert result["error"] == "Parameter validation failed"
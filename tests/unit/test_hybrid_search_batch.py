@@ -0,0 +1,184 @@
+"""
+Unit tests for hybrid_search_batch.
+
+Several queries share one embeddings request, one connection and one
+set-wise statement per channel; results are fused per query.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.tools import (
+    episode_keyword_search_batch,
+    generate_query_embeddings,
+    handle_hybrid_search_batch,
+    keyword_search_batch,
+    semantic_search_batch,
+)
+
+
+def _l2_row(query_idx: int, insight_id: int, **extra) -> dict:
+    return {
+        "query_idx": query_idx,
+        "id": insight_id,
+        "content": f"insight {insight_id}",
+        "source_ids": [],
+        "metadata": {},
+        "io_category": None,
+        "is_identity": False,
+        "source_file": None,
+        "memory_strength": 0.5,
+        "project_id": "io",
+        **extra,
+    }
+
+
+def _episode_row(query_idx: int, episode_id: int, **extra) -> dict:
+    return {
+        "query_idx": query_idx,
+        "id": episode_id,
+        "query": "q",
+        "reflection": "r",
+        "reward": 0.5,
+        "created_at": datetime(2026, 1, 1),
+        "project_id": "io",
+        **extra,
+    }
+
+
+class TestSetWiseChannels:
+    def test_semantic_results_grouped_per_query(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [
+            _l2_row(1, 10, distance=0.1),
+            _l2_row(1, 11, distance=0.2),
+            _l2_row(3, 12, distance=0.3),
+        ]
+
+        results = semantic_search_batch([[0.1] * 3, [0.2] * 3, [0.3] * 3], 5, conn)
+
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert "CROSS JOIN LATERAL" in sql
+        assert params[0] == ["[0.1,0.1,0.1]", "[0.2,0.2,0.2]", "[0.3,0.3,0.3]"]
+        assert [[r["id"] for r in rows] for rows in results] == [[10, 11], [], [12]]
+        assert [r["rank"] for r in results[0]] == [1, 2]
+
+    def test_empty_sector_filter_skips_query(self):
+        conn = MagicMock()
+        assert semantic_search_batch([[0.1]], 5, conn, sector_filter=[]) == [[]]
+        conn.cursor.assert_not_called()
+
+    def test_keyword_trigram_fallback_only_for_empty_queries(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.side_effect = [
+            [_l2_row(1, 10, rank=0.5)],
+            [_l2_row(2, 20, rank=0.4)],
+        ]
+
+        results = keyword_search_batch(["python", "Kontexttrennung"], 5, conn)
+
+        assert cursor.execute.call_count == 2
+        fallback_sql, fallback_params = cursor.execute.call_args_list[1].args
+        assert "word_similarity" in fallback_sql
+        assert fallback_params[:2] == [["Kontexttrennung"], [2]]
+        assert [[r["id"] for r in rows] for rows in results] == [[10], [20]]
+
+    def test_episode_keyword_results_use_prefixed_ids(self):
+        conn = MagicMock()
+        cursor = conn.cursor.return_value
+        cursor.fetchall.return_value = [_episode_row(1, 7, rank=0.9)]
+
+        results = episode_keyword_search_batch(["lesson"], 5, conn, tags_filter=[])
+
+        sql, _ = cursor.execute.call_args.args
+        assert "AND FALSE" in sql
+        assert results[0][0]["id"] == "episode_7"
+        assert results[0][0]["rank_position"] == 1
+
+
+class TestGenerateQueryEmbeddings:
+    @pytest.mark.asyncio
+    async def test_one_api_call_for_distinct_misses(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        client = MagicMock()
+        client.create_embeddings = AsyncMock(return_value=[[1.0], [2.0]])
+
+        with patch("mcp_server.tools.get_embeddings_client", AsyncMock(return_value=client)):
+            first = await generate_query_embeddings(["a", "b", "a"])
+            second = await generate_query_embeddings(["b", "a"])
+
+        client.create_embeddings.assert_awaited_once_with(["a", "b"])
+        assert first == [[1.0], [2.0], [1.0]]
+        assert second == [[2.0], [1.0]]
+
+
+class TestHandleHybridSearchBatch:
+    @pytest.mark.asyncio
+    async def test_queries_share_one_connection(self):
+        conn = MagicMock()
+        connections = []
+
+        @asynccontextmanager
+        async def ctx(*args, **kwargs):
+            connections.append(kwargs)
+            yield conn
+
+        async def executor(func, *args):
+            if func.__name__ == "_fetch_fusion_context":
+                return ["io"], {}
+            if func.__name__ in ("semantic_search_batch", "keyword_search_batch"):
+                return [[{**_l2_result(i), "rank": 1}] for i in range(2)]
+            return [[], []]
+
+        def _l2_result(i: int) -> dict:
+            return {"id": 100 + i, "content": f"insight {i}", "metadata": {}, "project_id": "io"}
+
+        with patch("mcp_server.tools.generate_query_embeddings", AsyncMock(return_value=[[0.1] * 1536] * 2)) as embed, \
+             patch("mcp_server.tools.get_connection_with_project_context", ctx), \
+             patch("mcp_server.tools.run_in_db_executor", side_effect=executor), \
+             patch("mcp_server.tools.graph_search", AsyncMock(return_value=[])) as graph:
+            result = await handle_hybrid_search_batch({"queries": ["first", "second"], "top_k": 3})
+
+        assert result["status"] == "success"
+        embed.assert_awaited_once_with(["first", "second"])
+        assert connections == [{"read_only": True}]
+        assert graph.await_count == 2
+        assert [q["query_text"] for q in result["queries"]] == ["first", "second"]
+        assert result["queries"][1]["results"][0]["id"] == 101
+        assert result["queries"][1]["results"][0]["metadata"]["project_id"] == "io"
+
+    @pytest.mark.asyncio
+    async def test_empty_sector_filter_returns_empty_results_without_io(self):
+        with patch("mcp_server.tools.generate_query_embeddings", AsyncMock()) as embed, \
+             patch("mcp_server.tools.get_connection_with_project_context") as ctx:
+            result = await handle_hybrid_search_batch({"queries": ["first", "second"], "sector_filter": []})
+
+        embed.assert_not_awaited()
+        ctx.assert_not_called()
+        assert result["status"] == "success"
+        assert [(q["query_text"], q["results"]) for q in result["queries"]] == [("first", []), ("second", [])]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "arguments",
+        [
+            {"queries": []},
+            {"queries": ["ok", ""]},
+            {"queries": ["q"] * 21},
+            {"queries": ["q"], "top_k": 0},
+            {"queries": ["q"], "date_from": "not-a-date"},
+            {"queries": ["q"], "sector_filter": ["unknown"]},
+        ],
+    )
+    async def test_invalid_parameters(self, arguments):
+        result = await handle_hybrid_search_batch(arguments)
+        assert result["error"] == "Parameter validation failed"
+        assert result["tool"] == "hybrid_search_batch"
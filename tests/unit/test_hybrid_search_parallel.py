@@ -0,0 +1,171 @@
+"""
+Unit tests for parallel hybrid_search channels.
+
+Channels run concurrently on separate pooled connections (each with RLS
+project context), bounded by a concurrency cap; a channel exceeding the
+per-channel timeout is dropped instead of failing the whole search.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server.tools import (
+    get_parallel_search_settings,
+    run_search_channels_parallel,
+)
+
+
+@pytest.fixture
+def mock_connections():
+    """Patch the RLS connection helper; records every connection handed out."""
+    handed_out: list[MagicMock] = []
+
+    @asynccontextmanager
+    async def fake_connection(read_only: bool = False):
+        conn = MagicMock()
+        handed_out.append(conn)
+        yield conn
+
+    with patch("mcp_server.tools.get_connection_with_project_context", fake_connection):
+        yield handed_out
+
+
+def _sleeping_channel(delay: float, rows: list[dict], tracker: dict | None = None):
+    async def channel(conn):
+        if tracker is not None:
+            tracker["active"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["active"])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            if tracker is not None:
+                tracker["active"] -= 1
+        return rows
+
+    return channel
+
+
+class TestRunSearchChannelsParallel:
+    async def test_channels_overlap(self, mock_connections):
+        channels = {
+            name: _sleeping_channel(0.2, [{"id": i}])
+            for i, name in enumerate(["semantic", "keyword", "graph"])
+        }
+
+        start = time.perf_counter()
+        results, dropped = await run_search_channels_parallel(channels, max_concurrency=5, channel_timeout=2.0)
+        elapsed = time.perf_counter() - start
+
+        assert elapsed < 0.45  # sequential would take ~0.6s
+        assert results == {"semantic": [{"id": 0}], "keyword": [{"id": 1}], "graph": [{"id": 2}]}
+        assert dropped == []
+
+    async def test_each_channel_gets_own_connection(self, mock_connections):
+        seen = []
+
+        async def channel(conn):
+            seen.append(conn)
+            return []
+
+        await run_search_channels_parallel({"a": channel, "b": channel, "c": channel})
+
+        assert len(mock_connections) == 3
+        assert len({id(c) for c in seen}) == 3
+
+    async def test_concurrency_cap(self, mock_connections):
+        tracker = {"active": 0, "peak": 0}
+        channels = {f"c{i}": _sleeping_channel(0.05, [], tracker) for i in range(5)}
+
+        await run_search_channels_parallel(channels, max_concurrency=2, channel_timeout=2.0)
+
+        assert tracker["peak"] == 2
+
+    async def test_slow_channel_dropped(self, mock_connections):
+        channels = {
+            "semantic": _sleeping_channel(0.01, [{"id": 1}]),
+            "graph": _sleeping_channel(0.5, [{"id": 2}]),
+        }
+
+        results, dropped = await run_search_channels_parallel(channels, channel_timeout=0.1)
+
+        assert results == {"semantic": [{"id": 1}], "graph": []}
+        assert dropped == ["graph"]
+        # The slow channel's server-side query was cancelled
+        assert sum(conn.cancel.called for conn in mock_connections) == 1
+
+    async def test_query_started_after_timeout_is_cancelled(self, mock_connections):
+        async def late_query(conn):
+            loop = asyncio.get_running_loop()
+            await asyncio.sleep(0.15)  # e.g. waiting on an embedding before querying
+            cancelled = asyncio.Event()
+            conn.cancel.side_effect = lambda: loop.call_soon_threadsafe(cancelled.set)
+            await cancelled.wait()  # query runs until cancelled server-side
+            return [{"id": 1}]
+
+        results, dropped = await run_search_channels_parallel({"graph": late_query}, channel_timeout=0.1)
+
+        assert dropped == ["graph"] and results == {"graph": []}
+        assert mock_connections[0].cancel.call_count >= 2
+
+    async def test_concurrency_capped_by_free_pool_connections(self, mock_connections):
+        tracker = {"active": 0, "peak": 0}
+        channels = {f"c{i}": _sleeping_channel(0.05, [], tracker) for i in range(4)}
+
+        with patch("mcp_server.tools.get_free_connection_count", return_value=2):
+            await run_search_channels_parallel(channels, max_concurrency=5)
+        assert tracker["peak"] == 2
+
+        tracker["peak"] = 0
+        with patch("mcp_server.tools.get_free_connection_count", return_value=0):
+            await run_search_channels_parallel(channels, max_concurrency=5)
+        assert tracker["peak"] == 1
+
+    async def test_channel_error_is_raised(self, mock_connections):
+        async def failing(conn):
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await run_search_channels_parallel(
+                {"semantic": _sleeping_channel(0.01, []), "keyword": failing}
+            )
+
+    async def test_ef_search_applied_per_connection(self, mock_connections):
+        async def channel(conn):
+            return []
+
+        with patch("mcp_server.tools.apply_ef_search") as apply:
+            await run_search_channels_parallel({"a": channel, "b": channel}, ef_search=100)
+
+        assert apply.call_count == 2
+        assert {id(call.args[0]) for call in apply.call_args_list} == {id(c) for c in mock_connections}
+
+
+class TestGetParallelSearchSettings:
+    def test_defaults(self, monkeypatch):
+        for var in ("HYBRID_SEARCH_PARALLEL", "HYBRID_SEARCH_MAX_CONCURRENCY", "HYBRID_SEARCH_CHANNEL_TIMEOUT"):
+            monkeypatch.delenv(var, raising=False)
+
+        assert get_parallel_search_settings() == (False, 5, 5.0)
+
+    def test_env_overrides(self, monkeypatch):
+        monkeypatch.setenv("HYBRID_SEARCH_PARALLEL", "true")
+        monkeypatch.setenv("HYBRID_SEARCH_MAX_CONCURRENCY", "3")
+        monkeypatch.setenv("HYBRID_SEARCH_CHANNEL_TIMEOUT", "0.75")
+
+        assert get_parallel_search_settings() == (True, 3, 0.75)
+
+    @pytest.mark.parametrize("concurrency,timeout", [("0", "-1"), ("many", "soon")])
+    def test_invalid_values_fall_back(self, monkeypatch, concurrency, timeout):
+        monkeypatch.setenv("HYBRID_SEARCH_MAX_CONCURRENCY", concurrency)
+        monkeypatch.setenv("HYBRID_SEARCH_CHANNEL_TIMEOUT", timeout)
+
+        _, max_concurrency, channel_timeout = get_parallel_search_settings()
+
+        assert max_concurrency == 5
+        assert channel_timeout == 5.0
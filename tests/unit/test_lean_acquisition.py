@@ -0,0 +1,157 @@
+"""
+Unit tests for lean connection acquisition in mcp_server/db/connection.py.
+
+Recently used connections skip the SELECT 1 health check, pgvector session
+settings are applied once per physical connection together with
+set_project_context(), and transient setup failures are retried.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import psycopg2
+import pytest
+
+from mcp_server.db import connection as db_connection
+from mcp_server.db.connection import (
+    get_connection_with_project_context,
+    get_connection_with_project_context_sync,
+)
+
+
+def _pool_with(*conns: MagicMock) -> MagicMock:
+    """Mock pool handing out the given connections in order."""
+    mock_pool = MagicMock()
+    mock_pool.getconn.side_effect = list(conns)
+    return mock_pool
+
+
+def _make_conn() -> MagicMock:
+    conn = MagicMock()
+    cursor = MagicMock()
+    cursor.fetchone.return_value = {"health_check": 1}
+    conn.cursor.return_value = cursor
+    return conn
+
+
+def _statements(conn: MagicMock) -> list[str]:
+    return [c.args[0] for c in conn.cursor.return_value.execute.call_args_list]
+
+
+@pytest.fixture(autouse=True)
+def _project():
+    with patch("mcp_server.middleware.context.get_project_id", return_value="test-project"):
+        yield
+
+
+class TestLeanAcquisition:
+    async def test_warm_connection_uses_one_statement(self):
+        """Second acquisition of a recently used connection only sets the RLS context."""
+        conn = _make_conn()
+        with patch.object(db_connection, "_connection_pool", _pool_with(conn, conn)):
+            async with get_connection_with_project_context():
+                pass
+            first = _statements(conn)
+            conn.cursor.return_value.execute.reset_mock()
+
+            async with get_connection_with_project_context():
+                pass
+            second = _statements(conn)
+
+        assert first[0] == "SELECT 1 as health_check"
+        assert "hnsw.iterative_scan" in first[1] and "set_project_context" in first[1]
+        assert second == ["SELECT set_project_context(%s)"]
+
+    async def test_idle_connection_is_health_checked(self):
+        """Connections idle past the threshold get the SELECT 1 check again."""
+        conn = _make_conn()
+        with patch.object(db_connection, "_connection_pool", _pool_with(conn, conn)), \
+             patch.object(db_connection, "_HEALTH_CHECK_IDLE_SECONDS", 0):
+            async with get_connection_with_project_context():
+                pass
+            conn.cursor.return_value.execute.reset_mock()
+
+            async with get_connection_with_project_context():
+                pass
+
+        assert _statements(conn) == ["SELECT 1 as health_check", "SELECT set_project_context(%s)"]
+
+    async def test_rollback_reapplies_session_settings(self):
+        """A rolled back first transaction undoes set_config, so the next use re-applies it."""
+        conn = _make_conn()
+        with patch.object(db_connection, "_connection_pool", _pool_with(conn, conn)):
+            with pytest.raises(ValueError):
+                async with get_connection_with_project_context():
+                    raise ValueError("boom")
+            conn.cursor.return_value.execute.reset_mock()
+
+            async with get_connection_with_project_context():
+                pass
+
+        assert "hnsw.max_scan_tuples" in _statements(conn)[0]
+
+    async def test_cancelled_caller_reapplies_session_settings(self):
+        """A cancelled caller's transaction is rolled back on checkin, so the settings are lost too."""
+        conn = _make_conn()
+        with patch.object(db_connection, "_connection_pool", _pool_with(conn, conn)):
+            with pytest.raises(asyncio.CancelledError):
+                async with get_connection_with_project_context():
+                    raise asyncio.CancelledError
+            conn.cursor.return_value.execute.reset_mock()
+
+            async with get_connection_with_project_context():
+                pass
+
+        assert "hnsw.max_scan_tuples" in _statements(conn)[0]
+
+    async def test_unsupported_settings_fall_back_to_rls_only(self):
+        """pgvector < 0.8.0 rejects the settings; the RLS context is still set."""
+        conn = _make_conn()
+        conn.cursor.return_value.execute.side_effect = [
+            None,
+            psycopg2.ProgrammingError('unrecognized configuration parameter "hnsw.iterative_scan"'),
+            None,
+        ]
+        with patch.object(db_connection, "_connection_pool", _pool_with(conn, conn)):
+            async with get_connection_with_project_context():
+                pass
+
+        assert _statements(conn)[-1] == "SELECT set_project_context(%s)"
+        assert conn.rollback.call_count == 1
+        conn.commit.assert_called_once()
+
+    async def test_dropped_warm_connection_is_replaced(self):
+        """A transient error on a warm connection (no health check) discards it and retries."""
+        stale, fresh = _make_conn(), _make_conn()
+        mock_pool = _pool_with(stale, stale, fresh)
+        with patch.object(db_connection, "_connection_pool", mock_pool):
+            async with get_connection_with_project_context():
+                pass
+            stale.cursor.return_value.execute.side_effect = psycopg2.OperationalError(
+                "SSL connection has been closed unexpectedly"
+            )
+
+            async with get_connection_with_project_context(retry_delay=0) as conn:
+                pass
+
+        assert conn is fresh
+        mock_pool.putconn.assert_any_call(stale, close=True)
+
+    def test_dropped_warm_connection_is_replaced_sync(self):
+        """The sync variant discards a stale warm connection and retries the same way."""
+        stale, fresh = _make_conn(), _make_conn()
+        mock_pool = _pool_with(stale, stale, fresh)
+        with patch.object(db_connection, "_connection_pool", mock_pool):
+            with get_connection_with_project_context_sync():
+                pass
+            stale.cursor.return_value.execute.side_effect = psycopg2.OperationalError(
+                "server closed the connection unexpectedly"
+            )
+
+            with get_connection_with_project_context_sync(retry_delay=0) as conn:
+                pass
+
+        assert conn is fresh
+        mock_pool.putconn.assert_any_call(stale, close=True)
@@ -0,0 +1,111 @@
+"""
+Unit tests for node embeddings (Migration 055).
+
+Nodes are embedded by the write-behind worker (UUID ids); suggest_lateral_edges
+takes its candidates from one ANN query over nodes and only falls back to the
+insight-based search while no node is embedded.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp_server.db.pending_embeddings import (
+    PENDING_EMBEDDING_TABLES,
+    record_embedding_failures,
+    store_embeddings,
+)
+from mcp_server.tools import suggest_lateral_edges
+from mcp_server.tools.suggest_lateral_edges import (
+    _node_embedding_text,
+    handle_suggest_lateral_edges,
+)
+
+SOURCE = {
+    "id": "00000000-0000-0000-0000-000000000001",
+    "name": "Python",
+    "label": "Technology",
+    "properties": {"description": "Programmiersprache"},
+}
+
+
+def _connection(fetchone=None, fetchall=None):
+    cursor = MagicMock()
+    cursor.fetchone.return_value = fetchone
+    cursor.fetchall.side_effect = fetchall or [[]]
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @asynccontextmanager
+    async def connection(*args, **kwargs):
+        yield conn
+
+    return connection, cursor
+
+
+def _patches(connection, neighbors=()):
+    return (
+        patch.object(suggest_lateral_edges, "get_current_project", return_value="io"),
+        patch.object(suggest_lateral_edges, "get_node_by_name", AsyncMock(return_value=SOURCE)),
+        patch.object(suggest_lateral_edges, "query_neighbors", AsyncMock(return_value=list(neighbors))),
+        patch.object(suggest_lateral_edges, "get_connection_with_project_context", connection),
+    )
+
+
+class TestNodeEmbeddingPipeline:
+    def test_nodes_are_a_pending_table(self):
+        assert PENDING_EMBEDDING_TABLES["nodes"] == "node_embedding_text(name, label, properties)"
+
+    def test_node_ids_are_cast_to_uuid(self):
+        conn = MagicMock()
+        conn.cursor.return_value.fetchall.return_value = []
+
+        with patch("mcp_server.db.pending_embeddings.execute_values") as ev:
+            store_embeddings(conn, "nodes", [(SOURCE["id"], [0.1])])
+            record_embedding_failures(conn, "nodes", [SOURCE["id"]], 3)
+
+        assert ev.call_args.kwargs["template"] == "(%s::uuid, %s::vector)"
+        assert "ANY(%s::uuid[])" in conn.cursor.return_value.execute.call_args.args[0]
+
+    def test_node_embedding_text_matches_sql(self):
+        assert _node_embedding_text(SOURCE) == "Python (Technology) Programmiersprache"
+        assert _node_embedding_text({"name": "X", "label": None, "properties": None}) == "X"
+
+
+class TestLateralSuggestionsFromNodeEmbeddings:
+    async def test_single_ann_query_excludes_neighbors(self):
+        connection, cursor = _connection(
+            fetchone={"embedded": True},
+            fetchall=[[{"node_id": "n2", "name": "Django", "label": "Technology", "similarity": 0.8}]],
+        )
+        p = _patches(connection, neighbors=[{"node_id": "n9"}])
+
+        with p[0], p[1], p[2], p[3], \
+             patch.object(suggest_lateral_edges, "_get_embedding") as embed:
+            result = await handle_suggest_lateral_edges({"node_name": "Python", "top_k": 3})
+
+        embed.assert_not_called()
+        sql, params = cursor.execute.call_args.args
+        assert "FROM nodes n" in sql and "ORDER BY n.embedding <=>" in sql
+        assert "l2_insights" not in sql
+        assert params[0] == SOURCE["id"]
+        assert set(params[1]) == {"n9", SOURCE["id"]}
+        assert params[-1] == 3
+        assert result["suggestions"][0]["target_node"] == "Django"
+        assert result["suggestions"][0]["match_type"] == "semantic_node"
+
+    async def test_pending_source_node_is_embedded_on_the_fly(self):
+        connection, cursor = _connection(fetchone={"embedded": False}, fetchall=[[]] * 3)
+        p = _patches(connection)
+
+        with p[0], p[1], p[2], p[3], \
+             patch.object(suggest_lateral_edges, "_get_embedding", AsyncMock(return_value=[0.1])) as embed, \
+             patch.object(suggest_lateral_edges, "get_entity_automaton", AsyncMock(return_value=None)):
+            result = await handle_suggest_lateral_edges({"node_name": "Python"})
+
+        embed.assert_awaited_once_with("Python (Technology) Programmiersprache")
+        # ANN over nodes found nothing -> insight fallback (l2 + keyword)
+        executed = [c.args[0] for c in cursor.execute.call_args_list]
+        assert any("FROM l2_insights" in sql and "get_allowed_projects" in sql for sql in executed)
+        assert result["suggestions"] == []
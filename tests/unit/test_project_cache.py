@@ -0,0 +1,81 @@
+"""
+Unit tests for the per-project snapshot cache (mcp_server/db/project_cache.py).
+
+Snapshots are served until the TTL expires, dropped by invalidate() for any
+project they contain, and a load that raced with a write is not published.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from mcp_server.db.project_cache import ProjectSnapshotCache
+
+
+@dataclass
+class _Snapshot:
+    projects: set[str]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+def _loader(loads: list[str], **projects: set[str]):
+    async def load(project_id: str) -> _Snapshot | None:
+        loads.append(project_id)
+        if project_id not in projects:
+            return None  # too large to cache
+        return _Snapshot(projects[project_id])
+
+    return load
+
+
+class TestProjectSnapshotCache:
+    async def test_hit_until_ttl_expires(self):
+        loads: list[str] = []
+        cache = ProjectSnapshotCache(_loader(loads, io={"io"}), ttl_seconds=300)
+
+        first = await cache.get("io")
+        assert await cache.get("io") is first
+        cache.ttl_seconds = 0
+        assert await cache.get("io") is not first
+
+        assert loads == ["io", "io"]
+        assert cache.get_stats() == {"hits": 1, "loads": 2, "invalidations": 0, "oversized": 0, "projects": 1}
+
+    async def test_invalidate_drops_snapshots_sharing_the_project(self):
+        loads: list[str] = []
+        cache = ProjectSnapshotCache(_loader(loads, io={"io", "shared"}, aa={"aa"}), ttl_seconds=300)
+        io, aa = await cache.get("io"), await cache.get("aa")
+
+        cache.invalidate("shared")
+
+        assert await cache.get("io") is not io
+        assert await cache.get("aa") is aa
+
+    async def test_oversized_result_is_remembered(self):
+        loads: list[str] = []
+        cache = ProjectSnapshotCache(_loader(loads), ttl_seconds=300)
+
+        assert await cache.get("huge") is None
+        assert await cache.get("huge") is None
+
+        assert loads == ["huge"]
+        assert cache.get_stats()["oversized"] == 1
+
+    async def test_load_racing_a_write_is_not_published(self):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_load(project_id: str) -> _Snapshot:
+            started.set()
+            await release.wait()
+            return _Snapshot({project_id})
+
+        cache = ProjectSnapshotCache(slow_load, ttl_seconds=300)
+        pending = asyncio.create_task(cache.get("io"))
+        await started.wait()
+        cache.invalidate("io")
+        release.set()
+
+        assert await pending is not None
+        assert cache.get_stats()["projects"] == 0
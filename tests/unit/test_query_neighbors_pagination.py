@@ -0,0 +1,264 @@
+"""
+Unit tests for bounded, paginated graph_query_neighbors.
+
+query_neighbors(limit=...) must rank, deduplicate per node and cut the page
+in SQL (without use_ief); the tool turns pages into opaque cursors. The
+level-by-level traversal behind it is checked against the adjacency cache
+snapshot, which is itself checked against a brute-force CTE enumeration.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_server.db import graph
+from mcp_server.db.decay_scores import edge_relevance_sql
+from mcp_server.db.graph_cache import GraphSnapshot
+from mcp_server.tools import graph_query_neighbors as tool
+from mcp_server.tools.graph_query_neighbors import (
+    decode_neighbors_cursor,
+    encode_neighbors_cursor,
+    handle_graph_query_neighbors,
+)
+
+
+def _random_graph(seed: int, nodes: int = 12, edges: int = 30) -> tuple[list[dict], list[dict]]:
+    rng = random.Random(seed)
+    node_rows = [
+        {"id": uuid.UUID(int=i + 1), "project_id": "io", "label": "Entity", "name": f"n{i}", "properties": {}}
+        for i in range(nodes)
+    ]
+    edge_rows = [
+        {
+            "id": uuid.UUID(int=1000 + i),
+            "project_id": "io",
+            "source_id": node_rows[rng.randrange(nodes)]["id"],
+            "target_id": node_rows[rng.randrange(nodes)]["id"],
+            "relation": rng.choice(["USES", "KNOWS"]),
+            "weight": rng.random(),
+            "memory_sector": "semantic",
+            "properties": {},
+            "last_accessed": datetime(2026, 1, 1, tzinfo=UTC),
+            "access_count": 0,
+            "modified_at": None,
+        }
+        for i in range(edges)
+    ]
+    return node_rows, edge_rows
+
+
+class _LevelCursor:
+    """Cursor stand-in answering the level queries from edge rows; hydration returns nothing."""
+
+    def __init__(self, edge_rows):
+        self.edge_rows = edge_rows
+        self.calls: list[tuple[str, tuple]] = []
+        self._rows: list[dict] = []
+
+    def execute(self, sql, params=None):
+        self.calls.append((sql, params))
+        self._rows = []
+        if "unnest(" not in sql:
+            outgoing, incoming, relation = set(params[0]), set(params[1]), params[2]
+            self._rows = [
+                {"id": e["id"], "source_id": e["source_id"], "target_id": e["target_id"]}
+                for e in self.edge_rows
+                if (str(e["source_id"]) in outgoing or str(e["target_id"]) in incoming)
+                and (relation is None or e["relation"] == relation)
+            ]
+
+    def fetchall(self):
+        return self._rows
+
+    @property
+    def level_calls(self) -> list[tuple[str, tuple]]:
+        return [call for call in self.calls if "unnest(" not in call[0]]
+
+    @property
+    def level_queries(self) -> list[str]:
+        return [sql for sql, _ in self.level_calls]
+
+    @property
+    def hydration(self) -> tuple[str, tuple] | None:
+        hydrations = [call for call in self.calls if "unnest(" in call[0]]
+        return hydrations[-1] if hydrations else None
+
+
+def _run_query_neighbors(monkeypatch, edge_rows=None, node_id="node-1", **kwargs):
+    """Run query_neighbors against a _LevelCursor; return (run, cursor)."""
+    monkeypatch.setenv("GRAPH_ADJACENCY_CACHE", "false")
+    if edge_rows is None:
+        edge_rows = [{"id": "edge-1", "source_id": "node-1", "target_id": "node-2", "relation": "USES"}]
+    cursor = _LevelCursor(edge_rows)
+    conn = MagicMock()
+    conn.cursor.return_value = cursor
+
+    @asynccontextmanager
+    async def connection(*args, **kw):
+        yield conn
+
+    async def run():
+        with patch.object(graph, "get_connection_with_project_context", connection):
+            return await graph.query_neighbors(node_id, **kwargs)
+
+    return run, cursor
+
+
+class TestBoundedQueryNeighbors:
+    async def test_page_is_ranked_and_cut_in_sql(self, monkeypatch):
+        run, cursor = _run_query_neighbors(monkeypatch, max_depth=3, limit=5, offset=10)
+
+        await run()
+
+        sql, params = cursor.hydration
+        assert "SELECT DISTINCT ON (node_id)" in sql
+        assert "LIMIT %s OFFSET %s" in sql
+        assert edge_relevance_sql("e") in sql
+        assert params[-2:] == (5, 10)
+        assert sql.count("%s") - sql.count("%%s") == len(params)
+        assert "superseded" in cursor.level_queries[0]
+
+    async def test_include_superseded_skips_sql_filter(self, monkeypatch):
+        run, cursor = _run_query_neighbors(monkeypatch, limit=5, include_superseded=True)
+
+        await run()
+
+        assert all("ILIKE" not in sql for sql, _ in cursor.calls)
+
+    async def test_without_limit_returns_all_rows(self, monkeypatch):
+        run, cursor = _run_query_neighbors(monkeypatch, max_depth=2)
+
+        await run()
+
+        sql, _ = cursor.hydration
+        assert "LIMIT" not in sql
+        assert "DISTINCT ON" not in sql
+
+    async def test_ief_ranking_is_sliced_in_python(self, monkeypatch):
+        run, cursor = _run_query_neighbors(monkeypatch, limit=1, offset=1, use_ief=True)
+        ranked = [{"node_id": "a"}, {"node_id": "b"}, {"node_id": "c"}]
+
+        with patch.object(graph, "_rank_neighbor_rows", AsyncMock(return_value=ranked)):
+            result = await run()
+
+        sql, _ = cursor.hydration
+        assert "LIMIT" not in sql
+        assert result == [{"node_id": "b"}]
+
+    async def test_no_hits_skip_hydration(self, monkeypatch):
+        run, cursor = _run_query_neighbors(monkeypatch, edge_rows=[], max_depth=3, limit=5)
+
+        assert await run() == []
+        assert len(cursor.calls) == 1
+        assert cursor.hydration is None
+
+
+class TestLevelTraversal:
+    """The SQL traversal must hit the same edges at the same distances as the cache."""
+
+    @pytest.mark.parametrize("seed", range(8))
+    @pytest.mark.parametrize("max_depth", [1, 2, 3, 5])
+    async def test_matches_snapshot_rows(self, monkeypatch, seed, max_depth):
+        node_rows, edge_rows = _random_graph(seed)
+        start = str(node_rows[0]["id"])
+        expected = {
+            (row["node_id"], row["edge_id"], row["distance"], row["edge_direction"])
+            for row in GraphSnapshot(node_rows, edge_rows).neighbor_rows(start, max_depth=max_depth)
+        }
+        run, cursor = _run_query_neighbors(monkeypatch, edge_rows, node_id=start, max_depth=max_depth)
+
+        await run()
+
+        hits = set(zip(*cursor.hydration[1][:4], strict=True)) if cursor.hydration else set()
+        assert hits == expected
+        # One adjacency query per level, each node expanded at most once per direction
+        assert len(cursor.level_queries) <= max_depth
+        for side in (0, 1):
+            expanded = [v for _, params in cursor.level_calls for v in params[side]]
+            assert len(expanded) == len(set(expanded))
+
+    async def test_relation_filter(self, monkeypatch):
+        node_rows, edge_rows = _random_graph(3)
+        start = str(node_rows[0]["id"])
+        snapshot_rows = GraphSnapshot(node_rows, edge_rows).neighbor_rows(
+            start, relation_type="USES", max_depth=3, direction="outgoing"
+        )
+        run, cursor = _run_query_neighbors(
+            monkeypatch, edge_rows, node_id=start, relation_type="USES", max_depth=3, direction="outgoing"
+        )
+
+        await run()
+
+        edge_ids = cursor.hydration[1][1] if cursor.hydration else []
+        assert set(edge_ids) == {row["edge_id"] for row in snapshot_rows}
+        assert all(not params[1] for _, params in cursor.level_calls)  # no incoming frontier
+
+
+class TestNeighborsCursor:
+    def test_round_trip(self):
+        assert decode_neighbors_cursor(encode_neighbors_cursor(40, 20)) == {"offset": 40, "limit": 20}
+
+    @pytest.mark.parametrize("cursor", ["not-base64!", "e30=", encode_neighbors_cursor(-1, 5)])
+    def test_malformed(self, cursor):
+        with pytest.raises(ValueError):
+            decode_neighbors_cursor(cursor)
+
+
+class TestToolPagination:
+    def _patches(self, neighbors):
+        start_node = {"id": "start-id", "label": "Entity", "name": "Start"}
+        return (
+            patch.object(tool, "get_current_project", return_value="io"),
+            patch.object(tool, "get_node_by_name", AsyncMock(return_value=start_node)),
+            patch.object(tool, "query_neighbors", AsyncMock(return_value=neighbors)),
+            patch.object(tool, "ShadowAuditLogger", side_effect=RuntimeError("no audit")),
+        )
+
+    async def test_first_page_has_next_cursor(self):
+        neighbors = [{"node_id": str(i), "name": str(i)} for i in range(3)]
+        p_project, p_node, p_query, p_audit = self._patches(neighbors)
+
+        with p_project, p_node, p_query as query, p_audit:
+            result = await handle_graph_query_neighbors({"node_name": "Start", "limit": 2})
+
+        assert query.call_args.kwargs["limit"] == 3
+        assert query.call_args.kwargs["offset"] == 0
+        assert result["neighbor_count"] == 2
+        assert result["has_more"] is True
+        assert decode_neighbors_cursor(result["next_cursor"]) == {"offset": 2, "limit": 2}
+
+    async def test_cursor_continues_with_its_page_size(self):
+        p_project, p_node, p_query, p_audit = self._patches([{"node_id": "x", "name": "x"}])
+
+        with p_project, p_node, p_query as query, p_audit:
+            result = await handle_graph_query_neighbors(
+                {"node_name": "Start", "cursor": encode_neighbors_cursor(2, 2)}
+            )
+
+        assert query.call_args.kwargs["limit"] == 3
+        assert query.call_args.kwargs["offset"] == 2
+        assert result["has_more"] is False
+        assert result["next_cursor"] is None
+
+    async def test_without_limit_query_is_unbounded(self):
+        p_project, p_node, p_query, p_audit = self._patches([])
+
+        with p_project, p_node, p_query as query, p_audit:
+            await handle_graph_query_neighbors({"node_name": "Start"})
+
+        assert "limit" not in query.call_args.kwargs
+
+    async def test_invalid_cursor(self):
+        p_project, p_node, p_query, p_audit = self._patches([])
+
+        with p_project, p_node, p_query as query, p_audit:
+            result = await handle_graph_query_neighbors({"node_name": "Start", "cursor": "bogus"})
+
+        assert result["error"] == "Parameter validation failed"
+        query.assert_not_called()
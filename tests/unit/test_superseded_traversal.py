@@ -0,0 +1,102 @@
+"""
+Unit tests for traversal-time superseded filtering (Migration 053).
+
+With include_superseded=False, query_neighbors() must not walk superseded
+edges: the level queries filter on edges.superseded and the adjacency cache
+snapshot skips flagged edges, so nodes behind them are not reached either.
+"""
+
+from __future__ import annotations
+
+import uuid
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from mcp_server.db import graph
+from mcp_server.db.graph import _is_edge_superseded
+from mcp_server.db.graph_cache import GraphSnapshot
+
+MIGRATION = Path(__file__).parents[2] / "mcp_server/db/migrations/053_edges_superseded_flag.sql"
+
+
+def _chain_snapshot(superseded_hop: int) -> tuple[GraphSnapshot, list[str]]:
+    """a -> b -> c -> d with the edge leaving hop `superseded_hop` superseded."""
+    node_rows = [
+        {"id": uuid.UUID(int=i + 1), "project_id": "io", "label": "Entity", "name": name, "properties": {}}
+        for i, name in enumerate("abcd")
+    ]
+    edge_rows = [
+        {
+            "id": uuid.UUID(int=100 + i),
+            "project_id": "io",
+            "source_id": node_rows[i]["id"],
+            "target_id": node_rows[i + 1]["id"],
+            "relation": "NEXT",
+            "weight": 1.0,
+            "memory_sector": "semantic",
+            "properties": {"superseded": True} if i == superseded_hop else {},
+            "last_accessed": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "access_count": 0,
+            "modified_at": None,
+            "superseded": i == superseded_hop,
+        }
+        for i in range(3)
+    ]
+    return GraphSnapshot(node_rows, edge_rows), [str(n["id"]) for n in node_rows]
+
+
+class TestSnapshotSkipsSupersededEdges:
+    def test_branch_behind_superseded_edge_is_not_reached(self):
+        snapshot, ids = _chain_snapshot(superseded_hop=1)
+
+        rows = snapshot.neighbor_rows(ids[0], max_depth=3, direction="outgoing")
+
+        assert [r["name"] for r in rows] == ["b"]
+
+    def test_include_superseded_walks_everything(self):
+        snapshot, ids = _chain_snapshot(superseded_hop=1)
+
+        rows = snapshot.neighbor_rows(ids[0], max_depth=3, direction="outgoing", include_superseded=True)
+
+        assert [r["name"] for r in rows] == ["b", "c", "d"]
+
+
+class TestSqlFiltersSupersededEdges:
+    async def _sql(self, monkeypatch, **kwargs) -> str:
+        monkeypatch.setenv("GRAPH_ADJACENCY_CACHE", "false")
+        cursor = MagicMock()
+        cursor.fetchall.return_value = []
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+
+        @asynccontextmanager
+        async def connection(*args, **kw):
+            yield conn
+
+        with patch.object(graph, "get_connection_with_project_context", connection):
+            await graph.query_neighbors("node-1", max_depth=3, **kwargs)
+        return cursor.execute.call_args[0][0]
+
+    async def test_level_query_skips_superseded(self, monkeypatch):
+        sql = await self._sql(monkeypatch)
+        assert "FROM edges e" in sql
+        assert sql.count("AND NOT e.superseded") == 1
+
+    async def test_include_superseded(self, monkeypatch):
+        sql = await self._sql(monkeypatch, include_superseded=True, limit=5)
+        assert "superseded" not in sql
+
+
+class TestMigrationMatchesPythonRule:
+    def test_generated_column_uses_same_properties(self):
+        sql = MIGRATION.read_text()
+        assert "GENERATED ALWAYS AS" in sql
+        for fragment in ("'resolution'", "properties->'superseded' = 'true'::jsonb", "ILIKE '%superseded%'"):
+            assert fragment in sql
+
+    def test_python_rule(self):
+        assert _is_edge_superseded("e", {"superseded": True})
+        assert _is_edge_superseded("e", {"status": "Superseded"})
+        assert not _is_edge_superseded("e", {"superseded": "true"})
@@ -0,0 +1,147 @@
+"""
+Unit tests for HNSW vector index management (Migration 050).
+
+Covers parameter validation, generated DDL, status/progress reporting and
+the ef_search knob of hybrid_search.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server.db.vector_indexes import (
+    apply_ef_search,
+    build_hnsw_index,
+    get_index_build_progress,
+    get_vector_index_status,
+    validate_ef_search,
+    validate_hnsw_params,
+)
+
+
+def _mock_conn(autocommit: bool = True) -> tuple[MagicMock, MagicMock]:
+    conn = MagicMock()
+    conn.autocommit = autocommit
+    cursor = MagicMock()
+    conn.cursor.return_value = cursor
+    return conn, cursor
+
+
+def _rendered(cursor: MagicMock) -> list[str]:
+    """Executed statements; psycopg2.sql Composables via their repr (no live connection)."""
+    return [str(call.args[0]) for call in cursor.execute.call_args_list]
+
+
+class TestValidation:
+    def test_defaults_are_valid(self):
+        validate_hnsw_params(16, 64)
+
+    @pytest.mark.parametrize("m,ef", [(1, 64), (101, 400), (16, 3), (16, 2000), (32, 40)])
+    def test_invalid_build_params(self, m, ef):
+        with pytest.raises(ValueError):
+            validate_hnsw_params(m, ef)
+
+    @pytest.mark.parametrize("value", [0, 1001, "100", 1.5, True])
+    def test_invalid_ef_search(self, value):
+        with pytest.raises(ValueError):
+            validate_ef_search(value)
+
+    def test_valid_ef_search(self):
+        validate_ef_search(1)
+        validate_ef_search(1000)
+
+
+class TestBuildHnswIndex:
+    def test_concurrent_build_ddl(self):
+        conn, cursor = _mock_conn()
+
+        build_hnsw_index(conn, "l2_insights", m=24, ef_construction=128)
+
+        ddl = _rendered(cursor)[-1]
+        assert "CREATE INDEX " in ddl and "CONCURRENTLY " in ddl and "IF NOT EXISTS" in ddl
+        assert "idx_l2_embedding_hnsw" in ddl
+        assert "USING hnsw" in ddl and "vector_cosine_ops" in ddl
+        assert "Literal(24)" in ddl and "Literal(128)" in ddl
+
+    def test_rebuild_drops_first(self):
+        conn, cursor = _mock_conn()
+
+        build_hnsw_index(conn, "episode_memory", rebuild=True, maintenance_work_mem="1GB")
+
+        statements = _rendered(cursor)
+        assert statements[0] == "SET maintenance_work_mem = %s"
+        assert "DROP INDEX " in statements[1] and "CONCURRENTLY " in statements[1]
+        assert "idx_episode_embedding_hnsw" in statements[1]
+        assert "CREATE INDEX" in statements[2]
+
+    def test_concurrent_build_requires_autocommit(self):
+        conn, _ = _mock_conn(autocommit=False)
+        with pytest.raises(ValueError, match="autocommit"):
+            build_hnsw_index(conn, "l2_insights")
+
+    def test_unknown_table_rejected(self):
+        conn, cursor = _mock_conn()
+        with pytest.raises(ValueError, match="Unknown vector table"):
+            build_hnsw_index(conn, "edges")
+        cursor.execute.assert_not_called()
+
+
+class TestReporting:
+    def test_status_reports_missing_and_existing(self):
+        conn, cursor = _mock_conn()
+        cursor.fetchall.return_value = [{
+            "index_name": "idx_l2_embedding_hnsw",
+            "valid": True,
+            "options": ["m=16", "ef_construction=64"],
+            "size_bytes": 8192,
+            "size_pretty": "8192 bytes",
+            "table_rows": 42,
+        }]
+
+        status = {s["table"]: s for s in get_vector_index_status(conn)}
+
+        assert status["l2_insights"]["exists"] is True
+        assert status["l2_insights"]["valid"] is True
+        assert status["l2_insights"]["size_bytes"] == 8192
+        assert status["episode_memory"]["exists"] is False
+        assert status["episode_memory"]["valid"] is False
+
+    def test_progress_percent(self):
+        conn, cursor = _mock_conn()
+        cursor.fetchall.return_value = [{
+            "table_name": "l2_insights",
+            "index_name": "idx_l2_embedding_hnsw",
+            "phase": "building index: loading tuples",
+            "tuples_done": 250,
+            "tuples_total": 1000,
+            "blocks_done": 0,
+            "blocks_total": 0,
+        }]
+
+        progress = get_index_build_progress(conn)
+
+        assert progress[0]["percent"] == 25.0
+        assert progress[0]["phase"].startswith("building index")
+
+
+class TestEfSearch:
+    def test_apply_ef_search_uses_set_local(self):
+        conn, cursor = _mock_conn(autocommit=False)
+
+        apply_ef_search(conn, 200)
+
+        cursor.execute.assert_called_once_with("SET LOCAL hnsw.ef_search = %s", (200,))
+
+    async def test_hybrid_search_rejects_invalid_ef_search(self):
+        from mcp_server.tools import handle_hybrid_search
+
+        result = await handle_hybrid_search({
+            "query_text": "test",
+            "query_embedding": [0.1] * 1536,
+            "ef_search": 0,
+        })
+
+        assert result["error"] == "Parameter validation failed"
+        assert "ef_search" in result["details"]